@@ -0,0 +1,79 @@
+"""add typed geometry column to project
+
+``project.geojson_representation`` is a Text blob that every consumer re-parses.
+``project.geometry`` holds the same features as a PostGIS GEOMETRYCOLLECTION
+(SRID 4326) behind a GiST index, so bbox/distance filters become index lookups.
+The column is backfilled from the existing text and ``centroid`` is recomputed
+server-side from it. Rows whose text is not valid GeoJSON keep ``geometry`` NULL.
+
+Revision ID: 20261018001
+Revises: 060f7da497a8
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from geoalchemy2 import Geometry
+
+revision = "20261018001"
+down_revision = "060f7da497a8"
+branch_labels = None
+depends_on = None
+
+
+_BACKFILL = """
+CREATE OR REPLACE FUNCTION pg_temp.geojson_to_collection(doc text)
+RETURNS geometry
+LANGUAGE plpgsql AS $$
+DECLARE
+    obj jsonb;
+    result geometry;
+BEGIN
+    obj := doc::jsonb;
+    IF obj->>'type' = 'FeatureCollection' THEN
+        SELECT ST_Collect(ST_GeomFromGeoJSON(f->'geometry'))
+          INTO result
+          FROM jsonb_array_elements(obj->'features') AS f
+         WHERE jsonb_typeof(f->'geometry') = 'object';
+    ELSIF obj->>'type' = 'Feature' THEN
+        result := ST_GeomFromGeoJSON(obj->'geometry');
+    ELSE
+        result := ST_GeomFromGeoJSON(obj);
+    END IF;
+    IF result IS NULL THEN
+        RETURN NULL;
+    END IF;
+    RETURN ST_SetSRID(ST_ForceCollection(result), 4326);
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$;
+
+UPDATE project
+   SET geometry = pg_temp.geojson_to_collection(geojson_representation)
+ WHERE geojson_representation IS NOT NULL;
+
+UPDATE project
+   SET centroid = ST_Centroid(geometry)
+ WHERE geometry IS NOT NULL;
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "project",
+        sa.Column(
+            "geometry",
+            Geometry("GEOMETRYCOLLECTION", srid=4326, spatial_index=False),
+            nullable=True,
+        ),
+    )
+    op.execute(_BACKFILL)
+    op.create_index(
+        "ix_project_geometry_gist", "project", ["geometry"], postgresql_using="gist"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_geometry_gist", table_name="project")
+    op.drop_column("project", "geometry")
@@ -0,0 +1,34 @@
+"""add data_version table
+
+One monotonic counter per data scope (projects, finves, vib, progress). Every
+write to a table of a scope bumps its counter in the same transaction
+(``crud/data_versions.py``); the public GET endpoints derive strong ETags from
+it and answer ``If-None-Match`` with 304 without loading any data.
+
+Revision ID: 20261018002
+Revises: 20261018001
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261018002"
+down_revision = "20261018001"
+branch_labels = None
+depends_on = None
+
+_SCOPES = ("projects", "finves", "vib", "progress")
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "data_version",
+        sa.Column("scope", sa.String(length=50), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.bulk_insert(table, [{"scope": scope, "version": 0} for scope in _SCOPES])
+
+
+def downgrade() -> None:
+    op.drop_table("data_version")
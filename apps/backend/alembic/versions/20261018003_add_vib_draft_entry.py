@@ -0,0 +1,122 @@
+"""split vib_draft_report.raw_result_json into vib_draft_entry rows
+
+The whole VIB parse result used to live in one JSON string that every review
+edit, AI checkpoint and read deserialised and re-serialised. Each proposed
+entry now is its own ``vib_draft_entry`` row (position, vib_section, entry
+JSON, AI status flags); the report header moves to ``drucksache_nr`` /
+``report_date`` columns. Existing drafts are split during the upgrade.
+
+Revision ID: 20261018003
+Revises: 20261018002
+Create Date: 2026-10-18
+"""
+
+import json
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261018003"
+down_revision = "20261018002"
+branch_labels = None
+depends_on = None
+
+_drafts = sa.table(
+    "vib_draft_report",
+    sa.column("id", sa.Integer),
+    sa.column("raw_result_json", sa.Text),
+    sa.column("drucksache_nr", sa.String),
+    sa.column("report_date", sa.String),
+)
+
+
+def upgrade() -> None:
+    entries = op.create_table(
+        "vib_draft_entry",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "draft_id",
+            sa.Integer(),
+            sa.ForeignKey("vib_draft_report.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("vib_section", sa.String(length=20), nullable=True),
+        sa.Column("entry_json", sa.Text(), nullable=False),
+        sa.Column("ai_extracted", sa.Boolean(), nullable=False, server_default="false"),
+        sa.Column("ai_extraction_failed", sa.Boolean(), nullable=False, server_default="false"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint("draft_id", "position", name="uq_vib_draft_entry_draft_position"),
+    )
+    op.create_index("ix_vib_draft_entry_id", "vib_draft_entry", ["id"])
+    op.create_index("ix_vib_draft_entry_draft_id", "vib_draft_entry", ["draft_id"])
+    op.add_column("vib_draft_report", sa.Column("drucksache_nr", sa.String(length=50), nullable=True))
+    op.add_column("vib_draft_report", sa.Column("report_date", sa.String(length=20), nullable=True))
+
+    bind = op.get_bind()
+    for draft_id, raw in bind.execute(sa.select(_drafts.c.id, _drafts.c.raw_result_json)).all():
+        data = json.loads(raw or "{}")
+        bind.execute(
+            _drafts.update()
+            .where(_drafts.c.id == draft_id)
+            .values(drucksache_nr=data.get("drucksache_nr"), report_date=data.get("report_date"))
+        )
+        rows = [
+            {
+                "draft_id": draft_id,
+                "position": position,
+                "vib_section": entry.get("vib_section"),
+                "entry_json": json.dumps(entry, ensure_ascii=False),
+                "ai_extracted": bool(entry.get("ai_extracted")),
+                "ai_extraction_failed": bool(entry.get("ai_extraction_failed")),
+            }
+            for position, entry in enumerate(data.get("entries") or [])
+        ]
+        if rows:
+            op.bulk_insert(entries, rows)
+
+    op.drop_column("vib_draft_report", "raw_result_json")
+
+
+def downgrade() -> None:
+    op.add_column("vib_draft_report", sa.Column("raw_result_json", sa.Text(), nullable=True))
+    entries = sa.table(
+        "vib_draft_entry",
+        sa.column("draft_id", sa.Integer),
+        sa.column("position", sa.Integer),
+        sa.column("entry_json", sa.Text),
+    )
+    drafts = sa.table(
+        "vib_draft_report",
+        sa.column("id", sa.Integer),
+        sa.column("year", sa.Integer),
+        sa.column("drucksache_nr", sa.String),
+        sa.column("report_date", sa.String),
+        sa.column("raw_result_json", sa.Text),
+    )
+    bind = op.get_bind()
+    for draft_id, year, drucksache_nr, report_date in bind.execute(
+        sa.select(drafts.c.id, drafts.c.year, drafts.c.drucksache_nr, drafts.c.report_date)
+    ).all():
+        items = bind.execute(
+            sa.select(entries.c.entry_json)
+            .where(entries.c.draft_id == draft_id)
+            .order_by(entries.c.position)
+        ).scalars()
+        payload = {
+            "year": year,
+            "drucksache_nr": drucksache_nr,
+            "report_date": report_date,
+            "entries": [json.loads(item) for item in items],
+        }
+        bind.execute(
+            drafts.update()
+            .where(drafts.c.id == draft_id)
+            .values(raw_result_json=json.dumps(payload, ensure_ascii=False))
+        )
+    op.alter_column("vib_draft_report", "raw_result_json", nullable=False)
+    op.drop_column("vib_draft_report", "report_date")
+    op.drop_column("vib_draft_report", "drucksache_nr")
+    op.drop_index("ix_vib_draft_entry_draft_id", table_name="vib_draft_entry")
+    op.drop_index("ix_vib_draft_entry_id", table_name="vib_draft_entry")
+    op.drop_table("vib_draft_entry")
@@ -0,0 +1,126 @@
+"""move vib_draft_report.ocr_images_json into the image store (vib_draft_image)
+
+Every OCR image of a draft used to be stored base64-encoded in one JSON text
+column, which inflated the draft row by megabytes. The images now live in the
+content-addressed image store (``UPLOAD_DIR/ocr-images``, see
+``dashboard_backend/utils/image_store.py``) with a thumbnail each; the draft
+keeps one ``vib_draft_image`` reference row per image. Existing drafts are
+written to the store during the upgrade, so UPLOAD_DIR must be mounted.
+
+Revision ID: 20261018004
+Revises: 20261018003
+Create Date: 2026-10-18
+"""
+
+import base64
+import json
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261018004"
+down_revision = "20261018003"
+branch_labels = None
+depends_on = None
+
+_drafts = sa.table(
+    "vib_draft_report",
+    sa.column("id", sa.Integer),
+    sa.column("ocr_images_json", sa.Text),
+)
+
+
+def upgrade() -> None:
+    from dashboard_backend.utils import image_store
+
+    images = op.create_table(
+        "vib_draft_image",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "draft_id",
+            sa.Integer(),
+            sa.ForeignKey("vib_draft_report.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("image_id", sa.String(length=200), nullable=False),
+        sa.Column("page_index", sa.Integer(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("media_type", sa.String(length=50), nullable=False),
+        sa.Column("byte_size", sa.Integer(), nullable=False),
+        sa.Column("has_thumbnail", sa.Boolean(), nullable=False, server_default="false"),
+        sa.UniqueConstraint("draft_id", "image_id", name="uq_vib_draft_image_draft_image_id"),
+    )
+    op.create_index("ix_vib_draft_image_id", "vib_draft_image", ["id"])
+    op.create_index("ix_vib_draft_image_draft_id", "vib_draft_image", ["draft_id"])
+
+    bind = op.get_bind()
+    drafts = bind.execute(
+        sa.select(_drafts.c.id).where(_drafts.c.ocr_images_json.isnot(None))
+    ).scalars().all()
+    for draft_id in drafts:
+        # One draft at a time: the JSON of a single draft can be tens of MB.
+        raw = bind.execute(
+            sa.select(_drafts.c.ocr_images_json).where(_drafts.c.id == draft_id)
+        ).scalar_one()
+        rows, seen = [], set()
+        for img in json.loads(raw or "[]"):
+            if img.get("id") in seen or not img.get("image_base64"):
+                continue
+            try:
+                data, media_type = image_store.decode_base64(img["image_base64"])
+            except ValueError:
+                continue
+            stored = image_store.put_image(data, media_type or image_store.guess_media_type(img["id"]))
+            seen.add(img["id"])
+            rows.append({
+                "draft_id": draft_id,
+                "image_id": img["id"],
+                "page_index": img.get("page_index", 0),
+                "sha256": stored.sha256,
+                "media_type": stored.media_type,
+                "byte_size": stored.size,
+                "has_thumbnail": stored.has_thumbnail,
+            })
+        if rows:
+            op.bulk_insert(images, rows)
+
+    op.drop_column("vib_draft_report", "ocr_images_json")
+
+
+def downgrade() -> None:
+    from dashboard_backend.utils import image_store
+
+    op.add_column("vib_draft_report", sa.Column("ocr_images_json", sa.Text(), nullable=True))
+    images = sa.table(
+        "vib_draft_image",
+        sa.column("draft_id", sa.Integer),
+        sa.column("image_id", sa.String),
+        sa.column("page_index", sa.Integer),
+        sa.column("sha256", sa.String),
+    )
+    bind = op.get_bind()
+    draft_ids = bind.execute(sa.select(images.c.draft_id).distinct()).scalars().all()
+    for draft_id in draft_ids:
+        rows = bind.execute(
+            sa.select(images.c.image_id, images.c.page_index, images.c.sha256)
+            .where(images.c.draft_id == draft_id)
+            .order_by(images.c.page_index, images.c.image_id)
+        ).all()
+        payload = []
+        for image_id, page_index, sha256 in rows:
+            path = image_store.image_path(sha256)
+            if not path.is_file():
+                continue
+            payload.append({
+                "page_index": page_index,
+                "id": image_id,
+                "image_base64": base64.b64encode(path.read_bytes()).decode("ascii"),
+            })
+        bind.execute(
+            _drafts.update()
+            .where(_drafts.c.id == draft_id)
+            .values(ocr_images_json=json.dumps(payload) if payload else None)
+        )
+    op.drop_index("ix_vib_draft_image_draft_id", table_name="vib_draft_image")
+    op.drop_index("ix_vib_draft_image_id", table_name="vib_draft_image")
+    op.drop_table("vib_draft_image")
@@ -0,0 +1,91 @@
+"""add routing_node / routing_edge (persisted routing topology)
+
+``find_route_section_of_lines`` used to number all operational points with
+``ROW_NUMBER() OVER ()`` and join the whole network inside every
+``pgr_dijkstra`` call. The topology is now stored once: nodes keep the id of
+their operational point, edges the id of their section of line. Both tables
+are filled here and refreshed after every RINF import
+(``routing/topology.py :: refresh_routing_topology``). The backfill is plain SQL
+so this revision does not depend on the current models or helpers.
+
+Revision ID: 20261018005
+Revises: 20261018004
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261018005"
+down_revision = "20261018004"
+branch_labels = None
+depends_on = None
+
+# Same rule as refresh_routing_topology at the time of this revision.
+_ROUTABLE = (
+    "sol_length IS NOT NULL"
+    " AND (validity_date_end IS NULL OR validity_date_end > CURRENT_DATE)"
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "routing_node",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("op_id", sa.String(), nullable=False, unique=True),
+        sa.Column("latitude", sa.Float(), nullable=True),
+        sa.Column("longitude", sa.Float(), nullable=True),
+    )
+    op.create_table(
+        "routing_edge",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column(
+            "source",
+            sa.Integer(),
+            sa.ForeignKey("routing_node.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "target",
+            sa.Integer(),
+            sa.ForeignKey("routing_node.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("cost", sa.Float(), nullable=False),
+    )
+    op.create_index("ix_routing_edge_source", "routing_edge", ["source"])
+    op.create_index("ix_routing_edge_target", "routing_edge", ["target"])
+
+    op.execute(
+        f"""
+        INSERT INTO routing_node (id, op_id, latitude, longitude)
+        SELECT id, op_id, latitude, longitude
+        FROM operational_point
+        WHERE op_id IN (
+            SELECT sol_op_start FROM section_of_line WHERE {_ROUTABLE}
+            UNION
+            SELECT sol_op_end FROM section_of_line WHERE {_ROUTABLE}
+        )
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO routing_edge (id, source, target, cost)
+        SELECT sol.id, start_node.id, end_node.id, sol.sol_length
+        FROM section_of_line AS sol
+        JOIN routing_node AS start_node ON start_node.op_id = sol.sol_op_start
+        JOIN routing_node AS end_node ON end_node.op_id = sol.sol_op_end
+        WHERE {_ROUTABLE}
+        """
+    )
+    op.execute(
+        "INSERT INTO data_version (scope, version) VALUES ('routing', 1) "
+        "ON CONFLICT (scope) DO UPDATE SET version = data_version.version + 1"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_routing_edge_target", table_name="routing_edge")
+    op.drop_index("ix_routing_edge_source", table_name="routing_edge")
+    op.drop_table("routing_edge")
+    op.drop_table("routing_node")
@@ -0,0 +1,58 @@
+"""add has_projects / ai_carried_over to vib_draft_entry
+
+The review page reads a draft page by page (``GET /draft/{id}/entries``) and
+its header counters (matched, carried over, AI failed) from
+``GET /draft/{id}``. Both flags are denormalised from ``entry_json`` like
+``ai_extraction_failed`` so the counters are one aggregate query instead of a
+scan over every entry's JSON. Existing rows are backfilled.
+
+Revision ID: 20261018006
+Revises: 20261018005
+Create Date: 2026-10-18
+"""
+
+import json
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261018006"
+down_revision = "20261018005"
+branch_labels = None
+depends_on = None
+
+_entries = sa.table(
+    "vib_draft_entry",
+    sa.column("id", sa.Integer),
+    sa.column("entry_json", sa.Text),
+    sa.column("has_projects", sa.Boolean),
+    sa.column("ai_carried_over", sa.Boolean),
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "vib_draft_entry",
+        sa.Column("has_projects", sa.Boolean(), nullable=False, server_default="false"),
+    )
+    op.add_column(
+        "vib_draft_entry",
+        sa.Column("ai_carried_over", sa.Boolean(), nullable=False, server_default="false"),
+    )
+
+    bind = op.get_bind()
+    for entry_id, raw in bind.execute(sa.select(_entries.c.id, _entries.c.entry_json)).all():
+        data = json.loads(raw or "{}")
+        has_projects = bool(data.get("project_ids"))
+        carried_over = data.get("ai_carried_over_from_year") is not None
+        if has_projects or carried_over:
+            bind.execute(
+                _entries.update()
+                .where(_entries.c.id == entry_id)
+                .values(has_projects=has_projects, ai_carried_over=carried_over)
+            )
+
+
+def downgrade() -> None:
+    op.drop_column("vib_draft_entry", "ai_carried_over")
+    op.drop_column("vib_draft_entry", "has_projects")
@@ -0,0 +1,62 @@
+"""Conditional GET (ETag / ``If-None-Match``) for the public read endpoints.
+
+Endpoints declare ``dependencies=[Depends(conditional_get(SCOPE_PROJECTS))]``.
+The dependency is resolved before any parameter dependency (e.g.
+``get_project_or_404``), reads only the ``data_version`` counters of its scopes
+and answers a matching ``If-None-Match`` with ``304`` — the ORM is never
+touched. Otherwise the ETag is attached to the normal response.
+
+The counters are per scope, not per row, so routes with a path ID list an
+existence check first (``Depends(require_project_exists)``); ``dependencies``
+are resolved in order and an unknown ID gets its ``404`` instead of a ``304``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import date
+from typing import Callable
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from dashboard_backend.crud.data_versions import get_versions
+from dashboard_backend.database import get_db
+
+# Browsers may keep the body but must revalidate before every reuse.
+_CACHE_CONTROL = "no-cache"
+
+
+def _etag(versions: dict[str, int], extra: str = "") -> str:
+    key = ";".join(f"{scope}.{version}" for scope, version in sorted(versions.items())) + extra
+    return '"' + hashlib.sha256(key.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison as required for ``If-None-Match`` (RFC 9110 §13.1.2).
+
+    A proxy that compresses the body (nginx gzip) downgrades the tag to ``W/"…"``.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def conditional_get(*scopes: str, daily: bool = False) -> Callable[..., None]:
+    """Build a dependency that validates ``If-None-Match`` against *scopes*.
+
+    ``daily=True`` folds the current date into the ETag for views whose content
+    also depends on "today" (progress forecasts, staleness).
+    """
+
+    def _dependency(request: Request, response: Response, db: Session = Depends(get_db)) -> None:
+        etag = _etag(get_versions(db, scopes), date.today().isoformat() if daily else "")
+        headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    return _dependency
@@ -12,7 +12,7 @@ from __future__ import annotations
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from dashboard_backend.crud.projects.projects import get_project_by_id
+from dashboard_backend.crud.projects.projects import get_project_by_id, project_exists
 from dashboard_backend.crud.vib import get_draft_by_task_id
 from dashboard_backend.database import get_db
 from dashboard_backend.models.projects.project import Project
@@ -31,6 +31,13 @@ def get_project_or_404(project_id: int, db: Session = Depends(get_db)) -> Projec
     return project
 
 
+def require_project_exists(project_id: int, db: Session = Depends(get_db)) -> None:
+    """404 check without loading the project; list it before ``conditional_get``
+    so an unknown ID never gets a ``304``."""
+    if not project_exists(db, project_id):
+        raise HTTPException(status_code=404, detail=PROJECT_NOT_FOUND)
+
+
 def get_text_or_404(text_id: int, db: Session = Depends(get_db)) -> ProjectText:
     text = db.query(ProjectText).filter(ProjectText.id == text_id).first()
     if text is None:
@@ -6,8 +6,10 @@ api_router = APIRouter()
 api_router.include_router(health.router, tags=["health"])
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(operational_points.router, prefix="/operational-points", tags=["operational-points"])
-api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
+# NOTE: project_progress must be mounted before projects so "progress-summary"
+# is not captured as a project id by GET /projects/{project_id}.
 api_router.include_router(project_progress.router, prefix="/projects", tags=["project-progress"])
+api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
 api_router.include_router(project_groups.router, prefix="/project_groups", tags=["project_groups"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(project_routes.router, tags=["routes"])
@@ -8,6 +8,7 @@ materialise FULDA_RUNDE observations. All actions require ``progress.edit``.
 from __future__ import annotations
 
 from fastapi import Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from dashboard_backend.core.security import require_permission
@@ -24,6 +25,7 @@ from dashboard_backend.schemas.fulda import (
 )
 from dashboard_backend.schemas.tasks import TaskLaunchResponse
 from dashboard_backend.tasks.fulda import parse_fulda_pdf
+from dashboard_backend.utils import blob_store
 
 router = AuthRouter()
 
@@ -38,15 +40,19 @@ async def parse_fulda(
 ):
     """Upload a Fulda Kleine-Anfrage PDF for ``year``; OCR + LLM run in Celery.
 
-    Returns the Celery task_id for polling via GET /api/v1/tasks/{task_id};
-    the task result is the summary ``{ocr_status, created, source_label}``.
+    The PDF is written once to the content-addressed upload store and the task
+    receives only its sha256. Returns the Celery task_id for polling via
+    GET /api/v1/tasks/{task_id}; the task result is the summary
+    ``{ocr_status, created, source_label}``.
     """
-    pdf_bytes = await pdf.read()
-    if not pdf_bytes:
+    stored = await run_in_threadpool(blob_store.put_file, pdf.file)
+    if not stored.size:
         raise HTTPException(status_code=400, detail="Leere Datei")
     user_info = {"id": current_user.id, "username": current_user.username}
-    result = parse_fulda_pdf.delay(pdf_bytes, year, pdf.filename or "upload.pdf", user_info)
-    return TaskLaunchResponse(task_id=result.id)
+    result = parse_fulda_pdf.delay(stored.sha256, year, pdf.filename or "upload.pdf", user_info)
+    return TaskLaunchResponse(
+        task_id=result.id, upload_sha256=stored.sha256, duplicate_upload=stored.duplicate
+    )
 
 
 @router.get("/years", response_model=list[int], dependencies=[_require_edit])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import Depends, HTTPException, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from dashboard_backend.core.security import require_permission
@@ -16,8 +17,13 @@ from dashboard_backend.crud.haushalt_import import (
     upsert_budget_titel_entries,
     upsert_finve,
 )
+from dashboard_backend.crud.projects.progress_invalidation import (
+    invalidate_progress,
+    invalidate_sources,
+)
 from dashboard_backend.database import get_db
 from dashboard_backend.models.associations.finve_to_project import FinveToProject
+from dashboard_backend.models.projects.finve import Finve
 from dashboard_backend.models.haushalt.haushalts_parse_result import HaushaltsParseResult
 from dashboard_backend.models.users import User
 from dashboard_backend.routing.auth_router import AuthRouter
@@ -30,6 +36,7 @@ from dashboard_backend.schemas.haushalt_import import (
 )
 from dashboard_backend.schemas.tasks import TaskLaunchResponse
 from dashboard_backend.tasks.haushalt import parse_haushalt_pdf
+from dashboard_backend.utils import blob_store
 
 router = AuthRouter()
 
@@ -48,14 +55,18 @@ async def start_parse(
 ):
     """Upload a Haushalt PDF and start a background parse task.
 
-    Returns the Celery task_id for polling via GET /api/v1/tasks/{task_id}.
+    The PDF is written once to the content-addressed upload store; the task
+    receives only its sha256. Returns the Celery task_id for polling via
+    GET /api/v1/tasks/{task_id}.
     """
     if pdf.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="Only PDF files are accepted.")
-    pdf_bytes = await pdf.read()
+    stored = await run_in_threadpool(blob_store.put_file, pdf.file)
     user_info = {"id": current_user.id, "username": current_user.username}
-    result = parse_haushalt_pdf.delay(pdf_bytes, year, pdf.filename or "upload.pdf", user_info)
-    return TaskLaunchResponse(task_id=result.id)
+    result = parse_haushalt_pdf.delay(stored.sha256, year, pdf.filename or "upload.pdf", user_info)
+    return TaskLaunchResponse(
+        task_id=result.id, upload_sha256=stored.sha256, duplicate_upload=stored.duplicate
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -134,6 +145,9 @@ def confirm_import(
     from datetime import datetime
 
     finves_created = finves_updated = budgets_created = budgets_updated = unmatched_saved = 0
+    # Projects whose FinVe-derived progress may change (old and new links).
+    unlinked_project_ids: set[int] = set()
+    touched_finve_ids: set[int] = set()
 
     for row in body.rows:
         if row.status == "unmatched":
@@ -142,7 +156,8 @@ def confirm_import(
         # 1. HaushaltTitel get_or_create handled inside upsert_budget_titel_entries
         # 2. Finve INSERT/UPDATE
         if row.proposed_finve:
-            _, created, _ = upsert_finve(db, row.proposed_finve, current_user, record.haushalt_year)
+            finve, created, _ = upsert_finve(db, row.proposed_finve, current_user, record.haushalt_year)
+            touched_finve_ids.add(finve.id)
             if created:
                 finves_created += 1
             else:
@@ -179,6 +194,7 @@ def confirm_import(
 
             for project_id in desired - current:
                 db.add(FinveToProject(finve_id=finve_id, project_id=project_id, haushalt_year=link_year))
+            unlinked_project_ids |= current - desired
             for project_id in current - desired:
                 del_q = db.query(FinveToProject).filter(
                     FinveToProject.finve_id == finve_id,
@@ -204,6 +220,9 @@ def confirm_import(
     record.confirmed_at = datetime.utcnow()
     record.confirmed_by_snapshot = current_user.username
 
+    db.flush()
+    invalidate_progress(db, unlinked_project_ids)
+    invalidate_sources(db, Finve, touched_finve_ids)
     db.commit()
 
     return HaushaltsConfirmResponse(
@@ -2,6 +2,8 @@ from fastapi import Depends, HTTPException
 from pydantic import BaseModel
 from typing import Optional
 from sqlalchemy.orm import Session
+from dashboard_backend.api.conditional import conditional_get
+from dashboard_backend.crud.data_versions import SCOPE_PROJECTS
 from dashboard_backend.crud.projects.project_groups import (
     get_project_groups,
     get_project_group_by_id,
@@ -29,7 +31,11 @@ class ProjectGroupUpdate(BaseModel):
     is_default_selected: Optional[bool] = None
 
 
-@router.get("/", response_model=list[ProjectGroupSchema])
+@router.get(
+    "/",
+    response_model=list[ProjectGroupSchema],
+    dependencies=[Depends(conditional_get(SCOPE_PROJECTS))],
+)
 def read_project_groups(db: Session = Depends(get_db)):
     return get_project_groups(db)
 
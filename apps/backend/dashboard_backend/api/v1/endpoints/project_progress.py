@@ -9,8 +9,10 @@ from __future__ import annotations
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from dashboard_backend.api.deps import get_project_or_404
+from dashboard_backend.api.conditional import conditional_get
+from dashboard_backend.api.deps import get_project_or_404, require_project_exists
 from dashboard_backend.core.security import require_permission
+from dashboard_backend.crud.data_versions import SCOPE_PROGRESS
 from dashboard_backend.crud.projects import progress as progress_crud
 from dashboard_backend.database import get_db
 from dashboard_backend.models.projects.project import Project
@@ -20,6 +22,7 @@ from dashboard_backend.schemas.projects.progress_schema import (
     LinkDocumentInput,
     ProgressObservationCreate,
     ProjectProgressSchema,
+    ProjectProgressSummarySchema,
     ProjectProgressUpdate,
 )
 
@@ -34,7 +37,25 @@ def _view(db: Session, project_id: int) -> dict:
     return progress_crud.get_progress_view(db, project_id)
 
 
-@router.get("/{project_id}/progress", response_model=ProjectProgressSchema)
+@router.get(
+    "/progress-summary",
+    response_model=list[ProjectProgressSummarySchema],
+    dependencies=[Depends(conditional_get(SCOPE_PROGRESS))],
+)
+def read_progress_summaries(db: Session = Depends(get_db)):
+    """Public: cached planning state of all projects for list views.
+
+    Served from the ``project_progress`` cache in one query; the Celery beat
+    task ``refresh_stale_progress`` keeps it fresh.
+    """
+    return progress_crud.get_progress_summaries(db)
+
+
+@router.get(
+    "/{project_id}/progress",
+    response_model=ProjectProgressSchema,
+    dependencies=[Depends(require_project_exists), Depends(conditional_get(SCOPE_PROGRESS, daily=True))],
+)
 def read_progress(
     project: Project = Depends(get_project_or_404),
     db: Session = Depends(get_db),
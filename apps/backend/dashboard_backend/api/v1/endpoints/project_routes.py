@@ -51,17 +51,19 @@ def _to_route_out(route: Route) -> RouteOut:
 async def calculate_route(
     request: RouteIn,
     current_user: User = Depends(require_permission("project.edit")),
+    db: Session = Depends(get_db),
     service: RouteService = Depends(get_route_service),
 ) -> Dict[str, Any]:
     """Calculate a route and return it as a GeoJSON Feature preview.
 
     Nothing is saved to the database. The frontend can evaluate the result
-    and then call the confirm endpoint to persist it.
+    and then call the confirm endpoint to persist it. Repeated previews and
+    already persisted routes are served from the cache.
     """
     waypoints = [waypoint.model_dump() for waypoint in request.waypoints]
 
     try:
-        feature = await service.calculate_only(waypoints, request.profile, request.options)
+        feature = await service.calculate_only(db, waypoints, request.profile, request.options)
     except RoutingNoPathError as error:
         raise HTTPException(status_code=422, detail=str(error)) from error
     except RoutingUpstreamError as error:
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import json
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 
-from dashboard_backend.api.deps import get_project_or_404
+from dashboard_backend.api.conditional import conditional_get
+from dashboard_backend.api.deps import get_project_or_404, require_project_exists
 from dashboard_backend.core.security import require_auth, require_permission
 from dashboard_backend.crud.admin_assignments import link_project_to_finves
 from dashboard_backend.crud.changelog import (
@@ -13,13 +14,19 @@ from dashboard_backend.crud.changelog import (
     get_changelog_entry,
     get_project_changelog,
 )
+from dashboard_backend.crud.data_versions import SCOPE_FINVES, SCOPE_PROJECTS, SCOPE_VIB
 from dashboard_backend.crud.projects.bvwp import get_bvwp_data
+from dashboard_backend.crud.projects.geometry import BBox, get_project_geometry
 from dashboard_backend.crud.projects.projects import (
     create_project,
     delete_project,
     finalize_project,
+    bulk_update_projects,
     get_draft_projects,
+    get_project_geometry_metrics,
+    get_project_list_items,
     get_projects,
+    get_projects_by_ids,
     update_project,
 )
 from dashboard_backend.models.projects.project import Project
@@ -29,20 +36,33 @@ from dashboard_backend.models.users import User
 from dashboard_backend.routing.auth_router import AuthRouter
 from dashboard_backend.schemas.changelog import ChangeLogRead, RevertFieldRequest
 from dashboard_backend.schemas.projects import ProjectSchema
-from dashboard_backend.schemas.projects.project_schema import BudgetSummarySchema, FinveWithBudgetsSchema, TitelEntrySchema
+from dashboard_backend.schemas.projects.project_schema import (
+    BudgetSummarySchema,
+    FinveWithBudgetsSchema,
+    ProjectListItemSchema,
+    TitelEntrySchema,
+)
 from dashboard_backend.models.projects.finve import Finve
 from dashboard_backend.models.projects.budget import Budget
 from dashboard_backend.models.haushalt.budget_titel_entry import BudgetTitelEntry
 from dashboard_backend.schemas.projects.bvwp_schema import BvwpProjectDataSchema
+from dashboard_backend.schemas.projects.project_geometry_schema import (
+    ProjectGeometryCollectionSchema,
+    ProjectGeometryMetricsSchema,
+)
 from dashboard_backend.schemas.projects.link_finves_schema import LinkFinvesInput
 from dashboard_backend.schemas.projects.project_create_schema import ProjectCreate
-from dashboard_backend.schemas.projects.project_update_schema import ProjectUpdate
+from dashboard_backend.schemas.projects.project_update_schema import ProjectBulkUpdateItem, ProjectUpdate
 from dashboard_backend.schemas.vib import VibEntryForProjectSchema
 
 router = AuthRouter()
 
 
-@router.get("/", response_model=list[ProjectSchema])
+@router.get(
+    "/",
+    response_model=list[ProjectSchema],
+    dependencies=[Depends(conditional_get(SCOPE_PROJECTS))],
+)
 def read_all_projects(db: Session = Depends(get_db)):
     """Retrieve all projects."""
     return get_projects(db)
@@ -58,6 +78,49 @@ def create_project_endpoint(
     return create_project(db, body.model_dump(exclude_unset=True))
 
 
+# NOTE: must be declared before GET /{project_id} so "summary" is not captured
+# as a project id.
+@router.get(
+    "/summary",
+    response_model=list[ProjectListItemSchema],
+    dependencies=[Depends(conditional_get(SCOPE_PROJECTS))],
+)
+def read_project_summaries(db: Session = Depends(get_db)):
+    """Retrieve all projects as a slim, geometry-free list (id, name, number,
+    groups, centroid) for list and card views."""
+    return get_project_list_items(db)
+
+
+def _parse_bbox(bbox: str | None) -> BBox | None:
+    """Parse ``minLon,minLat,maxLon,maxLat`` into a tuple (422 on malformed input)."""
+    if bbox is None:
+        return None
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(part) for part in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=422, detail="bbox must be 'minLon,minLat,maxLon,maxLat'")
+    if min_lon > max_lon or min_lat > max_lat:
+        raise HTTPException(status_code=422, detail="bbox minimum exceeds maximum")
+    return min_lon, min_lat, max_lon, max_lat
+
+
+# NOTE: must be declared before GET /{project_id} so "geometry" is not captured
+# as a project id.
+@router.get(
+    "/geometry",
+    response_model=ProjectGeometryCollectionSchema,
+    dependencies=[Depends(conditional_get(SCOPE_PROJECTS))],
+)
+def read_project_geometry(
+    bbox: str | None = Query(None, description="Viewport as minLon,minLat,maxLon,maxLat (WGS84)"),
+    zoom: int | None = Query(None, ge=0, le=22, description="Map zoom; geometry is simplified to ~1 px"),
+    db: Session = Depends(get_db),
+):
+    """Return the geometry of all finalized projects as one merged FeatureCollection,
+    limited to features intersecting *bbox* and simplified for *zoom*."""
+    return get_project_geometry(db, bbox=_parse_bbox(bbox), zoom=zoom)
+
+
 # NOTE: must be declared before GET /{project_id} so "drafts" is not captured
 # as a project id.
 @router.get("/drafts", response_model=list[ProjectSchema])
@@ -94,7 +157,11 @@ def delete_project_endpoint(
     return None
 
 
-@router.get("/{project_id}", response_model=ProjectSchema)
+@router.get(
+    "/{project_id}",
+    response_model=ProjectSchema,
+    dependencies=[Depends(require_project_exists), Depends(conditional_get(SCOPE_PROJECTS))],
+)
 def read_project(project: Project = Depends(get_project_or_404)):
     """Retrieve a single project by ID."""
     return project
@@ -112,7 +179,24 @@ def get_project_bvwp(
     return bvwp
 
 
-@router.get("/{project_id}/vib", response_model=list[VibEntryForProjectSchema])
+@router.get("/{project_id}/geometry-metrics", response_model=ProjectGeometryMetricsSchema)
+def get_project_geometry_metrics_endpoint(
+    project: Project = Depends(get_project_or_404),
+    db: Session = Depends(get_db),
+):
+    """Return bbox, centroid and line length (km) of the project's geometry, computed
+    by PostGIS. Returns 404 if the project has no geometry."""
+    metrics = get_project_geometry_metrics(db, project.id)
+    if metrics is None:
+        raise HTTPException(status_code=404, detail="Project has no geometry")
+    return metrics
+
+
+@router.get(
+    "/{project_id}/vib",
+    response_model=list[VibEntryForProjectSchema],
+    dependencies=[Depends(require_project_exists), Depends(conditional_get(SCOPE_VIB))],
+)
 def get_project_vib(
     project: Project = Depends(get_project_or_404),
     db: Session = Depends(get_db),
@@ -122,6 +206,40 @@ def get_project_vib(
     return [VibEntryForProjectSchema.from_entry(e) for e in entries]
 
 
+# NOTE: must be declared before PATCH /{project_id} so "bulk" is not captured
+# as a project id.
+@router.patch("/bulk", response_model=list[ProjectSchema])
+def patch_projects_bulk(
+    body: list[ProjectBulkUpdateItem],
+    current_user: User = Depends(require_permission("project.edit")),
+    db: Session = Depends(get_db),
+):
+    """Update several projects in one request. All targets are loaded with one
+    query, every changed field is recorded in the changelog, and everything is
+    committed in a single transaction (all-or-nothing)."""
+    ids = [item.id for item in body]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=422, detail="Duplicate project ids in bulk update")
+
+    projects_by_id = {p.id: p for p in get_projects_by_ids(db, ids)}
+    missing = [pid for pid in ids if pid not in projects_by_id]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Projects not found: {missing}")
+
+    updates = []
+    for item in body:
+        project = projects_by_id[item.id]
+        update_data = item.changes.model_dump(exclude_unset=True)
+        if not update_data:
+            continue
+        create_changelog_for_patch(db, project, update_data, current_user.id, current_user.username)
+        updates.append((project, update_data))
+
+    if updates:
+        bulk_update_projects(db, updates)
+    return [projects_by_id[pid] for pid in ids]
+
+
 @router.patch("/{project_id}", response_model=ProjectSchema)
 def patch_project(
     body: ProjectUpdate,
@@ -139,7 +257,11 @@ def patch_project(
     return update_project(db, project.id, update_data, project=project)
 
 
-@router.get("/{project_id}/finves", response_model=list[FinveWithBudgetsSchema])
+@router.get(
+    "/{project_id}/finves",
+    response_model=list[FinveWithBudgetsSchema],
+    dependencies=[Depends(require_project_exists), Depends(conditional_get(SCOPE_FINVES))],
+)
 def get_project_finves(
     project: Project = Depends(get_project_or_404),
     db: Session = Depends(get_db),
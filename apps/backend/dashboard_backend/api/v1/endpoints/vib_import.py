@@ -1,26 +1,33 @@
 from __future__ import annotations
 
-import base64
-import json
-
-from fastapi import Depends, File, Form, HTTPException, UploadFile
-from fastapi.responses import Response
+from fastapi import Depends, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response
 from sqlalchemy.orm import Session, joinedload, selectinload
 
+from dashboard_backend.api.conditional import etag_matches
 from dashboard_backend.api.deps import get_draft_or_404, get_parse_draft_or_404
 from dashboard_backend.celery_app import celery_app
 from dashboard_backend.core.config import settings
 from dashboard_backend.core.security import require_permission
 from dashboard_backend.crud.vib import (
+    count_draft_entries,
     create_vib_report_with_entries,
+    draft_entry_counts,
     delete_draft,
     delete_report,
+    draft_result,
     get_draft_by_task_id,
+    get_draft_entries,
+    get_draft_entry,
+    get_draft_image,
+    get_draft_images,
     get_report_by_year,
     get_vib_entry_full,
+    iter_draft_entries,
     list_drafts,
     list_reports,
-    update_draft_ai_result,
+    update_draft_entry,
     update_vib_entry,
 )
 from dashboard_backend.database import get_db
@@ -32,7 +39,11 @@ from dashboard_backend.schemas.vib import (
     VibAiAvailableResponse,
     VibConfirmRequest,
     VibConfirmResponse,
+    VibDraftEntryItem,
+    VibDraftEntryPage,
+    VibDraftImageSchema,
     VibDraftSchema,
+    VibDraftSummarySchema,
     VibEntryListItemSchema,
     VibEntryProposed,
     VibEntrySchema,
@@ -43,6 +54,7 @@ from dashboard_backend.schemas.vib import (
 )
 from dashboard_backend.tasks.vib import parse_vib_pdf
 from dashboard_backend.tasks.vib_ai_extraction import extract_vib_blocks
+from dashboard_backend.utils import blob_store, image_store
 
 router = AuthRouter()
 
@@ -54,7 +66,7 @@ def _draft_result(db: Session, task_id: str) -> VibParseTaskResult | None:
     draft = get_draft_by_task_id(db, task_id)
     if draft is None:
         return None
-    return VibParseTaskResult.model_validate_json(draft.raw_result_json)
+    return draft_result(db, draft)
 
 
 # ---------------------------------------------------------------------------
@@ -111,15 +123,19 @@ async def start_vib_parse(
     start_page / end_page (optional, 1-indexed): restrict OCR to these pages only.
     strip_headers_footers: remove repeated page headers/footers from OCR output (default True).
 
-    Returns the Celery task_id for polling via GET /api/v1/tasks/{task_id}.
+    The PDF is written once to the content-addressed upload store; the task
+    receives only its sha256. Returns the Celery task_id for polling via
+    GET /api/v1/tasks/{task_id}.
     """
-    pdf_bytes = await pdf.read()
+    stored = await run_in_threadpool(blob_store.put_file, pdf.file)
     user_info = {"id": current_user.id, "username": current_user.username}
     result = parse_vib_pdf.delay(
-        pdf_bytes, year, pdf.filename or "upload.pdf", user_info,
+        stored.sha256, year, pdf.filename or "upload.pdf", user_info,
         start_page, end_page, strip_headers_footers,
     )
-    return TaskLaunchResponse(task_id=result.id)
+    return TaskLaunchResponse(
+        task_id=result.id, upload_sha256=stored.sha256, duplicate_upload=stored.duplicate
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -156,8 +172,9 @@ def get_vib_parse_result(task_id: str, db: Session = Depends(get_db)):
 
     if async_result.state == "SUCCESS":
         # Prefer the DB draft over the original Redis result — the user may have
-        # saved edits via PATCH /draft/{task_id}, which updates raw_result_json
-        # in DB but cannot update the immutable Celery task result in Redis.
+        # saved edits via PATCH /draft/{task_id}/entries/{idx}, which updates the
+        # draft entries in DB but cannot update the immutable Celery task result
+        # in Redis.
         result = _draft_result(db, task_id)
         if result is not None:
             return result
@@ -187,7 +204,15 @@ def confirm_vib_import(
 
     Guard: if a VibReport for the given year already exists, returns 409.
     Delete the existing report first if re-import is needed.
+
+    With ``use_draft`` the entries of the saved draft ``task_id`` are
+    imported; they are read chunk by chunk, never as one document.
     """
+    if body.use_draft and body.entries:
+        raise HTTPException(
+            status_code=422,
+            detail="use_draft und entries schließen sich aus",
+        )
     existing = get_report_by_year(db, body.year)
     if existing is not None:
         raise HTTPException(
@@ -201,12 +226,12 @@ def confirm_vib_import(
     # Verify the task result is available — the user may also submit the entries
     # directly without going through the task (e.g. in tests), so only validate
     # if a task_id was provided.
+    draft = get_draft_by_task_id(db, body.task_id) if body.task_id else None
     if body.task_id:
         async_result = celery_app.AsyncResult(body.task_id)
         if async_result.state != "SUCCESS":
             # The Celery result may have been evicted from Redis, but the draft
             # saved to DB counts as proof the task completed successfully.
-            draft = get_draft_by_task_id(db, body.task_id)
             if draft is None:
                 raise HTTPException(
                     status_code=422,
@@ -217,12 +242,22 @@ def confirm_vib_import(
                     ),
                 )
 
+    if body.use_draft:
+        if draft is None:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Kein gespeicherter Entwurf für Task {body.task_id!r}",
+            )
+        entries = iter_draft_entries(db, draft)
+    else:
+        entries = body.entries
+
     response = create_vib_report_with_entries(
         db=db,
         year=body.year,
         drucksache_nr=body.drucksache_nr,
         report_date_str=body.report_date,
-        entries=body.entries,
+        entries=entries,
         user=current_user,
     )
 
@@ -243,6 +278,7 @@ def confirm_vib_import(
     response_model=TaskLaunchResponse,
 )
 def start_vib_ai_extraction(
+    force: bool = Query(False),
     current_user: User = Depends(require_permission("vib.import")),
     draft: VibDraftReport = Depends(get_parse_draft_or_404),
 ):
@@ -250,14 +286,16 @@ def start_vib_ai_extraction(
 
     The parse_task_id must refer to a completed parse task whose draft is saved in DB.
     Returns a new task_id for polling via GET /api/v1/tasks/{task_id}.
-    When the task reaches SUCCESS, the draft in DB is updated with AI-extracted content.
-    Retrieve the updated parse result via GET /parse-result/{parse_task_id}.
+    Each entry is written to the draft as soon as its extraction finishes, so
+    GET /parse-result/{parse_task_id} shows progress while the task runs.
+    Re-starting resumes with the entries that are still missing or failed;
+    ``force=true`` re-extracts every entry without using cached LLM answers.
     """
     if not settings.llm_base_url:
         raise HTTPException(status_code=422, detail="LLM not configured: LLM_BASE_URL is empty")
 
     user_info = {"id": current_user.id, "username": current_user.username}
-    result = extract_vib_blocks.delay(draft.task_id, user_info)
+    result = extract_vib_blocks.delay(draft.task_id, user_info, force)
     return TaskLaunchResponse(task_id=result.id)
 
 
@@ -287,20 +325,76 @@ def delete_vib_draft(
 
 
 # ---------------------------------------------------------------------------
-# PATCH /draft/{parse_task_id} — persist review edits across sessions
+# GET /draft/{parse_task_id} — draft header and review counters
 # ---------------------------------------------------------------------------
 
-@router.patch("/draft/{parse_task_id}", status_code=204, dependencies=[_require_editor])
-def save_vib_draft(
-    body: VibParseTaskResult,
+@router.get(
+    "/draft/{parse_task_id}",
+    response_model=VibDraftSummarySchema,
+    dependencies=[_require_editor],
+)
+def get_vib_draft_summary(
     draft: VibDraftReport = Depends(get_parse_draft_or_404),
     db: Session = Depends(get_db),
 ):
-    """Overwrite the draft's raw_result_json with the current review state.
+    """Return the draft header and its counters without loading any entry."""
+    return VibDraftSummarySchema(
+        task_id=draft.task_id,
+        year=draft.year,
+        drucksache_nr=draft.drucksache_nr,
+        report_date=draft.report_date,
+        **draft_entry_counts(db, draft),
+    )
 
-    Called by the review UI to persist edits so work survives page reloads.
-    """
-    update_draft_ai_result(db, draft.task_id, body.model_dump_json())
+
+# ---------------------------------------------------------------------------
+# GET /draft/{parse_task_id}/entries — paginated draft entries
+# ---------------------------------------------------------------------------
+
+@router.get(
+    "/draft/{parse_task_id}/entries",
+    response_model=VibDraftEntryPage,
+    dependencies=[_require_editor],
+)
+def list_vib_draft_entries(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    draft: VibDraftReport = Depends(get_parse_draft_or_404),
+    db: Session = Depends(get_db),
+):
+    """Return one page of the draft's entries, ordered by index."""
+    return VibDraftEntryPage(
+        total=count_draft_entries(db, draft),
+        offset=offset,
+        limit=limit,
+        items=[
+            VibDraftEntryItem(idx=idx, entry=entry)
+            for idx, entry in get_draft_entries(db, draft, offset, limit)
+        ],
+    )
+
+
+# ---------------------------------------------------------------------------
+# PATCH /draft/{parse_task_id}/entries/{entry_idx} — save one review edit
+# ---------------------------------------------------------------------------
+
+@router.patch(
+    "/draft/{parse_task_id}/entries/{entry_idx}",
+    status_code=204,
+    dependencies=[_require_editor],
+)
+def save_vib_draft_entry(
+    entry_idx: int,
+    body: VibEntryProposed,
+    draft: VibDraftReport = Depends(get_parse_draft_or_404),
+    db: Session = Depends(get_db),
+):
+    """Replace a single draft entry; other entries are not touched."""
+    if not update_draft_entry(db, draft.task_id, entry_idx, body):
+        raise HTTPException(
+            status_code=422,
+            detail=f"entry_idx {entry_idx} außerhalb des gültigen Bereichs",
+        )
     db.commit()
 
 
@@ -318,25 +412,31 @@ def retry_vib_ai_for_entry(
     draft: VibDraftReport = Depends(get_parse_draft_or_404),
     db: Session = Depends(get_db),
 ):
-    """Re-run LLM extraction synchronously for a single entry and persist the result."""
-    from dashboard_backend.services.llm import call_llm_json
+    """Re-run LLM extraction synchronously for a single entry and persist the result.
+
+    The LLM response cache is bypassed: a retry must ask the model again.
+    429s are retried ``LLM_RATE_LIMIT_RETRIES`` times, like in the extraction task.
+    """
     from dashboard_backend.tasks.vib_ai_extraction import (
-        _SYSTEM_PROMPT,
-        _USER_PROMPT_TEMPLATE,
+        _extract_entry,
         _merge_ai_result,
+        _RateLimitGate,
     )
 
     if not settings.llm_base_url:
         raise HTTPException(status_code=422, detail="LLM nicht konfiguriert: LLM_BASE_URL fehlt")
 
-    result = VibParseTaskResult.model_validate_json(draft.raw_result_json)
-    if entry_idx < 0 or entry_idx >= len(result.entries):
+    entry = get_draft_entry(db, draft, entry_idx)
+    if entry is None:
         raise HTTPException(
             status_code=422,
-            detail=f"entry_idx {entry_idx} außerhalb des gültigen Bereichs (0–{len(result.entries) - 1})",
+            detail=(
+                f"entry_idx {entry_idx} außerhalb des gültigen Bereichs "
+                f"(0–{count_draft_entries(db, draft) - 1})"
+            ),
         )
 
-    entry_dict = result.entries[entry_idx].model_dump()
+    entry_dict = entry.model_dump()
     raw_text = entry_dict.get("raw_text") or ""
     if not raw_text.strip():
         raise HTTPException(
@@ -344,79 +444,95 @@ def retry_vib_ai_for_entry(
             detail="Kein Rohtext für diesen Eintrag — KI-Extraktion nicht möglich",
         )
 
-    prompt = _USER_PROMPT_TEMPLATE.format(
-        vib_section=entry_dict.get("vib_section") or "?",
-        vib_name_raw=entry_dict.get("vib_name_raw") or "?",
-        raw_text=raw_text[:6000],
-    )
     try:
-        ai_result = call_llm_json(_SYSTEM_PROMPT, prompt)
+        ai_result = _extract_entry(
+            entry_dict, _RateLimitGate(), retries=settings.llm_rate_limit_retries, use_cache=False
+        )
         entry_dict = _merge_ai_result(entry_dict, ai_result)
         entry_dict["ai_extraction_failed"] = False
         entry_dict["ai_extraction_error"] = None
+        entry_dict["ai_carried_over_from_year"] = None
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"LLM-Aufruf fehlgeschlagen: {exc}")
 
-    updated_entries = list(result.entries)
-    updated_entries[entry_idx] = VibEntryProposed(**entry_dict)
-    updated_result = VibParseTaskResult(
-        year=result.year,
-        drucksache_nr=result.drucksache_nr,
-        report_date=result.report_date,
-        entries=updated_entries,
-    )
-    update_draft_ai_result(db, draft.task_id, updated_result.model_dump_json())
+    updated = VibEntryProposed(**entry_dict)
+    update_draft_entry(db, draft.task_id, entry_idx, updated)
     db.commit()
 
-    return updated_entries[entry_idx]
+    return updated
 
 
 # ---------------------------------------------------------------------------
 # GET /draft/{task_id}/image/{image_id} — serve a single OCR image
 # ---------------------------------------------------------------------------
 
+# Image files are content-addressed and never change under their digest.
+_IMAGE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
 @router.get("/draft/{task_id}/image/{image_id:path}", dependencies=[_require_editor])
-def get_vib_draft_image(image_id: str, draft: VibDraftReport = Depends(get_draft_or_404)):
+def get_vib_draft_image(
+    image_id: str,
+    request: Request,
+    thumbnail: bool = Query(False, description="Serve the JPEG thumbnail instead of the original"),
+    draft: VibDraftReport = Depends(get_draft_or_404),
+    db: Session = Depends(get_db),
+):
     """Return a single OCR image extracted from the Mistral OCR response.
 
-    image_id matches the id returned by the OCR API, e.g. "img-0.jpeg".
-    The image bytes are decoded from base64 and returned with the appropriate
-    content type (image/jpeg or image/png).
+    image_id matches the id returned by the OCR API, e.g. "img-0.jpeg". The
+    file is served from the image store with a content-derived ETag
+    (``If-None-Match`` → 304), a long private ``Cache-Control`` and support
+    for ``Range`` requests. Images without a thumbnail fall back to the
+    original for ``?thumbnail=true``.
     """
-    if not draft.ocr_images_json:
-        raise HTTPException(status_code=404, detail="No images available for this draft")
-
-    images: list[dict] = json.loads(draft.ocr_images_json)
-    for img in images:
-        if img.get("id") == image_id:
-            img_bytes = base64.b64decode(img["image_base64"])
-            lower_id = image_id.lower()
-            if lower_id.endswith(".png"):
-                media_type = "image/png"
-            elif lower_id.endswith(".webp"):
-                media_type = "image/webp"
-            else:
-                media_type = "image/jpeg"
-            return Response(content=img_bytes, media_type=media_type)
-
-    raise HTTPException(status_code=404, detail=f"Image {image_id!r} not found in draft")
+    image = get_draft_image(db, draft, image_id)
+    if image is None:
+        raise HTTPException(status_code=404, detail=f"Image {image_id!r} not found in draft")
+
+    use_thumbnail = thumbnail and image.has_thumbnail
+    path = image_store.thumbnail_path(image.sha256) if use_thumbnail else image_store.image_path(image.sha256)
+    etag = f'"{image.sha256}{"-thumb" if use_thumbnail else ""}"'
+    headers = {"ETag": etag, "Cache-Control": _IMAGE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail=f"Image {image_id!r} missing from image store")
+    return FileResponse(
+        path,
+        media_type=image_store.THUMBNAIL_MEDIA_TYPE if use_thumbnail else image.media_type,
+        headers=headers,
+    )
 
 
 # ---------------------------------------------------------------------------
 # GET /draft/{task_id}/images — list all OCR image IDs for a draft
 # ---------------------------------------------------------------------------
 
-@router.get("/draft/{task_id}/images", dependencies=[_require_editor])
-def list_vib_draft_images(draft: VibDraftReport = Depends(get_draft_or_404)):
-    """Return metadata for all OCR images extracted from a draft (id, page_index).
+@router.get(
+    "/draft/{task_id}/images",
+    response_model=list[VibDraftImageSchema],
+    dependencies=[_require_editor],
+)
+def list_vib_draft_images(
+    draft: VibDraftReport = Depends(get_draft_or_404),
+    db: Session = Depends(get_db),
+):
+    """Return metadata for all OCR images extracted from a draft.
 
-    Does NOT return base64 data — fetch individual images via
-    GET /draft/{task_id}/image/{image_id}.
+    Does NOT return image data — fetch individual images (or their
+    thumbnails) via GET /draft/{task_id}/image/{image_id}.
     """
-    if not draft.ocr_images_json:
-        return []
-    images: list[dict] = json.loads(draft.ocr_images_json)
-    return [{"id": img["id"], "page_index": img["page_index"]} for img in images]
+    return [
+        VibDraftImageSchema(
+            id=img.image_id,
+            page_index=img.page_index,
+            media_type=img.media_type,
+            byte_size=img.byte_size,
+            has_thumbnail=img.has_thumbnail,
+        )
+        for img in get_draft_images(db, draft)
+    ]
 
 
 # ---------------------------------------------------------------------------
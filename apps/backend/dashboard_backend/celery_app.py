@@ -10,10 +10,26 @@ celery_app = Celery(
         "dashboard_backend.tasks.vib_ai_extraction",
         "dashboard_backend.tasks.haushalt",
         "dashboard_backend.tasks.fulda",
+        "dashboard_backend.tasks.progress",
+        "dashboard_backend.tasks.maintenance",
     ],
 )
 
 celery_app.conf.update(
     task_track_started=True,
     result_expires=3600,  # results expire after 1 hour
+    beat_schedule={
+        # Refreshes progress caches RESYNC_LEAD (2 h) before STALENESS_WINDOW
+        # (24 h) runs out; hourly < RESYNC_LEAD, so GETs never resync lazily.
+        "refresh-stale-progress": {
+            "task": "dashboard_backend.tasks.progress.refresh_stale_progress",
+            "schedule": 3600.0,
+        },
+        # Deletes upload blobs past UPLOAD_RETENTION_HOURS and OCR images no
+        # VIB draft references any more.
+        "purge-upload-storage": {
+            "task": "dashboard_backend.tasks.maintenance.purge_upload_storage",
+            "schedule": 3600.0,
+        },
+    },
 )
@@ -29,16 +29,48 @@ class Settings(BaseSettings):
     routing_base_url: str = "http://localhost:8989"
     routing_timeout_seconds: float = 20.0
     graph_version: str = "unknown"
+    # In-process cache of unconfirmed route previews (per worker); 0 entries = off.
+    route_preview_cache_ttl_seconds: int = 3600
+    route_preview_cache_max_entries: int = 256
     backend_cors_origins: list[str] = ["http://localhost:5173"]
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
     session_secret_key: str  # Required: 32-byte hex string for HMAC-signing session tokens
     upload_dir: str = "/app/uploads/text-attachments"  # UPLOAD_DIR env var
+    # Uploaded import PDFs (UPLOAD_DIR/blobs) are deleted this many hours after
+    # their last upload; OCR images no VIB draft references are purged as well.
+    upload_retention_hours: int = 24
     # LLM settings for optional VIB semantic extraction (OpenAI-compatible)
     # llm_base_url empty = feature disabled
     llm_base_url: str = ""
     llm_api_key: str = ""
     llm_model: str = "gpt-4o-mini"
+    # Pooled client: timeouts per request, retries on 429/5xx/connection
+    # errors with jittered exponential backoff (base delay doubles per retry).
+    llm_connect_timeout_seconds: float = 10.0
+    llm_read_timeout_seconds: float = 120.0
+    llm_max_retries: int = 3
+    llm_retry_backoff_seconds: float = 1.0
+    # VIB block extraction: LLM calls in flight at once, and how often a
+    # rate-limited (429) call is retried after the shared backoff (the VIB
+    # extraction turns off llm_max_retries for 429s, it is the only 429 layer).
+    llm_max_concurrency: int = 4
+    llm_rate_limit_retries: int = 5
+    # Pack short VIB blocks into one request up to this many estimated input
+    # tokens / entries (max entries 1 = one request per block). Longer blocks
+    # are split into parts of this size instead of being truncated.
+    llm_batch_token_budget: int = 4000
+    llm_batch_max_entries: int = 8
+    # Reuse the previous year's confirmed fields for VIB blocks whose numbers,
+    # dates and status words are unchanged and whose remaining raw_text is at
+    # least this similar (word-level ratio) instead of calling the LLM.
+    vib_carry_over_enabled: bool = True
+    vib_carry_over_min_similarity: float = 0.97
+    # Cache LLM responses under UPLOAD_DIR/llm-cache, keyed by
+    # sha256(model, system prompt, prompt); TTL 0 / max size 0 = unlimited.
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_seconds: int = 90 * 24 * 3600
+    llm_cache_max_mb: int = 256
 
     # OCR settings for VIB PDF text extraction (Mistral OCR API)
     # ocr_api_key empty = pymupdf fallback is used instead
@@ -48,6 +80,17 @@ class Settings(BaseSettings):
     # Strip repeated header/footer lines (page numbers, running headers) from OCR output.
     # Can be overridden per-import via the upload form.
     ocr_strip_headers_footers: bool = True
+    # Cache Mistral OCR pages under UPLOAD_DIR/ocr-cache, keyed by
+    # (pdf sha256, page range, model), so re-parses skip the OCR call;
+    # TTL 0 / max size 0 = unlimited.
+    ocr_cache_enabled: bool = True
+    ocr_cache_ttl_seconds: int = 90 * 24 * 3600
+    ocr_cache_max_mb: int = 1024
+    # Chunked OCR: send the PDF in windows of this many pages (0 = one request),
+    # at most ocr_max_concurrency in parallel, each retried ocr_chunk_retries times.
+    ocr_chunk_pages: int = 20
+    ocr_max_concurrency: int = 4
+    ocr_chunk_retries: int = 2
 
     model_config = SettingsConfigDict(
         env_file=_find_env_file(),
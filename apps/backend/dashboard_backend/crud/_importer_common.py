@@ -12,7 +12,7 @@ from collections.abc import Iterable
 
 from sqlalchemy.orm import Session
 
-from dashboard_backend.crud.projects.progress import recompute_progress
+from dashboard_backend.crud.projects.progress_invalidation import invalidate_progress
 from dashboard_backend.models.projects.project import Project
 
 
@@ -53,6 +53,10 @@ def apply_editable_fields(row: object, payload: dict, fields: set[str]) -> None:
 
 
 def recompute_for(db: Session, ids: Iterable[int | None]) -> None:
-    """Re-materialise progress for every distinct non-None project id."""
-    for pid in {i for i in ids if i is not None}:
-        recompute_progress(db, pid)
+    """Queue a progress recompute for every distinct non-None project id.
+
+    Call it *before* the commit: the projects and their ancestors are marked
+    stale in the same transaction and re-materialised by one batched Celery
+    task after the commit (see ``crud.projects.progress_invalidation``).
+    """
+    invalidate_progress(db, ids)
@@ -1,9 +1,9 @@
 """DB access for the DB-Bauportal importer (#47).
 
 Thin layer over the fetch/match task and the ``bauportal_status`` raw table.
-Confirming a match sets ``project_id`` and immediately re-materialises the
-affected project(s) so the derived BAUPORTAL observation appears without waiting
-for the 24-h lazy resync.
+Confirming a match sets ``project_id`` and queues the affected project(s) for
+the post-commit batch recompute, so the derived BAUPORTAL observation appears
+without waiting for the 24-h lazy resync.
 """
 
 from __future__ import annotations
@@ -101,9 +101,8 @@ def update_entry(db: Session, entry_id: int, payload: dict) -> dict | None:
         # Can only confirm a row that actually has an assigned project.
         row.confirmed = bool(payload["confirmed"]) and row.project_id is not None
 
-    db.commit()
-
     recompute_for(db, [old_project_id, row.project_id])
+    db.commit()
 
     names = project_name_map(db, [row.project_id, row.suggested_project_id])
     return _entry_dict(row, names)
@@ -112,8 +111,8 @@ def update_entry(db: Session, entry_id: int, payload: dict) -> dict | None:
 def confirm_all(db: Session) -> int:
     """Confirm every assigned-but-unconfirmed entry in one step.
 
-    Skips entries without an assigned project. Re-materialises each affected
-    project once and returns the number of newly confirmed entries.
+    Skips entries without an assigned project. Queues each affected project
+    once for the batch recompute and returns the number of newly confirmed entries.
     """
 
     rows = (
@@ -129,7 +128,6 @@ def confirm_all(db: Session) -> int:
         row.confirmed = True
         if row.project_id is not None:
             affected.add(row.project_id)
-    db.commit()
-
     recompute_for(db, affected)
+    db.commit()
     return len(rows)
@@ -0,0 +1,144 @@
+"""Per-scope data version counters backing the ETags of the public read endpoints.
+
+Every flush (and every ORM/Core DML statement run through the session) that
+touches a table listed in ``_SCOPES_BY_TABLE`` marks the affected scopes; the
+counters are bumped once, right before the transaction commits. The
+``data_version`` row locks are therefore held only for the commit itself, not
+for the whole (possibly long) import transaction, and a rollback bumps
+nothing. Loaded objects without a net change (``Session.is_modified``) do not
+count. Readers compare a cheap ``SELECT scope, version FROM data_version``
+against ``If-None-Match`` before loading anything else.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+
+from dashboard_backend.models.data_version import DataVersion
+
+SCOPE_PROJECTS = "projects"
+SCOPE_FINVES = "finves"
+SCOPE_VIB = "vib"
+SCOPE_PROGRESS = "progress"
+# Bumped explicitly by routing/topology.refresh_routing_topology.
+SCOPE_ROUTING = "routing"
+
+# ``Session.info`` key holding the scopes to bump at commit.
+_PENDING_KEY = "data_version_pending"
+
+# The progress view is derived from the project hierarchy and every importer
+# source, so all of those tables also bump SCOPE_PROGRESS.
+_SCOPES_BY_TABLE: dict[str, frozenset[str]] = {
+    "project": frozenset({SCOPE_PROJECTS, SCOPE_PROGRESS}),
+    "project_group": frozenset({SCOPE_PROJECTS}),
+    "project_to_project_group": frozenset({SCOPE_PROJECTS}),
+    "change_log": frozenset({SCOPE_PROJECTS}),
+    "finve": frozenset({SCOPE_FINVES, SCOPE_PROGRESS}),
+    "finve_to_project": frozenset({SCOPE_FINVES, SCOPE_PROGRESS}),
+    "budgets": frozenset({SCOPE_FINVES}),
+    "budget_titel_entry": frozenset({SCOPE_FINVES}),
+    "haushalt_titel": frozenset({SCOPE_FINVES}),
+    "vib_report": frozenset({SCOPE_VIB, SCOPE_PROGRESS}),
+    "vib_entry": frozenset({SCOPE_VIB, SCOPE_PROGRESS}),
+    "vib_entry_project": frozenset({SCOPE_VIB, SCOPE_PROGRESS}),
+    "vib_pfa_entry": frozenset({SCOPE_VIB, SCOPE_PROGRESS}),
+    "project_progress": frozenset({SCOPE_PROGRESS}),
+    "progress_observation": frozenset({SCOPE_PROGRESS}),
+    "progress_track_document": frozenset({SCOPE_PROGRESS}),
+    "document": frozenset({SCOPE_PROGRESS}),
+    "bauportal_status": frozenset({SCOPE_PROGRESS}),
+    "media_report": frozenset({SCOPE_PROGRESS}),
+    "fulda_announcement": frozenset({SCOPE_PROGRESS}),
+    "fulda_announcement_to_project": frozenset({SCOPE_PROGRESS}),
+}
+
+
+def get_versions(db: Session, scopes: Iterable[str]) -> dict[str, int]:
+    """Return the current counter per scope (0 for scopes never bumped)."""
+    scopes = list(scopes)
+    rows = db.execute(
+        select(DataVersion.scope, DataVersion.version).where(DataVersion.scope.in_(scopes))
+    ).all()
+    found = {scope: version for scope, version in rows}
+    return {scope: found.get(scope, 0) for scope in scopes}
+
+
+def bump_versions(db: Session, scopes: Iterable[str]) -> None:
+    """Increment the counters of *scopes* in the current transaction.
+
+    Holds the counter row locks until the commit, so call it at the end of the
+    unit of work (or use :func:`mark_changed` with an ORM session).
+    """
+    table = DataVersion.__table__
+    for scope in sorted(set(scopes)):
+        result = db.execute(
+            update(table).where(table.c.scope == scope).values(version=table.c.version + 1)
+        )
+        if result.rowcount == 0:
+            db.execute(insert(table).values(scope=scope, version=1))
+
+
+def _scopes_for_tables(table_names: Iterable[str]) -> set[str]:
+    scopes: set[str] = set()
+    for name in table_names:
+        scopes |= _SCOPES_BY_TABLE.get(name, frozenset())
+    return scopes
+
+
+def mark_changed(db: Session, scopes: Iterable[str]) -> None:
+    """Bump the counters of *scopes* when the current transaction commits."""
+    db.info.setdefault(_PENDING_KEY, set()).update(scopes)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    # new/dirty/deleted still reflect the pre-flush state inside after_flush;
+    # dirty also holds objects whose attributes were set to their old value.
+    changed = (
+        *session.new,
+        *(obj for obj in session.dirty if session.is_modified(obj)),
+        *session.deleted,
+    )
+    tables = {obj.__table__.name for obj in changed if hasattr(obj, "__table__")}
+    scopes = _scopes_for_tables(tables)
+    if scopes:
+        mark_changed(session, scopes)
+
+
+def _do_orm_execute(state: ORMExecuteState) -> None:
+    # Query.delete()/update() and Core inserts bypass the flush entirely.
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table = getattr(state.statement, "table", None)
+    name = getattr(table, "name", None)
+    if name is None or name == DataVersion.__tablename__:
+        return
+    scopes = _scopes_for_tables([name])
+    if scopes:
+        mark_changed(state.session, scopes)
+
+
+def _before_commit(session: Session) -> None:
+    # The commit's own flush runs after before_commit; flush first so its
+    # changes are marked, then bump everything in one short step.
+    session.flush()
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        bump_versions(session, pending)
+
+
+def _after_rollback(session: Session, previous_transaction) -> None:
+    # A rolled-back savepoint keeps the marks of its outer transaction; an
+    # extra bump only costs one cache miss.
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def register_version_tracking(session_factory: sessionmaker) -> None:
+    """Attach the version-bumping listeners to every session of *session_factory*."""
+    event.listen(session_factory, "after_flush", _after_flush)
+    event.listen(session_factory, "do_orm_execute", _do_orm_execute)
+    event.listen(session_factory, "before_commit", _before_commit)
+    event.listen(session_factory, "after_soft_rollback", _after_rollback)
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session, joinedload
 
+from dashboard_backend.crud.projects.progress_invalidation import invalidate_sources
 from dashboard_backend.models.associations.finve_to_project import FinveToProject
 from dashboard_backend.models.haushalt.budget_titel_entry import BudgetTitelEntry
 from dashboard_backend.models.projects.budget import Budget
@@ -156,6 +157,7 @@ def set_finve_progress_phase(db: Session, finve_id: int, phase: str | None):
     if finve is None:
         return None
     finve.progress_phase = phase
+    invalidate_sources(db, Finve, [finve_id])
     db.commit()
     db.refresh(finve)
     return finve
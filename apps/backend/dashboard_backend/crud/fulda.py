@@ -22,6 +22,7 @@ from dashboard_backend.models.projects.project import Project
 from dashboard_backend.models.users import User
 from dashboard_backend.services.progress_dates import parse_flexible_date
 from dashboard_backend.services.progress_materialization import fulda_category_to_phase
+from dashboard_backend.services.project_name_index import ProjectNameIndex
 from dashboard_backend.tasks.fulda_extraction import (
     extract_fulda_announcements,
     ocr_fulda_pdf,
@@ -75,7 +76,7 @@ def _resolve_leaf_ids(
 
 
 def parse_and_store(
-    db: Session, *, pdf_bytes: bytes, year: int, user: User | None
+    db: Session, *, pdf_bytes: bytes, year: int, user: User | None, pdf_sha256: str | None = None
 ) -> dict:
     """OCR + LLM extract a Fulda PDF and store draft announcement rows for ``year``.
 
@@ -86,18 +87,24 @@ def parse_and_store(
     Returns a summary ``{ocr_status, created, source_label}``.
     """
 
-    full_text, _ocr_model, ocr_status = ocr_fulda_pdf(pdf_bytes)
+    full_text, _ocr_model, ocr_status = ocr_fulda_pdf(pdf_bytes, pdf_sha256)
     extracted = extract_fulda_announcements(full_text)
 
     document_date = parse_flexible_date(extracted.get("document_date"))
     source_label = extracted.get("source_label")
-    # The fuzzy matcher only reads id/name/superior_project_id — don't drag
-    # geojson_representation (potentially MBs per row) along for every project.
+    # The fuzzy matcher only reads id/name/description (+ superior_project_id for
+    # the leaf resolution) — don't drag geojson_representation (potentially MBs
+    # per row) along for every project. Names are indexed once for all items.
     projects = (
         db.query(Project)
-        .options(load_only(Project.id, Project.name, Project.superior_project_id))
+        .options(
+            load_only(
+                Project.id, Project.name, Project.description, Project.superior_project_id
+            )
+        )
         .all()
     )
+    name_index = ProjectNameIndex(projects)
     by_id = {p.id: p for p in projects}
     children_by_superior: dict[int, list[Project]] = {}
     for p in projects:
@@ -113,7 +120,7 @@ def parse_and_store(
     for item in extracted["items"]:
         phase = fulda_category_to_phase(item["category"])
         abschnitt = item.get("abschnitt")
-        superior_ids = suggest_projects_for_vib_entry(item["project_name"], projects)
+        superior_ids = suggest_projects_for_vib_entry(item["project_name"], name_index)
         leaf_ids = _resolve_leaf_ids(superior_ids, abschnitt, children_by_superior)
         row = FuldaAnnouncement(
             announcement_year=year,
@@ -232,9 +239,9 @@ def update_entry(db: Session, entry_id: int, payload: dict) -> dict | None:
 
     apply_editable_fields(row, payload, _EDITABLE_FIELDS)
 
+    recompute_for(db, old_project_ids | {p.id for p in row.projects})
     db.commit()
     db.refresh(row)
-    recompute_for(db, old_project_ids | {p.id for p in row.projects})
 
     return _entry_dict(row)
 
@@ -245,8 +252,8 @@ def delete_entry(db: Session, entry_id: int) -> bool:
         return False
     linked_ids = {p.id for p in row.projects}
     db.delete(row)
-    db.commit()
     recompute_for(db, linked_ids)
+    db.commit()
     return True
 
 
@@ -274,8 +281,8 @@ def confirm_year(db: Session, year: int) -> int:
         row.confirmed = True
         affected.update(p.id for p in row.projects)
         count += 1
-    db.commit()
     recompute_for(db, affected)
+    db.commit()
     return count
 
 
@@ -295,6 +302,6 @@ def delete_year(db: Session, year: int) -> int:
     for row in rows:
         affected.update(p.id for p in row.projects)
         db.delete(row)
-    db.commit()
     recompute_for(db, affected)
+    db.commit()
     return len(rows)
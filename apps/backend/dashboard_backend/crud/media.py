@@ -139,9 +139,8 @@ def update_entry(db: Session, entry_id: int, payload: dict) -> dict | None:
 
     apply_editable_fields(row, payload, _EDITABLE_FIELDS)
 
-    db.commit()
-
     recompute_for(db, [old_project_id, row.project_id])
+    db.commit()
 
     db.refresh(row)
     return _entry_dict(row, project_name_map(db, [row.project_id, row.suggested_project_id]))
@@ -153,6 +152,6 @@ def delete_entry(db: Session, entry_id: int) -> bool:
         return False
     linked_project_id = row.project_id
     db.delete(row)
-    db.commit()
     recompute_for(db, [linked_project_id])
+    db.commit()
     return True
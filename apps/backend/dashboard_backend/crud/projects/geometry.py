@@ -0,0 +1,109 @@
+"""Map geometry for finalized projects, filtered to a viewport.
+
+The map used to receive every project's ``geojson_representation`` through the
+project list and parse all of them client-side. ``get_project_geometry``
+instead returns one merged FeatureCollection that only contains features
+intersecting the requested bbox, simplified to the requested zoom level.
+Candidate projects are selected via the GiST-indexed ``project.geometry``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from shapely.geometry import box, mapping
+from shapely.geometry.base import BaseGeometry
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
+
+from dashboard_backend.crud.projects.projects import _extract_features, _shape_or_none
+from dashboard_backend.models.projects import Project
+
+BBox = Tuple[float, float, float, float]
+
+# Web-mercator tiles are 256 px wide and cover 360° at zoom 0.
+_TILE_SIZE_PX = 256
+
+
+def simplify_tolerance(zoom: Optional[int]) -> float:
+    """Return the simplification tolerance in degrees for *zoom* (≈ one pixel).
+
+    ``None`` disables simplification.
+    """
+    if zoom is None:
+        return 0.0
+    return 360.0 / (_TILE_SIZE_PX * 2 ** zoom)
+
+
+def _prepare_geometry(
+    geometry: Dict[str, Any], viewport: Optional[BaseGeometry], tolerance: float
+) -> Optional[Dict[str, Any]]:
+    """Filter one GeoJSON geometry against *viewport* and simplify it.
+
+    Returns ``None`` when the geometry is invalid or outside the viewport.
+    """
+    geom = _shape_or_none(geometry)
+    if geom is None:
+        return None
+    if viewport is not None and not geom.intersects(viewport):
+        return None
+    if tolerance > 0 and geom.geom_type not in ("Point", "MultiPoint"):
+        geom = geom.simplify(tolerance, preserve_topology=True)
+    return mapping(geom)
+
+
+def get_project_geometry(
+    db: Session, bbox: Optional[BBox] = None, zoom: Optional[int] = None
+) -> Dict[str, Any]:
+    """Return the geometry of all finalized projects as one FeatureCollection.
+
+    Every feature carries ``project_id``, ``name`` and ``project_number`` in its
+    properties so the map can link back to the project.
+    """
+    query = (
+        db.query(Project)
+        .options(
+            load_only(
+                Project.id,
+                Project.name,
+                Project.project_number,
+                Project.geojson_representation,
+            )
+        )
+        .filter(
+            Project.is_draft.is_(False),
+            Project.geojson_representation.isnot(None),
+        )
+    )
+    if bbox is not None:
+        # GiST index lookup on project.geometry narrows the candidates; the
+        # per-feature check below drops members of a collection outside the bbox.
+        query = query.filter(Project.geometry.ST_Intersects(func.ST_MakeEnvelope(*bbox, 4326)))
+    projects = query.all()
+
+    viewport = box(*bbox) if bbox is not None else None
+    tolerance = simplify_tolerance(zoom)
+
+    features: List[Dict[str, Any]] = []
+    for project in projects:
+        for feature in _extract_features(project.geojson_representation):
+            geometry = feature.get("geometry")
+            if not isinstance(geometry, dict):
+                continue
+            prepared = _prepare_geometry(geometry, viewport, tolerance)
+            if prepared is None:
+                continue
+            features.append(
+                {
+                    "type": "Feature",
+                    "geometry": prepared,
+                    "properties": {
+                        **(feature.get("properties") or {}),
+                        "project_id": project.id,
+                        "name": project.name,
+                        "project_number": project.project_number,
+                    },
+                }
+            )
+
+    return {"type": "FeatureCollection", "features": features}
@@ -9,7 +9,9 @@ resync; the seams (``STALENESS_WINDOW``, ``is_derived`` guard) already exist.
 
 from __future__ import annotations
 
-from datetime import date, datetime
+import logging
+import time
+from datetime import date, datetime, timedelta
 
 from sqlalchemy.orm import Session, joinedload, selectinload
 
@@ -70,6 +72,15 @@ from dashboard_backend.models.vib.vib_pfa_entry import VibPfaEntry
 # ``parl_befassung_relevant`` override stays authoritative when set.
 BEDARFSPLAN_GROUP_SHORT_NAME_PREFIX = "BSWAG"
 
+# Background resync (``resync_stale_progress``): projects per batched
+# ``sync_derived_observations_bulk`` call, and how long before the lazy
+# ``STALENESS_WINDOW`` a cache is refreshed ahead of time. The beat interval
+# must stay below ``RESYNC_LEAD`` so GETs never find a stale cache.
+RESYNC_CHUNK_SIZE = 200
+RESYNC_LEAD = timedelta(hours=2)
+
+logger = logging.getLogger(__name__)
+
 
 class DerivedObservationDeleteError(Exception):
     """Raised when a caller tries to delete a derived (materialised) observation."""
@@ -810,6 +821,238 @@ def _track_documents(db: Session, project_id: int, track: ObservationTrack) -> l
     ]
 
 
+def get_progress_summaries(db: Session) -> list[dict]:
+    """Cached planning state of every finalized project for list views.
+
+    Reads the ``computed_*`` cache columns with a single outer join — no
+    derivation, no resync. Projects without a ``project_progress`` row yet are
+    reported with an empty cache and the default lifecycle. Freshness of the
+    cache is the job of :func:`resync_stale_progress` (Celery beat).
+
+    ``effective_phase`` of a superior is aggregated over its subtree with
+    :func:`aggregate_tree`, like the headline of :func:`get_progress_view`; the
+    leaves come from the cache (a cached leaf is "known" when its confidence is
+    above zero, i.e. a credible MAIN observation decided it).
+    """
+
+    rows = (
+        db.query(
+            Project.id,
+            Project.superior_project_id,
+            Project.is_draft,
+            ProjectProgress.computed_phase,
+            ProjectProgress.computed_confidence,
+            ProjectProgress.computed_at,
+            ProjectProgress.manual_phase_override,
+            ProjectProgress.lifecycle_status,
+        )
+        .outerjoin(ProjectProgress, ProjectProgress.project_id == Project.id)
+        .order_by(Project.id)
+        .all()
+    )
+
+    # Drafts stay in the tree (get_progress_view spans them too) but are not listed.
+    children_by_parent: dict[int, list[int]] = {}
+    for row in rows:
+        if row.superior_project_id is not None:
+            children_by_parent.setdefault(row.superior_project_id, []).append(row.id)
+    rows_by_id = {row.id: row for row in rows}
+
+    # Every node is built once and shared by all its ancestors; aggregation
+    # results are memoised the same way, so the whole list costs O(n).
+    nodes: dict[int, AggregationNode] = {}
+    on_path: set[int] = set()
+
+    def build(project_id: int) -> AggregationNode:
+        if project_id in nodes:
+            return nodes[project_id]
+        row = rows_by_id[project_id]
+        override = _enum_or_none(MainPhase, row.manual_phase_override)
+        on_path.add(project_id)
+        # A superior_project_id cycle would recurse forever; cut it at the repeat.
+        children = [
+            build(child_id)
+            for child_id in children_by_parent.get(project_id, [])
+            if child_id not in on_path
+        ]
+        on_path.discard(project_id)
+        if children:
+            node = AggregationNode(
+                leaf_phase=MainPhase.NICHT_GESTARTET,  # unused for intermediate nodes
+                leaf_is_known=False,
+                manual_override=override,
+                children=children,
+            )
+        else:
+            node = AggregationNode(
+                leaf_phase=override or _enum_or_none(MainPhase, row.computed_phase) or MainPhase.NICHT_GESTARTET,
+                leaf_is_known=override is not None or bool(row.computed_confidence),
+            )
+        nodes[project_id] = node
+        return node
+
+    memo: dict = {}
+    summaries = []
+    for row in rows:
+        if row.is_draft:
+            continue
+        effective_phase = row.manual_phase_override or row.computed_phase
+        if row.id in children_by_parent:
+            effective_phase = aggregate_tree(build(row.id), memo).display_phase.value
+        summaries.append(
+            {
+                "project_id": row.id,
+                "effective_phase": effective_phase,
+                "computed_phase": row.computed_phase,
+                "computed_confidence": row.computed_confidence,
+                "computed_at": row.computed_at,
+                "is_overridden": row.manual_phase_override is not None,
+                "lifecycle_status": row.lifecycle_status or LifecycleStatus.AKTIV.value,
+            }
+        )
+    return summaries
+
+
+def _stale_project_ids(db: Session, threshold: datetime) -> list[int]:
+    """Finalized projects whose cache predates ``threshold`` or that have no
+    ``project_progress`` row / no ``computed_at`` yet."""
+
+    return [
+        pid
+        for (pid,) in db.query(Project.id)
+        .outerjoin(ProjectProgress, ProjectProgress.project_id == Project.id)
+        .filter(
+            Project.is_draft.is_(False),
+            (ProjectProgress.id.is_(None))
+            | (ProjectProgress.computed_at.is_(None))
+            | (ProjectProgress.computed_at < threshold),
+        )
+        .order_by(Project.id)
+        .all()
+    ]
+
+
+def _resync_chunk(db: Session, project_ids: list[int], today: date) -> tuple[float, float]:
+    """Resync + re-derive one chunk in a constant number of queries.
+
+    Returns ``(sync_seconds, derive_seconds)``; the caller commits.
+    """
+
+    started = time.perf_counter()
+    progress_by_id = _bulk_get_or_create_progress(db, project_ids)
+    sync_derived_observations_bulk(db, project_ids)
+    synced = time.perf_counter()
+
+    obs_by_project: dict[int, list[ProgressObservation]] = {pid: [] for pid in project_ids}
+    for obs in (
+        db.query(ProgressObservation)
+        .filter(
+            ProgressObservation.project_id.in_(project_ids),
+            ProgressObservation.is_expected.is_(False),
+        )
+        .all()
+    ):
+        obs_by_project[obs.project_id].append(obs)
+
+    projects = (
+        db.query(Project)
+        .options(selectinload(Project.project_groups))
+        .filter(Project.id.in_(project_ids))
+        .all()
+    )
+    for project in projects:
+        derive_for_project(
+            db,
+            project,
+            progress_by_id[project.id],
+            today,
+            observations=obs_by_project[project.id],
+        )
+    return synced - started, time.perf_counter() - synced
+
+
+def resync_projects(
+    db: Session,
+    project_ids: list[int],
+    today: date | None = None,
+    *,
+    chunk_size: int = RESYNC_CHUNK_SIZE,
+) -> dict:
+    """Re-materialise and re-derive the given projects in committed chunks.
+
+    Each chunk of ``chunk_size`` projects costs one ``sync_derived_observations_bulk``
+    call and a constant number of queries, and is committed on its own. A
+    failing chunk is logged and rolled back, and the remaining chunks still run;
+    its projects stay stale and are picked up again by the next beat run. Ids
+    of deleted projects are skipped. Returns counts and durations: ``{refreshed,
+    failed, chunks, failed_chunks, sync_seconds, derive_seconds,
+    duration_seconds}``.
+    """
+
+    today = today or date.today()
+    started = time.perf_counter()
+    wanted = sorted(set(project_ids))
+    existing = (
+        [pid for (pid,) in db.query(Project.id).filter(Project.id.in_(wanted)).all()]
+        if wanted
+        else []
+    )
+    existing.sort()
+
+    sync_seconds = derive_seconds = 0.0
+    chunks = failed_chunks = refreshed = failed = 0
+    for offset in range(0, len(existing), chunk_size):
+        chunk = existing[offset : offset + chunk_size]
+        try:
+            chunk_sync, chunk_derive = _resync_chunk(db, chunk, today)
+            db.commit()
+        except Exception:
+            logger.exception(
+                "Progress resync failed for projects %d..%d (%d projects)",
+                chunk[0],
+                chunk[-1],
+                len(chunk),
+            )
+            db.rollback()
+            failed_chunks += 1
+            failed += len(chunk)
+            continue
+        sync_seconds += chunk_sync
+        derive_seconds += chunk_derive
+        chunks += 1
+        refreshed += len(chunk)
+
+    return {
+        "refreshed": refreshed,
+        "failed": failed,
+        "chunks": chunks,
+        "failed_chunks": failed_chunks,
+        "sync_seconds": round(sync_seconds, 3),
+        "derive_seconds": round(derive_seconds, 3),
+        "duration_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def resync_stale_progress(
+    db: Session,
+    today: date | None = None,
+    *,
+    chunk_size: int = RESYNC_CHUNK_SIZE,
+    lead: timedelta = RESYNC_LEAD,
+) -> dict:
+    """Re-materialise and re-derive every project whose cache is (nearly) stale.
+
+    Picks projects whose ``computed_at`` is older than ``STALENESS_WINDOW -
+    lead`` — i.e. slightly *before* ``_ensure_fresh`` would consider them
+    stale, so a beat interval shorter than ``lead`` means interactive GETs never
+    hit the lazy resync. Projects without a ``project_progress`` row are created.
+    Runs through :func:`resync_projects` and returns its stats.
+    """
+
+    stale_ids = _stale_project_ids(db, datetime.utcnow() - (STALENESS_WINDOW - lead))
+    return resync_projects(db, stale_ids, today, chunk_size=chunk_size)
+
+
 # --- Mutations ---------------------------------------------------------------
 
 
@@ -0,0 +1,169 @@
+"""Dependency-tracked invalidation of cached project progress.
+
+Every source of derived observations (VIB entries and their PFAs, FinVe links,
+Bauportal, Medien, Fulda) feeds a known set of projects. A write to such a
+source calls :func:`invalidate_sources` (or :func:`invalidate_progress` with
+explicit ids) *before* its commit; the fed projects plus all their ancestors
+are marked stale (``computed_at = NULL``) in the same transaction and, once the
+transaction commits, handed to **one** ``recompute_progress_batch`` Celery task
+per session commit (listeners attached by :func:`register_progress_invalidation`). The HTTP request therefore never runs per-project
+derivations, and a lost task only degrades to the lazy/beat resync.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from dashboard_backend.crud.projects.projects import ancestor_chain_cte
+from dashboard_backend.models.associations.finve_to_project import FinveToProject
+from dashboard_backend.models.associations.fulda_announcement_to_project import (
+    fulda_announcement_to_project,
+)
+from dashboard_backend.models.projects.bauportal_status import BauportalStatus
+from dashboard_backend.models.projects.finve import Finve
+from dashboard_backend.models.projects.fulda_announcement import FuldaAnnouncement
+from dashboard_backend.models.projects.media_report import MediaReport
+from dashboard_backend.models.projects.project_progress import ProjectProgress
+from dashboard_backend.models.vib.vib_entry import VibEntry, vib_entry_project
+from dashboard_backend.models.vib.vib_pfa_entry import VibPfaEntry
+
+logger = logging.getLogger(__name__)
+
+# ``Session.info`` key holding the project ids awaiting the post-commit enqueue.
+_PENDING_KEY = "progress_invalidation_pending"
+
+
+def _column_values(db: Session, column, key_column, ids: list[int]) -> set[int]:
+    return {
+        value
+        for (value,) in db.execute(select(column).where(key_column.in_(ids)))
+        if value is not None
+    }
+
+
+def _vib_entry_projects(db: Session, ids: list[int]) -> set[int]:
+    # Entry-level links (MAIN + unassigned PFAs) and PFAs assigned to subprojects.
+    return _column_values(
+        db, vib_entry_project.c.project_id, vib_entry_project.c.vib_entry_id, ids
+    ) | _column_values(db, VibPfaEntry.project_id, VibPfaEntry.vib_entry_id, ids)
+
+
+def _vib_pfa_projects(db: Session, ids: list[int]) -> set[int]:
+    # An unassigned PFA renders on the projects linked to its parent entry.
+    entry_ids = _column_values(db, VibPfaEntry.vib_entry_id, VibPfaEntry.id, ids)
+    return _column_values(db, VibPfaEntry.project_id, VibPfaEntry.id, ids) | (
+        _column_values(
+            db, vib_entry_project.c.project_id, vib_entry_project.c.vib_entry_id, list(entry_ids)
+        )
+        if entry_ids
+        else set()
+    )
+
+
+def _finve_projects(db: Session, ids: list[int]) -> set[int]:
+    return _column_values(db, FinveToProject.project_id, FinveToProject.finve_id, ids)
+
+
+def _bauportal_projects(db: Session, ids: list[int]) -> set[int]:
+    return _column_values(db, BauportalStatus.project_id, BauportalStatus.id, ids)
+
+
+def _media_projects(db: Session, ids: list[int]) -> set[int]:
+    return _column_values(db, MediaReport.project_id, MediaReport.id, ids)
+
+
+def _fulda_projects(db: Session, ids: list[int]) -> set[int]:
+    return _column_values(
+        db,
+        fulda_announcement_to_project.c.project_id,
+        fulda_announcement_to_project.c.fulda_announcement_id,
+        ids,
+    )
+
+
+# Source model → resolver of the project ids its rows (by primary key) feed.
+# FinVe links are keyed by finve id, so ``Finve`` and ``FinveToProject`` share one.
+_PROJECTS_FED_BY: dict[type, Callable[[Session, list[int]], set[int]]] = {
+    VibEntry: _vib_entry_projects,
+    VibPfaEntry: _vib_pfa_projects,
+    Finve: _finve_projects,
+    FinveToProject: _finve_projects,
+    BauportalStatus: _bauportal_projects,
+    MediaReport: _media_projects,
+    FuldaAnnouncement: _fulda_projects,
+}
+
+
+def with_ancestors(db: Session, project_ids: Iterable[int]) -> set[int]:
+    """Return ``project_ids`` plus every superior project above them."""
+    ids = set(project_ids)
+    if not ids:
+        return set()
+    chain = ancestor_chain_cte(ids)
+    return ids | {pid for (pid,) in db.execute(select(chain.c.id))}
+
+
+def projects_fed_by(db: Session, source: type, ids: Iterable[int | None]) -> set[int]:
+    """Projects (incl. ancestors) whose progress depends on the given source rows.
+
+    Raises ``KeyError`` for a model that is not a progress source.
+    """
+    resolver = _PROJECTS_FED_BY[source]
+    wanted = list({i for i in ids if i is not None})
+    if not wanted:
+        return set()
+    return with_ancestors(db, resolver(db, wanted))
+
+
+def invalidate_progress(db: Session, project_ids: Iterable[int | None]) -> set[int]:
+    """Mark the projects and their ancestors stale and queue them for the
+    post-commit batch recompute. Returns the invalidated id set."""
+
+    ids = with_ancestors(db, {i for i in project_ids if i is not None})
+    if not ids:
+        return set()
+    db.query(ProjectProgress).filter(ProjectProgress.project_id.in_(ids)).update(
+        {ProjectProgress.computed_at: None}, synchronize_session=False
+    )
+    db.info.setdefault(_PENDING_KEY, set()).update(ids)
+    return ids
+
+
+def invalidate_sources(db: Session, source: type, ids: Iterable[int | None]) -> set[int]:
+    """:func:`invalidate_progress` for every project fed by the given source rows.
+
+    Call it with the *old* state before re-linking/deleting and again after the
+    flush for the new state; both sets end up in the same batch.
+    """
+    return invalidate_progress(db, projects_fed_by(db, source, ids))
+
+
+def _enqueue_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        # Imported lazily: the task module imports the progress CRUD.
+        from dashboard_backend.tasks.progress import recompute_progress_batch
+
+        # Runs for every committing session: a broker outage must not surface
+        # as an error of the (already committed) write. The projects stay
+        # stale and are picked up by the lazy/beat resync.
+        try:
+            recompute_progress_batch.delay(sorted(pending))
+        except Exception:
+            logger.exception(
+                "Could not enqueue progress recompute for %d projects", len(pending)
+            )
+
+
+def _drop_pending(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_progress_invalidation(session_factory: sessionmaker) -> None:
+    """Attach the post-commit enqueue to every session of *session_factory*."""
+    event.listen(session_factory, "after_commit", _enqueue_pending)
+    event.listen(session_factory, "after_soft_rollback", _drop_pending)
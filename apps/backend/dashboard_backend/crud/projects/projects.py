@@ -1,7 +1,14 @@
 import json
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
-from sqlalchemy.orm import Session, selectinload
+from geoalchemy2 import Geography
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.shape import from_shape
+from shapely.errors import ShapelyError
+from shapely.geometry import GeometryCollection, shape
+from shapely.geometry.base import BaseGeometry
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session, aliased, load_only, selectinload
 
 from dashboard_backend.models.projects import Project
 from dashboard_backend.models.projects.project_group import ProjectGroup
@@ -18,6 +25,29 @@ def get_projects(db: Session):
     )
 
 
+def get_project_list_items(db: Session):
+    """Gibt alle finalisierten Projekte als schlanke Listen-Projektion zurück.
+
+    Only the columns of ``ProjectListItemSchema`` are selected — the large
+    ``geojson_representation`` text and the property flags are never read.
+    """
+    return (
+        db.query(Project)
+        .options(
+            load_only(
+                Project.id,
+                Project.name,
+                Project.project_number,
+                Project.superior_project_id,
+                Project.centroid,
+            ),
+            selectinload(Project.project_groups),
+        )
+        .filter(Project.is_draft.is_(False))
+        .all()
+    )
+
+
 def get_draft_projects(db: Session):
     """Gibt alle noch nicht finalisierten Projekte (Entwürfe) zurück."""
     return (
@@ -33,6 +63,11 @@ def get_project_by_id(db: Session, project_id: int):
     return db.query(Project).filter(Project.id == project_id).first()
 
 
+def project_exists(db: Session, project_id: int) -> bool:
+    """Prüft, ob ein Projekt existiert, ohne es zu laden."""
+    return db.query(Project.id).filter(Project.id == project_id).first() is not None
+
+
 def _extract_features(geojson_str: Optional[str]) -> List[Any]:
     """Parse a geojson_representation string and return a flat list of GeoJSON Features."""
     if not geojson_str:
@@ -56,42 +91,156 @@ def _extract_features(geojson_str: Optional[str]) -> List[Any]:
     return []
 
 
-def recompute_parent_geojson(db: Session, project: Project) -> None:
-    """Recompute and persist the geojson_representation of every ancestor of *project*.
+def _shape_or_none(geometry: Any) -> Optional[BaseGeometry]:
+    """Convert a GeoJSON geometry dict to a Shapely geometry (``None`` if invalid or empty)."""
+    if not isinstance(geometry, dict):
+        return None
+    try:
+        geom = shape(geometry)
+    except (ShapelyError, ValueError, TypeError, AttributeError, KeyError):
+        return None
+    return None if geom.is_empty else geom
 
-    Walks the superior_project chain upwards. At each level, all direct children's
-    geojson_representations are flattened into a FeatureCollection and stored on the
-    parent. The recursion stops when a project has no superior project.
-    """
-    if project.superior_project_id is None:
-        return
 
-    parent = get_project_by_id(db, project.superior_project_id)
-    if parent is None:
-        return
+def _geometry_from_geojson(geojson_str: Optional[str]) -> Optional[WKBElement]:
+    """Collect all feature geometries of a geojson_representation into one GEOMETRYCOLLECTION."""
+    geoms = [
+        geom
+        for geom in (_shape_or_none(f.get("geometry")) for f in _extract_features(geojson_str))
+        if geom is not None
+    ]
+    if not geoms:
+        return None
+    return from_shape(GeometryCollection(geoms), srid=4326)
 
-    children = (
-        db.query(Project)
-        .filter(Project.superior_project_id == parent.id)
-        .all()
-    )
 
-    features: List[Any] = []
-    for child in children:
-        features.extend(_extract_features(child.geojson_representation))
+def sync_project_geometry(project: Project) -> None:
+    """Derive ``geometry`` and ``centroid`` from ``geojson_representation``.
+
+    Must be called whenever ``geojson_representation`` is written. The centroid
+    is computed by PostGIS (``ST_Centroid``) when the session flushes.
+    """
+    geometry = _geometry_from_geojson(project.geojson_representation)
+    project.geometry = geometry
+    project.centroid = geometry.ST_Centroid() if geometry is not None else None
+
 
+def _apply_child_features(parent: Project, features: List[Any]) -> None:
+    """Store the merged child *features* on *parent* and re-derive its typed geometry."""
     if features:
         parent.geojson_representation = json.dumps(
             {"type": "FeatureCollection", "features": features}
         )
     else:
         parent.geojson_representation = None
+    sync_project_geometry(parent)
+
+
+def ancestor_chain_cte(parent_ids: Iterable[int]):
+    """Recursive CTE yielding *parent_ids* and the ids of all projects above them.
+
+    ``UNION`` (not ``UNION ALL``) terminates on accidental cycles in the
+    superior_project chain and de-duplicates ancestors shared by several chains.
+    """
+    chain = (
+        select(Project.id, Project.superior_project_id)
+        .where(Project.id.in_(list(parent_ids)))
+        .cte("ancestors", recursive=True)
+    )
+    parent = aliased(Project)
+    return chain.union(
+        select(parent.id, parent.superior_project_id).join(chain, parent.id == chain.c.superior_project_id)
+    )
+
+
+def _rollup(rows: List[Project], affected_ids: Set[int]) -> None:
+    """Merge child features bottom-up into every project of *affected_ids*.
+
+    *rows* must contain each affected project and all of its direct children.
+    Every child's geojson is parsed at most once and a recomputed parent's
+    features are reused directly at the level above it.
+    """
+    children_of: Dict[int, List[Project]] = {}
+    for p in rows:
+        if p.superior_project_id is not None:
+            children_of.setdefault(p.superior_project_id, []).append(p)
+
+    features_cache: Dict[int, List[Any]] = {}
+
+    def _features(p: Project) -> List[Any]:
+        if p.id in features_cache:
+            return features_cache[p.id]
+        # Mark before descending so a cyclic chain cannot recurse forever.
+        features_cache[p.id] = []
+        if p.id in affected_ids:
+            features: List[Any] = []
+            for child in children_of.get(p.id, []):
+                features.extend(_features(child))
+            _apply_child_features(p, features)
+        else:
+            features = _extract_features(p.geojson_representation)
+        features_cache[p.id] = features
+        return features
+
+    for p in rows:
+        if p.id in affected_ids:
+            _features(p)
+
+
+def recompute_parents_geojson(db: Session, projects: Iterable[Project]) -> None:
+    """Recompute the geojson_representation of every ancestor of *projects*.
+
+    All ancestor chains and their direct children are loaded in one query
+    (recursive CTE); an ancestor shared by several projects is recomputed once.
+    Nothing is committed — the caller owns the transaction.
+    """
+    parent_ids = {p.superior_project_id for p in projects if p.superior_project_id is not None}
+    if not parent_ids:
+        return
+
+    ancestor_ids = select(ancestor_chain_cte(parent_ids).c.id)
+    rows = (
+        db.query(Project)
+        .options(load_only(Project.id, Project.superior_project_id, Project.geojson_representation))
+        .filter(or_(Project.id.in_(ancestor_ids), Project.superior_project_id.in_(ancestor_ids)))
+        .all()
+    )
+    by_id = {p.id: p for p in rows}
+    affected: Set[int] = set()
+    for parent_id in parent_ids:
+        parent = by_id.get(parent_id)
+        while parent is not None and parent.id not in affected:
+            affected.add(parent.id)
+            parent = by_id.get(parent.superior_project_id)
+
+    _rollup(rows, affected)
 
-    db.commit()
-    db.refresh(parent)
 
-    # Recurse upwards to update grandparent, great-grandparent, …
-    recompute_parent_geojson(db, parent)
+def recompute_parent_geojson(db: Session, project: Project) -> None:
+    """Recompute the geojson_representation of every ancestor of *project*.
+
+    See :func:`recompute_parents_geojson`. Nothing is committed.
+    """
+    recompute_parents_geojson(db, [project])
+
+
+def recompute_all_parent_geojson(db: Session) -> int:
+    """Recompute the geojson_representation of every project that has children.
+
+    Intended for bulk imports that (re)assign many superior projects at once:
+    all projects are loaded in one query, the hierarchy is merged bottom-up with
+    every geometry parsed at most once, and the result is committed in one
+    transaction. Returns the number of recomputed parent projects.
+    """
+    rows = (
+        db.query(Project)
+        .options(load_only(Project.id, Project.superior_project_id, Project.geojson_representation))
+        .all()
+    )
+    parent_ids = {p.superior_project_id for p in rows if p.superior_project_id is not None}
+    _rollup(rows, parent_ids)
+    db.commit()
+    return len(parent_ids & {p.id for p in rows})
 
 
 def create_project(db: Session, data: dict) -> Project:
@@ -100,6 +249,8 @@ def create_project(db: Session, data: dict) -> Project:
     group_ids = data.pop("project_group_ids", None)
 
     project = Project(**data)
+    if project.geojson_representation is not None:
+        sync_project_geometry(project)
     if group_ids:
         project.project_groups = (
             db.query(ProjectGroup).filter(ProjectGroup.id.in_(group_ids)).all()
@@ -132,16 +283,93 @@ def update_project(db: Session, project_id: int, update_data: dict, project: Pro
 
     for key, value in update_data.items():
         setattr(project, key, value)
-    db.commit()
-    db.refresh(project)
-
-    # Cascade geometry upwards only when the geometry actually changed
+    # Cascade geometry upwards only when the geometry actually changed; the
+    # project and all its ancestors are committed together below.
     if geojson_changed:
+        sync_project_geometry(project)
         recompute_parent_geojson(db, project)
+    db.commit()
+    db.refresh(project)
 
     return project
 
 
+def get_project_geometry_metrics(db: Session, project_id: int) -> Optional[Dict[str, Any]]:
+    """Return bbox, centroid and line length of a project's geometry, computed by PostGIS.
+
+    Returns ``None`` when the project does not exist or has no geometry.
+    """
+    row = (
+        db.query(
+            Project.geometry.ST_Envelope().ST_AsGeoJSON().label("envelope"),
+            Project.geometry.ST_Centroid().ST_AsGeoJSON().label("centroid"),
+            # geography cast → metres on the spheroid; points/polygons contribute 0
+            Project.geometry.ST_CollectionExtract(2).cast(Geography(srid=4326)).ST_Length().label("length_m"),
+        )
+        .filter(Project.id == project_id, Project.geometry.isnot(None))
+        .first()
+    )
+    if row is None:
+        return None
+    return {
+        "bbox": json.loads(row.envelope),
+        "centroid": json.loads(row.centroid),
+        "length_km": (row.length_m or 0.0) / 1000.0,
+    }
+
+
+def get_projects_by_ids(db: Session, project_ids: Iterable[int]) -> List[Project]:
+    """Load several projects (incl. drafts) with one ``IN`` query."""
+    ids = list(project_ids)
+    if not ids:
+        return []
+    return (
+        db.query(Project)
+        .options(selectinload(Project.project_groups))
+        .filter(Project.id.in_(ids))
+        .all()
+    )
+
+
+def bulk_update_projects(db: Session, updates: List[tuple[Project, dict]]) -> List[Project]:
+    """Apply several partial updates and commit them in one transaction.
+
+    *updates* pairs already-loaded projects with their update dicts (same
+    semantics as :func:`update_project`). Group ids of all updates are resolved
+    with one query, and the parent geometry cascade runs once for the whole
+    batch so shared ancestors are recomputed only once.
+    """
+    all_group_ids = {
+        gid
+        for _, data in updates
+        for gid in (data.get("project_group_ids") or [])
+    }
+    groups_by_id = (
+        {g.id: g for g in db.query(ProjectGroup).filter(ProjectGroup.id.in_(all_group_ids)).all()}
+        if all_group_ids
+        else {}
+    )
+
+    geometry_changed: List[Project] = []
+    for project, update_data in updates:
+        update_data = dict(update_data)
+        group_ids = update_data.pop("project_group_ids", None)
+        if group_ids is not None:
+            project.project_groups = [groups_by_id[gid] for gid in group_ids if gid in groups_by_id]
+        for key, value in update_data.items():
+            setattr(project, key, value)
+        if "geojson_representation" in update_data:
+            sync_project_geometry(project)
+            geometry_changed.append(project)
+
+    if geometry_changed:
+        recompute_parents_geojson(db, geometry_changed)
+    db.commit()
+    for project, _ in updates:
+        db.refresh(project)
+    return [project for project, _ in updates]
+
+
 def finalize_project(db: Session, project_id: int):
     """Mark a draft project as finalized (no longer a draft)."""
     project = get_project_by_id(db, project_id)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime, timezone
 from typing import TYPE_CHECKING
 
+from sqlalchemy import case, func, insert
 from sqlalchemy.orm import Session, joinedload
 
+from dashboard_backend.crud.projects.progress_invalidation import invalidate_sources
 from dashboard_backend.models.projects.project import Project
+from dashboard_backend.models.vib.vib_draft_entry import VibDraftEntry
+from dashboard_backend.models.vib.vib_draft_image import VibDraftImage
 from dashboard_backend.models.vib.vib_draft_report import VibDraftReport
 from dashboard_backend.models.vib.vib_entry import VibEntry
 from dashboard_backend.models.vib.vib_entry_project import vib_entry_project
@@ -15,7 +20,9 @@ from dashboard_backend.schemas.vib import (
     VibConfirmEntryInput,
     VibConfirmResponse,
     VibEntryFieldsBase,
+    VibEntryProposed,
     VibEntryUpdateSchema,
+    VibParseTaskResult,
     VibPfaEntryProposed,
 )
 
@@ -41,45 +48,65 @@ def _pfa_from_schema(vib_entry_id: int, pfa_data: VibPfaEntryProposed) -> VibPfa
 # VibDraftReport (raw parse result persisted before user confirmation)
 # ---------------------------------------------------------------------------
 
+# Entries read per query when a whole draft is streamed (confirm, extraction).
+DRAFT_CHUNK_SIZE = 200
+
+
+def _draft_entry_values(entry: VibEntryProposed) -> dict:
+    return {
+        "vib_section": entry.vib_section,
+        "entry_json": entry.model_dump_json(),
+        "ai_extracted": entry.ai_extracted,
+        "ai_extraction_failed": entry.ai_extraction_failed,
+        "has_projects": bool(entry.project_ids),
+        "ai_carried_over": entry.ai_carried_over_from_year is not None,
+    }
+
+
 def save_draft_report(
     db: Session,
     task_id: str,
-    year: int,
-    raw_result_json: str,
+    result: VibParseTaskResult,
     user: "User | None",
     ocr_raw_text: str | None = None,
     ocr_status: str | None = None,
     ocr_model: str | None = None,
-    ocr_images_json: str | None = None,
+    ocr_images: list[dict] | None = None,
 ) -> VibDraftReport:
-    """Upsert the raw parse result JSON for a given task_id.
+    """Upsert the parse result for a given task_id (header + one row per entry).
+
+    ``ocr_images`` are references into the image store as built by
+    ``tasks.vib._store_ocr_images`` (image_id, page_index, sha256, media_type,
+    byte_size, has_thumbnail).
 
     If a draft for this task_id already exists (e.g. task retried) it is
     replaced so the latest result is always current.
     """
-    existing = db.query(VibDraftReport).filter(VibDraftReport.task_id == task_id).first()
-    if existing:
-        existing.raw_result_json = raw_result_json
-        existing.year = year
-        existing.ocr_raw_text = ocr_raw_text
-        existing.ocr_status = ocr_status
-        existing.ocr_model = ocr_model
-        existing.ocr_images_json = ocr_images_json
-        db.flush()
-        return existing
-
-    draft = VibDraftReport(
-        task_id=task_id,
-        year=year,
-        raw_result_json=raw_result_json,
-        created_by_user_id=user.id if user else None,
-        ocr_raw_text=ocr_raw_text,
-        ocr_status=ocr_status,
-        ocr_model=ocr_model,
-        ocr_images_json=ocr_images_json,
-    )
-    db.add(draft)
+    draft = db.query(VibDraftReport).filter(VibDraftReport.task_id == task_id).first()
+    if draft is None:
+        draft = VibDraftReport(task_id=task_id, created_by_user_id=user.id if user else None)
+        db.add(draft)
+    else:
+        db.query(VibDraftEntry).filter(VibDraftEntry.draft_id == draft.id).delete()
+        db.query(VibDraftImage).filter(VibDraftImage.draft_id == draft.id).delete()
+    draft.year = result.year
+    draft.drucksache_nr = result.drucksache_nr
+    draft.report_date = result.report_date
+    draft.ocr_raw_text = ocr_raw_text
+    draft.ocr_status = ocr_status
+    draft.ocr_model = ocr_model
     db.flush()
+    if result.entries:
+        db.execute(
+            insert(VibDraftEntry),
+            [
+                {"draft_id": draft.id, "position": position, **_draft_entry_values(entry)}
+                for position, entry in enumerate(result.entries)
+            ],
+        )
+    if ocr_images:
+        db.execute(insert(VibDraftImage), [{"draft_id": draft.id, **image} for image in ocr_images])
+    db.expire(draft, ["entries", "images"])
     return draft
 
 
@@ -93,17 +120,151 @@ def list_drafts(db: Session) -> list[VibDraftReport]:
 
 
 def delete_draft(db: Session, task_id: str) -> None:
+    draft_ids = db.query(VibDraftReport.id).filter(VibDraftReport.task_id == task_id)
+    for child in (VibDraftEntry, VibDraftImage):
+        db.query(child).filter(child.draft_id.in_(draft_ids.scalar_subquery())).delete(
+            synchronize_session=False
+        )
     db.query(VibDraftReport).filter(VibDraftReport.task_id == task_id).delete()
 
 
-def update_draft_ai_result(db: Session, task_id: str, raw_result_json: str) -> bool:
-    """Replace the raw_result_json of an existing draft. Returns False if not found."""
-    draft = get_draft_by_task_id(db, task_id)
-    if draft is None:
+def get_draft_images(db: Session, draft: VibDraftReport) -> list[VibDraftImage]:
+    return (
+        db.query(VibDraftImage)
+        .filter(VibDraftImage.draft_id == draft.id)
+        .order_by(VibDraftImage.page_index, VibDraftImage.id)
+        .all()
+    )
+
+
+def get_draft_image(db: Session, draft: VibDraftReport, image_id: str) -> VibDraftImage | None:
+    return (
+        db.query(VibDraftImage)
+        .filter(VibDraftImage.draft_id == draft.id, VibDraftImage.image_id == image_id)
+        .first()
+    )
+
+
+def count_draft_entries(db: Session, draft: VibDraftReport) -> int:
+    return db.query(func.count(VibDraftEntry.id)).filter(VibDraftEntry.draft_id == draft.id).scalar()
+
+
+def draft_entry_counts(db: Session, draft: VibDraftReport) -> dict[str, int]:
+    """Counters for the review header: total, matched, ai_failed, carried_over."""
+
+    def _count_true(column):
+        return func.coalesce(func.sum(case((column, 1), else_=0)), 0)
+
+    total, matched, ai_failed, carried_over = (
+        db.query(
+            func.count(VibDraftEntry.id),
+            _count_true(VibDraftEntry.has_projects),
+            _count_true(VibDraftEntry.ai_extraction_failed),
+            _count_true(VibDraftEntry.ai_carried_over),
+        )
+        .filter(VibDraftEntry.draft_id == draft.id)
+        .one()
+    )
+    return {
+        "total": total,
+        "matched": matched,
+        "ai_failed": ai_failed,
+        "carried_over": carried_over,
+    }
+
+
+def get_draft_entries(
+    db: Session, draft: VibDraftReport, offset: int = 0, limit: int | None = None
+) -> list[tuple[int, VibEntryProposed]]:
+    """Return ``(position, entry)`` pairs of a draft, ordered by position."""
+    query = (
+        db.query(VibDraftEntry.position, VibDraftEntry.entry_json)
+        .filter(VibDraftEntry.draft_id == draft.id)
+        .order_by(VibDraftEntry.position)
+        .offset(offset)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return [(pos, VibEntryProposed.model_validate_json(raw)) for pos, raw in query]
+
+
+def get_draft_entry(db: Session, draft: VibDraftReport, entry_idx: int) -> VibEntryProposed | None:
+    raw = (
+        db.query(VibDraftEntry.entry_json)
+        .filter(VibDraftEntry.draft_id == draft.id, VibDraftEntry.position == entry_idx)
+        .scalar()
+    )
+    return VibEntryProposed.model_validate_json(raw) if raw is not None else None
+
+
+def iter_draft_entries(
+    db: Session, draft: VibDraftReport, chunk_size: int | None = None
+) -> Iterator[VibEntryProposed]:
+    """Yield a draft's entries in order, reading ``chunk_size`` rows at a time
+    (default :data:`DRAFT_CHUNK_SIZE`).
+
+    Keyset-paginated on ``position``, so the caller may write to the session
+    (e.g. confirm inserting VibEntry rows) between chunks.
+    """
+    chunk_size = chunk_size or DRAFT_CHUNK_SIZE
+    last = -1
+    while True:
+        chunk = (
+            db.query(VibDraftEntry.position, VibDraftEntry.entry_json)
+            .filter(VibDraftEntry.draft_id == draft.id, VibDraftEntry.position > last)
+            .order_by(VibDraftEntry.position)
+            .limit(chunk_size)
+            .all()
+        )
+        for _, raw in chunk:
+            yield VibEntryProposed.model_validate_json(raw)
+        if len(chunk) < chunk_size:
+            return
+        last = chunk[-1][0]
+
+
+def draft_result(db: Session, draft: VibDraftReport) -> VibParseTaskResult:
+    """Assemble the full parse result of a draft (header + all entries)."""
+    return VibParseTaskResult(
+        year=draft.year,
+        drucksache_nr=draft.drucksache_nr,
+        report_date=draft.report_date,
+        entries=list(iter_draft_entries(db, draft)),
+    )
+
+
+def get_draft_entry_for_update(db: Session, task_id: str, entry_idx: int) -> VibEntryProposed | None:
+    """Current state of one draft entry, row-locked until the transaction ends.
+
+    Used to merge a result into what is stored now rather than into an older
+    snapshot, so an edit saved in the meantime is not overwritten.
+    """
+    raw = (
+        db.query(VibDraftEntry.entry_json)
+        .join(VibDraftReport, VibDraftReport.id == VibDraftEntry.draft_id)
+        .filter(VibDraftReport.task_id == task_id, VibDraftEntry.position == entry_idx)
+        .with_for_update(of=VibDraftEntry)
+        .scalar()
+    )
+    return VibEntryProposed.model_validate_json(raw) if raw is not None else None
+
+
+def update_draft_entry(db: Session, task_id: str, entry_idx: int, entry: VibEntryProposed) -> bool:
+    """Replace a single entry of a draft (review edit, per-entry AI checkpoint).
+
+    Only that entry's row is written, so edits to other entries saved in the
+    meantime are kept. Returns False if the draft or the index does not exist.
+    """
+    draft_id = db.query(VibDraftReport.id).filter(VibDraftReport.task_id == task_id).scalar()
+    if draft_id is None:
         return False
-    draft.raw_result_json = raw_result_json
+    updated = (
+        db.query(VibDraftEntry)
+        .filter(VibDraftEntry.draft_id == draft_id, VibDraftEntry.position == entry_idx)
+        .update(_draft_entry_values(entry), synchronize_session=False)
+    )
     db.flush()
-    return True
+    return bool(updated)
 
 
 # ---------------------------------------------------------------------------
@@ -114,6 +275,17 @@ def get_report_by_year(db: Session, year: int) -> VibReport | None:
     return db.query(VibReport).filter(VibReport.year == year).first()
 
 
+def get_previous_report(db: Session, year: int) -> VibReport | None:
+    """Latest confirmed report before ``year``, with entries and PFA rows loaded."""
+    return (
+        db.query(VibReport)
+        .options(joinedload(VibReport.entries).joinedload(VibEntry.pfa_entries))
+        .filter(VibReport.year < year)
+        .order_by(VibReport.year.desc())
+        .first()
+    )
+
+
 def get_report(db: Session, report_id: int) -> VibReport | None:
     return db.query(VibReport).filter(VibReport.id == report_id).first()
 
@@ -123,10 +295,17 @@ def list_reports(db: Session) -> list[VibReport]:
 
 
 def delete_report(db: Session, report_id: int) -> bool:
-    """Delete a VibReport and all its entries (cascade). Returns True when deleted."""
+    """Delete a VibReport and all its entries (cascade). Returns True when deleted.
+
+    The projects fed by the entries are queued for a progress recompute.
+    """
     report = get_report(db, report_id)
     if not report:
         return False
+    entry_ids = [
+        eid for (eid,) in db.query(VibEntry.id).filter(VibEntry.vib_report_id == report_id)
+    ]
+    invalidate_sources(db, VibEntry, entry_ids)
     db.delete(report)
     db.flush()
     return True
@@ -141,14 +320,17 @@ def create_vib_report_with_entries(
     year: int,
     drucksache_nr: str | None,
     report_date_str: str | None,
-    entries: list[VibConfirmEntryInput],
+    entries: Iterable[VibConfirmEntryInput | VibEntryProposed],
     user: "User | None",
 ) -> VibConfirmResponse:
     """Write a confirmed VIB import to the database.
 
     Creates one VibReport and one VibEntry per input entry, together with all
-    VibPfaEntry child rows.  The caller must call db.commit() after this
-    function returns.
+    VibPfaEntry child rows. ``entries`` may be a generator
+    (:func:`iter_draft_entries`), so a large draft is never held as a whole.
+    The caller must call db.commit() after this function returns; the linked
+    projects are then recomputed by one batched progress task (see
+    ``crud.projects.progress_invalidation``).
     """
     parsed_date: date | None = None
     if report_date_str:
@@ -169,6 +351,7 @@ def create_vib_report_with_entries(
 
     entries_created = 0
     pfa_entries_created = 0
+    entry_ids: list[int] = []
 
     for entry_data in entries:
         vib_entry = VibEntry(
@@ -179,6 +362,7 @@ def create_vib_report_with_entries(
         )
         db.add(vib_entry)
         db.flush()  # get vib_entry.id
+        entry_ids.append(vib_entry.id)
 
         if entry_data.project_ids:
             unique_pids = list(dict.fromkeys(entry_data.project_ids))
@@ -193,6 +377,9 @@ def create_vib_report_with_entries(
             db.add(_pfa_from_schema(vib_entry.id, pfa_data))
             pfa_entries_created += 1
 
+    db.flush()
+    invalidate_sources(db, VibEntry, entry_ids)
+
     return VibConfirmResponse(
         report_id=report.id,
         entries_created=entries_created,
@@ -277,6 +464,9 @@ def update_vib_entry(db: Session, entry_id: int, data: VibEntryUpdateSchema) ->
     if entry is None:
         return None
 
+    # Projects fed before the change (links/PFAs may be replaced below).
+    invalidate_sources(db, VibEntry, [entry_id])
+
     # Apply scalar content fields (shared set derived from VibEntryFieldsBase)
     for field in _ENTRY_CONTENT_FIELDS:
         value = getattr(data, field)
@@ -305,5 +495,6 @@ def update_vib_entry(db: Session, entry_id: int, data: VibEntryUpdateSchema) ->
             )
 
     db.flush()
+    invalidate_sources(db, VibEntry, [entry_id])
     db.expire(entry)
     return get_vib_entry_full(db, entry_id)
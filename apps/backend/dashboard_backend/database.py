@@ -2,9 +2,13 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from dashboard_backend.core.config import settings
+from dashboard_backend.crud.data_versions import register_version_tracking
+from dashboard_backend.crud.projects.progress_invalidation import register_progress_invalidation
 
 engine = create_engine(settings.database_url)
 Session = sessionmaker(autocommit=False, bind=engine)
+register_version_tracking(Session)
+register_progress_invalidation(Session)
 
 def get_db():
     db = Session()
@@ -17,7 +17,12 @@ def _routing_client() -> RoutingClient:
 
 @lru_cache()
 def _route_service() -> RouteService:
-    return RouteService(_routing_client(), settings.graph_version)
+    return RouteService(
+        _routing_client(),
+        settings.graph_version,
+        preview_cache_ttl_seconds=settings.route_preview_cache_ttl_seconds,
+        preview_cache_max_entries=settings.route_preview_cache_max_entries,
+    )
 
 
 def get_route_service() -> RouteService:
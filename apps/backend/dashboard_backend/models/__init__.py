@@ -11,4 +11,5 @@ from . import routes  # noqa: F401
 from . import haushalt  # noqa: F401
 from . import vib  # noqa: F401
 from .app_settings import AppSettings  # noqa: F401
+from .data_version import DataVersion  # noqa: F401
 from .guides import GuideSectionOverride  # noqa: F401
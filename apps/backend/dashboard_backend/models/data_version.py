@@ -0,0 +1,15 @@
+from sqlalchemy import BigInteger, Column, String
+
+from dashboard_backend.models.base import Base
+
+
+class DataVersion(Base):
+    """Monotonic change counter per data scope (e.g. ``projects``, ``vib``).
+
+    Bumped in the same transaction as every write to a table of the scope (see
+    ``crud/data_versions.py``); the public read endpoints derive their ETags from it.
+    """
+    __tablename__ = 'data_version'
+
+    scope = Column(String(50), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
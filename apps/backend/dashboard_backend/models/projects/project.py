@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, Index, String, Float, Boolean, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from geoalchemy2 import Geometry
 
 from dashboard_backend.models.base import Base
@@ -81,6 +81,10 @@ class Project(Base):
     # some additionale fields for Geojson and centroid to avoid anoying calculations
     geojson_representation = Column(Text)  # storing the GeoJSON as a text field
     centroid = Column(Geometry('POINT'))  # storing the centroid as a point geometry
+    # typed copy of geojson_representation, kept in sync on write
+    # (crud.projects.projects.sync_project_geometry); GiST-indexed for spatial filters.
+    # Deferred: only used inside SQL (bbox filter, metrics), never read into Python.
+    geometry = deferred(Column(Geometry('GEOMETRYCOLLECTION', srid=4326, spatial_index=False)))
 
     # Relationships
     bvwp_data = relationship(
@@ -125,3 +129,4 @@ class Project(Base):
     # indexes
     superior_project_id_index = Index('superior_project_content_id_index',
                                                          superior_project_id)
+    geometry_index = Index('ix_project_geometry_gist', geometry, postgresql_using='gist')
@@ -3,3 +3,4 @@ from .section_of_line import SectionOfLine
 from .sol_track import SOLTrack
 from .sol_track_parameter import SOLTrackParameter
 
+from .routing_topology import RoutingEdge, RoutingNode
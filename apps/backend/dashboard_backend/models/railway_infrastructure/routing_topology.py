@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Float, ForeignKey, Integer, String
+
+from dashboard_backend.models.base import Base
+
+
+class RoutingNode(Base):
+    """Graph vertex for routing: one row per operational point that ends a section of line.
+
+    The node id is the id of the operational point, so it stays stable across
+    differential RINF imports. Rebuilt by ``routing/topology.refresh_routing_topology``.
+    """
+    __tablename__ = 'routing_node'
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    op_id = Column(String, nullable=False, unique=True)
+    latitude = Column(Float)
+    longitude = Column(Float)
+
+    def __repr__(self):
+        return f"<RoutingNode(id={self.id}, op_id={self.op_id})>"
+
+
+class RoutingEdge(Base):
+    """Undirected graph edge for routing; the edge id is the id of the section of line."""
+    __tablename__ = 'routing_edge'
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    source = Column(Integer, ForeignKey('routing_node.id', ondelete='CASCADE'), nullable=False, index=True)
+    target = Column(Integer, ForeignKey('routing_node.id', ondelete='CASCADE'), nullable=False, index=True)
+    cost = Column(Float, nullable=False)
+
+    def __repr__(self):
+        return f"<RoutingEdge(id={self.id}, source={self.source}, target={self.target}, cost={self.cost})>"
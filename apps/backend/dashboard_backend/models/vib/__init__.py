@@ -2,4 +2,6 @@ from .vib_report import VibReport
 from .vib_entry import VibEntry
 from .vib_pfa_entry import VibPfaEntry
 from .vib_draft_report import VibDraftReport
+from .vib_draft_entry import VibDraftEntry
+from .vib_draft_image import VibDraftImage
 from .vib_entry_project import vib_entry_project
@@ -0,0 +1,37 @@
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from dashboard_backend.models.base import Base
+
+
+class VibDraftEntry(Base):
+    """One proposed Vorhaben of an unconfirmed VIB draft.
+
+    The review UI, the AI extraction and the confirm step read and write
+    single entries (by ``position``, the index in the parse result) instead of
+    re-serialising the whole report, so concurrent edits to different entries
+    do not overwrite each other.
+    """
+
+    __tablename__ = "vib_draft_entry"
+    __table_args__ = (
+        UniqueConstraint("draft_id", "position", name="uq_vib_draft_entry_draft_position"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    draft_id = Column(
+        Integer, ForeignKey("vib_draft_report.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    position = Column(Integer, nullable=False)
+    vib_section = Column(String(20), nullable=True)
+    # VibEntryProposed serialised as JSON string
+    entry_json = Column(Text, nullable=False)
+    # Denormalised from entry_json for filtering without parsing the payload
+    ai_extracted = Column(Boolean, nullable=False, server_default="false", default=False)
+    ai_extraction_failed = Column(Boolean, nullable=False, server_default="false", default=False)
+    has_projects = Column(Boolean, nullable=False, server_default="false", default=False)
+    ai_carried_over = Column(Boolean, nullable=False, server_default="false", default=False)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+    draft = relationship("VibDraftReport", back_populates="entries")
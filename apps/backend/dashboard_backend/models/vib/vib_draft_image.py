@@ -0,0 +1,31 @@
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import relationship
+
+from dashboard_backend.models.base import Base
+
+
+class VibDraftImage(Base):
+    """Reference to one OCR image of an unconfirmed VIB draft.
+
+    The bytes live in the content-addressed image store
+    (``utils/image_store.py``) under ``sha256``; the row only carries what the
+    gallery and the image endpoint need, so loading a draft stays small.
+    """
+
+    __tablename__ = "vib_draft_image"
+    __table_args__ = (
+        UniqueConstraint("draft_id", "image_id", name="uq_vib_draft_image_draft_image_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    draft_id = Column(
+        Integer, ForeignKey("vib_draft_report.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    image_id = Column(String(200), nullable=False)  # id from the OCR API, e.g. "img-0.jpeg"
+    page_index = Column(Integer, nullable=False)
+    sha256 = Column(String(64), nullable=False)
+    media_type = Column(String(50), nullable=False)
+    byte_size = Column(Integer, nullable=False)
+    has_thumbnail = Column(Boolean, nullable=False, server_default="false", default=False)
+
+    draft = relationship("VibDraftReport", back_populates="images")
@@ -10,7 +10,9 @@ class VibDraftReport(Base):
     completes — before the user reviews/corrects and confirms the import.
 
     This ensures the parse result survives Redis eviction and allows the user
-    to resume a review session without re-uploading the PDF.
+    to resume a review session without re-uploading the PDF. The report header
+    lives here, the proposed entries one row each in ``vib_draft_entry`` and
+    the OCR images as references in ``vib_draft_image``.
     """
 
     __tablename__ = "vib_draft_report"
@@ -18,8 +20,8 @@ class VibDraftReport(Base):
     id = Column(Integer, primary_key=True, index=True)
     task_id = Column(String(200), unique=True, nullable=False, index=True)
     year = Column(Integer, nullable=False, index=True)
-    # Full VibParseTaskResult serialised as JSON string
-    raw_result_json = Column(Text, nullable=False)
+    drucksache_nr = Column(String(50), nullable=True)
+    report_date = Column(String(20), nullable=True)  # ISO date string, as in VibParseTaskResult
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     created_by_user_id = Column(
         Integer,
@@ -29,8 +31,22 @@ class VibDraftReport(Base):
 
     # OCR extraction fields — populated by parse_vib_pdf when OCR is used
     ocr_raw_text = Column(Text, nullable=True)       # full OCR text before block-splitting
-    ocr_status = Column(String(20), nullable=True)   # "done" | "fallback" | "failed"
+    ocr_status = Column(String(20), nullable=True)   # "done" | "partial" | "fallback" | "failed"
     ocr_model = Column(String(100), nullable=True)   # e.g. "mistral-ocr-2512" or "pymupdf"
-    ocr_images_json = Column(Text, nullable=True)    # JSON list of {page_index, id, image_base64}
 
     created_by = relationship("User", foreign_keys=[created_by_user_id])
+    entries = relationship(
+        "VibDraftEntry",
+        back_populates="draft",
+        order_by="VibDraftEntry.position",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    # OCR images: references into the image store (utils/image_store.py)
+    images = relationship(
+        "VibDraftImage",
+        back_populates="draft",
+        order_by="[VibDraftImage.page_index, VibDraftImage.id]",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
@@ -2,7 +2,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 import logging
 
-from dashboard_backend.models.railway_infrastructure import OperationalPoint, SectionOfLine
+from dashboard_backend.models.railway_infrastructure import OperationalPoint
 
 # Konfigurieren des Loggings
 logger = logging.getLogger(__name__)
@@ -12,30 +12,19 @@ logger = logging.getLogger(__name__)
 # user-controlled data is ever interpolated into the query string.
 # All dynamic values (:start_op_id, :end_op_id) are passed as bound params.
 # ---------------------------------------------------------------------------
-_SQL_NODES = (
-    "SELECT op_id, ROW_NUMBER() OVER () AS node_id FROM operational_point"
-)
-
-_SQL_EDGES = (
-    "SELECT sol.id, n_start.node_id AS source, n_end.node_id AS target,"
-    " sol.sol_length AS cost"
-    " FROM section_of_line sol"
-    " JOIN (" + _SQL_NODES + ") n_start ON sol.sol_op_start = n_start.op_id"
-    " JOIN (" + _SQL_NODES + ") n_end ON sol.sol_op_end = n_end.op_id"
-)
+# The topology (routing_node / routing_edge) is precomputed after every RINF
+# import, see routing/topology.py; a query only reads the edge list.
+_SQL_EDGES = "SELECT id, source, target, cost FROM routing_edge"
 
 _SQL_ROUTE_QUERY = text(
-    "WITH nodes AS (" + _SQL_NODES + "),"
-    " start_node AS (SELECT node_id FROM nodes WHERE op_id = :start_op_id),"
-    " end_node AS (SELECT node_id FROM nodes WHERE op_id = :end_op_id)"
-    " SELECT sol.id AS section_of_line_id"
+    "SELECT di.edge AS section_of_line_id"
     " FROM pgr_dijkstra("
     "   $$ " + _SQL_EDGES + " $$,"
-    "   (SELECT node_id FROM start_node),"
-    "   (SELECT node_id FROM end_node),"
+    "   (SELECT id FROM routing_node WHERE op_id = :start_op_id),"
+    "   (SELECT id FROM routing_node WHERE op_id = :end_op_id),"
     "   directed := false"
     " ) AS di"
-    " JOIN section_of_line sol ON di.edge = sol.id"
+    " WHERE di.edge <> -1"
     " ORDER BY di.path_seq"
 )
 
@@ -43,7 +32,8 @@ _SQL_ROUTE_QUERY = text(
 def find_route_section_of_lines(db: Session, start_op_id: str, end_op_id: str) -> list[int]:
     """
     Findet die kürzeste Route zwischen zwei Betriebspunkten mithilfe von pgRouting (pgr_dijkstra).
-    Die Funktion baut die Graphentopologie zur Laufzeit aus den Tabellen 'operational_point' und 'section_of_line' auf.
+    Die Graphentopologie kommt aus den vorberechneten Tabellen 'routing_node' und 'routing_edge'
+    (siehe routing/topology.py); die Kanten-IDs sind die IDs der Streckenabschnitte.
 
     :param db: Die SQLAlchemy-Datenbanksitzung.
     :param start_op_id: Die RINF OP-ID des Startpunkts.
@@ -0,0 +1,307 @@
+"""In-process rail network graph for batch routing between operational points.
+
+``find_route_section_of_lines`` runs one pgRouting query per pair and the
+route previews go to GraphHopper. For analyses and project geometry
+generation that need hundreds of operational-point pairs, :class:`RailGraph`
+loads the persisted topology (``routing_node`` / ``routing_edge``, see
+``routing/topology.py``) once into a CSR adjacency (``indptr`` / ``indices``
+/ ``weights`` / ``edge_ids`` as typed arrays) and answers every query in
+memory:
+
+* :meth:`RailGraph.shortest_path` — A* with a haversine heuristic,
+* :meth:`RailGraph.distances_from` — one-to-many (Dijkstra, stops once all
+  targets are settled),
+* :meth:`RailGraph.distance_matrix` — many-to-many,
+* :meth:`RailGraph.k_shortest_paths` — Yen's loopless k shortest paths.
+
+Edges are undirected and weighted with ``sol_length`` like the pgRouting
+query. The heuristic is the great-circle distance times the smallest
+``cost / great-circle length`` ratio over all edges, so it never
+overestimates whatever unit ``sol_length`` is in; if an operational point has
+no coordinates, A* falls back to plain Dijkstra.
+
+:func:`get_rail_graph` keeps one graph per process and rebuilds it whenever
+the ``routing`` data version has moved, i.e. after every RINF import.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import threading
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from dashboard_backend.crud.data_versions import SCOPE_ROUTING, get_versions
+from dashboard_backend.models.railway_infrastructure import RoutingEdge, RoutingNode
+
+logger = logging.getLogger(__name__)
+
+_EARTH_RADIUS_KM = 6371.0
+
+
+class RailPath(NamedTuple):
+    op_ids: list[str]
+    section_ids: list[int]
+    cost: float
+
+
+class _Path(NamedTuple):
+    cost: float
+    nodes: list[int]
+    positions: list[int]  # CSR positions of the traversed half-edges
+
+
+def _haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; arguments in radians, scalars or arrays."""
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class RailGraph:
+    """Undirected rail network in CSR form, nodes addressed by RINF op_id."""
+
+    def __init__(
+        self,
+        nodes: Iterable[tuple[int, str, float | None, float | None]],
+        edges: Iterable[tuple[int, int, int, float]],
+    ):
+        """Build from ``(node_id, op_id, latitude, longitude)`` and
+        ``(edge_id, source_node_id, target_node_id, cost)`` rows."""
+        nodes = list(nodes)
+        self.op_ids: list[str] = [op_id for _, op_id, _, _ in nodes]
+        self._index = {op_id: i for i, op_id in enumerate(self.op_ids)}
+        position = {node_id: i for i, (node_id, _, _, _) in enumerate(nodes)}
+        n = len(nodes)
+
+        rows = [
+            (edge_id, position[source], position[target], cost)
+            for edge_id, source, target, cost in edges
+            if source in position and target in position and cost is not None and cost >= 0
+        ]
+        eid = np.array([r[0] for r in rows], dtype=np.int64)
+        src = np.array([r[1] for r in rows], dtype=np.int64)
+        dst = np.array([r[2] for r in rows], dtype=np.int64)
+        cost = np.array([r[3] for r in rows], dtype=np.float64)
+
+        # Both directions of every edge, grouped by tail node.
+        tails = np.concatenate([src, dst])
+        order = np.argsort(tails, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tails, minlength=n), out=indptr[1:])
+        # array.array keeps the CSR compact and yields plain Python numbers in
+        # the search loops, which is much faster than indexing numpy arrays.
+        self.indptr = array("q", indptr.tolist())
+        self.indices = array("q", np.concatenate([dst, src])[order].tolist())
+        self.weights = array("d", np.concatenate([cost, cost])[order].tolist())
+        self.edge_ids = array("q", np.concatenate([eid, eid])[order].tolist())
+
+        coords = np.array(
+            [(lat, lon) if lat is not None and lon is not None else (np.nan, np.nan) for _, _, lat, lon in nodes],
+            dtype=np.float64,
+        ).reshape(n, 2)
+        self._lat = np.radians(coords[:, 0])
+        self._lon = np.radians(coords[:, 1])
+        self._heuristic_scale = 0.0
+        if n and not np.isnan(coords).any() and len(rows):
+            length = _haversine_km(self._lat[src], self._lon[src], self._lat[dst], self._lon[dst])
+            moved = length > 0
+            if moved.any():
+                self._heuristic_scale = float(np.min(cost[moved] / length[moved]))
+
+    @classmethod
+    def from_db(cls, db: Session) -> "RailGraph":
+        nodes = db.execute(
+            select(RoutingNode.id, RoutingNode.op_id, RoutingNode.latitude, RoutingNode.longitude)
+            .order_by(RoutingNode.id)
+        ).all()
+        edges = db.execute(
+            select(RoutingEdge.id, RoutingEdge.source, RoutingEdge.target, RoutingEdge.cost)
+        ).all()
+        return cls(nodes, edges)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.op_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices) // 2
+
+    def _node(self, op_id: str) -> int:
+        try:
+            return self._index[op_id]
+        except KeyError:
+            raise ValueError(f"Betriebspunkt {op_id} ist nicht im Routing-Graphen.") from None
+
+    def _heuristic(self, goal: int) -> list[float]:
+        if not self._heuristic_scale:
+            return [0.0] * self.node_count
+        km = _haversine_km(self._lat, self._lon, self._lat[goal], self._lon[goal])
+        return (km * self._heuristic_scale).tolist()
+
+    def _search(
+        self,
+        source: int,
+        goal: int,
+        banned_nodes: frozenset[int] | set[int] = frozenset(),
+        banned_edges: frozenset[int] | set[int] = frozenset(),
+        h: list[float] | None = None,
+    ) -> _Path | None:
+        """A* from ``source`` to ``goal``; the heuristic is consistent, so
+        every node is settled at most once."""
+        indptr, indices, weights, edge_ids = self.indptr, self.indices, self.weights, self.edge_ids
+        if h is None:
+            h = self._heuristic(goal)
+        dist = {source: 0.0}
+        prev: dict[int, tuple[int, int]] = {}
+        heap = [(h[source], 0.0, source)]
+        while heap:
+            _, d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            if u == goal:
+                break
+            for pos in range(indptr[u], indptr[u + 1]):
+                v = indices[pos]
+                if v in banned_nodes or edge_ids[pos] in banned_edges:
+                    continue
+                nd = d + weights[pos]
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    prev[v] = (u, pos)
+                    heapq.heappush(heap, (nd + h[v], nd, v))
+        else:
+            return None
+
+        nodes, positions = [goal], []
+        while nodes[-1] != source:
+            u, pos = prev[nodes[-1]]
+            nodes.append(u)
+            positions.append(pos)
+        nodes.reverse()
+        positions.reverse()
+        return _Path(dist[goal], nodes, positions)
+
+    def _to_rail_path(self, path: _Path) -> RailPath:
+        return RailPath(
+            op_ids=[self.op_ids[i] for i in path.nodes],
+            section_ids=[self.edge_ids[pos] for pos in path.positions],
+            cost=path.cost,
+        )
+
+    def shortest_path(self, start_op_id: str, end_op_id: str) -> RailPath | None:
+        """Shortest route between two operational points, or None if they are not connected."""
+        path = self._search(self._node(start_op_id), self._node(end_op_id))
+        return self._to_rail_path(path) if path else None
+
+    def distances_from(self, start_op_id: str, targets: Iterable[str] | None = None) -> dict[str, float]:
+        """Route lengths from one operational point to ``targets`` (default: all nodes).
+
+        Unreachable targets are missing from the result.
+        """
+        source = self._node(start_op_id)
+        targets = list(targets) if targets is not None else None
+        pending = {self._node(t) for t in targets} if targets is not None else None
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        dist = {source: 0.0}
+        settled: dict[int, float] = {}
+        heap = [(0.0, source)]
+        while heap and (pending is None or pending):
+            d, u = heapq.heappop(heap)
+            if u in settled:
+                continue
+            settled[u] = d
+            if pending is not None:
+                pending.discard(u)
+            for pos in range(indptr[u], indptr[u + 1]):
+                v = indices[pos]
+                nd = d + weights[pos]
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+
+        if targets is None:
+            return {self.op_ids[i]: d for i, d in settled.items()}
+        return {t: settled[self._index[t]] for t in targets if self._index[t] in settled}
+
+    def distance_matrix(self, sources: Sequence[str], targets: Sequence[str]) -> np.ndarray:
+        """``len(sources) × len(targets)`` route lengths; ``inf`` where not connected."""
+        matrix = np.full((len(sources), len(targets)), np.inf)
+        for row, source in enumerate(sources):
+            distances = self.distances_from(source, targets)
+            for col, target in enumerate(targets):
+                if target in distances:
+                    matrix[row, col] = distances[target]
+        return matrix
+
+    def k_shortest_paths(self, start_op_id: str, end_op_id: str, k: int) -> list[RailPath]:
+        """Up to ``k`` loopless routes in ascending length (Yen's algorithm)."""
+        source, goal = self._node(start_op_id), self._node(end_op_id)
+        # All spur searches run towards the same goal.
+        h = self._heuristic(goal)
+        first = self._search(source, goal, h=h)
+        if first is None or k < 1:
+            return []
+
+        found = [first]
+        candidates: list[tuple[float, list[int], list[int]]] = []
+        seen = {tuple(first.positions)}
+        while len(found) < k:
+            last = found[-1]
+            for i in range(len(last.positions)):
+                root_nodes = last.nodes[: i + 1]
+                root_positions = last.positions[:i]
+                # Sections that continue an already found route from the same root.
+                banned_edges = {
+                    self.edge_ids[p.positions[i]]
+                    for p in found
+                    if len(p.positions) > i and p.nodes[: i + 1] == root_nodes
+                }
+                spur = self._search(root_nodes[-1], goal, set(root_nodes[:-1]), banned_edges, h)
+                if spur is None:
+                    continue
+                positions = root_positions + spur.positions
+                if tuple(positions) in seen:
+                    continue
+                seen.add(tuple(positions))
+                cost = sum(self.weights[pos] for pos in root_positions) + spur.cost
+                heapq.heappush(candidates, (cost, root_nodes[:-1] + spur.nodes, positions))
+            if not candidates:
+                break
+            found.append(_Path(*heapq.heappop(candidates)))
+        return [self._to_rail_path(p) for p in found]
+
+
+_lock = threading.Lock()
+_graph: RailGraph | None = None
+_graph_version: int | None = None
+
+
+def get_rail_graph(db: Session) -> RailGraph:
+    """Return the process-wide graph, rebuilding it if the routing data version changed."""
+    global _graph, _graph_version
+    version = get_versions(db, [SCOPE_ROUTING])[SCOPE_ROUTING]
+    with _lock:
+        if _graph is None or _graph_version != version:
+            _graph = RailGraph.from_db(db)
+            _graph_version = version
+            logger.info(
+                "Rail graph built: %d nodes, %d edges (routing version %d).",
+                _graph.node_count, _graph.edge_count, version,
+            )
+        return _graph
+
+
+def reset_rail_graph() -> None:
+    """Drop the cached graph (tests)."""
+    global _graph, _graph_version
+    with _lock:
+        _graph = None
+        _graph_version = None
@@ -0,0 +1,80 @@
+"""Persisted routing topology (``routing_node`` / ``routing_edge``).
+
+pgRouting needs integer vertex ids and an edge list ``(id, source, target,
+cost)``. Both are derived from the RINF tables once, after every import,
+instead of inside every route query:
+
+* a node per operational point that starts or ends a routable section of
+  line, with the id of the operational point — stable across differential imports;
+* an edge per routable (valid, with a length) section of line, with the
+  id of the section and ``sol_length`` as cost.
+
+Sections whose ``validity_date_end`` lies on or before the refresh date
+(e.g. expired by ``import_xml.py --diff``) are left out. Every refresh bumps
+the ``routing`` data version.
+"""
+
+import logging
+from datetime import date
+
+from sqlalchemy import and_, delete, func, insert, or_, select, union
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, aliased
+
+from dashboard_backend.crud.data_versions import SCOPE_ROUTING, bump_versions
+from dashboard_backend.models.railway_infrastructure import (
+    OperationalPoint,
+    RoutingEdge,
+    RoutingNode,
+    SectionOfLine,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_routing_topology(db: Connection | Session, as_of: date | None = None) -> tuple[int, int]:
+    """Rebuild routing_node / routing_edge from the RINF tables (no commit).
+
+    :return: Number of nodes and edges written.
+    """
+    as_of = as_of or date.today()
+    sol = SectionOfLine.__table__
+    op = OperationalPoint.__table__
+    nodes = RoutingNode.__table__
+    edges = RoutingEdge.__table__
+    routable = and_(
+        sol.c.sol_length.is_not(None),
+        or_(sol.c.validity_date_end.is_(None), sol.c.validity_date_end > as_of),
+    )
+
+    db.execute(delete(edges))
+    db.execute(delete(nodes))
+
+    endpoints = union(
+        select(sol.c.sol_op_start).where(routable),
+        select(sol.c.sol_op_end).where(routable),
+    )
+    db.execute(
+        insert(nodes).from_select(
+            ["id", "op_id", "latitude", "longitude"],
+            select(op.c.id, op.c.op_id, op.c.latitude, op.c.longitude).where(op.c.op_id.in_(endpoints)),
+        )
+    )
+
+    start = aliased(nodes)
+    end = aliased(nodes)
+    db.execute(
+        insert(edges).from_select(
+            ["id", "source", "target", "cost"],
+            select(sol.c.id, start.c.id, end.c.id, sol.c.sol_length)
+            .join(start, start.c.op_id == sol.c.sol_op_start)
+            .join(end, end.c.op_id == sol.c.sol_op_end)
+            .where(routable),
+        )
+    )
+
+    bump_versions(db, [SCOPE_ROUTING])
+    node_count = db.execute(select(func.count()).select_from(nodes)).scalar_one()
+    edge_count = db.execute(select(func.count()).select_from(edges)).scalar_one()
+    logger.info("Routing topology refreshed: %d nodes, %d edges.", node_count, edge_count)
+    return node_count, edge_count
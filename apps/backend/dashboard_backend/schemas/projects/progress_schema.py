@@ -197,6 +197,23 @@ class FinveProgressPhaseUpdate(BaseModel):
 # --- GET response ------------------------------------------------------------
 
 
+class ProjectProgressSummarySchema(BaseModel):
+    """Cached headline of one project for list views (``GET /projects/progress-summary``).
+
+    Read straight from the ``project_progress`` cache columns; ``computed_*`` is
+    null while a project has never been derived.
+    """
+
+    project_id: int
+    # manual override ?? computed; for a superior the subtree aggregation (as in the detail view)
+    effective_phase: Optional[MainPhaseLiteral] = None
+    computed_phase: Optional[MainPhaseLiteral] = None
+    computed_confidence: Optional[float] = None
+    computed_at: Optional[datetime] = None
+    is_overridden: bool = False
+    lifecycle_status: LifecycleStatusLiteral
+
+
 class ProjectProgressSchema(BaseModel):
     project_id: int
 
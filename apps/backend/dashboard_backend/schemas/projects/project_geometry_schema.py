@@ -0,0 +1,21 @@
+from typing import Any, Dict, List, Literal
+
+from pydantic import BaseModel
+
+
+class ProjectGeometryCollectionSchema(BaseModel):
+    """Merged GeoJSON FeatureCollection of project geometries for the map.
+
+    Each feature's properties carry ``project_id``, ``name`` and ``project_number``.
+    """
+
+    type: Literal["FeatureCollection"] = "FeatureCollection"
+    features: List[Dict[str, Any]] = []
+
+
+class ProjectGeometryMetricsSchema(BaseModel):
+    """Server-side (PostGIS) metrics of a project's geometry."""
+
+    bbox: Dict[str, Any]  # GeoJSON Polygon (ST_Envelope)
+    centroid: Dict[str, Any]  # GeoJSON Point (ST_Centroid)
+    length_km: float  # length of all line members on the WGS84 spheroid
@@ -94,6 +94,35 @@ class FinveListItemSchema(BaseModel):
     budgets: list[BudgetSummarySchema] = []
 
 
+def _serialize_centroid(v):
+    if v is None:
+        return None
+    from geoalchemy2.shape import to_shape
+    from shapely.geometry import mapping
+    return nan_to_none(mapping(to_shape(v)))  # sanitize coords
+
+
+class ProjectListItemSchema(BaseModel):
+    """Slim, geometry-free projection of a project for list and card views.
+
+    Deliberately omits ``geojson_representation`` and the property flags so the
+    CRUD layer can skip loading those columns (see ``get_project_list_items``).
+    """
+
+    id: int
+    name: str
+    project_number: Optional[str] = None
+    superior_project_id: Optional[int] = None
+    centroid: Optional[Any] = None
+    project_groups: list[ProjectGroupRef] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_serializer("centroid")
+    def serialize_centroid(self, v):
+        return _serialize_centroid(v)
+
+
 class ProjectSchema(BaseModel):
     id: Optional[int] = None
     name: str
@@ -164,11 +193,7 @@ class ProjectSchema(BaseModel):
 
     @field_serializer("centroid")
     def serialize_centroid(self, v):
-        if v is None:
-            return None
-        from geoalchemy2.shape import to_shape
-        from shapely.geometry import mapping
-        return nan_to_none(mapping(to_shape(v)))  # sanitize coords
+        return _serialize_centroid(v)
 
     @model_serializer(mode="wrap")
     def ser(self, serializer):
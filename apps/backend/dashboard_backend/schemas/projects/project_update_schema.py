@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Optional
 
+from pydantic import BaseModel
+
 from .project_fields_base import ProjectFieldsBase
 
 
@@ -9,3 +11,10 @@ class ProjectUpdate(ProjectFieldsBase):
     """Partial update schema for Project (PATCH semantics — all fields optional)."""
 
     geojson_representation: Optional[str] = None
+
+
+class ProjectBulkUpdateItem(BaseModel):
+    """One entry of ``PATCH /projects/bulk``: the target project and its partial update."""
+
+    id: int
+    changes: ProjectUpdate
@@ -11,6 +11,10 @@ class TaskStatusResponse(BaseModel):
 
 class TaskLaunchResponse(BaseModel):
     task_id: str
+    # Set by upload endpoints: digest of the stored document and whether an
+    # identical file had already been uploaded before.
+    upload_sha256: str | None = None
+    duplicate_upload: bool = False
 
 
 class DebugTaskRequest(BaseModel):
@@ -110,6 +110,9 @@ class VibEntryProposed(VibEntryFieldsBase):
     ai_extraction_failed: bool = False
     # Short error description when ai_extraction_failed=True (e.g. "429 capacity exceeded")
     ai_extraction_error: Optional[str] = None
+    # Report year whose confirmed fields were reused because raw_text is unchanged
+    # (no LLM call); None when the fields come from the LLM or the parser.
+    ai_carried_over_from_year: Optional[int] = None
 
 
 # ---------------------------------------------------------------------------
@@ -125,6 +128,36 @@ class VibParseTaskResult(BaseModel):
     entries: list[VibEntryProposed] = []
 
 
+class VibDraftEntryItem(BaseModel):
+    """One draft entry with its index in the parse result."""
+
+    idx: int
+    entry: VibEntryProposed
+
+
+class VibDraftEntryPage(BaseModel):
+    """A page of draft entries (GET /draft/{parse_task_id}/entries)."""
+
+    total: int
+    offset: int
+    limit: int
+    items: list[VibDraftEntryItem] = []
+
+
+class VibDraftSummarySchema(BaseModel):
+    """Header and counters of a draft (GET /draft/{parse_task_id}); the entries
+    themselves are read page by page from GET /draft/{parse_task_id}/entries."""
+
+    task_id: str
+    year: int
+    drucksache_nr: Optional[str] = None
+    report_date: Optional[str] = None
+    total: int
+    matched: int
+    ai_failed: int
+    carried_over: int
+
+
 # ---------------------------------------------------------------------------
 # Confirm request / response
 # ---------------------------------------------------------------------------
@@ -141,10 +174,15 @@ class VibConfirmEntryInput(VibEntryFieldsBase):
 
 
 class VibConfirmRequest(BaseModel):
+    """Confirm a draft. With ``use_draft`` the entries are read from the saved
+    draft ``task_id`` and ``entries`` must be empty; otherwise exactly the
+    given ``entries`` are imported."""
+
     task_id: str
     year: int
     drucksache_nr: Optional[str] = None
     report_date: Optional[str] = None
+    use_draft: bool = False
     entries: list[VibConfirmEntryInput] = []
 
 
@@ -253,6 +291,18 @@ class VibDraftSchema(BaseModel):
         return _as_utc(dt).isoformat()
 
 
+class VibDraftImageSchema(BaseModel):
+    """One OCR image of a draft (GET /draft/{task_id}/images); bytes are
+    served by GET /draft/{task_id}/image/{id}, ``?thumbnail=true`` for the
+    thumbnail."""
+
+    id: str
+    page_index: int
+    media_type: str
+    byte_size: int
+    has_thumbnail: bool
+
+
 class VibAiAvailableResponse(BaseModel):
     available: bool
     model: Optional[str] = None
@@ -3,37 +3,204 @@
 Single site for the OpenAI-compatible chat call (``json_object`` response
 format, ``temperature=0``) and for classifying API errors into the short
 labels shown in the review UIs. Timeout/retry policy changes belong here.
+Responses are served from the prompt-hash cache in ``services/llm_cache.py``
+when the same model has already answered the same prompts; ``use_cache=False``
+(explicit re-extraction) skips the lookup and overwrites the entry.
+
+The ``OpenAI`` client is created lazily once per worker process and reused,
+so bulk extractions keep their HTTP connections alive instead of paying a new
+pool and TLS handshake per block. Calls use ``LLM_CONNECT_TIMEOUT_SECONDS`` /
+``LLM_READ_TIMEOUT_SECONDS``; a 429, a 5xx or a connection error is retried up
+to ``LLM_MAX_RETRIES`` times with jittered exponential backoff (Retry-After
+wins when the server sends it). Callers that pace 429s themselves across
+workers (the VIB extraction's shared rate-limit gate) pass
+``retry_rate_limits=False`` so a 429 is raised at once instead of being slept
+on here as well. Per-process latency/token counters are available via
+:func:`metrics`.
 """
 
 from __future__ import annotations
 
 import json
+import logging
+import os
+import random
+import threading
+import time
 
 from dashboard_backend.core.config import settings
+from dashboard_backend.services import llm_cache
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single backoff sleep, also for a server's Retry-After.
+_MAX_BACKOFF_S = 60.0
+
+_client_lock = threading.Lock()
+_client = None
+_client_key: tuple | None = None
+
+_metrics_lock = threading.Lock()
+_metrics = {
+    "calls": 0,
+    "errors": 0,
+    "retries": 0,
+    "latency_seconds_total": 0.0,
+    "latency_seconds_max": 0.0,
+    "prompt_tokens": 0,
+    "completion_tokens": 0,
+}
+
+
+def get_client():
+    """Return the process-wide ``OpenAI`` client, creating it on first use.
+
+    The client is rebuilt when the LLM settings change or after a fork (a
+    Celery prefork child must not share its parent's connections).
+    """
+    global _client, _client_key
+    key = (
+        os.getpid(),
+        settings.llm_base_url,
+        settings.llm_api_key,
+        settings.llm_connect_timeout_seconds,
+        settings.llm_read_timeout_seconds,
+    )
+    with _client_lock:
+        if _client is None or _client_key != key:
+            import httpx
+            from openai import OpenAI  # lazy import — only loaded when extraction runs
+
+            _client = OpenAI(
+                base_url=settings.llm_base_url,
+                api_key=settings.llm_api_key or "no-key",
+                timeout=httpx.Timeout(
+                    settings.llm_read_timeout_seconds,
+                    connect=settings.llm_connect_timeout_seconds,
+                ),
+                max_retries=0,  # retried below with our own policy
+            )
+            _client_key = key
+        return _client
+
+
+def reset_client() -> None:
+    """Drop the pooled client (tests, settings changes)."""
+    global _client, _client_key
+    with _client_lock:
+        _client = None
+        _client_key = None
 
 
-def call_llm_json(system_prompt: str, prompt: str) -> dict:
+def metrics() -> dict:
+    """Return a copy of this process's LLM call counters."""
+    with _metrics_lock:
+        snapshot = dict(_metrics)
+    calls = snapshot["calls"]
+    snapshot["latency_seconds_avg"] = snapshot["latency_seconds_total"] / calls if calls else 0.0
+    return snapshot
+
+
+def reset_metrics() -> None:
+    with _metrics_lock:
+        for name in _metrics:
+            _metrics[name] = 0.0 if name.startswith("latency") else 0
+
+
+def _is_retryable(exc: Exception, retry_rate_limits: bool = True) -> bool:
+    from openai import APIConnectionError
+
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return (status == 429 and retry_rate_limits) or status >= 500
+    return isinstance(exc, APIConnectionError)
+
+
+def _backoff_seconds(exc: Exception, attempt: int) -> float:
+    """Retry-After if the server sent one, else full-jitter exponential backoff."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return min(max(float(headers.get("retry-after")), 0.0), _MAX_BACKOFF_S)
+    except (TypeError, ValueError):
+        ceiling = min(settings.llm_retry_backoff_seconds * 2**attempt, _MAX_BACKOFF_S)
+        return random.uniform(0, ceiling)
+
+
+def _record(latency: float, usage, retries: int, failed: bool) -> None:
+    with _metrics_lock:
+        _metrics["calls"] += 1
+        _metrics["retries"] += retries
+        _metrics["errors"] += int(failed)
+        _metrics["latency_seconds_total"] += latency
+        _metrics["latency_seconds_max"] = max(_metrics["latency_seconds_max"], latency)
+        if usage is not None:
+            _metrics["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+            _metrics["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+
+
+def call_llm_json(
+    system_prompt: str,
+    prompt: str,
+    *,
+    retry_rate_limits: bool = True,
+    use_cache: bool = True,
+) -> dict:
     """Send a prompt to the configured LLM and return the parsed JSON object.
 
     Caller is responsible for checking ``settings.llm_base_url`` beforehand
     and for handling exceptions (extraction is best-effort in all importers).
+    A cached response for the same model and prompts is returned without an
+    API call unless ``use_cache`` is False; the fresh answer is cached either
+    way. Transient API errors are retried before they are raised; with
+    ``retry_rate_limits=False`` a 429 is raised immediately for the caller's
+    own backoff.
     """
-    from openai import OpenAI  # lazy import — only loaded when extraction runs
+    model = settings.llm_model
+    if use_cache:
+        cached = llm_cache.load(model, system_prompt, prompt)
+        if cached is not None:
+            return cached
 
-    client = OpenAI(
-        base_url=settings.llm_base_url,
-        api_key=settings.llm_api_key or "no-key",
-    )
-    response = client.chat.completions.create(
-        model=settings.llm_model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt},
-        ],
-        response_format={"type": "json_object"},
-        temperature=0,
+    client = get_client()
+    started = time.perf_counter()
+    attempt = 0
+    while True:
+        try:
+            response = client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt},
+                ],
+                response_format={"type": "json_object"},
+                temperature=0,
+            )
+            break
+        except Exception as exc:
+            if attempt >= settings.llm_max_retries or not _is_retryable(exc, retry_rate_limits):
+                _record(time.perf_counter() - started, None, attempt, failed=True)
+                raise
+            delay = _backoff_seconds(exc, attempt)
+            attempt += 1
+            logger.warning(
+                "LLM call failed (%s), retry %d/%d in %.1fs",
+                summarise_error(exc), attempt, settings.llm_max_retries, delay,
+            )
+            time.sleep(delay)
+
+    latency = time.perf_counter() - started
+    usage = getattr(response, "usage", None)
+    _record(latency, usage, attempt, failed=False)
+    logger.debug(
+        "LLM call: %.2fs, %s prompt / %s completion tokens, %d retries",
+        latency,
+        getattr(usage, "prompt_tokens", "?"),
+        getattr(usage, "completion_tokens", "?"),
+        attempt,
     )
-    return json.loads(response.choices[0].message.content)
+    result = json.loads(response.choices[0].message.content)
+    llm_cache.store(model, system_prompt, prompt, result)
+    return result
 
 
 def summarise_error(exc: Exception) -> str:
@@ -0,0 +1,166 @@
+"""Persistent cache of LLM JSON responses, keyed by prompt hash.
+
+``call_llm_json`` runs with ``temperature=0``, so a response only depends on
+the model and the two prompts. Re-extracting a VIB draft, re-uploading the
+same Fulda PDF or re-submitting a media URL sends identical prompts; their
+responses are stored on disk keyed by ``sha256(model, system_prompt, prompt)``:
+
+    UPLOAD_DIR/llm-cache/<aa>/<key>.json.gz
+
+Entries older than ``LLM_CACHE_TTL_SECONDS`` count as a miss and are removed.
+Once the directory exceeds ``LLM_CACHE_MAX_MB``, the least recently written
+entries are evicted down to 90 % of the limit. Only parsed responses are
+stored; failed calls always go to the API again. Cache errors are logged and
+treated as a miss, and deleting the directory is always safe. Hit/miss counters
+are per process (:func:`stats`). Disabled with ``LLM_CACHE_ENABLED=false``.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from dashboard_backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored format changes; old entries then simply miss.
+CACHE_VERSION = 1
+
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+# Approximate size of the cache directory; None until the first write scans it.
+_size_bytes: int | None = None
+
+
+def _cache_root() -> Path:
+    return Path(settings.upload_dir).resolve() / "llm-cache"
+
+
+def cache_key(model: str, system_prompt: str, prompt: str) -> str:
+    raw = json.dumps([CACHE_VERSION, model, system_prompt, prompt], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    return _cache_root() / key[:2] / f"{key}.json.gz"
+
+
+def _count(name: str, n: int = 1) -> None:
+    with _lock:
+        _stats[name] += n
+
+
+def stats() -> dict:
+    """Return a copy of this process's counters (hits, misses, stores, evictions)."""
+    with _lock:
+        return dict(_stats)
+
+
+def reset_stats() -> None:
+    with _lock:
+        for name in _stats:
+            _stats[name] = 0
+
+
+def load(model: str, system_prompt: str, prompt: str) -> dict | None:
+    """Return the cached response for the prompt, or None on a miss."""
+    if not settings.llm_cache_enabled:
+        return None
+    path = _cache_path(cache_key(model, system_prompt, prompt))
+    try:
+        ttl = settings.llm_cache_ttl_seconds
+        if ttl > 0 and time.time() - path.stat().st_mtime > ttl:
+            path.unlink(missing_ok=True)
+            _count("misses")
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        response = payload["response"]
+    except FileNotFoundError:
+        _count("misses")
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("LLM cache entry %s unreadable, ignoring: %s", path.name, exc)
+        _count("misses")
+        return None
+    _count("hits")
+    return response
+
+
+def store(model: str, system_prompt: str, prompt: str, response: dict) -> None:
+    """Persist a response (atomic write; failures are logged, never raised)."""
+    global _size_bytes
+    if not settings.llm_cache_enabled:
+        return
+    path = _cache_path(cache_key(model, system_prompt, prompt))
+    payload = {"version": CACHE_VERSION, "model": model, "response": response}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".llm-")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False)
+            os.replace(tmp_name, path)
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+        written = path.stat().st_size
+    except OSError as exc:
+        logger.warning("LLM cache write failed for %s: %s", path.name, exc)
+        return
+    _count("stores")
+
+    limit = settings.llm_cache_max_mb * 1024 * 1024
+    if limit <= 0:
+        return
+    with _lock:
+        if _size_bytes is None:
+            _size_bytes = _directory_size()
+        else:
+            _size_bytes += written
+        over = _size_bytes > limit
+    if over:
+        _evict(int(limit * 0.9))
+
+
+def _entries() -> list[tuple[float, int, Path]]:
+    result = []
+    for path in _cache_root().glob("*/*.json.gz"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        result.append((st.st_mtime, st.st_size, path))
+    return result
+
+
+def _directory_size() -> int:
+    return sum(size for _, size, _ in _entries())
+
+
+def _evict(target_bytes: int) -> None:
+    """Delete the oldest entries until the cache is at most ``target_bytes``."""
+    global _size_bytes
+    entries = sorted(_entries(), key=lambda e: e[0])
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in entries:
+        if total <= target_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    with _lock:
+        _size_bytes = total
+    if removed:
+        _count("evictions", removed)
+        logger.info("LLM cache: evicted %d entries (now %.1f MB)", removed, total / 1e6)
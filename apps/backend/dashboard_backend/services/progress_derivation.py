@@ -337,15 +337,31 @@ class AggregationResult:
     display_phase: MainPhase
 
 
-def aggregate_tree(node: AggregationNode) -> AggregationResult:
+def aggregate_tree(
+    node: AggregationNode, memo: dict[int, AggregationResult] | None = None
+) -> AggregationResult:
     """Recursively aggregate a subtree of arbitrary depth.
 
     Leaves contribute their own phase; intermediate nodes span the union of all
     leaves below them, so a level-1 superior reflects diverging level-3 leaves —
     not a level-2 node's stale summary. A manual override on an intermediate node
     short-circuits the recursion and pins the whole subtree to that phase.
+
+    ``memo`` (keyed by ``id(node)``) lets a caller aggregating many nodes of one
+    shared tree compute every subtree only once.
     """
 
+    if memo is not None:
+        key = id(node)
+        if key not in memo:
+            memo[key] = _aggregate(node, memo)
+        return memo[key]
+    return _aggregate(node, None)
+
+
+def _aggregate(
+    node: AggregationNode, memo: dict[int, AggregationResult] | None
+) -> AggregationResult:
     if not node.children:
         phases = [node.leaf_phase] if node.leaf_is_known else []
         return AggregationResult(
@@ -367,7 +383,7 @@ def aggregate_tree(node: AggregationNode) -> AggregationResult:
 
     phases: list[MainPhase] = []
     for child in node.children:
-        phases.extend(aggregate_tree(child).phases)
+        phases.extend(aggregate_tree(child, memo).phases)
     span = aggregate_span(phases)
     display = span[1] if span is not None else MainPhase.NICHT_GESTARTET
     return AggregationResult(
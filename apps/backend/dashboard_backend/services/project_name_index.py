@@ -0,0 +1,227 @@
+"""Precomputed project-name index for the importers' fuzzy matching.
+
+The Haushalt, VIB, Fulda, Bauportal and Medien importers score every parsed
+name against every project name (``0.6 · SequenceMatcher ratio + 0.4 · token
+overlap`` on normalised names). Doing that pairwise is O(rows × projects)
+``SequenceMatcher`` runs. :class:`ProjectNameIndex` normalises and tokenises
+all project names once and keeps
+
+* an inverted token index, which yields the exact token-overlap term for every
+  project at once, and
+* a per-project character-count matrix, which bounds the ``SequenceMatcher``
+  ratio from above (its ``quick_ratio``) for all projects in one numpy pass.
+
+Only projects whose upper bound reaches the threshold are shortlisted for the
+real ``SequenceMatcher`` (one cached matcher per project name, so its lookup
+table is built once). :meth:`ProjectNameIndex.top` additionally visits the
+shortlist best-bound-first and stops as soon as no remaining bound can enter
+the result. Scores — and therefore the suggestions — are identical to the
+pairwise computation.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterable
+from difflib import SequenceMatcher
+
+import numpy as np
+
+_STRIP_PREFIXES = re.compile(
+    r"^(abs/nbs|nbs/abs|abs|nbs|neu-|aus-|um-)\s*",
+    re.IGNORECASE,
+)
+_PUNCTUATION = re.compile(r"[/\-–—,;:()\[\].]")
+_WHITESPACE = re.compile(r"\s+")
+
+# Weights of the combined score (full-string similarity weighs slightly more).
+_FULL_WEIGHT = 0.6
+_TOKEN_WEIGHT = 0.4
+# Float slack for the upper-bound filter; it only ever widens the shortlist.
+_BOUND_EPSILON = 1e-9
+
+
+def normalize_name(text: str) -> str:
+    """Normalise a name for fuzzy comparison.
+
+    Steps:
+    1. Unicode NFC normalise
+    2. Lowercase
+    3. Strip leading type prefixes (ABS, NBS, ABS/NBS …)
+    4. Replace punctuation / hyphens with spaces
+    5. Collapse whitespace
+    """
+    text = unicodedata.normalize("NFC", text)
+    text = text.lower()
+    text = _STRIP_PREFIXES.sub("", text)
+    text = _PUNCTUATION.sub(" ", text)
+    text = _WHITESPACE.sub(" ", text).strip()
+    return text
+
+
+def _token_score(tokens_a: set[str], tokens_b: set[str]) -> float:
+    if tokens_a and tokens_b:
+        return len(tokens_a & tokens_b) / max(len(tokens_a), len(tokens_b))
+    return 0.0
+
+
+def _weighted(full: float, token: float) -> float:
+    return _FULL_WEIGHT * full + _TOKEN_WEIGHT * token
+
+
+def _combined(a: str, b: str, tokens_a: set[str], tokens_b: set[str]) -> float:
+    full = SequenceMatcher(None, a, b, autojunk=False).ratio()
+    return _weighted(full, _token_score(tokens_a, tokens_b))
+
+
+def name_similarity(name_a: str, name_b: str) -> float:
+    """Return a similarity score in [0, 1] between two raw names."""
+    a = normalize_name(name_a)
+    b = normalize_name(name_b)
+    if not a or not b:
+        return 0.0
+    return _combined(a, b, set(a.split()), set(b.split()))
+
+
+class ProjectNameIndex:
+    """Normalised, tokenised project names with candidate shortlisting.
+
+    Accepts any objects with ``.id`` and ``.name`` (ORM ``Project`` rows, or
+    lightweight stand-ins); projects without a name are skipped. Results keep
+    the input order of the projects, so tie-breaking matches a plain loop.
+    """
+
+    def __init__(self, projects: Iterable):
+        self.projects = [p for p in projects if p.name]
+        self._ids = [p.id for p in self.projects]
+        self._names = [normalize_name(p.name) for p in self.projects]
+        self._tokens = [set(name.split()) for name in self._names]
+        self._lengths = np.array([len(name) for name in self._names], dtype=np.float64)
+        self._token_counts = np.array([len(t) for t in self._tokens], dtype=np.float64)
+        self._nonempty = self._lengths > 0
+
+        postings: dict[str, list[int]] = {}
+        for pos, tokens in enumerate(self._tokens):
+            for token in tokens:
+                postings.setdefault(token, []).append(pos)
+        self._postings = {t: np.array(p, dtype=np.intp) for t, p in postings.items()}
+
+        alphabet = sorted({ch for name in self._names for ch in name})
+        self._char_column = {ch: col for col, ch in enumerate(alphabet)}
+        self._char_counts = np.zeros((len(self._names), len(alphabet)), dtype=np.int32)
+        for pos, name in enumerate(self._names):
+            for ch, count in Counter(name).items():
+                self._char_counts[pos, self._char_column[ch]] = count
+
+        # ``SequenceMatcher`` caches its index over the second sequence; keep
+        # one per project name and only swap in the query (``set_seq1``).
+        self._matchers: dict[int, SequenceMatcher] = {}
+        self._groups: dict[Callable, dict[Hashable, list[int]]] = {}
+
+    @classmethod
+    def of(cls, projects) -> "ProjectNameIndex":
+        """Return ``projects`` if it already is an index, else build one."""
+        return projects if isinstance(projects, cls) else cls(projects)
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+    def group_by(self, key: Callable[[object], Hashable | None]) -> dict[Hashable, list[int]]:
+        """Project ids grouped by ``key(project)`` (``None`` keys are dropped).
+
+        Memoised per ``key`` function, so per-project lookups such as the VDE
+        number are computed once per index instead of once per query.
+        """
+        groups = self._groups.get(key)
+        if groups is None:
+            groups = {}
+            for project in self.projects:
+                value = key(project)
+                if value is not None:
+                    groups.setdefault(value, []).append(project.id)
+            self._groups[key] = groups
+        return groups
+
+    def _shortlist(
+        self, a: str, tokens_a: set[str], threshold: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Positions whose score upper bound reaches ``threshold`` (input order)
+        and their bounds."""
+        common = np.zeros(len(self._names), dtype=np.float64)
+        for token in tokens_a:
+            positions = self._postings.get(token)
+            if positions is not None:
+                common[positions] += 1
+        token_scores = common / np.maximum(self._token_counts, len(tokens_a))
+
+        # Characters of ``a`` that no project name contains match nothing.
+        query_counts = Counter(ch for ch in a if ch in self._char_column)
+        if query_counts:
+            columns = [self._char_column[ch] for ch in query_counts]
+            matched = np.minimum(
+                self._char_counts[:, columns], np.array(list(query_counts.values()))
+            ).sum(axis=1)
+        else:
+            matched = np.zeros(len(self._names))
+        full_bound = 2.0 * matched / (self._lengths + len(a))
+
+        bound = _weighted(full_bound, token_scores)
+        positions = np.flatnonzero(self._nonempty & (bound >= threshold - _BOUND_EPSILON))
+        return positions, bound[positions]
+
+    def _score(self, pos: int, a: str, tokens_a: set[str]) -> float:
+        matcher = self._matchers.get(pos)
+        if matcher is None:
+            matcher = SequenceMatcher(None, "", self._names[pos], autojunk=False)
+            self._matchers[pos] = matcher
+        matcher.set_seq1(a)
+        return _weighted(matcher.ratio(), _token_score(tokens_a, self._tokens[pos]))
+
+    def scores(self, name: str, threshold: float) -> list[tuple[float, int]]:
+        """``(score, project_id)`` for every project scoring ``>= threshold``,
+        in input order. Scores equal :func:`name_similarity` exactly."""
+        a = normalize_name(name)
+        if not a or not self.projects:
+            return []
+        tokens_a = set(a.split())
+        result: list[tuple[float, int]] = []
+        positions, _ = self._shortlist(a, tokens_a, threshold)
+        for pos in positions:
+            score = self._score(pos, a, tokens_a)
+            if score >= threshold:
+                result.append((score, self._ids[pos]))
+        return result
+
+    def top(self, name: str, threshold: float, limit: int) -> list[int]:
+        """Up to ``limit`` project ids scoring ``>= threshold``, best first
+        (stable: equal scores keep input order)."""
+        a = normalize_name(name)
+        if not a or not self.projects or limit <= 0:
+            return []
+        tokens_a = set(a.split())
+        positions, bounds = self._shortlist(a, tokens_a, threshold)
+
+        found: list[tuple[float, int]] = []
+        kept: list[float] = []  # min-heap of the ``limit`` best scores so far
+        for i in np.argsort(-bounds, kind="stable"):
+            # Every remaining project scores below the current ``limit``-th best.
+            if len(kept) == limit and bounds[i] < kept[0] - _BOUND_EPSILON:
+                break
+            pos = int(positions[i])
+            score = self._score(pos, a, tokens_a)
+            if score < threshold:
+                continue
+            found.append((score, pos))
+            heapq.heappush(kept, score)
+            if len(kept) > limit:
+                heapq.heappop(kept)
+        found.sort(key=lambda x: (-x[0], x[1]))
+        return [self._ids[pos] for _, pos in found[:limit]]
+
+    def best(self, name: str, threshold: float) -> int | None:
+        """The best-scoring project id ``>= threshold`` (first on ties), or None."""
+        top = self.top(name, threshold, 1)
+        return top[0] if top else None
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import copy
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Dict, Iterable, Sequence
 
-from geoalchemy2.shape import from_shape
+from geoalchemy2.shape import from_shape, to_shape
 from shapely.geometry import LineString, Polygon
 from sqlalchemy.orm import Session
 
 from dashboard_backend.crud.routes import (
+    get_route_by_cache_key,
     list_routes_for_project,
     persist_route,
 )
@@ -15,12 +20,60 @@ from dashboard_backend.services.exceptions import RoutingNoPathError
 from dashboard_backend.services.routing_client import RoutingClient
 
 
+class _PreviewCache:
+    """Bounded in-process TTL cache of route preview Features, keyed by cache_key.
+
+    Least recently used entries are evicted once ``max_entries`` is reached;
+    ``max_entries`` 0 disables the cache.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, feature = entry
+            if self._ttl > 0 and time.monotonic() - stored_at > self._ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(feature)
+
+    def put(self, key: str, feature: Dict[str, Any]) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(feature))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
 class RouteService:
-    """Coordinates caching, persistence and microservice interaction."""
+    """Coordinates caching, persistence and microservice interaction.
+
+    Previews are read through two cache layers, both keyed by ``cache_key``
+    (which includes ``graph_version``, so a new graph misses both): the
+    persisted ``routes`` table and a bounded TTL cache of unconfirmed previews.
+    """
 
-    def __init__(self, routing_client: RoutingClient, graph_version: str) -> None:
+    def __init__(
+        self,
+        routing_client: RoutingClient,
+        graph_version: str,
+        *,
+        preview_cache_ttl_seconds: float = 3600,
+        preview_cache_max_entries: int = 256,
+    ) -> None:
         self._routing_client = routing_client
         self._graph_version = graph_version
+        self._preview_cache = _PreviewCache(preview_cache_ttl_seconds, preview_cache_max_entries)
 
     async def list_for_project(
         self, db: Session, project_id: int, *, limit: int, offset: int
@@ -29,6 +82,7 @@ class RouteService:
 
     async def calculate_only(
         self,
+        db: Session,
         waypoints: Iterable[Dict[str, float]],
         profile: str,
         options: Dict[str, Any],
@@ -36,18 +90,29 @@ class RouteService:
         """Calculate a route via GraphHopper and return a GeoJSON Feature.
 
         Nothing is written to the database. The feature's properties include
-        all data needed to later confirm and persist the route.
+        all data needed to later confirm and persist the route. A route that
+        was already persisted or previewed with the same waypoints, profile,
+        options and graph version is returned without calling GraphHopper.
         """
         waypoints = list(waypoints)
         cache_key = route_hash(waypoints, profile, options, self._graph_version)
 
+        cached = self._preview_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        stored = get_route_by_cache_key(db, cache_key)
+        if stored is not None and stored.graph_version == self._graph_version:
+            feature = self._route_to_feature(stored)
+            self._preview_cache.put(cache_key, feature)
+            return feature
+
         response = await self._routing_client.route(waypoints, profile, options)
         path = self._extract_path(response)
         line = self._build_line(path)
         bbox = self._build_bbox(line)
         minx, miny, maxx, maxy = bbox.bounds
 
-        return {
+        feature = {
             "type": "Feature",
             "geometry": {
                 "type": "LineString",
@@ -63,6 +128,8 @@ class RouteService:
                 "cache_key": cache_key,
             },
         }
+        self._preview_cache.put(cache_key, feature)
+        return feature
 
     def confirm_and_store(
         self,
@@ -86,6 +153,29 @@ class RouteService:
         )
         return persist_route(db, route)
 
+    @staticmethod
+    def _route_to_feature(route: Route) -> Dict[str, Any]:
+        """Rebuild the preview Feature of a persisted route."""
+        line = to_shape(route.geom)
+        bbox = to_shape(route.bbox) if route.bbox is not None else line.envelope
+        minx, miny, maxx, maxy = bbox.bounds
+        return {
+            "type": "Feature",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [[float(x), float(y)] for x, y in line.coords],
+            },
+            "properties": {
+                "distance_m": float(route.distance_m),
+                "duration_ms": int(route.duration_ms),
+                "profile": route.profile,
+                "graph_version": route.graph_version,
+                "bbox": [float(minx), float(miny), float(maxx), float(maxy)],
+                "details": route.details or {},
+                "cache_key": route.cache_key,
+            },
+        }
+
     def _feature_to_parts(
         self, feature: Dict[str, Any]
     ) -> tuple[LineString, Any, Dict[str, Any]]:
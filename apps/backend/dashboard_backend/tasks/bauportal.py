@@ -19,6 +19,7 @@ from sqlalchemy.orm import Session
 
 from dashboard_backend.models.projects.bauportal_status import BauportalStatus
 from dashboard_backend.models.projects.project import Project
+from dashboard_backend.services.project_name_index import ProjectNameIndex
 from dashboard_backend.tasks.vib_matching import suggest_project_for_bauportal
 
 BAUPORTAL_API_URL = "https://bauprojekte.deutschebahn.com/api/getProjectsList"
@@ -66,7 +67,8 @@ def import_bauportal(db: Session, records: list[dict] | None = None) -> dict:
     if records is None:
         records = fetch_bauportal_projects()
 
-    projects = db.query(Project).all()
+    # Indexed once for all records instead of re-normalising every name per record.
+    projects = ProjectNameIndex(db.query(Project).all())
 
     existing = {row.bauportal_id: row for row in db.query(BauportalStatus).all()}
     created = updated = skipped = 0
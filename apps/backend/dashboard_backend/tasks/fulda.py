@@ -12,6 +12,7 @@ import logging
 from dashboard_backend.celery_app import celery_app
 from dashboard_backend.crud import fulda as fulda_crud
 from dashboard_backend.database import Session
+from dashboard_backend.utils import blob_store
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,13 @@ class _UserProxy:
 @celery_app.task(bind=True)
 def parse_fulda_pdf(
     self,
-    pdf_bytes: bytes,
+    pdf_sha256: str,
     year: int,
     pdf_filename: str,
     user_info: dict,
 ) -> dict:
-    """OCR + LLM extract a Fulda PDF into draft announcement rows.
+    """OCR + LLM extract a Fulda PDF (by its upload-store digest) into draft
+    announcement rows.
 
     Returns the summary dict ``{ocr_status, created, source_label}``.
     """
@@ -44,12 +46,14 @@ def parse_fulda_pdf(
     )
     db = Session()
     try:
-        summary = fulda_crud.parse_and_store(
-            db,
-            pdf_bytes=pdf_bytes,
-            year=year,
-            user=_UserProxy(user_info) if user_info else None,
-        )
+        with blob_store.open_blob(pdf_sha256) as pdf_data:
+            summary = fulda_crud.parse_and_store(
+                db,
+                pdf_bytes=pdf_data,
+                year=year,
+                user=_UserProxy(user_info) if user_info else None,
+                pdf_sha256=pdf_sha256,
+            )
         logger.info("parse_fulda_pdf finished: created=%d", summary["created"])
         return summary
     except Exception as exc:
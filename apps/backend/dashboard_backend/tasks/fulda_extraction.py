@@ -105,7 +105,7 @@ Mittelbedarf) lässt du weg. Erfinde nichts.
 _MAX_TEXT_CHARS = 60000
 
 
-def ocr_fulda_pdf(pdf_bytes: bytes) -> tuple[str, str, str]:
+def ocr_fulda_pdf(pdf_bytes: bytes, pdf_sha256: str | None = None) -> tuple[str, str, str]:
     """OCR a Fulda PDF. Returns (full_text, ocr_model, ocr_status)."""
     full_text, ocr_model, ocr_status, _images = extract_full_pdf_text(
         pdf_bytes=pdf_bytes,
@@ -113,6 +113,10 @@ def ocr_fulda_pdf(pdf_bytes: bytes) -> tuple[str, str, str]:
         base_url=settings.ocr_base_url,
         model=settings.ocr_model,
         strip_headers_footers=settings.ocr_strip_headers_footers,
+        chunk_pages=settings.ocr_chunk_pages,
+        max_concurrency=settings.ocr_max_concurrency,
+        chunk_retries=settings.ocr_chunk_retries,
+        pdf_sha256=pdf_sha256,
     )
     return full_text, ocr_model, ocr_status
 
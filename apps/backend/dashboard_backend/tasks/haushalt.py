@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import io
 import logging
+import mmap
 import re
 
 from celery import Task
+from sqlalchemy.orm import load_only
 
 from dashboard_backend.celery_app import celery_app
 
@@ -17,6 +19,8 @@ from dashboard_backend.database import Session
 from dashboard_backend.models.associations.finve_to_project import FinveToProject
 from dashboard_backend.models.projects.finve import Finve
 from dashboard_backend.models.projects.project import Project
+from dashboard_backend.services.project_name_index import ProjectNameIndex
+from dashboard_backend.utils import blob_store
 from dashboard_backend.tasks.finve_matching import suggest_projects_for_finve, suggest_projects_for_sv_erlaeuterung, suggest_per_erlaeuterung_project
 from dashboard_backend.schemas.haushalt_import import (
     HaushaltsParseResultSchema,
@@ -423,7 +427,7 @@ def _build_proposed(
 def _refresh_sv_suggestions(
     row: HaushaltsParseResultSchema,
     finve_projects: dict[int, list[int]] | None,
-    all_projects: list | None,
+    all_projects: ProjectNameIndex | list | None,
 ) -> None:
     """Recompute per-Erläuterung and whole-SV suggestions after new sub-lines.
 
@@ -448,7 +452,7 @@ def _parse_pdf(
     year: int,
     known_finve_ids: set[int],
     finve_projects: dict[int, list[int]] | None = None,
-    all_projects: list | None = None,
+    all_projects: ProjectNameIndex | list | None = None,
     task: Task | None = None,
 ) -> HaushaltsParseTaskResult:
     """Parse a Haushalt PDF and return a structured task result."""
@@ -459,7 +463,9 @@ def _parse_pdf(
 
     current_row: HaushaltsParseResultSchema | None = None
 
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+    # The upload store's memory map is already a seekable file object.
+    source = pdf_bytes if isinstance(pdf_bytes, mmap.mmap) else io.BytesIO(pdf_bytes)
+    with pdfplumber.open(source) as pdf:
         total_pages = len(pdf.pages)
         logger.info("Starting PDF parse: %d pages, year=%d", total_pages, year)
 
@@ -695,12 +701,12 @@ def _parse_pdf(
 @celery_app.task(bind=True)
 def parse_haushalt_pdf(
     self: Task,
-    pdf_bytes: bytes,
+    pdf_sha256: str,
     year: int,
     pdf_filename: str,
     user_info: dict,
 ) -> dict:
-    """Parse a Haushalt PDF and persist the result.
+    """Parse a Haushalt PDF (by its upload-store digest) and persist the result.
 
     Returns {"parse_result_id": int}.
     """
@@ -749,15 +755,19 @@ def parse_haushalt_pdf(
             finve_projects.setdefault(finve_id, []).append(project_id)
 
         # Load all projects for auto-suggestion matching
-        all_projects = db.query(Project).all()
+        # Indexed once for all FinVe rows; the matcher only reads id/name.
+        all_projects = ProjectNameIndex(
+            db.query(Project).options(load_only(Project.id, Project.name)).all()
+        )
         logger.info("Loaded %d projects for auto-suggestion matching", len(all_projects))
 
-        task_result = _parse_pdf(
-            pdf_bytes, year, known_ids,
-            finve_projects=finve_projects,
-            all_projects=all_projects,
-            task=self,
-        )
+        with blob_store.open_blob(pdf_sha256) as pdf_data:
+            task_result = _parse_pdf(
+                pdf_data, year, known_ids,
+                finve_projects=finve_projects,
+                all_projects=all_projects,
+                task=self,
+            )
 
         # Build a minimal user-like object from user_info dict for save_parse_result
         class _UserProxy:
@@ -0,0 +1,49 @@
+"""Celery beat task bounding the disk usage under ``UPLOAD_DIR``.
+
+Uploaded import PDFs (``blobs``) are only needed until their parse task has
+run, and OCR images (``ocr-images``) only while a VIB draft references them.
+Neither store deletes anything on its own, so this periodic task removes
+blobs older than ``UPLOAD_RETENTION_HOURS`` and images no ``vib_draft_image``
+row points to. The OCR and LLM caches bound themselves (TTL + size eviction).
+"""
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import select
+
+from dashboard_backend.celery_app import celery_app
+from dashboard_backend.core.config import settings
+from dashboard_backend.database import Session
+from dashboard_backend.models.vib import VibDraftImage
+from dashboard_backend.utils import blob_store, image_store
+
+logger = logging.getLogger(__name__)
+
+# Images younger than this are kept even when unreferenced: the parse task
+# stores them before it commits the draft rows pointing to them.
+ORPHAN_IMAGE_GRACE_SECONDS = 3600
+
+
+@celery_app.task
+def purge_upload_storage() -> dict:
+    """Delete expired upload blobs and unreferenced OCR images.
+
+    Returns ``{"blobs_deleted": int, "images_deleted": int}``.
+    """
+    blobs_deleted = blob_store.purge_expired(settings.upload_retention_hours * 3600)
+    db = Session()
+    try:
+        referenced = set(db.scalars(select(VibDraftImage.sha256).distinct()))
+    except Exception as exc:
+        logger.exception("purge_upload_storage failed: %s", exc)
+        raise
+    finally:
+        db.close()
+    images_deleted = image_store.purge_unreferenced(referenced, ORPHAN_IMAGE_GRACE_SECONDS)
+    logger.info(
+        "purge_upload_storage finished: blobs_deleted=%d images_deleted=%d",
+        blobs_deleted,
+        images_deleted,
+    )
+    return {"blobs_deleted": blobs_deleted, "images_deleted": images_deleted}
@@ -0,0 +1,194 @@
+"""Persistent cache of Mistral OCR results.
+
+A Mistral OCR run over a ~100-page VIB takes 60–120 s. The per-page result
+(markdown, tables, header, footer, images) only depends on the document, the
+page range and the OCR model, so it is stored on disk keyed by
+``(pdf sha256, start_page, end_page, ocr_model)``:
+
+    UPLOAD_DIR/ocr-cache/<aa>/<key>.json.gz
+
+A re-parse of the same upload (after a parser fix, or with a different
+``strip_headers_footers``) rebuilds the text from the cached pages via
+``vib_ocr._pages_to_text`` instead of calling the API again. Only successful
+Mistral runs are cached — the pymupdf fallback is cheap and must not shadow a
+later OCR run. Cache errors are logged and treated as a miss; deleting the
+directory is always safe. Disabled with ``OCR_CACHE_ENABLED=false``.
+
+Like the LLM cache, entries expire after ``OCR_CACHE_TTL_SECONDS`` and the
+oldest entries are evicted once the directory exceeds ``OCR_CACHE_MAX_MB``.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from dashboard_backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored page format changes; old entries then simply miss.
+CACHE_VERSION = 1
+
+_lock = threading.Lock()
+# Cache directory size as last measured + bytes written since; None = unknown.
+_size_bytes: int | None = None
+
+
+def _cache_root() -> Path:
+    return Path(settings.upload_dir).resolve() / "ocr-cache"
+
+
+def cache_key(pdf_sha256: str, start_page: int | None, end_page: int | None, ocr_model: str) -> str:
+    raw = json.dumps([CACHE_VERSION, pdf_sha256, start_page, end_page, ocr_model])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    return _cache_root() / key[:2] / f"{key}.json.gz"
+
+
+def page_record(page) -> dict:
+    """Serialise the fields of a Mistral OCR page that the text builders read."""
+    return {
+        "index": getattr(page, "index", 0),
+        "markdown": getattr(page, "markdown", "") or "",
+        "header": getattr(page, "header", None),
+        "footer": getattr(page, "footer", None),
+        "tables": [
+            {"id": tbl.id, "content": tbl.content}
+            for tbl in (getattr(page, "tables", None) or [])
+        ],
+        "images": [
+            {"id": getattr(img, "id", None), "image_base64": getattr(img, "image_base64", None)}
+            for img in (getattr(page, "images", None) or [])
+        ],
+    }
+
+
+def page_from_record(record: dict) -> SimpleNamespace:
+    """Rebuild a page object (attribute access like the Mistral model) from a record."""
+    return SimpleNamespace(
+        index=record["index"],
+        markdown=record["markdown"],
+        header=record["header"],
+        footer=record["footer"],
+        tables=[SimpleNamespace(**tbl) for tbl in record["tables"]],
+        images=[SimpleNamespace(**img) for img in record["images"]],
+    )
+
+
+def load_pages(
+    pdf_sha256: str, start_page: int | None, end_page: int | None, ocr_model: str
+) -> tuple[list, str] | None:
+    """Return ``(pages, model_used)`` for a cached OCR run, or None on a miss."""
+    if not settings.ocr_cache_enabled:
+        return None
+    path = _cache_path(cache_key(pdf_sha256, start_page, end_page, ocr_model))
+    try:
+        ttl = settings.ocr_cache_ttl_seconds
+        if ttl > 0 and time.time() - path.stat().st_mtime > ttl:
+            path.unlink(missing_ok=True)
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        return [page_from_record(r) for r in payload["pages"]], payload["model_used"]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("OCR cache entry %s unreadable, ignoring: %s", path.name, exc)
+        return None
+
+
+def store_pages(
+    pdf_sha256: str,
+    start_page: int | None,
+    end_page: int | None,
+    ocr_model: str,
+    pages: list,
+    model_used: str,
+) -> None:
+    """Persist an OCR run (atomic write; failures are logged, never raised)."""
+    global _size_bytes
+    if not settings.ocr_cache_enabled:
+        return
+    path = _cache_path(cache_key(pdf_sha256, start_page, end_page, ocr_model))
+    payload = {
+        "version": CACHE_VERSION,
+        "pdf_sha256": pdf_sha256,
+        "start_page": start_page,
+        "end_page": end_page,
+        "ocr_model": ocr_model,
+        "model_used": model_used,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "pages": [page_record(p) for p in pages],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".ocr-")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as fh:
+                json.dump(payload, fh)
+            os.replace(tmp_name, path)
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+        written = path.stat().st_size
+    except OSError as exc:
+        logger.warning("OCR cache write failed for %s: %s", path.name, exc)
+        return
+
+    limit = settings.ocr_cache_max_mb * 1024 * 1024
+    if limit <= 0:
+        return
+    with _lock:
+        if _size_bytes is None:
+            _size_bytes = _directory_size()
+        else:
+            _size_bytes += written
+        over = _size_bytes > limit
+    if over:
+        _evict(int(limit * 0.9))
+
+
+def _entries() -> list[tuple[float, int, Path]]:
+    result = []
+    for path in _cache_root().glob("*/*.json.gz"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        result.append((st.st_mtime, st.st_size, path))
+    return result
+
+
+def _directory_size() -> int:
+    return sum(size for _, size, _ in _entries())
+
+
+def _evict(target_bytes: int) -> None:
+    """Delete the oldest entries until the cache is at most ``target_bytes``."""
+    global _size_bytes
+    entries = sorted(_entries(), key=lambda e: e[0])
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in entries:
+        if total <= target_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    with _lock:
+        _size_bytes = total
+    if removed:
+        logger.info("OCR cache: evicted %d entries (now %.1f MB)", removed, total / 1e6)
@@ -0,0 +1,76 @@
+"""Celery beat task keeping the cached project progress fresh.
+
+``GET /projects/progress-summary`` only reads the ``computed_*`` cache columns
+on ``project_progress``, and ``GET /projects/{id}/progress`` resyncs lazily
+once ``STALENESS_WINDOW`` has passed — the first visitor would pay the full
+derived-observation resync. This periodic task refreshes every project shortly
+*before* it turns stale (``RESYNC_LEAD``), in chunks of batched
+``sync_derived_observations_bulk`` calls, so interactive requests never do.
+"""
+from __future__ import annotations
+
+import logging
+
+from dashboard_backend.celery_app import celery_app
+from dashboard_backend.crud.projects import progress as progress_crud
+from dashboard_backend.database import Session
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def refresh_stale_progress() -> dict:
+    """Resync every (nearly) stale project.
+
+    Returns the stats dict of :func:`progress_crud.resync_stale_progress`
+    (``refreshed``, ``failed``, ``chunks``, ``failed_chunks`` and the sync /
+    derive / total durations).
+    """
+    db = Session()
+    try:
+        stats = progress_crud.resync_stale_progress(db)
+        logger.info(
+            "refresh_stale_progress finished: refreshed=%d failed=%d chunks=%d "
+            "failed_chunks=%d sync=%.2fs derive=%.2fs total=%.2fs",
+            stats["refreshed"],
+            stats["failed"],
+            stats["chunks"],
+            stats["failed_chunks"],
+            stats["sync_seconds"],
+            stats["derive_seconds"],
+            stats["duration_seconds"],
+        )
+        return stats
+    except Exception as exc:
+        logger.exception("refresh_stale_progress failed: %s", exc)
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task
+def recompute_progress_batch(project_ids: list[int]) -> dict:
+    """Resync the projects invalidated by one importer commit.
+
+    Enqueued by ``crud.projects.progress_invalidation`` after the commit of a
+    source write (VIB/Haushalt confirm, Bauportal/Medien/Fulda review), with
+    the fed projects and their ancestors. Returns the ``resync_projects`` stats.
+    """
+    db = Session()
+    try:
+        stats = progress_crud.resync_projects(db, project_ids)
+        logger.info(
+            "recompute_progress_batch finished: requested=%d refreshed=%d failed=%d total=%.2fs",
+            len(project_ids),
+            stats["refreshed"],
+            stats["failed"],
+            stats["duration_seconds"],
+        )
+        return stats
+    except Exception as exc:
+        logger.exception("recompute_progress_batch failed: %s", exc)
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -5,11 +5,14 @@ import logging
 import re
 
 from celery import Task
+from PIL import Image
+from sqlalchemy.orm import load_only
 
 from dashboard_backend.celery_app import celery_app
 from dashboard_backend.core.config import settings
 from dashboard_backend.crud.vib import save_draft_report
 from dashboard_backend.tasks.vib_ocr import extract_full_pdf_text
+from dashboard_backend.utils import blob_store, image_store
 from dashboard_backend.database import Session
 from dashboard_backend.models.projects.project import Project
 from dashboard_backend.schemas.vib import (
@@ -17,6 +20,7 @@ from dashboard_backend.schemas.vib import (
     VibParseTaskResult,
     VibPfaEntryProposed,
 )
+from dashboard_backend.services.project_name_index import ProjectNameIndex
 from dashboard_backend.tasks.vib_matching import suggest_projects_for_vib_entry
 
 logger = logging.getLogger(__name__)
@@ -579,11 +583,12 @@ def _extract_sub_blocks(block_text: str) -> dict[str, str]:
 def _parse_vib_pdf(
     pdf_bytes: bytes,
     year: int,
-    all_projects: list | None = None,
+    all_projects: ProjectNameIndex | list | None = None,
     task: "Task | None" = None,
     start_page: int | None = None,
     end_page: int | None = None,
     strip_headers_footers: bool = True,
+    pdf_sha256: str | None = None,
 ) -> tuple[VibParseTaskResult, str | None, str | None, str | None, list[dict]]:
     """Parse a VIB PDF and return a structured task result plus OCR metadata.
 
@@ -610,17 +615,20 @@ def _parse_vib_pdf(
         start_page=start_page,
         end_page=end_page,
         strip_headers_footers=strip_headers_footers,
+        chunk_pages=settings.ocr_chunk_pages,
+        max_concurrency=settings.ocr_max_concurrency,
+        chunk_retries=settings.ocr_chunk_retries,
+        pdf_sha256=pdf_sha256,
     )
     logger.info("VIB OCR finished: status=%s model=%s chars=%d", ocr_status, ocr_model, len(full_text))
 
     if ocr_status == "fallback":
         logger.info("VIB OCR: using pymupdf fallback (no OCR_API_KEY or Mistral error)")
     if task is not None:
-        ocr_step_label = (
-            f"Texterkennung abgeschlossen ({ocr_model})"
-            if ocr_status == "done"
-            else "Texterkennung: pymupdf-Fallback"
-        )
+        ocr_step_label = {
+            "done": f"Texterkennung abgeschlossen ({ocr_model})",
+            "partial": f"Texterkennung abgeschlossen ({ocr_model}, einzelne Seiten per pymupdf)",
+        }.get(ocr_status, "Texterkennung: pymupdf-Fallback")
         task.update_state(state="PROGRESS", meta={"step": "splitting", "step_label": f"{ocr_step_label} — Blöcke aufteilen…"})
 
     # Extract document metadata from the first portion of the text
@@ -819,6 +827,35 @@ def _parse_vib_pdf(
     return parse_result, full_text, ocr_model, ocr_status, ocr_images
 
 
+def _store_ocr_images(ocr_images: list[dict]) -> list[dict]:
+    """Write OCR images (``_collect_images`` dicts with base64 data) to the
+    image store and return the references saved in ``vib_draft_image``.
+
+    Undecodable images are logged and skipped; they never fail the parse.
+    """
+    refs: list[dict] = []
+    seen: set[str] = set()
+    for img in ocr_images:
+        if img["id"] in seen:
+            continue
+        try:
+            data, media_type = image_store.decode_base64(img["image_base64"])
+            stored = image_store.put_image(data, media_type or image_store.guess_media_type(img["id"]))
+        except (ValueError, OSError, Image.DecompressionBombError) as exc:
+            logger.warning("OCR image %s skipped: %s", img["id"], exc)
+            continue
+        seen.add(img["id"])
+        refs.append({
+            "image_id": img["id"],
+            "page_index": img["page_index"],
+            "sha256": stored.sha256,
+            "media_type": stored.media_type,
+            "byte_size": stored.size,
+            "has_thumbnail": stored.has_thumbnail,
+        })
+    return refs
+
+
 # ---------------------------------------------------------------------------
 # Celery task
 # ---------------------------------------------------------------------------
@@ -826,7 +863,7 @@ def _parse_vib_pdf(
 @celery_app.task(bind=True)
 def parse_vib_pdf(
     self: Task,
-    pdf_bytes: bytes,
+    pdf_sha256: str,
     year: int,
     pdf_filename: str,
     user_info: dict,
@@ -834,7 +871,7 @@ def parse_vib_pdf(
     end_page: int | None = None,
     strip_headers_footers: bool = True,
 ) -> dict:
-    """Parse a VIB PDF and return the structured result.
+    """Parse a VIB PDF (by its upload-store digest) and return the structured result.
 
     The full VibParseTaskResult is returned as a dict and stored in the Celery
     result backend (Redis).  The confirm endpoint reads it via the task_id.
@@ -847,33 +884,38 @@ def parse_vib_pdf(
     )
     db = Session()
     try:
-        all_projects = db.query(Project).all()
+        # Indexed once for all Vorhaben; the matcher only reads id/name/description.
+        all_projects = ProjectNameIndex(
+            db.query(Project)
+            .options(load_only(Project.id, Project.name, Project.description))
+            .all()
+        )
         logger.info("Loaded %d projects for VIB auto-matching", len(all_projects))
 
-        result, ocr_raw_text, ocr_model, ocr_status, ocr_images = _parse_vib_pdf(
-            pdf_bytes,
-            year,
-            all_projects=all_projects,
-            task=self,
-            start_page=start_page,
-            end_page=end_page,
-            strip_headers_footers=strip_headers_footers,
-        )
+        with blob_store.open_blob(pdf_sha256) as pdf_data:
+            result, ocr_raw_text, ocr_model, ocr_status, ocr_images = _parse_vib_pdf(
+                pdf_data,
+                year,
+                all_projects=all_projects,
+                task=self,
+                start_page=start_page,
+                end_page=end_page,
+                strip_headers_footers=strip_headers_footers,
+                pdf_sha256=pdf_sha256,
+            )
         logger.info("parse_vib_pdf finished: %d entries", len(result.entries))
 
         # Persist the raw parse result to the DB immediately so it survives
         # Redis eviction and the user can resume review without re-uploading.
-        import json as _json
         save_draft_report(
             db=db,
             task_id=self.request.id,
-            year=year,
-            raw_result_json=result.model_dump_json(),
+            result=result,
             user=None,  # user object not available in worker context; id stored in user_info
             ocr_raw_text=ocr_raw_text,
             ocr_status=ocr_status,
             ocr_model=ocr_model,
-            ocr_images_json=_json.dumps(ocr_images) if ocr_images else None,
+            ocr_images=_store_ocr_images(ocr_images),
         )
         db.commit()
         logger.info("parse_vib_pdf: raw result saved to vib_draft_report (task_id=%s)", self.request.id)
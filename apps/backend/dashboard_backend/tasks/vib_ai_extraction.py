@@ -1,17 +1,47 @@
-"""Celery task: LLM-based sub-block extraction for VIB entries."""
+"""Celery task: LLM-based sub-block extraction for VIB entries.
+
+Entries are extracted concurrently (``LLM_MAX_CONCURRENCY`` calls in flight).
+A 429 from the LLM pauses *all* workers for the Retry-After/backoff period
+before the call is retried, so the pool backs off as a whole instead of
+hammering the rate limit. Each finished entry is written to the draft right
+away, merged into the entry as stored at that moment (``_checkpoint``), so
+review edits saved meanwhile are kept; a re-run resumes with the entries that
+are still missing or failed unless ``force`` is set.
+
+Short entries are packed into one request up to ``LLM_BATCH_TOKEN_BUDGET``
+estimated input tokens (answer: an ``entries`` array keyed by ``vib_section``);
+a raw_text above the budget is split on paragraph boundaries and its parts'
+answers are combined, instead of being truncated. Blocks whose text repeats
+the previous year's confirmed entry take over its fields without an LLM call
+(``tasks/vib_carry_over.py``); ``force`` sends every block to the LLM and
+bypasses the LLM response cache.
+"""
 from __future__ import annotations
 
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Callable
 
 from celery import Task
 
 from dashboard_backend.celery_app import celery_app
 from dashboard_backend.core.config import settings
-from dashboard_backend.crud.vib import get_draft_by_task_id, update_draft_ai_result
+from dashboard_backend.crud.vib import (
+    draft_result,
+    get_draft_by_task_id,
+    get_draft_entry_for_update,
+    get_previous_report,
+    iter_draft_entries,
+    update_draft_entry,
+)
 from dashboard_backend.database import Session
 from dashboard_backend.services.llm import call_llm_json, summarise_error
-from dashboard_backend.schemas.vib import VibEntryProposed, VibParseTaskResult
+from dashboard_backend.schemas.vib import VibEntryProposed
+from dashboard_backend.tasks.vib_carry_over import carried_fields, find_carry_overs
 
 logger = logging.getLogger(__name__)
 
@@ -20,16 +50,8 @@ _SYSTEM_PROMPT = (
     "Antworte ausschließlich mit einem validen JSON-Objekt, ohne Erklärungen."
 )
 
-_USER_PROMPT_TEMPLATE = """\
-Sektionsnummer: {vib_section}
-Projektname: {vib_name_raw}
-
---- ROHTEXT ---
-{raw_text}
---- ENDE ---
-
-Extrahiere folgende Felder als JSON:
-{{
+_FIELDS_SCHEMA = """\
+{
   "verkehrliche_zielsetzung": "<Text oder null>",
   "durchgefuehrte_massnahmen": "<Text oder null>",
   "noch_umzusetzende_massnahmen": "<Text oder null>",
@@ -43,7 +65,7 @@ Extrahiere folgende Felder als JSON:
   "gesamtkosten_mio_eur": "<float oder null>",
   "entwurfsgeschwindigkeit": "<z.B. '200/250' oder null>",
   "pfa_entries": [
-    {{
+    {
       "nr_pfa": "<z.B. '1.1'>",
       "oertlichkeit": "<Text oder null>",
       "entwurfsplanung": "<'abgeschlossen' | 'offen' | 'in Überarbeitung' | null>",
@@ -51,14 +73,46 @@ Extrahiere folgende Felder als JSON:
       "datum_pfb": "<Datum oder null>",
       "baubeginn": "<Datum oder null>",
       "inbetriebnahme": "<Datum oder null>"
-    }}
+    }
   ]
-}}
+}"""
 
+_STATUS_NOTE = """\
 Hinweis zu Projektstatus: status_planung, status_bau und status_abgeschlossen können gleichzeitig true sein \
 (z.B. wenn Teilabschnitte bereits in Betrieb sind während andere noch geplant werden).
 """
 
+_USER_PROMPT_TEMPLATE = """\
+Sektionsnummer: {vib_section}
+Projektname: {vib_name_raw}
+{part_note}
+--- ROHTEXT ---
+{raw_text}
+--- ENDE ---
+
+Extrahiere folgende Felder als JSON:
+{schema}
+
+{status_note}"""
+
+_PART_NOTE = "Teil {part} von {parts} des Rohtexts — Angaben, die in diesem Teil fehlen, als null.\n"
+
+# Several short Vorhaben in one request; the answer is an array keyed by vib_section.
+_BATCH_PROMPT_TEMPLATE = """\
+Die folgenden {count} Abschnitte sind voneinander unabhängige Vorhaben. Extrahiere für \
+JEDEN Abschnitt die Felder und antworte mit {{"entries": [...]}} — genau ein Objekt pro \
+Abschnitt, jeweils mit "vib_section" (Sektionsnummer wie angegeben) und diesen Feldern:
+{schema}
+
+{blocks}
+{status_note}"""
+
+_BATCH_BLOCK_TEMPLATE = """\
+=== ABSCHNITT {vib_section}: {vib_name_raw} ===
+{raw_text}
+=== ENDE {vib_section} ===
+"""
+
 _TEXT_FIELDS = [
     "verkehrliche_zielsetzung",
     "durchgefuehrte_massnahmen",
@@ -74,6 +128,9 @@ _BOOL_STATUS_FIELDS = ["status_planung", "status_bau", "status_abgeschlossen"]
 
 _TEILINBETRIEBNAHMEN_NONE_RE = re.compile(r"^\s*[-–]\s*[Kk]eine\.?\s*$")
 
+# Base delay for a 429 without Retry-After header (doubles per attempt).
+_RATE_LIMIT_BACKOFF_S = 5.0
+
 
 def _normalize_teilinbetriebnahmen(val: str) -> str | None:
     """Normalize '- Keine.' and variants to None (no partial commissioning)."""
@@ -113,17 +170,338 @@ def _merge_ai_result(entry_dict: dict, ai: dict) -> dict:
     return entry_dict
 
 
+def _estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting (German prose: ~3 characters per token)."""
+    return len(text) // 3 + 1
+
+
+def _block_char_limit() -> int:
+    """Largest raw_text (in characters) sent in one request."""
+    return max(settings.llm_batch_token_budget, 500) * 3
+
+
+def _split_text(text: str, max_chars: int) -> list[str]:
+    """Split ``text`` into parts of at most ``max_chars``, preferring paragraph
+    over line boundaries; only a single overlong line is cut hard."""
+    if len(text) <= max_chars:
+        return [text]
+    # (piece, separator that preceded it in the original text)
+    pieces: list[tuple[str, str]] = []
+    for para in text.split("\n\n"):
+        sep = "\n\n"
+        for line in para.split("\n") if len(para) > max_chars else [para]:
+            for start in range(0, max(len(line), 1), max_chars):
+                pieces.append((line[start : start + max_chars], sep))
+                sep = "\n" if start == 0 else ""
+            sep = "\n"
+    parts: list[str] = []
+    current = ""
+    for piece, sep in pieces:
+        if current and len(current) + len(sep) + len(piece) > max_chars:
+            parts.append(current)
+            current = piece
+        else:
+            current = current + sep + piece if current else piece
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _build_prompt(entry_dict: dict, raw_text: str | None = None, part: int = 1, parts: int = 1) -> str:
+    return _USER_PROMPT_TEMPLATE.format(
+        vib_section=entry_dict.get("vib_section") or "?",
+        vib_name_raw=entry_dict.get("vib_name_raw") or "?",
+        part_note=_PART_NOTE.format(part=part, parts=parts) if parts > 1 else "",
+        raw_text=(entry_dict.get("raw_text") or "") if raw_text is None else raw_text,
+        schema=_FIELDS_SCHEMA,
+        status_note=_STATUS_NOTE,
+    )
+
+
+def _build_batch_prompt(entry_dicts: list[dict]) -> str:
+    blocks = "\n".join(
+        _BATCH_BLOCK_TEMPLATE.format(
+            vib_section=e["vib_section"],
+            vib_name_raw=e.get("vib_name_raw") or "?",
+            raw_text=e.get("raw_text") or "",
+        )
+        for e in entry_dicts
+    )
+    return _BATCH_PROMPT_TEMPLATE.format(
+        count=len(entry_dicts), schema=_FIELDS_SCHEMA, blocks=blocks, status_note=_STATUS_NOTE
+    )
+
+
+def _combine_parts(results: list[dict]) -> dict:
+    """Fold the answers for the parts of a split block into one answer.
+
+    Text fields: distinct non-empty values joined in part order. Numbers: first
+    value given. Status flags: true if any part says so. PFA rows: concatenated,
+    first row per ``nr_pfa`` wins.
+    """
+    if len(results) == 1:
+        return results[0]
+    combined: dict = {}
+    for field in _TEXT_FIELDS:
+        values: list[str] = []
+        for ai in results:
+            val = ai.get(field)
+            if isinstance(val, list):
+                val = "\n".join(str(item) for item in val)
+            if val is None or not str(val).strip():
+                continue
+            if field == "teilinbetriebnahmen" and _normalize_teilinbetriebnahmen(val) is None:
+                continue
+            if val not in values:
+                values.append(val)
+        if values:
+            combined[field] = "\n".join(values)
+    for num_field in ("strecklaenge_km", "gesamtkosten_mio_eur"):
+        combined[num_field] = next(
+            (ai[num_field] for ai in results if ai.get(num_field) is not None), None
+        )
+    for bool_field in _BOOL_STATUS_FIELDS:
+        flags = [ai.get(bool_field) for ai in results if ai.get(bool_field) is not None]
+        combined[bool_field] = any(bool(f) for f in flags) if flags else None
+    pfa_rows: list = []
+    seen_pfa: set = set()
+    for ai in results:
+        for row in ai.get("pfa_entries") or []:
+            nr = row.get("nr_pfa") if isinstance(row, dict) else None
+            if nr is not None:
+                if nr in seen_pfa:
+                    continue
+                seen_pfa.add(nr)
+            pfa_rows.append(row)
+    combined["pfa_entries"] = pfa_rows
+    return combined
+
+
+class _RateLimitGate:
+    """Backoff shared by all extraction workers: after a 429 nobody sends
+    until the pause has elapsed."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        while True:
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def _is_rate_limited(exc: Exception) -> bool:
+    return getattr(exc, "status_code", None) == 429 or summarise_error(exc).startswith("429")
+
+
+def _retry_after(exc: Exception, attempt: int) -> float:
+    """Seconds to wait after a 429: the Retry-After header, else exponential."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return max(float(headers.get("retry-after")), 0.0)
+    except (TypeError, ValueError):
+        return _RATE_LIMIT_BACKOFF_S * 2**attempt
+
+
+def _call_llm(
+    prompt: str, gate: _RateLimitGate, retries: int, label: str, use_cache: bool = True
+) -> dict:
+    """One LLM request, retrying 429s through the shared gate.
+
+    ``call_llm_json`` still retries 5xx/connection errors, but raises a 429 at
+    once: rate limits are paced only here, so every worker honours the pause.
+    """
+    for attempt in range(retries + 1):
+        gate.wait()
+        try:
+            return call_llm_json(
+                _SYSTEM_PROMPT, prompt, retry_rate_limits=False, use_cache=use_cache
+            )
+        except Exception as exc:
+            if attempt == retries or not _is_rate_limited(exc):
+                raise
+            delay = _retry_after(exc, attempt)
+            logger.warning(
+                "LLM rate-limited for %s (attempt %d/%d), pausing workers %.1fs",
+                label, attempt + 1, retries + 1, delay,
+            )
+            gate.pause(delay)
+    raise AssertionError("unreachable")
+
+
+def _extract_entry(
+    entry_dict: dict, gate: _RateLimitGate, retries: int, use_cache: bool = True
+) -> dict:
+    """Run the LLM for one entry. A raw_text above the block limit is split
+    into parts that are extracted one after another and combined."""
+    parts = _split_text(entry_dict.get("raw_text") or "", _block_char_limit())
+    label = entry_dict.get("vib_section") or "?"
+    return _combine_parts(
+        [
+            _call_llm(
+                _build_prompt(entry_dict, text, i, len(parts)), gate, retries, label, use_cache
+            )
+            for i, text in enumerate(parts, start=1)
+        ]
+    )
+
+
+def _extract_batch(
+    entry_dicts: list[dict], gate: _RateLimitGate, retries: int, use_cache: bool = True
+) -> list[dict | Exception]:
+    """Extract several short entries with one request.
+
+    Returns one answer (or the exception to record) per entry, in order.
+    Entries the model left out of its array — or all of them if the answer is
+    not a usable array — are extracted on their own.
+    """
+    label = ", ".join(e["vib_section"] for e in entry_dicts)
+    try:
+        answer = _call_llm(_build_batch_prompt(entry_dicts), gate, retries, label, use_cache)
+        items = answer.get("entries") if isinstance(answer, dict) else answer
+        if not isinstance(items, list):
+            raise ValueError("batch answer has no 'entries' array")
+    except ValueError as exc:
+        logger.warning("Unusable batch answer for %s, extracting singly: %s", label, exc)
+        items = []
+    except Exception as exc:
+        return [exc] * len(entry_dicts)
+
+    by_section = {
+        str(item.get("vib_section")).strip(): item
+        for item in items
+        if isinstance(item, dict) and item.get("vib_section") is not None
+    }
+    outcomes: list[dict | Exception] = []
+    for entry_dict in entry_dicts:
+        ai = by_section.get(entry_dict["vib_section"])
+        if ai is None:
+            try:
+                ai = _extract_entry(entry_dict, gate, retries, use_cache)
+            except Exception as exc:
+                outcomes.append(exc)
+                continue
+        outcomes.append(ai)
+    return outcomes
+
+
+def _run_job(
+    job: list[int],
+    entries: list[dict],
+    gate: _RateLimitGate,
+    retries: int,
+    use_cache: bool = True,
+) -> list[tuple[int, dict | Exception]]:
+    if len(job) == 1:
+        try:
+            return [(job[0], _extract_entry(entries[job[0]], gate, retries, use_cache))]
+        except Exception as exc:
+            return [(job[0], exc)]
+    return list(
+        zip(job, _extract_batch([entries[i] for i in job], gate, retries, use_cache))
+    )
+
+
+def _plan_jobs(entries: list[dict], pending: list[int]) -> list[list[int]]:
+    """Pack pending entries into requests of at most ``LLM_BATCH_TOKEN_BUDGET``
+    estimated input tokens and ``LLM_BATCH_MAX_ENTRIES`` entries.
+
+    Entries over the budget (split later) and entries without a section
+    number (not addressable in a batch answer) are sent on their own; a
+    section number occurs at most once per batch.
+    """
+    budget = max(settings.llm_batch_token_budget, 500)
+    max_entries = settings.llm_batch_max_entries
+    jobs: list[list[int]] = []
+    batch: list[int] = []
+    used = 0
+    sections: set[str] = set()
+    for idx in pending:
+        section = entries[idx].get("vib_section")
+        cost = _estimate_tokens(entries[idx].get("raw_text") or "")
+        if max_entries <= 1 or cost > budget or not section:
+            jobs.append([idx])
+            continue
+        if batch and (used + cost > budget or len(batch) >= max_entries or section in sections):
+            jobs.append(batch)
+            batch, used, sections = [], 0, set()
+        batch.append(idx)
+        used += cost
+        sections.add(section)
+    if batch:
+        jobs.append(batch)
+    return jobs
+
+
+def _needs_extraction(entry_dict: dict, force: bool) -> bool:
+    """Entries with text that have not been extracted successfully yet."""
+    if not (entry_dict.get("raw_text") or "").strip():
+        return False
+    if force:
+        return True
+    return not entry_dict.get("ai_extracted") or bool(entry_dict.get("ai_extraction_failed"))
+
+
+def _apply_success(entry_dict: dict, *, ai: dict, carried_from: int | None) -> dict:
+    entry_dict = _merge_ai_result(entry_dict, ai)
+    entry_dict["ai_extraction_failed"] = False
+    entry_dict["ai_extraction_error"] = None
+    entry_dict["ai_carried_over_from_year"] = carried_from
+    return entry_dict
+
+
+def _apply_failure(entry_dict: dict, *, error: str) -> dict:
+    entry_dict["ai_extraction_failed"] = True
+    entry_dict["ai_extraction_error"] = error
+    return entry_dict
+
+
+def _checkpoint(
+    db, parse_task_id: str, idx: int, apply: Callable[[dict], dict]
+) -> dict | None:
+    """Persist one finished entry; a crash from here on keeps its result.
+
+    ``apply`` merges the result into the entry as stored *now* (re-read with a
+    row lock), not into the snapshot taken at task start, so a review edit
+    saved while the extraction runs survives. Returns the merged entry, or
+    None if the entry no longer exists.
+    """
+    current = get_draft_entry_for_update(db, parse_task_id, idx)
+    if current is None:
+        db.rollback()
+        return None
+    entry_dict = apply(current.model_dump())
+    update_draft_entry(db, parse_task_id, idx, VibEntryProposed(**entry_dict))
+    db.commit()
+    return entry_dict
+
+
 @celery_app.task(bind=True)
 def extract_vib_blocks(
     self: Task,
     parse_task_id: str,
     user_info: dict,
+    force: bool = False,
 ) -> dict:
-    """Run LLM extraction on each VIB entry in the draft identified by parse_task_id."""
+    """Run LLM extraction on the VIB entries in the draft identified by parse_task_id.
+
+    Only entries without a successful extraction are sent (all of them with
+    ``force=True``, then without consulting the LLM response cache); every
+    finished entry is checkpointed into the draft.
+    """
     logger.info(
-        "extract_vib_blocks started: parse_task_id=%s user=%s",
+        "extract_vib_blocks started: parse_task_id=%s user=%s force=%s",
         parse_task_id,
         user_info.get("username") if user_info else "unknown",
+        force,
     )
 
     if not settings.llm_base_url:
@@ -135,52 +513,68 @@ def extract_vib_blocks(
         if draft is None:
             raise RuntimeError(f"Draft not found for task_id={parse_task_id}")
 
-        result = VibParseTaskResult.model_validate_json(draft.raw_result_json)
-        entries_as_dicts = [e.model_dump() for e in result.entries]
+        entries_as_dicts = [e.model_dump() for e in iter_draft_entries(db, draft)]
         total = len(entries_as_dicts)
 
-        for idx, entry_dict in enumerate(entries_as_dicts):
-            self.update_state(
-                state="PROGRESS",
-                meta={"current": idx + 1, "total": total},
-            )
-            raw_text = entry_dict.get("raw_text") or ""
-            if not raw_text.strip():
+        for entry_dict in entries_as_dicts:
+            if not (entry_dict.get("raw_text") or "").strip():
                 logger.warning(
                     "Entry %s has no raw_text — skipping LLM call",
                     entry_dict.get("vib_section"),
                 )
-                continue
-            try:
-                prompt = _USER_PROMPT_TEMPLATE.format(
-                    vib_section=entry_dict.get("vib_section") or "?",
-                    vib_name_raw=entry_dict.get("vib_name_raw") or "?",
-                    raw_text=raw_text[:6000],
+        pending = [i for i, e in enumerate(entries_as_dicts) if _needs_extraction(e, force)]
+        done = total - len(pending)
+        logger.info("extract_vib_blocks: %d of %d entries to extract", len(pending), total)
+        self.update_state(state="PROGRESS", meta={"current": done, "total": total})
+
+        if pending and not force and settings.vib_carry_over_enabled:
+            previous = get_previous_report(db, draft.year)
+            if previous is not None:
+                matches = find_carry_overs(
+                    [entries_as_dicts[idx] for idx in pending],
+                    previous.entries,
+                    settings.vib_carry_over_min_similarity,
                 )
-                ai_result = call_llm_json(_SYSTEM_PROMPT, prompt)
-                entries_as_dicts[idx] = _merge_ai_result(entry_dict, ai_result)
-                entries_as_dicts[idx]["ai_extraction_failed"] = False
-                entries_as_dicts[idx]["ai_extraction_error"] = None
-                logger.debug("LLM extraction OK for %s", entry_dict.get("vib_section"))
-            except Exception as exc:
-                logger.warning(
-                    "LLM extraction failed for %s: %s",
-                    entry_dict.get("vib_section"),
-                    exc,
+                for pos, prev in matches.items():
+                    _checkpoint(
+                        db,
+                        parse_task_id,
+                        pending[pos],
+                        partial(_apply_success, ai=carried_fields(prev), carried_from=previous.year),
+                    )
+                    done += 1
+                pending = [idx for pos, idx in enumerate(pending) if pos not in matches]
+                logger.info(
+                    "extract_vib_blocks: %d entries carried over from %d, %d left for the LLM",
+                    len(matches), previous.year, len(pending),
                 )
-                entries_as_dicts[idx]["ai_extraction_failed"] = True
-                entries_as_dicts[idx]["ai_extraction_error"] = summarise_error(exc)
-
-        updated_result = VibParseTaskResult(
-            year=result.year,
-            drucksache_nr=result.drucksache_nr,
-            report_date=result.report_date,
-            entries=[VibEntryProposed(**e) for e in entries_as_dicts],
-        )
-        update_draft_ai_result(db, parse_task_id, updated_result.model_dump_json())
-        db.commit()
+                self.update_state(state="PROGRESS", meta={"current": done, "total": total})
+
+        jobs = _plan_jobs(entries_as_dicts, pending)
+        logger.info("extract_vib_blocks: %d entries in %d LLM jobs", len(pending), len(jobs))
+
+        gate = _RateLimitGate()
+        retries = settings.llm_rate_limit_retries
+        with ThreadPoolExecutor(max_workers=max(1, settings.llm_max_concurrency)) as pool:
+            futures = [
+                pool.submit(_run_job, job, entries_as_dicts, gate, retries, not force)
+                for job in jobs
+            ]
+            for future in as_completed(futures):
+                for idx, outcome in future.result():
+                    section = entries_as_dicts[idx].get("vib_section")
+                    if isinstance(outcome, Exception):
+                        logger.warning("LLM extraction failed for %s: %s", section, outcome)
+                        apply = partial(_apply_failure, error=summarise_error(outcome))
+                    else:
+                        logger.debug("LLM extraction OK for %s", section)
+                        apply = partial(_apply_success, ai=outcome, carried_from=None)
+                    _checkpoint(db, parse_task_id, idx, apply)
+                    done += 1
+                    self.update_state(state="PROGRESS", meta={"current": done, "total": total})
 
-        logger.info("extract_vib_blocks finished: %d entries processed", total)
+        updated_result = draft_result(db, draft)
+        logger.info("extract_vib_blocks finished: %d entries processed", len(pending))
         return updated_result.model_dump()
 
     except Exception as exc:
@@ -0,0 +1,109 @@
+"""Carry last year's confirmed extraction over to unchanged VIB blocks.
+
+Most Vorhaben are described with (nearly) the same text in consecutive VIB
+reports. Before ``extract_vib_blocks`` sends a block to the LLM, the block is
+compared with the confirmed ``VibEntry.raw_text`` of the latest earlier report.
+Candidates are the entries with the same normalised name or the same
+``vib_section``. The facts the extraction is made of — every word containing
+a digit (costs, lengths, dates, PFA numbers) and the status words — must be
+identical; only the remaining prose is compared fuzzily. The best candidate
+whose prose similarity (word-level ``SequenceMatcher`` ratio) reaches
+``VIB_CARRY_OVER_MIN_SIMILARITY`` donates its structured fields, as
+confirmed/edited by the editor, and the block is not sent to the LLM. Blocks
+whose facts or wording changed still go to the LLM.
+"""
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+from dashboard_backend.models.vib.vib_entry import VibEntry
+from dashboard_backend.schemas.vib import VibEntryFieldsBase, VibPfaEntryProposed
+from dashboard_backend.services.project_name_index import normalize_name
+
+_WORD_RE = re.compile(r"\w+")
+_DIGIT_RE = re.compile(r"\d")
+# Word stems that flip the status_* flags or the planungsstand; like numbers,
+# they must not change between the two years.
+_STATUS_STEMS = (
+    "abgeschlossen", "fertiggestellt", "inbetrieb", "planfeststell", "baurecht",
+    "baubeginn", "bauende", "vorplanung", "entwurfsplanung", "genehmigung",
+    "nicht", "noch",
+)
+
+# Content fields that come from the document itself, not from the extraction.
+_NOT_CARRIED = {"vib_name_raw", "category", "raw_text", "sonstiges"}
+CARRIED_FIELDS = [f for f in VibEntryFieldsBase.model_fields if f not in _NOT_CARRIED]
+
+
+def _is_fact(word: str) -> bool:
+    return bool(_DIGIT_RE.search(word)) or word.startswith(_STATUS_STEMS)
+
+
+def text_similarity(a: str, b: str, floor: float = 0.0) -> float:
+    """Word-level similarity in [0, 1] of two raw texts (case/whitespace-blind).
+
+    0.0 when the fact words (digits, status words) differ in any way;
+    otherwise the ratio of the remaining prose. Returns an upper bound below
+    ``floor`` without the full comparison when the prose already differs too
+    much.
+    """
+    words_a = _WORD_RE.findall(a.lower())
+    words_b = _WORD_RE.findall(b.lower())
+    if words_a == words_b:
+        return 1.0
+    if [w for w in words_a if _is_fact(w)] != [w for w in words_b if _is_fact(w)]:
+        return 0.0
+    prose_a = [w for w in words_a if not _is_fact(w)]
+    prose_b = [w for w in words_b if not _is_fact(w)]
+    if not prose_a or not prose_b:
+        return 0.0
+    matcher = SequenceMatcher(None, prose_a, prose_b, autojunk=False)
+    bound = matcher.quick_ratio()
+    if bound < floor:
+        return bound
+    return matcher.ratio()
+
+
+def carried_fields(previous: VibEntry) -> dict:
+    """The previous entry's structured fields, shaped like an LLM answer."""
+    fields = {name: getattr(previous, name) for name in CARRIED_FIELDS}
+    fields["pfa_entries"] = [
+        {name: getattr(pfa, name, None) for name in VibPfaEntryProposed.model_fields}
+        for pfa in previous.pfa_entries
+    ]
+    return fields
+
+
+def find_carry_overs(
+    entries: list[dict],
+    previous_entries: list[VibEntry],
+    min_similarity: float,
+) -> dict[int, VibEntry]:
+    """Map positions in ``entries`` to the previous entry whose text they repeat."""
+    by_name: dict[str, list[VibEntry]] = defaultdict(list)
+    by_section: dict[str, list[VibEntry]] = defaultdict(list)
+    for prev in previous_entries:
+        if not (prev.raw_text or "").strip():
+            continue
+        by_name[normalize_name(prev.vib_name_raw or "")].append(prev)
+        if prev.vib_section:
+            by_section[prev.vib_section].append(prev)
+
+    matches: dict[int, VibEntry] = {}
+    for pos, entry in enumerate(entries):
+        raw_text = entry.get("raw_text") or ""
+        candidates = by_name.get(normalize_name(entry.get("vib_name_raw") or ""), [])
+        candidates = candidates + [
+            prev for prev in by_section.get(entry.get("vib_section") or "", [])
+            if prev not in candidates
+        ]
+        best, best_score = None, min_similarity
+        for prev in candidates:
+            score = text_similarity(raw_text, prev.raw_text, floor=best_score)
+            if score >= best_score:
+                best, best_score = prev, score
+        if best is not None:
+            matches[pos] = best
+    return matches
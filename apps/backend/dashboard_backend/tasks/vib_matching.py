@@ -9,12 +9,19 @@ Two matching strategies are combined:
 2. Fuzzy name matching — SequenceMatcher + token overlap, same algorithm as
    finve_matching.py, threshold 0.5 (raised slightly for VIB because names
    tend to be longer and more distinctive).
+
+Callers matching many names pass a :class:`ProjectNameIndex` built once
+instead of the project list; a plain list is indexed on the fly.
 """
 from __future__ import annotations
 
 import re
-import unicodedata
-from difflib import SequenceMatcher
+
+from dashboard_backend.services.project_name_index import (
+    ProjectNameIndex,
+    name_similarity,
+    normalize_name,
+)
 
 # ---------------------------------------------------------------------------
 # VDE number extraction
@@ -30,27 +37,16 @@ def _extract_vde_number(text: str) -> str | None:
     return m.group(1) if m else None
 
 
-def _vde_match(vib_name: str, project_name: str, project_description: str | None) -> bool:
-    """True if both texts refer to the same VDE number."""
-    vib_vde = _extract_vde_number(vib_name)
-    if vib_vde is None:
-        return False
-    candidate_text = (project_name or "") + " " + (project_description or "")
-    proj_vde = _extract_vde_number(candidate_text)
-    return proj_vde is not None and vib_vde == proj_vde
+def _project_vde_number(project) -> str | None:
+    """VDE number referenced in a project's name or description, or None."""
+    candidate_text = (project.name or "") + " " + (getattr(project, "description", None) or "")
+    return _extract_vde_number(candidate_text)
 
 
 # ---------------------------------------------------------------------------
-# Fuzzy name matching (same approach as finve_matching.py)
+# Fuzzy name matching (shared with finve_matching.py)
 # ---------------------------------------------------------------------------
 
-_STRIP_PREFIXES = re.compile(
-    r"^(abs/nbs|nbs/abs|abs|nbs|neu-|aus-|um-)\s*",
-    re.IGNORECASE,
-)
-_PUNCTUATION = re.compile(r"[/\-–—,;:()\[\].]")
-_WHITESPACE = re.compile(r"\s+")
-
 # Slightly higher threshold than finve_matching (0.45) — VIB names are long proper nouns
 _THRESHOLD = 0.50
 _MAX_SUGGESTIONS = 3
@@ -59,39 +55,13 @@ _MAX_SUGGESTIONS = 3
 # matching a PFA to a subproject is permissive — it is only a review-UI hint.
 _PFA_THRESHOLD = 0.35
 
-
-def _normalize(text: str) -> str:
-    text = unicodedata.normalize("NFC", text)
-    text = text.lower()
-    text = _STRIP_PREFIXES.sub("", text)
-    text = _PUNCTUATION.sub(" ", text)
-    text = _WHITESPACE.sub(" ", text).strip()
-    return text
-
-
-def _score(vib_name: str, project_name: str) -> float:
-    """Return a similarity score in [0, 1] between two normalised names."""
-    a = _normalize(vib_name)
-    b = _normalize(project_name)
-    if not a or not b:
-        return 0.0
-
-    full = SequenceMatcher(None, a, b, autojunk=False).ratio()
-
-    tokens_a = set(a.split())
-    tokens_b = set(b.split())
-    if tokens_a and tokens_b:
-        common = tokens_a & tokens_b
-        token_score = len(common) / max(len(tokens_a), len(tokens_b))
-    else:
-        token_score = 0.0
-
-    return 0.6 * full + 0.4 * token_score
+_normalize = normalize_name
+_score = name_similarity
 
 
 def suggest_projects_for_vib_entry(
     vib_name: str,
-    projects: list,  # list of Project ORM instances (.id, .name, .description)
+    projects,  # ProjectNameIndex, or Project ORM instances (.id, .name, .description)
 ) -> list[int]:
     """Return project IDs (up to _MAX_SUGGESTIONS) that best match the given VIB name.
 
@@ -101,39 +71,29 @@ def suggest_projects_for_vib_entry(
     2. Fuzzy name match for remaining candidates above _THRESHOLD.
     3. Return deduplicated list, VDE matches first.
     """
-    vde_matches: list[int] = []
-    fuzzy_scored: list[tuple[float, int]] = []
-    seen: set[int] = set()
-
-    for project in projects:
-        if not project.name:
-            continue
-        proj_desc = getattr(project, "description", None) or ""
-
-        if _vde_match(vib_name, project.name, proj_desc):
-            if project.id not in seen:
-                vde_matches.append(project.id)
-                seen.add(project.id)
-
-        s = _score(vib_name, project.name)
-        if s >= _THRESHOLD and project.id not in seen:
-            fuzzy_scored.append((s, project.id))
+    index = ProjectNameIndex.of(projects)
+    vib_vde = _extract_vde_number(vib_name)
+    vde_matches = list(
+        dict.fromkeys(index.group_by(_project_vde_number).get(vib_vde, []))
+        if vib_vde is not None
+        else []
+    )
+    seen = set(vde_matches)
 
-    fuzzy_scored.sort(key=lambda x: x[0], reverse=True)
     result = vde_matches[:]
-    for _, pid in fuzzy_scored:
+    for pid in index.top(vib_name, _THRESHOLD, limit=len(index)):
+        if len(result) >= _MAX_SUGGESTIONS:
+            break
         if pid not in seen:
             result.append(pid)
             seen.add(pid)
-        if len(result) >= _MAX_SUGGESTIONS:
-            break
 
     return result[:_MAX_SUGGESTIONS]
 
 
 def suggest_project_for_bauportal(
     title: str,
-    projects: list,  # list of Project ORM instances (.id, .name)
+    projects,  # ProjectNameIndex, or Project ORM instances (.id, .name)
 ) -> int | None:
     """Best-matching project id for one DB-Bauportal entry, or None.
 
@@ -143,16 +103,7 @@ def suggest_project_for_bauportal(
     """
     if not title or not title.strip():
         return None
-    best_id: int | None = None
-    best_score = 0.0
-    for project in projects:
-        if not project.name:
-            continue
-        s = _score(title, project.name)
-        if s > best_score:
-            best_score = s
-            best_id = project.id
-    return best_id if best_score >= _THRESHOLD else None
+    return ProjectNameIndex.of(projects).best(title, _THRESHOLD)
 
 
 def suggest_subproject_for_pfa(
@@ -24,14 +24,18 @@ Fallback (no OCR_API_KEY): use pymupdf get_text("text") per page.
 from __future__ import annotations
 
 import base64
-import io
+import hashlib
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 
 import fitz  # pymupdf — fallback text extraction
 from mistralai.client import Mistral
 
+from dashboard_backend.tasks import ocr_cache
+
 logger = logging.getLogger(__name__)
 
 _RAIL_START_RE = re.compile(r"\bB\s+Schienenwege\b", re.IGNORECASE)
@@ -40,6 +44,15 @@ _RAIL_END_RE = re.compile(r"\bC\s+Bundesfernstra", re.IGNORECASE)
 # Inline image references produced by Mistral OCR: ![alt](filename)
 _IMAGE_REF_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)", re.IGNORECASE)
 
+# Document-wide numbered ids of OCR images / tables ("img-3.jpeg", "tbl-2.md").
+_NUMBERED_ID_RE = re.compile(r"^(img|tbl)-(\d+)(\.\w+)?$")
+# The same ids inside markdown links: [tbl-2.md](tbl-2.md), ![img-3.jpeg](img-3.jpeg)
+_ID_REF_RE = re.compile(r"(?<=[\[(])(img|tbl)-(\d+)(?=[.\])])")
+
+# Chunked OCR: per-request timeout and base backoff between retries of a chunk.
+_CHUNK_TIMEOUT_MS = 120_000
+_CHUNK_RETRY_BACKOFF_S = 2.0
+
 
 def _find_rail_section_pages(pages: list) -> list:
     """Return only the pages belonging to section B (Schienenwege).
@@ -148,11 +161,13 @@ def _collect_images(pages: list) -> list[dict]:
     return images
 
 
-def _ocr_with_mistral(pdf_bytes: bytes, api_key: str, base_url: str, model: str) -> tuple[list, str]:
+def _ocr_with_mistral(
+    pdf_bytes: bytes, api_key: str, base_url: str, model: str, timeout_ms: int = 300_000
+) -> tuple[list, str]:
     """Call Mistral OCR API. Returns (pages, model_name_used)."""
     b64 = base64.b64encode(pdf_bytes).decode("ascii")
-    # 5 minute timeout — VIB PDFs are ~100 pages and OCR can take 60–120s
-    client = Mistral(api_key=api_key, server_url=base_url, timeout_ms=300_000)
+    # 5 minute default timeout — VIB PDFs are ~100 pages and OCR can take 60–120s
+    client = Mistral(api_key=api_key, server_url=base_url, timeout_ms=timeout_ms)
     response = client.ocr.process(
         model=model,
         document={
@@ -164,10 +179,145 @@ def _ocr_with_mistral(pdf_bytes: bytes, api_key: str, base_url: str, model: str)
     return response.pages, response.model
 
 
+def _page_windows(page_count: int, chunk_pages: int) -> list[tuple[int, int]]:
+    """Split ``1..page_count`` into inclusive 1-indexed windows of ``chunk_pages``."""
+    return [
+        (start, min(start + chunk_pages - 1, page_count))
+        for start in range(1, page_count + 1, chunk_pages)
+    ]
+
+
+def _renumber_ids(record: dict, offsets: dict[str, int], counts: dict[str, int]) -> None:
+    """Shift chunk-local ``img-N``/``tbl-N`` ids (and their markdown references)
+    by the number of such items in earlier chunks, so ids stay document-wide unique."""
+    for key, kind in (("images", "img"), ("tables", "tbl")):
+        for item in record[key]:
+            match = _NUMBERED_ID_RE.match(item["id"] or "")
+            if not match or match.group(1) != kind:
+                continue
+            local = int(match.group(2))
+            counts[kind] = max(counts[kind], local + 1)
+            item["id"] = f"{kind}-{local + offsets[kind]}{match.group(3) or ''}"
+    if any(offsets.values()):
+        # One pass, so a shifted id is never shifted again.
+        record["markdown"] = _ID_REF_RE.sub(
+            lambda m: f"{m.group(1)}-{int(m.group(2)) + offsets[m.group(1)]}",
+            record["markdown"],
+        )
+
+
+def _stitch_chunks(chunks: list[tuple[int, list]]) -> list:
+    """Reassemble per-window OCR pages into one document-ordered page list.
+
+    ``chunks`` holds ``(window_start, pages)`` with chunk-local page indexes;
+    the result has the indexes (and image/table ids) a single OCR call over the
+    whole PDF would have produced.
+    """
+    stitched: list = []
+    offsets = {"img": 0, "tbl": 0}
+    for window_start, pages in sorted(chunks, key=lambda c: c[0]):
+        counts = {"img": 0, "tbl": 0}
+        for local_index, page in enumerate(pages):
+            record = ocr_cache.page_record(page)
+            page_index = getattr(page, "index", None)
+            record["index"] = window_start - 1 + (local_index if page_index is None else page_index)
+            _renumber_ids(record, offsets, counts)
+            stitched.append(ocr_cache.page_from_record(record))
+        offsets = {kind: offsets[kind] + counts[kind] for kind in offsets}
+    stitched.sort(key=lambda p: p.index)
+    return stitched
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether an OCR request is worth retrying.
+
+    HTTP errors are retried only for timeouts, 429 and 5xx — a 400/401/403 fails
+    the same way again. Errors without a status code (connection resets,
+    client-side timeouts) are retried.
+    """
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        return True
+    return status in (408, 429) or status >= 500
+
+
+def _ocr_chunked(
+    pdf_bytes: bytes,
+    api_key: str,
+    base_url: str,
+    model: str,
+    chunk_pages: int,
+    max_concurrency: int,
+    retries: int,
+    pdf_sha256: str | None = None,
+    page_offset: int = 0,
+) -> tuple[list, str, list[tuple[int, int]]]:
+    """OCR ``pdf_bytes`` in page windows of ``chunk_pages``, concurrently.
+
+    Each window is cut with :func:`extract_pages_as_pdf` and sent as its own
+    request (at most ``max_concurrency`` in flight); transient errors are
+    retried up to ``retries`` times with exponential backoff. Successful
+    windows are cached per absolute page range (``page_offset`` maps this PDF's
+    pages onto the uploaded one). A window that still fails is read with
+    pymupdf instead, so only its pages lose the OCR result, and a later run
+    only repeats that window.
+
+    Returns ``(pages, model_used, failed_windows)`` with the pages in document
+    order and the (1-indexed, inclusive) windows that fell back to pymupdf.
+    """
+    with fitz.open(stream=memoryview(pdf_bytes), filetype="pdf") as doc:
+        page_count = doc.page_count
+    windows = _page_windows(page_count, chunk_pages)
+    if len(windows) <= 1:
+        pages, model_used = _ocr_with_mistral(pdf_bytes, api_key, base_url, model)
+        return pages, model_used, []
+
+    def _run(window: tuple[int, int]) -> tuple[int, list, str | None]:
+        start, end = window
+        abs_range = (page_offset + start, page_offset + end)
+        if pdf_sha256:
+            cached = ocr_cache.load_pages(pdf_sha256, *abs_range, model)
+            if cached is not None:
+                return start, cached[0], cached[1]
+        sub_pdf = extract_pages_as_pdf(pdf_bytes, start, end)
+        for attempt in range(retries + 1):
+            try:
+                pages, model_used = _ocr_with_mistral(
+                    sub_pdf, api_key, base_url, model, timeout_ms=_CHUNK_TIMEOUT_MS
+                )
+                break
+            except Exception as exc:
+                if attempt == retries or not _is_transient(exc):
+                    logger.warning(
+                        "VIB OCR chunk %d–%d failed after %d attempt(s), using pymupdf for these pages: %s",
+                        start, end, attempt + 1, exc,
+                    )
+                    return start, _ocr_fallback_pymupdf(sub_pdf), None
+                delay = _CHUNK_RETRY_BACKOFF_S * 2**attempt
+                logger.warning(
+                    "VIB OCR chunk %d–%d failed (attempt %d/%d), retrying in %.0fs: %s",
+                    start, end, attempt + 1, retries + 1, delay, exc,
+                )
+                time.sleep(delay)
+        if pdf_sha256:
+            ocr_cache.store_pages(pdf_sha256, *abs_range, model, pages, model_used)
+        return start, pages, model_used
+
+    logger.info(
+        "VIB OCR chunked: %d pages in %d windows of %d (concurrency %d)",
+        page_count, len(windows), chunk_pages, max_concurrency,
+    )
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+        results = list(pool.map(_run, windows))
+    failed = [window for window, (_, _, model_used) in zip(windows, results) if model_used is None]
+    model_used = next((m for _, _, m in results if m is not None), "pymupdf")
+    return _stitch_chunks([(start, pages) for start, pages, _ in results]), model_used, failed
+
+
 def _ocr_fallback_pymupdf(pdf_bytes: bytes) -> list:
     """Extract text from PDF using pymupdf. Returns list of SimpleNamespace pages."""
     pages = []
-    with fitz.open(stream=io.BytesIO(pdf_bytes), filetype="pdf") as doc:
+    with fitz.open(stream=memoryview(pdf_bytes), filetype="pdf") as doc:
         for page in doc:
             pages.append(SimpleNamespace(index=page.number, markdown=page.get_text("text") or ""))
     return pages
@@ -178,7 +328,7 @@ def extract_pages_as_pdf(pdf_bytes: bytes, start_page: int, end_page: int) -> by
 
     Pages are 1-indexed and inclusive.  Uses pymupdf (fitz).
     """
-    with fitz.open(stream=io.BytesIO(pdf_bytes), filetype="pdf") as doc:
+    with fitz.open(stream=memoryview(pdf_bytes), filetype="pdf") as doc:
         sub = fitz.open()
         sub.insert_pdf(doc, from_page=start_page - 1, to_page=end_page - 1)
         data = sub.tobytes()
@@ -194,9 +344,16 @@ def extract_full_pdf_text(
     start_page: int | None = None,
     end_page: int | None = None,
     strip_headers_footers: bool = True,
+    chunk_pages: int = 0,
+    max_concurrency: int = 4,
+    chunk_retries: int = 2,
+    pdf_sha256: str | None = None,
 ) -> tuple[str, str, str, list[dict]]:
     """Extract the full text of a VIB PDF (all pages joined).
 
+    pdf_bytes may be any bytes-like object — the import tasks pass the upload
+    store's read-only memory map, which pymupdf and base64 read without a copy.
+
     If start_page / end_page are given (1-indexed, inclusive), only those pages
     are extracted and sent to OCR — all other pages are ignored.
 
@@ -204,29 +361,78 @@ def extract_full_pdf_text(
     separate fields by Mistral OCR) are excluded from the joined text.
     Image references are always stripped.
 
+    Mistral results are cached per (pdf sha256, page range, model) — see
+    ``tasks/ocr_cache.py``; a hit rebuilds the text without calling the API.
+    Callers that read the PDF from the blob store pass its digest as
+    pdf_sha256; it is only computed here otherwise.
+
+    chunk_pages > 0 OCRs the PDF in windows of that many pages, up to
+    max_concurrency requests in parallel with chunk_retries retries each
+    (see :func:`_ocr_chunked`); the stitched pages yield the same text as a
+    single request. A window that keeps failing is read with pymupdf on its
+    own. 0 sends the whole PDF in one request.
+
     Returns:
         (full_text, ocr_model, ocr_status) where ocr_status is one of:
           "done"     — Mistral OCR succeeded
+          "partial"  — Mistral OCR succeeded except for some page windows,
+                       which were read with pymupdf
           "fallback" — pymupdf used (no api_key or Mistral error)
           "failed"   — both Mistral and pymupdf unavailable
     """
+    # Cache key: the uploaded document and the page range actually OCR'd.
+    requested_range: tuple[int | None, int | None] = (
+        (start_page, end_page) if start_page is not None and end_page is not None else (None, None)
+    )
+    if api_key and pdf_sha256 is None:
+        pdf_sha256 = hashlib.sha256(pdf_bytes).hexdigest()
+    if api_key:
+        cached = ocr_cache.load_pages(pdf_sha256, *requested_range, model)
+        if cached is not None:
+            pages, model_used = cached
+            logger.info("VIB OCR cache hit: %d pages (model=%s), OCR skipped", len(pages), model_used)
+            return (
+                _pages_to_text(pages, strip_headers_footers=strip_headers_footers),
+                model_used,
+                "done",
+                _collect_images(pages),
+            )
+
+    ocr_range: tuple[int | None, int | None] = (None, None)
     if start_page is not None and end_page is not None:
         try:
             pdf_bytes = extract_pages_as_pdf(pdf_bytes, start_page, end_page)
+            ocr_range = requested_range
             logger.info("VIB OCR: restricted to pages %d–%d", start_page, end_page)
         except Exception as exc:
             logger.warning("Failed to extract page range %d–%d, using full PDF: %s", start_page, end_page, exc)
 
     if api_key:
         try:
-            pages, model_used = _ocr_with_mistral(pdf_bytes, api_key, base_url, model)
+            failed: list[tuple[int, int]] = []
+            if chunk_pages > 0:
+                pages, model_used, failed = _ocr_chunked(
+                    pdf_bytes, api_key, base_url, model,
+                    chunk_pages, max_concurrency, chunk_retries,
+                    pdf_sha256=pdf_sha256,
+                    page_offset=(ocr_range[0] - 1) if ocr_range[0] else 0,
+                )
+            else:
+                pages, model_used = _ocr_with_mistral(pdf_bytes, api_key, base_url, model)
             n_tables = sum(len(getattr(p, "tables", None) or []) for p in pages)
             ocr_images = _collect_images(pages)
             logger.info(
-                "VIB OCR done: %d pages, %d tables, %d images extracted (strip_headers=%s)",
-                len(pages), n_tables, len(ocr_images), strip_headers_footers,
+                "VIB OCR done: %d pages, %d tables, %d images extracted (strip_headers=%s, pymupdf windows=%s)",
+                len(pages), n_tables, len(ocr_images), strip_headers_footers, failed or "none",
             )
-            return _pages_to_text(pages, strip_headers_footers=strip_headers_footers), model_used, "done", ocr_images
+            status = "done"
+            if failed:
+                # Only complete Mistral results are cached for the whole range;
+                # the finished windows are already cached one by one.
+                status = "partial" if model_used != "pymupdf" else "fallback"
+            else:
+                ocr_cache.store_pages(pdf_sha256, *ocr_range, model, pages, model_used)
+            return _pages_to_text(pages, strip_headers_footers=strip_headers_footers), model_used, status, ocr_images
         except Exception as exc:
             logger.warning("Mistral OCR failed, falling back to pymupdf: %s", exc, exc_info=True)
 
@@ -0,0 +1,158 @@
+"""Content-addressed blob store for uploaded import documents.
+
+Import endpoints (Haushalt, VIB, Fulda) stream the uploaded PDF into
+``UPLOAD_DIR/blobs/<aa>/<sha256>`` and enqueue only the hex digest, so the
+Celery broker message no longer carries the document. Workers open the blob
+as a read-only memory map.
+
+Guarantees:
+- Streamed write: the upload is hashed while it is copied to a temp file in
+  the store and then atomically renamed to its digest — it is never held in
+  memory as a whole.
+- Deduplication: an identical re-upload finds its digest already present and
+  is reported as ``duplicate`` without writing a second copy.
+- Path safety: digests are validated as 64 lowercase hex characters before
+  they are turned into a path.
+- Retention: blobs are only needed until their parse task has run.
+  :func:`purge_expired` (run by the ``purge-upload-storage`` beat job) deletes
+  blobs that were not uploaded again for ``UPLOAD_RETENTION_HOURS``; a
+  duplicate upload renews the blob's mtime.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import mmap
+import os
+import re
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from dashboard_backend.core.config import settings
+
+CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    """Result of :func:`put_file`."""
+
+    sha256: str
+    size: int
+    duplicate: bool  # True if an identical blob was already stored
+
+
+# ---------------------------------------------------------------------------
+# Path helpers
+# ---------------------------------------------------------------------------
+
+def _blob_root() -> Path:
+    return Path(settings.upload_dir).resolve() / "blobs"
+
+
+def blob_path(sha256: str) -> Path:
+    """Return the on-disk path for ``sha256``. Raises ValueError for a bad digest."""
+    if not _DIGEST_RE.match(sha256 or ""):
+        raise ValueError(f"Invalid blob digest: {sha256!r}")
+    return _blob_root() / sha256[:2] / sha256
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def put_file(fileobj: BinaryIO) -> StoredBlob:
+    """Stream ``fileobj`` (read from its current position) into the store."""
+    root = _blob_root()
+    root.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_name = tempfile.mkstemp(dir=root, prefix=".upload-")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            while chunk := fileobj.read(CHUNK_SIZE):
+                digest.update(chunk)
+                tmp.write(chunk)
+                size += len(chunk)
+        sha256 = digest.hexdigest()
+        dest = blob_path(sha256)
+        if dest.exists():
+            # Restart the retention period for the task enqueued with this upload.
+            os.utime(dest)
+            return StoredBlob(sha256=sha256, size=size, duplicate=True)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_name, dest)
+        return StoredBlob(sha256=sha256, size=size, duplicate=False)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def put_bytes(data: bytes) -> StoredBlob:
+    """Store an in-memory payload (scripts, tests)."""
+    return put_file(io.BytesIO(data))
+
+
+def exists(sha256: str) -> bool:
+    return blob_path(sha256).is_file()
+
+
+@contextmanager
+def open_blob(sha256: str) -> Iterator[mmap.mmap | bytes]:
+    """Yield the blob as a read-only memory map.
+
+    The map is both a buffer (``memoryview``/``base64`` work on it without a
+    copy) and a seekable file object (``pdfplumber.open`` accepts it). Empty
+    blobs cannot be mapped and are yielded as ``b""``. Raises FileNotFoundError
+    if the blob is missing.
+    """
+    path = blob_path(sha256)
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            yield b""
+            return
+        mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mapped
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                # A consumer still holds a view (e.g. a PDF document kept
+                # alive by a traceback); the map is released with the view.
+                pass
+
+
+def delete_blob(sha256: str) -> None:
+    """Remove a stored blob. Silently ignores missing files."""
+    try:
+        blob_path(sha256).unlink(missing_ok=True)
+    except (ValueError, OSError):
+        pass
+
+
+def purge_expired(max_age_seconds: float) -> int:
+    """Delete blobs (and leftover temp files) older than ``max_age_seconds``.
+
+    Returns the number of deleted blobs.
+    """
+    cutoff = time.time() - max_age_seconds
+    root = _blob_root()
+    removed = 0
+    for path in [*root.glob("*/*"), *root.glob(".upload-*")]:
+        try:
+            if path.stat().st_mtime >= cutoff:
+                continue
+            path.unlink()
+        except OSError:
+            continue
+        if not path.name.startswith("."):
+            removed += 1
+    return removed
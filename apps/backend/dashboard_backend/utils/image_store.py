@@ -0,0 +1,206 @@
+"""Content-addressed store for OCR images, with one thumbnail per image.
+
+Mistral OCR returns the images embedded in a VIB as base64 strings. They are
+decoded once in the parse task and written to
+
+    UPLOAD_DIR/ocr-images/<aa>/<sha256>            original bytes
+    UPLOAD_DIR/ocr-images/<aa>/<sha256>.thumb.jpg  JPEG thumbnail
+
+so the draft only keeps a reference (``vib_draft_image``) and the image
+endpoints can serve files with range requests and a content-derived ETag.
+
+Guarantees:
+- Deduplication: identical images (the same logo on every page, a re-parse of
+  the same upload) are stored once; a second ``put_image`` only reports them.
+- Atomic writes: files are written to a temp file and renamed into place.
+- Thumbnails are best effort: an image Pillow cannot decode is still stored,
+  ``has_thumbnail`` is False and the original is served instead.
+- Path safety: digests are validated as 64 lowercase hex characters before
+  they are turned into a path.
+- Garbage collection: :func:`purge_unreferenced` (run by the
+  ``purge-upload-storage`` beat job) removes images that no draft references
+  any more, e.g. after the draft was confirmed or discarded.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
+import time
+from collections.abc import Collection
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image, UnidentifiedImageError
+
+from dashboard_backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_MAX_PX = 320
+THUMBNAIL_MEDIA_TYPE = "image/jpeg"
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+_DATA_URI_RE = re.compile(r"^data:(?P<media_type>[\w.+-]+/[\w.+-]+)?(;[^,]*)?,", re.IGNORECASE)
+
+_FORMAT_TO_MEDIA_TYPE: dict[str, str] = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "GIF": "image/gif",
+}
+_EXT_TO_MEDIA_TYPE: dict[str, str] = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
+
+@dataclass(frozen=True)
+class StoredImage:
+    """Result of :func:`put_image`."""
+
+    sha256: str
+    size: int
+    media_type: str
+    has_thumbnail: bool
+
+
+# ---------------------------------------------------------------------------
+# Path helpers
+# ---------------------------------------------------------------------------
+
+def _image_root() -> Path:
+    return Path(settings.upload_dir).resolve() / "ocr-images"
+
+
+def image_path(sha256: str) -> Path:
+    """Return the on-disk path of an image. Raises ValueError for a bad digest."""
+    if not _DIGEST_RE.match(sha256 or ""):
+        raise ValueError(f"Invalid image digest: {sha256!r}")
+    return _image_root() / sha256[:2] / sha256
+
+
+def thumbnail_path(sha256: str) -> Path:
+    """Return the on-disk path of an image's thumbnail."""
+    return image_path(sha256).with_name(f"{sha256}.thumb.jpg")
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def decode_base64(value: str) -> tuple[bytes, str | None]:
+    """Decode a base64 image, optionally given as ``data:<type>;base64,`` URI.
+
+    Returns ``(bytes, media_type)``; the media type is None without a data URI
+    prefix. Raises ValueError for invalid base64.
+    """
+    media_type = None
+    match = _DATA_URI_RE.match(value)
+    if match:
+        media_type = match.group("media_type")
+        value = value[match.end():]
+    try:
+        return base64.b64decode(value, validate=True), media_type
+    except binascii.Error as exc:
+        raise ValueError(f"Invalid base64 image data: {exc}") from exc
+
+
+def guess_media_type(name: str) -> str:
+    """Media type from a file name such as ``img-0.jpeg`` (JPEG if unknown)."""
+    return _EXT_TO_MEDIA_TYPE.get(Path(name).suffix.lower(), "image/jpeg")
+
+
+def put_image(data: bytes, media_type: str | None = None) -> StoredImage:
+    """Store ``data`` under its sha256 and make sure its thumbnail exists.
+
+    ``media_type`` is used when Pillow cannot identify the format.
+    """
+    sha256 = hashlib.sha256(data).hexdigest()
+    dest = image_path(sha256)
+    if not dest.exists():
+        _write_atomic(dest, data)
+
+    detected = None
+    thumb = thumbnail_path(sha256)
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            detected = _FORMAT_TO_MEDIA_TYPE.get(img.format or "")
+            if not thumb.exists():
+                _write_atomic(thumb, _render_thumbnail(img))
+        has_thumbnail = True
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError) as exc:
+        logger.warning("No thumbnail for OCR image %s: %s", sha256[:12], exc)
+        has_thumbnail = False
+
+    return StoredImage(
+        sha256=sha256,
+        size=len(data),
+        media_type=detected or media_type or "image/jpeg",
+        has_thumbnail=has_thumbnail,
+    )
+
+
+def exists(sha256: str) -> bool:
+    return image_path(sha256).is_file()
+
+
+def purge_unreferenced(referenced: Collection[str], min_age_seconds: float) -> int:
+    """Delete images (and their thumbnails) whose digest is not in ``referenced``.
+
+    Files younger than ``min_age_seconds`` are kept: a running parse task
+    writes its images before it commits the rows referencing them.
+    Returns the number of deleted images.
+    """
+    cutoff = time.time() - min_age_seconds
+    removed = 0
+    for path in _image_root().glob("*/*"):
+        sha256 = path.name.split(".", 1)[0]
+        if not _DIGEST_RE.match(sha256) or sha256 in referenced:
+            continue
+        try:
+            if path.stat().st_mtime >= cutoff:
+                continue
+            path.unlink()
+        except OSError:
+            continue
+        if path.name == sha256:
+            removed += 1
+    return removed
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+def _render_thumbnail(img: Image.Image) -> bytes:
+    thumb = img.copy()
+    thumb.thumbnail((THUMBNAIL_MAX_PX, THUMBNAIL_MAX_PX))
+    if thumb.mode not in ("RGB", "L"):
+        # JPEG has no alpha channel: flatten transparent areas onto white.
+        rgba = thumb.convert("RGBA")
+        thumb = Image.new("RGB", rgba.size, "white")
+        thumb.paste(rgba, mask=rgba.getchannel("A"))
+    out = io.BytesIO()
+    thumb.save(out, format="JPEG", quality=80, optimize=True)
+    return out.getvalue()
+
+
+def _write_atomic(dest: Path, data: bytes) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=".image-")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_name, dest)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
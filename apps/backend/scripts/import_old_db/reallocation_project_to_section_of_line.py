@@ -7,7 +7,7 @@ from dashboard_backend.database import Session
 from dashboard_backend.models.projects import Project
 from dashboard_backend.models.railway_infrastructure import OperationalPoint, SectionOfLine
 
-from dashboard_backend.routing.core import find_route_section_of_lines
+from dashboard_backend.routing.graph import RailGraph, get_rail_graph
 
 def haversine(lat1, lon1, lat2, lon2):
     R = 6371  # Erdradius in km
@@ -17,7 +17,7 @@ def haversine(lat1, lon1, lat2, lon2):
     a = math.sin(dphi/2)**2 + math.cos(phi1)*math.cos(phi2)*math.sin(dlambda/2)**2
     return 2 * R * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
-def find_route_between_operational_points(session: Session, start_point: list, end_point: list, operational_points_dict: dict) -> list[int]:
+def find_route_between_operational_points(graph: RailGraph, start_point: list, end_point: list, operational_points_dict: dict) -> list[int]:
     # Use precomputed operational_points_dict for faster lookup
     nearest_start_op = min(
         operational_points_dict.values(),
@@ -28,18 +28,19 @@ def find_route_between_operational_points(session: Session, start_point: list, e
         key=lambda op: haversine(end_point[1], end_point[0], op.latitude, op.longitude)
     )
     if nearest_start_op and nearest_end_op:
-        section_of_line_ids = find_route_section_of_lines(
-            session,
-            nearest_start_op.op_id,
-            nearest_end_op.op_id
-        )
-        return section_of_line_ids
+        try:
+            path = graph.shortest_path(nearest_start_op.op_id, nearest_end_op.op_id)
+        except ValueError:
+            # Operational point without a routable section.
+            return []
+        return path.section_ids if path else []
     return []
 
 def reallocate_project_to_section_of_line(session: Session, clear_existing: bool = True):
     projects = session.query(Project).all()
     operational_points = session.query(OperationalPoint).all()
     operational_points_dict = {op.id: op for op in operational_points}
+    graph = get_rail_graph(session)
 
     # Preload SectionOfLine objects for fast lookup
     section_of_line_objs = {sol.id: sol for sol in session.query(SectionOfLine).all()}
@@ -61,7 +62,7 @@ def reallocate_project_to_section_of_line(session: Session, clear_existing: bool
                 start_point = feature["geometry"]["coordinates"][0]
                 end_point = feature["geometry"]["coordinates"][-1]
                 section_of_line_ids_new = find_route_between_operational_points(
-                    session, start_point, end_point, operational_points_dict
+                    graph, start_point, end_point, operational_points_dict
                 )
                 section_of_line_ids_set.update(section_of_line_ids_new)
             elif geom_type == "Point":
@@ -1,4 +1,3 @@
 # scripts/import_rinf_data/__init__.py
 
-from . import rinf_xml_parser
-
+from . import rinf_xml_stream
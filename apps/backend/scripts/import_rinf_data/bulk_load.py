@@ -0,0 +1,486 @@
+"""
+Bulk loading of streamed RINF rows through staging tables.
+
+The rows from ``rinf_xml_stream.iter_rinf_rows`` are buffered per kind and
+flushed in batches into temporary staging tables — with ``COPY ... FROM
+STDIN`` on PostgreSQL (psycopg2) and ``executemany`` on other dialects. Once
+the file is read, ``merge_staging`` moves the data into the RINF tables with a
+handful of set-based ``INSERT ... SELECT`` statements:
+
+- operational_point: duplicates of an op_id inside the file are reduced to the
+  row with the latest ValidityDateEnd (first one on ties); op_ids already in
+  the table are left untouched.
+- section_of_line / sol_track: ids are assigned as ``MAX(id) + seq``, so
+  tracks and parameters find their parents without a round trip per row. The
+  tables are locked for the duration of the merge on PostgreSQL and the id
+  sequences are moved past the new maximum afterwards.
+
+``merge_staging_diff`` is the differential alternative (``import_xml.py
+--diff``): it matches the staged rows against the stored ones by natural key
+and applies only inserts, updates and expirations.
+"""
+
+import csv
+import io
+import logging
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import Column, Date, Float, Integer, MetaData, String, Table, bindparam, text
+from sqlalchemy.engine import Connection
+
+from .rinf_xml_stream import OPRow, ParamRow, SOLRow, TrackRow
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 5000
+
+# Stored attributes per table, besides the natural key (see merge_staging_diff).
+_OP_COLUMNS = (
+    "name, type, country_code, latitude, longitude, "
+    "validity_date_start, validity_date_end, railway_location, railway_location_km"
+)
+
+_staging = MetaData()
+
+STAGE_OP = Table(
+    "rinf_stage_op", _staging,
+    Column("seq", Integer),
+    Column("op_id", String),
+    Column("name", String),
+    Column("type", String),
+    Column("country_code", String),
+    Column("latitude", Float),
+    Column("longitude", Float),
+    Column("validity_date_start", Date),
+    Column("validity_date_end", Date),
+    Column("railway_location", String),
+    Column("railway_location_km", Float),
+    prefixes=["TEMPORARY"],
+)
+STAGE_SOL = Table(
+    "rinf_stage_sol", _staging,
+    Column("seq", Integer),
+    Column("validity_date_start", Date),
+    Column("validity_date_end", Date),
+    Column("solim_code", String),
+    Column("sol_line_identification", String),
+    Column("sol_op_start", String),
+    Column("sol_op_end", String),
+    Column("sol_length", Float),
+    Column("sol_nature", String),
+    prefixes=["TEMPORARY"],
+)
+STAGE_TRACK = Table(
+    "rinf_stage_track", _staging,
+    Column("seq", Integer),
+    Column("sol_seq", Integer),
+    Column("track_validity_date_start", Date),
+    Column("track_validity_date_end", Date),
+    Column("sol_track_identification", String),
+    Column("sol_track_direction", String),
+    prefixes=["TEMPORARY"],
+)
+STAGE_PARAM = Table(
+    "rinf_stage_param", _staging,
+    Column("seq", Integer),
+    Column("track_seq", Integer),
+    Column("parameter_id", String),
+    Column("is_applicable", String),
+    Column("value", String),
+    Column("optional_value", String),
+    prefixes=["TEMPORARY"],
+)
+
+# Differential merge: staged row (seq) -> id of the matching or newly inserted row.
+_MAP_TABLES = [
+    Table(
+        name, _staging,
+        Column("seq", Integer, primary_key=True, autoincrement=False),
+        Column("target_id", Integer),
+        Column("is_new", Integer, nullable=False, default=0),
+        prefixes=["TEMPORARY"],
+    )
+    for name in ("rinf_map_sol", "rinf_map_track", "rinf_map_param")
+]
+
+_STAGE_FOR_ROW = {OPRow: STAGE_OP, SOLRow: STAGE_SOL, TrackRow: STAGE_TRACK, ParamRow: STAGE_PARAM}
+
+
+@dataclass
+class MergeStats:
+    """Row counts of one import, as logged by ``import_xml``."""
+
+    operational_points: int = 0
+    operational_points_skipped: int = 0
+    sections_of_line: int = 0
+    tracks: int = 0
+    parameters: int = 0
+
+
+class StagingLoader:
+    """Buffer rows per staging table and flush them in batches."""
+
+    def __init__(self, conn: Connection, batch_size: int = BATCH_SIZE):
+        self.conn = conn
+        self.batch_size = batch_size
+        self._buffers: dict[Table, list[tuple]] = {table: [] for table in _STAGE_FOR_ROW.values()}
+        self._use_copy = conn.dialect.name == "postgresql" and conn.dialect.driver == "psycopg2"
+
+    def __enter__(self) -> "StagingLoader":
+        _staging.drop_all(self.conn, checkfirst=True)
+        _staging.create_all(self.conn)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if exc[0] is None:
+            self.flush()
+
+    def add(self, row: OPRow | SOLRow | TrackRow | ParamRow) -> None:
+        table = _STAGE_FOR_ROW[type(row)]
+        buffer = self._buffers[table]
+        buffer.append(tuple(row))
+        if len(buffer) >= self.batch_size:
+            self._flush_table(table)
+
+    def flush(self) -> None:
+        for table in self._buffers:
+            self._flush_table(table)
+
+    def _flush_table(self, table: Table) -> None:
+        rows = self._buffers[table]
+        if not rows:
+            return
+        if self._use_copy:
+            self._copy(table, rows)
+        else:
+            keys = table.columns.keys()
+            self.conn.execute(table.insert(), [dict(zip(keys, row)) for row in rows])
+        rows.clear()
+
+    def _copy(self, table: Table, rows: list[tuple]) -> None:
+        buf = io.StringIO()
+        # None is written as an unquoted empty field, which COPY's csv format reads as NULL.
+        csv.writer(buf).writerows(rows)
+        buf.seek(0)
+        columns = ", ".join(c.name for c in table.columns)
+        cursor = self.conn.connection.driver_connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table.name} ({columns}) FROM STDIN WITH (FORMAT csv)", buf)
+        finally:
+            cursor.close()
+
+
+def drop_staging(conn: Connection) -> None:
+    _staging.drop_all(conn, checkfirst=True)
+
+
+def clear_rinf_tables(conn: Connection) -> None:
+    """Delete all RINF rows, children first."""
+    for table in ("sol_track_parameter", "sol_track", "section_of_line", "operational_point"):
+        conn.execute(text(f"DELETE FROM {table}"))
+
+
+def _lock_rinf_tables(conn: Connection) -> None:
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(
+            "LOCK TABLE operational_point, section_of_line, sol_track, sol_track_parameter IN EXCLUSIVE MODE"
+        ))
+
+
+def _reset_sequences(conn: Connection) -> None:
+    """Move the id sequences past the ids assigned as ``MAX(id) + seq``."""
+    if conn.dialect.name == "postgresql":
+        for table in ("section_of_line", "sol_track"):
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"(SELECT COALESCE(MAX(id), 0) + 1 FROM {table}), false)"
+            ))
+
+
+def _dedupe_staged_ops(conn: Connection) -> int:
+    """Keep one staged row per op_id (latest ValidityDateEnd, first on ties); return their count."""
+    conn.execute(text("""
+        DELETE FROM rinf_stage_op WHERE seq IN (
+            SELECT seq FROM (
+                SELECT seq, ROW_NUMBER() OVER (
+                    PARTITION BY op_id
+                    ORDER BY CASE WHEN validity_date_end IS NULL THEN 1 ELSE 0 END,
+                             validity_date_end DESC, seq
+                ) AS dup_rank
+                FROM rinf_stage_op
+            ) ranked
+            WHERE dup_rank > 1
+        )
+    """))
+    return conn.execute(text("SELECT COUNT(*) FROM rinf_stage_op")).scalar_one()
+
+
+def _insert_new_ops(conn: Connection) -> int:
+    return conn.execute(text(f"""
+        INSERT INTO operational_point (op_id, {_OP_COLUMNS})
+        SELECT op_id, {_OP_COLUMNS}
+        FROM rinf_stage_op s
+        WHERE NOT EXISTS (SELECT 1 FROM operational_point o WHERE o.op_id = s.op_id)
+    """)).rowcount
+
+
+def merge_staging(conn: Connection) -> MergeStats:
+    """Move the staged rows into the RINF tables (set-based, see module docstring)."""
+    stats = MergeStats()
+    _lock_rinf_tables(conn)
+
+    staged_ops = _dedupe_staged_ops(conn)
+    stats.operational_points = _insert_new_ops(conn)
+    stats.operational_points_skipped = staged_ops - stats.operational_points
+
+    sol_base = conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM section_of_line")).scalar_one()
+    track_base = conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM sol_track")).scalar_one()
+    stats.sections_of_line = conn.execute(text("""
+        INSERT INTO section_of_line (
+            id, validity_date_start, validity_date_end, solim_code, sol_line_identification,
+            sol_op_start, sol_op_end, sol_length, sol_nature
+        )
+        SELECT :base + seq, validity_date_start, validity_date_end, solim_code, sol_line_identification,
+               sol_op_start, sol_op_end, sol_length, sol_nature
+        FROM rinf_stage_sol
+    """), {"base": sol_base}).rowcount
+    stats.tracks = conn.execute(text("""
+        INSERT INTO sol_track (
+            id, section_id, track_validity_date_start, track_validity_date_end,
+            sol_track_identification, sol_track_direction
+        )
+        SELECT :base + seq, :sol_base + sol_seq, track_validity_date_start, track_validity_date_end,
+               sol_track_identification, sol_track_direction
+        FROM rinf_stage_track
+    """), {"base": track_base, "sol_base": sol_base}).rowcount
+    stats.parameters = conn.execute(text("""
+        INSERT INTO sol_track_parameter (track_id, parameter_id, is_applicable, value, optional_value, manual_added)
+        SELECT :track_base + track_seq, parameter_id, is_applicable, value, optional_value, false
+        FROM rinf_stage_param
+    """), {"track_base": track_base}).rowcount
+
+    _reset_sequences(conn)
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Differential merge
+# ---------------------------------------------------------------------------
+
+# Natural keys. op_id is unique; a section is identified by its IM code, line
+# and end points and the start of its validity, a track by its section,
+# identification and direction, a parameter by its track and parameter ID.
+_SOL_KEY = ("solim_code", "sol_line_identification", "sol_op_start", "sol_op_end", "validity_date_start")
+_TRACK_KEY = ("sol_track_identification", "sol_track_direction")
+
+_SOL_ATTRS = ("validity_date_end", "sol_length", "sol_nature")
+_TRACK_ATTRS = ("track_validity_date_start", "track_validity_date_end")
+_PARAM_ATTRS = ("is_applicable", "value", "optional_value")
+
+
+@dataclass
+class DiffStats:
+    """Delta applied by ``merge_staging_diff`` (inserted / updated / expired or deleted)."""
+
+    operational_points_inserted: int = 0
+    operational_points_updated: int = 0
+    operational_points_expired: int = 0
+    sections_of_line_inserted: int = 0
+    sections_of_line_updated: int = 0
+    sections_of_line_expired: int = 0
+    tracks_inserted: int = 0
+    tracks_updated: int = 0
+    tracks_deleted: int = 0
+    parameters_inserted: int = 0
+    parameters_updated: int = 0
+    parameters_deleted: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"operational points +{self.operational_points_inserted} ~{self.operational_points_updated} "
+            f"expired {self.operational_points_expired}; "
+            f"sections of line +{self.sections_of_line_inserted} ~{self.sections_of_line_updated} "
+            f"expired {self.sections_of_line_expired}; "
+            f"tracks +{self.tracks_inserted} ~{self.tracks_updated} -{self.tracks_deleted}; "
+            f"parameters +{self.parameters_inserted} ~{self.parameters_updated} -{self.parameters_deleted}"
+        )
+
+
+def _key_match(a: str, b: str, columns: tuple[str, ...]) -> str:
+    # NULL-safe equality that still allows hash joins (unlike IS NOT DISTINCT FROM).
+    return " AND ".join(
+        f"COALESCE(CAST({a}.{c} AS VARCHAR(100)), '') = COALESCE(CAST({b}.{c} AS VARCHAR(100)), '')"
+        for c in columns
+    )
+
+
+def _changed(a: str, b: str, columns: tuple[str, ...]) -> str:
+    return " OR ".join(f"{a}.{c} IS DISTINCT FROM {b}.{c}" for c in columns)
+
+
+def _dedupe_staged(conn: Connection, table: str, partition: str) -> None:
+    conn.execute(text(f"""
+        DELETE FROM {table} WHERE seq NOT IN (SELECT MIN(seq) FROM {table} GROUP BY {partition})
+    """))
+
+
+def merge_staging_diff(conn: Connection, expire_on: date) -> DiffStats:
+    """Apply only the delta between the staged file and the stored RINF rows.
+
+    Matching rows are updated where an attribute differs, unmatched staged
+    rows are inserted. Operational points and sections of line of the
+    imported countries that are no longer in the file are expired
+    (``validity_date_end = expire_on``) instead of deleted, so project links
+    stay intact. Tracks and (non-manual) parameters of the imported sections
+    that disappeared from the file are deleted; manually added parameters are
+    never touched.
+    """
+    stats = DiffStats()
+    _lock_rinf_tables(conn)
+
+    # Countries covered by the file — only their rows can expire.
+    countries = [
+        row[0] for row in conn.execute(text("""
+            SELECT country_code FROM rinf_stage_op WHERE country_code IS NOT NULL
+            UNION
+            SELECT SUBSTR(sol_op_start, 1, 2) FROM rinf_stage_sol WHERE sol_op_start IS NOT NULL
+        """))
+    ]
+
+    # -- operational points ---------------------------------------------------
+    _dedupe_staged_ops(conn)
+    op_attrs = tuple(c.strip() for c in _OP_COLUMNS.split(","))
+    stats.operational_points_updated = conn.execute(text(f"""
+        UPDATE operational_point
+        SET {", ".join(f"{c} = s.{c}" for c in op_attrs)}
+        FROM rinf_stage_op s
+        WHERE operational_point.op_id = s.op_id AND ({_changed("operational_point", "s", op_attrs)})
+    """)).rowcount
+    stats.operational_points_inserted = _insert_new_ops(conn)
+    if countries:
+        stats.operational_points_expired = conn.execute(
+            text("""
+                UPDATE operational_point SET validity_date_end = :expire_on
+                WHERE country_code IN :countries
+                  AND (validity_date_end IS NULL OR validity_date_end > :expire_on)
+                  AND NOT EXISTS (SELECT 1 FROM rinf_stage_op s WHERE s.op_id = operational_point.op_id)
+            """).bindparams(bindparam("countries", expanding=True), bindparam("expire_on", type_=Date)),
+            {"expire_on": expire_on, "countries": countries},
+        ).rowcount
+
+    # -- sections of line -------------------------------------------------------
+    _dedupe_staged(conn, "rinf_stage_sol", ", ".join(_SOL_KEY))
+    conn.execute(text("DELETE FROM rinf_stage_track WHERE sol_seq NOT IN (SELECT seq FROM rinf_stage_sol)"))
+    conn.execute(text(f"""
+        INSERT INTO rinf_map_sol (seq, target_id, is_new)
+        SELECT s.seq, MIN(t.id), 0
+        FROM rinf_stage_sol s LEFT JOIN section_of_line t ON {_key_match("s", "t", _SOL_KEY)}
+        GROUP BY s.seq
+    """))
+    sol_base = conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM section_of_line")).scalar_one()
+    conn.execute(
+        text("UPDATE rinf_map_sol SET target_id = :base + seq, is_new = 1 WHERE target_id IS NULL"),
+        {"base": sol_base},
+    )
+    stats.sections_of_line_updated = conn.execute(text(f"""
+        UPDATE section_of_line
+        SET {", ".join(f"{c} = s.{c}" for c in _SOL_ATTRS)}
+        FROM rinf_stage_sol s JOIN rinf_map_sol m ON m.seq = s.seq
+        WHERE section_of_line.id = m.target_id AND m.is_new = 0
+          AND ({_changed("section_of_line", "s", _SOL_ATTRS)})
+    """)).rowcount
+    stats.sections_of_line_inserted = conn.execute(text(f"""
+        INSERT INTO section_of_line (id, {", ".join(_SOL_KEY + _SOL_ATTRS)})
+        SELECT m.target_id, {", ".join(f"s.{c}" for c in _SOL_KEY + _SOL_ATTRS)}
+        FROM rinf_stage_sol s JOIN rinf_map_sol m ON m.seq = s.seq
+        WHERE m.is_new = 1
+    """)).rowcount
+    if countries:
+        stats.sections_of_line_expired = conn.execute(
+            text("""
+                UPDATE section_of_line SET validity_date_end = :expire_on
+                WHERE SUBSTR(sol_op_start, 1, 2) IN :countries
+                  AND (validity_date_end IS NULL OR validity_date_end > :expire_on)
+                  AND id NOT IN (SELECT target_id FROM rinf_map_sol)
+            """).bindparams(bindparam("countries", expanding=True), bindparam("expire_on", type_=Date)),
+            {"expire_on": expire_on, "countries": countries},
+        ).rowcount
+
+    # -- tracks ---------------------------------------------------------------
+    _dedupe_staged(conn, "rinf_stage_track", "sol_seq, " + ", ".join(_TRACK_KEY))
+    conn.execute(text("DELETE FROM rinf_stage_param WHERE track_seq NOT IN (SELECT seq FROM rinf_stage_track)"))
+    conn.execute(text(f"""
+        INSERT INTO rinf_map_track (seq, target_id, is_new)
+        SELECT s.seq, MIN(t.id), 0
+        FROM rinf_stage_track s
+        JOIN rinf_map_sol ms ON ms.seq = s.sol_seq
+        LEFT JOIN sol_track t ON t.section_id = ms.target_id AND {_key_match("s", "t", _TRACK_KEY)}
+        GROUP BY s.seq
+    """))
+    track_base = conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM sol_track")).scalar_one()
+    conn.execute(
+        text("UPDATE rinf_map_track SET target_id = :base + seq, is_new = 1 WHERE target_id IS NULL"),
+        {"base": track_base},
+    )
+    stale_tracks = """
+        SELECT id FROM sol_track
+        WHERE section_id IN (SELECT target_id FROM rinf_map_sol)
+          AND id NOT IN (SELECT target_id FROM rinf_map_track)
+    """
+    conn.execute(text(f"DELETE FROM sol_track_parameter WHERE track_id IN ({stale_tracks})"))
+    stats.tracks_deleted = conn.execute(text(f"DELETE FROM sol_track WHERE id IN ({stale_tracks})")).rowcount
+    stats.tracks_updated = conn.execute(text(f"""
+        UPDATE sol_track
+        SET {", ".join(f"{c} = s.{c}" for c in _TRACK_ATTRS)}
+        FROM rinf_stage_track s JOIN rinf_map_track m ON m.seq = s.seq
+        WHERE sol_track.id = m.target_id AND m.is_new = 0
+          AND ({_changed("sol_track", "s", _TRACK_ATTRS)})
+    """)).rowcount
+    stats.tracks_inserted = conn.execute(text(f"""
+        INSERT INTO sol_track (id, section_id, {", ".join(_TRACK_KEY + _TRACK_ATTRS)})
+        SELECT m.target_id, ms.target_id, {", ".join(f"s.{c}" for c in _TRACK_KEY + _TRACK_ATTRS)}
+        FROM rinf_stage_track s
+        JOIN rinf_map_track m ON m.seq = s.seq
+        JOIN rinf_map_sol ms ON ms.seq = s.sol_seq
+        WHERE m.is_new = 1
+    """)).rowcount
+
+    # -- track parameters (manually added ones are left alone) ----------------
+    _dedupe_staged(conn, "rinf_stage_param", "track_seq, parameter_id")
+    conn.execute(text("""
+        INSERT INTO rinf_map_param (seq, target_id, is_new)
+        SELECT s.seq, MIN(p.id), 0
+        FROM rinf_stage_param s
+        JOIN rinf_map_track mt ON mt.seq = s.track_seq
+        LEFT JOIN sol_track_parameter p
+               ON p.track_id = mt.target_id
+              AND COALESCE(p.parameter_id, '') = COALESCE(s.parameter_id, '')
+              AND (p.manual_added IS NULL OR p.manual_added = false)
+        GROUP BY s.seq
+    """))
+    conn.execute(text("UPDATE rinf_map_param SET is_new = 1 WHERE target_id IS NULL"))
+    stats.parameters_deleted = conn.execute(text("""
+        DELETE FROM sol_track_parameter
+        WHERE track_id IN (SELECT target_id FROM rinf_map_track WHERE is_new = 0)
+          AND (manual_added IS NULL OR manual_added = false)
+          AND id NOT IN (SELECT target_id FROM rinf_map_param WHERE target_id IS NOT NULL)
+    """)).rowcount
+    stats.parameters_updated = conn.execute(text(f"""
+        UPDATE sol_track_parameter
+        SET {", ".join(f"{c} = s.{c}" for c in _PARAM_ATTRS)}
+        FROM rinf_stage_param s JOIN rinf_map_param m ON m.seq = s.seq
+        WHERE sol_track_parameter.id = m.target_id
+          AND ({_changed("sol_track_parameter", "s", _PARAM_ATTRS)})
+    """)).rowcount
+    stats.parameters_inserted = conn.execute(text("""
+        INSERT INTO sol_track_parameter (track_id, parameter_id, is_applicable, value, optional_value, manual_added)
+        SELECT mt.target_id, s.parameter_id, s.is_applicable, s.value, s.optional_value, false
+        FROM rinf_stage_param s
+        JOIN rinf_map_param m ON m.seq = s.seq
+        JOIN rinf_map_track mt ON mt.seq = s.track_seq
+        WHERE m.is_new = 1
+    """)).rowcount
+
+    _reset_sequences(conn)
+    return stats
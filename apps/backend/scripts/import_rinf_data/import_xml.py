@@ -1,36 +1,65 @@
 """
-This script imports RINF (Register of Infrastructure) data from an XML file into the database.
+This script imports RINF (Register of Infrastructure) data from XML files into the database.
 
 Usage:
-    python import_xml.py <country_code> [--clear]
+    python import_xml.py <country_code> [<country_code> ...] [--clear | --diff]
 
 Arguments:
     <country_code>: The two-letter country code for which to import data (e.g., 'DE').
                     The script expects a corresponding file 'rinf_<country_code>.xml'
-                    in the 'output/xml_countries' directory.
+                    in the 'output/xml_countries' directory. Several codes can be given.
 
 Options:
     --clear: If specified, all existing data in the relevant database tables
              (OperationalPoint, SectionOfLine, SOLTrack, SOLTrackParameter)
-             will be deleted before the new data is imported.
+             will be deleted before the new data is imported. Deleting cascades to the
+             project links (project_to_operation_point / project_to_section_of_line).
+    --diff:  Differential re-import: compare the file with the stored rows by op_id /
+             section key, apply only inserts, updates and expirations and log the delta.
+             Rows of the imported countries that are no longer in the file get
+             ValidityDateEnd = today instead of being deleted, so project links stay.
+
+The file is streamed (see ``rinf_xml_stream.py``) into temporary staging
+tables in batches of plain tuples — ``COPY`` on PostgreSQL — and merged into
+the RINF tables with set-based statements (see ``bulk_load.py``). Memory use
+does not grow with the size of the file. Each country is imported in its own
+transaction, which also rebuilds the routing topology (routing_node /
+routing_edge, see ``dashboard_backend/routing/topology.py``).
 
 Example (import for Germany without clearing tables):
     python import_xml.py DE
 
-Example (import for Austria, clearing tables first):
-    python import_xml.py AT --clear
+Example (import for Austria and Switzerland, clearing tables first):
+    python import_xml.py AT CH --clear
+
+Example (quarterly refresh for Germany):
+    python import_xml.py DE --diff
 """
 
 import os
 import sys
+import time
 import logging
 import argparse
+from datetime import date
 from xml.etree import ElementTree as ET
-from scripts.import_rinf_data.rinf_xml_parser import parse_rinf_operational_points_to_object, parse_rinf_sections_of_line_to_object
 
+from sqlalchemy.engine import Connection
+
+from scripts.import_rinf_data.bulk_load import (
+    BATCH_SIZE,
+    DiffStats,
+    MergeStats,
+    StagingLoader,
+    clear_rinf_tables,
+    drop_staging,
+    merge_staging,
+    merge_staging_diff,
+)
 from scripts.import_rinf_data.config import OUTPUT_DIR
-from dashboard_backend.database import Session
-from dashboard_backend.models.railway_infrastructure import OperationalPoint, SectionOfLine, SOLTrackParameter, SOLTrack
+from scripts.import_rinf_data.rinf_xml_stream import iter_rinf_rows
+from dashboard_backend.database import engine
+from dashboard_backend.routing.topology import refresh_routing_topology
 
 # Logging configuration
 logging.basicConfig(
@@ -39,79 +68,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-print(f"Aktuelles Arbeitsverzeichnis: {os.getcwd()}")
-print(f"Python-Suchpfad: {sys.path}")
 
-def import_xml(xml_file_path: str) -> ET.ElementTree:
+def _stage_file(conn: Connection, xml_file_path: str, batch_size: int) -> None:
+    started = time.monotonic()
+    logger.info(f"Streaming XML file into staging tables: {xml_file_path}")
+    rows = 0
     try:
-        logger.info(f"Starting to parse XML file: {xml_file_path}")
-        tree = ET.parse(xml_file_path)
-        root = tree.getroot()
+        with StagingLoader(conn, batch_size=batch_size) as loader:
+            for row in iter_rinf_rows(xml_file_path):
+                loader.add(row)
+                rows += 1
     except ET.ParseError as e:
         logger.error(f"Error parsing XML file {xml_file_path}: {e}")
         raise
-    return root
-
-
-def import_xml_country(country_string: str, clear_tables: bool = False, output_dir: str = OUTPUT_DIR) -> None:
-    # read the XML file
+    logger.info(f"Staged {rows} rows in {time.monotonic() - started:.1f}s, merging...")
+
+
+def import_xml_file(conn: Connection, xml_file_path: str, clear_tables: bool = False, batch_size: int = BATCH_SIZE) -> MergeStats:
+    """Stream one RINF XML file into the database over ``conn`` (no commit)."""
+    started = time.monotonic()
+    if clear_tables:
+        logger.info("Clearing database tables before import...")
+        clear_rinf_tables(conn)
+        logger.info("Tables cleared.")
+
+    _stage_file(conn, xml_file_path, batch_size)
+    stats = merge_staging(conn)
+    drop_staging(conn)
+    logger.info(
+        f"Imported {stats.operational_points} operational points "
+        f"({stats.operational_points_skipped} already present), {stats.sections_of_line} sections of line, "
+        f"{stats.tracks} tracks, {stats.parameters} track parameters in {time.monotonic() - started:.1f}s."
+    )
+    return stats
+
+
+def import_xml_file_diff(
+    conn: Connection, xml_file_path: str, expire_on: date | None = None, batch_size: int = BATCH_SIZE
+) -> DiffStats:
+    """Differential re-import of one RINF XML file over ``conn`` (no commit)."""
+    started = time.monotonic()
+    _stage_file(conn, xml_file_path, batch_size)
+    stats = merge_staging_diff(conn, expire_on or date.today())
+    drop_staging(conn)
+    logger.info(f"Applied RINF delta in {time.monotonic() - started:.1f}s: {stats.summary()}")
+    return stats
+
+
+def import_xml_country(
+    country_string: str, clear_tables: bool = False, output_dir: str = OUTPUT_DIR, diff: bool = False
+) -> MergeStats | DiffStats:
     xml_file_path = os.path.abspath(f'{output_dir}/xml_countries/rinf_{country_string}.xml')
     if not os.path.exists(xml_file_path):
         logger.error(f"XML file for country {country_string} does not exist at {xml_file_path}")
         raise FileNotFoundError(f"XML file for country {country_string} does not exist at {xml_file_path}")
 
     logger.info(f"Importing data for country: {country_string}")
-    root = import_xml(xml_file_path)
-
-    logger.info("Parsing operational points...")
-    operational_lines = parse_rinf_operational_points_to_object(root)
-    logger.info(f"Parsed {len(operational_lines)} operational points.")
-
-    logger.info("Parsing sections of line...")
-    section_of_lines = parse_rinf_sections_of_line_to_object(root)
-    logger.info(f"Parsed {len(section_of_lines)} sections of line.")
-
-    # save operational points and sections of line to the database
-    session = Session()
     try:
-        if clear_tables:
-            logger.info("Clearing database tables before import...")
-            # This will also delete related SOLTrack and SOLTrackParameter due to cascade
-            session.query(SectionOfLine).delete()
-            session.query(OperationalPoint).delete()
-            session.query(SOLTrack).delete()
-            session.query(SOLTrackParameter).delete()
-            logger.info("Tables cleared.")
-
-        logger.info("Saving objects to the database...")
-        session.add_all(operational_lines)
-        session.add_all(section_of_lines)
-        session.commit()
-        logger.info("Data successfully written to the database.")
+        with engine.begin() as conn:
+            if diff:
+                stats = import_xml_file_diff(conn, xml_file_path)
+            else:
+                stats = import_xml_file(conn, xml_file_path, clear_tables)
+            refresh_routing_topology(conn)
     except Exception as e:
         logger.error(f"Error writing to the database: {e}")
-        session.rollback()
         raise
-    finally:
-        session.close()
-        logger.info("Session closed.")
+    logger.info("Data successfully written to the database.")
+    return stats
 
 
 if __name__ == "__main__":
     if len(sys.argv) == 1:
-        country_code = "DE"
-        clear = False
+        country_codes = ["DE"]
+        clear = diff = False
         logging.warning(f"No country code provided. Defaulting to 'DE'. Use --help for usage instructions.")
     else:
-        parser = argparse.ArgumentParser(description="Import RINF XML data for a specific country.")
-        parser.add_argument("country_code", type=str, help="The country code to import (e.g., 'DE').")
-        parser.add_argument("--clear", action="store_true", help="Clear the relevant database tables before importing.")
+        parser = argparse.ArgumentParser(description="Import RINF XML data for one or more countries.")
+        parser.add_argument("country_codes", type=str, nargs="+", help="The country codes to import (e.g., 'DE AT').")
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument("--clear", action="store_true", help="Clear the relevant database tables before importing.")
+        mode.add_argument("--diff", action="store_true", help="Apply only the delta to the stored rows (keeps project links).")
         args = parser.parse_args()
-        country_code = args.country_code
+        country_codes = args.country_codes
         clear = args.clear
+        diff = args.diff
 
     try:
-        import_xml_country(country_code, clear)
+        for i, country_code in enumerate(country_codes):
+            # --clear empties the tables once, before the first country.
+            import_xml_country(country_code, clear and i == 0, diff=diff)
     except Exception as e:
         logger.error(f"Import failed: {e}")
         sys.exit(1)
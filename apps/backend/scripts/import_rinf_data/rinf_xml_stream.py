@@ -0,0 +1,191 @@
+"""
+Streaming reader for RINF country XML files.
+
+``iter_rinf_rows`` walks the file with ``ElementTree.iterparse`` and yields one
+plain tuple per OperationalPoint, SectionOfLine, SOLTrack and
+SOLTrackParameter. Every OperationalPoint / SectionOfLine element is removed
+from its parent as soon as it has been read, so memory stays constant no
+matter how large the country file is.
+
+Rows are numbered (``seq``) in document order: tracks refer to their section
+and parameters to their track by that number, which the bulk loader turns into
+database ids (see ``bulk_load.py``).
+"""
+
+import logging
+from datetime import date
+from typing import Iterator, NamedTuple
+from xml.etree import ElementTree as ET
+
+logger = logging.getLogger(__name__)
+
+_RECORD_TAGS = frozenset({"OperationalPoint", "SectionOfLine"})
+
+
+class OPRow(NamedTuple):
+    seq: int
+    op_id: str
+    name: str | None
+    type: str | None
+    country_code: str | None
+    latitude: float | None
+    longitude: float | None
+    validity_date_start: date | None
+    validity_date_end: date | None
+    railway_location: str | None
+    railway_location_km: float | None
+
+
+class SOLRow(NamedTuple):
+    seq: int
+    validity_date_start: date | None
+    validity_date_end: date | None
+    solim_code: str | None
+    sol_line_identification: str | None
+    sol_op_start: str | None
+    sol_op_end: str | None
+    sol_length: float | None
+    sol_nature: str | None
+
+
+class TrackRow(NamedTuple):
+    seq: int
+    sol_seq: int
+    track_validity_date_start: date | None
+    track_validity_date_end: date | None
+    sol_track_identification: str | None
+    sol_track_direction: str | None
+
+
+class ParamRow(NamedTuple):
+    seq: int
+    track_seq: int
+    parameter_id: str | None
+    is_applicable: str | None
+    value: str | None
+    optional_value: str | None
+
+
+def _attr(elem: ET.Element, child: str, name: str = "Value") -> str | None:
+    node = elem.find(child)
+    if node is None:
+        return None
+    return node.get(name) or None
+
+
+def _float(value: str | None) -> float | None:
+    if value is None:
+        return None
+    return float(value.replace(",", "."))
+
+
+def _date(value: str | None) -> date | None:
+    # RINF dates are ISO dates, sometimes with a time part.
+    return date.fromisoformat(value[:10]) if value else None
+
+
+def _op_row(seq: int, op: ET.Element) -> OPRow | None:
+    op_id = _attr(op, "UniqueOPID")
+    if op_id is None:
+        return None
+    location = op.find("OPGeographicLocation")
+    railway_location = op.find("OPRailwayLocation")
+    return OPRow(
+        seq=seq,
+        op_id=op_id,
+        name=_attr(op, "OPName"),
+        type=_attr(op, "OPType"),
+        country_code=op_id[0:2],
+        latitude=_float(location.get("Latitude")) if location is not None else None,
+        longitude=_float(location.get("Longitude")) if location is not None else None,
+        validity_date_start=_date(op.get("ValidityDateStart")),
+        validity_date_end=_date(op.get("ValidityDateEnd")),
+        railway_location=railway_location.get("NationalIdentNum") if railway_location is not None else None,
+        railway_location_km=_float(railway_location.get("Kilometer")) if railway_location is not None else None,
+    )
+
+
+def _sol_row(seq: int, section: ET.Element) -> SOLRow:
+    return SOLRow(
+        seq=seq,
+        validity_date_start=_date(section.get("ValidityDateStart")),
+        validity_date_end=_date(section.get("ValidityDateEnd")),
+        solim_code=_attr(section, "SOLIMCode"),
+        sol_line_identification=_attr(section, "SOLLineIdentification"),
+        sol_op_start=_attr(section, "SOLOPStart"),
+        sol_op_end=_attr(section, "SOLOPEnd"),
+        sol_length=_float(_attr(section, "SOLLength")),
+        sol_nature=_attr(section, "SOLNature"),
+    )
+
+
+def _track_row(seq: int, sol_seq: int, track: ET.Element) -> TrackRow:
+    return TrackRow(
+        seq=seq,
+        sol_seq=sol_seq,
+        track_validity_date_start=_date(track.get("ValidityDateStart")),
+        track_validity_date_end=_date(track.get("ValidityDateEnd")),
+        sol_track_identification=_attr(track, "SOLTrackIdentification"),
+        sol_track_direction=_attr(track, "SOLTrackDirection"),
+    )
+
+
+def _param_row(seq: int, track_seq: int, param: ET.Element) -> ParamRow:
+    return ParamRow(
+        seq=seq,
+        track_seq=track_seq,
+        parameter_id=param.get("ID"),
+        is_applicable=param.get("IsApplicable"),
+        value=param.get("Value"),
+        optional_value=param.get("OptionalValue"),
+    )
+
+
+def iter_rinf_rows(xml_source) -> Iterator[OPRow | SOLRow | TrackRow | ParamRow]:
+    """Yield the rows of a RINF XML file (path or binary file object) in document order.
+
+    OperationalPoints without a UniqueOPID are skipped with a warning.
+    Raises ``ET.ParseError`` for malformed XML.
+    """
+    op_seq = sol_seq = track_seq = param_seq = 0
+    skipped = 0
+    # Open elements from the root down; the parent of a finished element is stack[-1].
+    stack: list[ET.Element] = []
+    open_records = 0
+    for event, elem in ET.iterparse(xml_source, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            if elem.tag in _RECORD_TAGS:
+                open_records += 1
+            continue
+
+        stack.pop()
+        if elem.tag == "OperationalPoint":
+            op_seq += 1
+            row = _op_row(op_seq, elem)
+            if row is None:
+                skipped += 1
+            else:
+                yield row
+        elif elem.tag == "SectionOfLine":
+            sol_seq += 1
+            yield _sol_row(sol_seq, elem)
+            for track in elem.iter("SOLTrack"):
+                track_seq += 1
+                yield _track_row(track_seq, sol_seq, track)
+                for param in track.iter("SOLTrackParameter"):
+                    param_seq += 1
+                    yield _param_row(param_seq, track_seq, param)
+        elif open_records:
+            # Child of a record still being read.
+            continue
+
+        if elem.tag in _RECORD_TAGS:
+            open_records -= 1
+        # Finished records and everything outside them are dropped right away.
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+    if skipped:
+        logger.warning("Skipped %d OperationalPoints without UniqueOPID.", skipped)
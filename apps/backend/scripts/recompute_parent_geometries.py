@@ -0,0 +1,37 @@
+"""Recompute the merged geometry of every superior project.
+
+Run after bulk imports that (re)assign ``superior_project_id`` or load many
+geometries at once (e.g. ``import_old_db/reallocation_superior_project_id.py``).
+All parents are recomputed bottom-up and committed in a single transaction.
+
+Usage:
+    python scripts/recompute_parent_geometries.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from dashboard_backend.crud.projects.projects import recompute_all_parent_geojson
+from dashboard_backend.database import Session
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Recompute geojson_representation/geometry of all superior projects from their children"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    parse_args()
+    started = time.perf_counter()
+    with Session() as db:
+        count = recompute_all_parent_geojson(db)
+    print(f"Recomputed {count} parent projects in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
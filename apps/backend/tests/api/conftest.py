@@ -12,6 +12,7 @@ from dashboard_backend.crud import roles as roles_crud
 from dashboard_backend.database import get_db
 from dashboard_backend.dependencies.routes import get_route_service
 from dashboard_backend.models.app_settings import AppSettings
+from dashboard_backend.models.data_version import DataVersion
 from dashboard_backend.models.guides import GuideSectionOverride
 from dashboard_backend.models.projects.project_text import ProjectText
 from dashboard_backend.models.projects.project_text_type import ProjectTextType
@@ -19,6 +20,15 @@ from dashboard_backend.models.roles import Role, RolePermission
 from dashboard_backend.models.todos.todo import Todo, TodoAssignee
 from dashboard_backend.models.users import User
 from dashboard_backend.models.routes import Route
+from dashboard_backend.models.vib import (
+    VibDraftEntry,
+    VibDraftImage,
+    VibDraftReport,
+    VibEntry,
+    VibPfaEntry,
+    VibReport,
+    vib_entry_project,
+)
 from dashboard_backend.models.projects.project_group import ProjectGroup
 from dashboard_backend.schemas.users import UserRole
 from dashboard_backend.services.route_service import RouteService
@@ -42,6 +52,14 @@ TABLES = [
     Todo.__table__,  # FK to project (absent here) is unenforced in SQLite
     TodoAssignee.__table__,  # must follow Todo (FK dependency)
     GuideSectionOverride.__table__,
+    DataVersion.__table__,
+    VibDraftReport.__table__,  # must precede VibDraftEntry (FK dependency)
+    VibDraftEntry.__table__,
+    VibDraftImage.__table__,
+    VibReport.__table__,
+    VibEntry.__table__,
+    VibPfaEntry.__table__,
+    vib_entry_project,  # FK to project (absent here) is unenforced in SQLite
 ]
 
 
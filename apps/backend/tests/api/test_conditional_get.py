@@ -0,0 +1,88 @@
+"""ETag / If-None-Match handling on the public read endpoints."""
+from __future__ import annotations
+
+import dashboard_backend.api.v1.endpoints.projects as projects_route
+from dashboard_backend.crud.data_versions import SCOPE_FINVES, SCOPE_PROJECTS, bump_versions
+
+
+def _no_projects(monkeypatch) -> list:
+    calls: list = []
+    monkeypatch.setattr(projects_route, "get_projects", lambda db: calls.append(1) or [])
+    return calls
+
+
+def test_list_projects_sets_etag(client, monkeypatch):
+    _no_projects(monkeypatch)
+
+    resp = client.get("/api/v1/projects/")
+    assert resp.status_code == 200
+    assert resp.headers["etag"].startswith('"')
+    assert resp.headers["cache-control"] == "no-cache"
+
+
+def test_matching_etag_returns_304_without_loading(client, monkeypatch):
+    calls = _no_projects(monkeypatch)
+    etag = client.get("/api/v1/projects/").headers["etag"]
+
+    resp = client.get("/api/v1/projects/", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+    assert len(calls) == 1  # only the first, unconditional request hit the CRUD layer
+
+
+def test_weak_etag_from_proxy_still_matches(client, monkeypatch):
+    _no_projects(monkeypatch)
+    etag = client.get("/api/v1/projects/").headers["etag"]
+
+    resp = client.get("/api/v1/projects/", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert resp.status_code == 304
+
+
+def test_version_bump_invalidates_etag(client, db_session, monkeypatch):
+    _no_projects(monkeypatch)
+    etag = client.get("/api/v1/projects/").headers["etag"]
+
+    bump_versions(db_session, [SCOPE_PROJECTS])
+    db_session.commit()
+
+    resp = client.get("/api/v1/projects/", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+
+
+def test_unrelated_scope_keeps_etag(client, db_session, monkeypatch):
+    _no_projects(monkeypatch)
+    etag = client.get("/api/v1/projects/").headers["etag"]
+
+    bump_versions(db_session, [SCOPE_FINVES])
+    db_session.commit()
+
+    resp = client.get("/api/v1/projects/", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+
+def test_project_detail_304_precedes_project_lookup(client, monkeypatch):
+    import dashboard_backend.api.deps as api_deps
+    from tests.api.test_projects import _make_project
+
+    lookups: list = []
+    monkeypatch.setattr(api_deps, "project_exists", lambda db, pid: True)
+    monkeypatch.setattr(
+        api_deps, "get_project_by_id", lambda db, pid: lookups.append(pid) or _make_project(pid)
+    )
+    etag = client.get("/api/v1/projects/1").headers["etag"]
+
+    resp = client.get("/api/v1/projects/1", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert lookups == [1]
+
+
+def test_unknown_project_gets_404_not_304(client, monkeypatch):
+    import dashboard_backend.api.deps as api_deps
+
+    monkeypatch.setattr(api_deps, "project_exists", lambda db, pid: False)
+
+    for path in ("/api/v1/projects/999", "/api/v1/projects/999/vib", "/api/v1/projects/999/progress"):
+        resp = client.get(path, headers={"If-None-Match": "*"})
+        assert resp.status_code == 404, path
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 
 import dashboard_backend.api.v1.endpoints.fulda_import as fulda_route
+import dashboard_backend.utils.blob_store as blob_store
 from dashboard_backend.crud._importer_common import ProjectNotFoundError
 from dashboard_backend.schemas.users import UserRole
 from tests.api.conftest import basic_auth_header
@@ -56,15 +58,16 @@ def test_parse_forbidden_for_viewer(client, create_user):
 # --- parse -------------------------------------------------------------------
 
 
-def test_parse_starts_task(client, create_user, monkeypatch):
+def test_parse_starts_task(client, create_user, monkeypatch, tmp_path):
     create_user("editor-f", "pass123", UserRole.editor)
+    monkeypatch.setattr(blob_store, "_blob_root", lambda: tmp_path / "blobs")
     captured = {}
 
     class _FakeResult:
         id = "task-123"
 
-    def _delay(pdf_bytes, year, filename, user_info):
-        captured["len"] = len(pdf_bytes)
+    def _delay(pdf_sha256, year, filename, user_info):
+        captured["sha256"] = pdf_sha256
         captured["year"] = year
         captured["filename"] = filename
         captured["username"] = user_info["username"]
@@ -79,14 +82,28 @@ def test_parse_starts_task(client, create_user, monkeypatch):
     )
     assert resp.status_code == 200
     assert resp.json()["task_id"] == "task-123"
-    assert captured["len"] > 0
+    # Only the digest is enqueued; the PDF lives in the upload store.
+    digest = hashlib.sha256(b"%PDF-1.4 fake").hexdigest()
+    assert captured["sha256"] == digest
+    assert resp.json()["upload_sha256"] == digest
+    assert resp.json()["duplicate_upload"] is False
+    assert blob_store.blob_path(digest).read_bytes() == b"%PDF-1.4 fake"
     assert captured["year"] == 2026
     assert captured["filename"] == "fulda.pdf"
     assert captured["username"] == "editor-f"
 
+    again = client.post(
+        "/api/v1/import/fulda/parse",
+        files=_pdf_upload(),
+        data={"year": "2026"},
+        headers=basic_auth_header("editor-f", "pass123"),
+    )
+    assert again.json()["duplicate_upload"] is True
+
 
-def test_parse_rejects_empty_file(client, create_user):
+def test_parse_rejects_empty_file(client, create_user, monkeypatch, tmp_path):
     create_user("editor-f2", "pass123", UserRole.editor)
+    monkeypatch.setattr(blob_store, "_blob_root", lambda: tmp_path / "blobs")
     resp = client.post(
         "/api/v1/import/fulda/parse",
         files={"pdf": ("empty.pdf", io.BytesIO(b""), "application/pdf")},
@@ -53,6 +53,7 @@ def _make_view(project_id: int = 1, **overrides) -> dict:
 
 
 def test_get_progress_is_public(client, monkeypatch):
+    monkeypatch.setattr(api_deps, "project_exists", lambda db, pid: True)
     monkeypatch.setattr(api_deps, "get_project_by_id", _project_exists)
     monkeypatch.setattr(progress_route.progress_crud, "get_progress_view", lambda db, pid: _make_view(pid))
     resp = client.get("/api/v1/projects/1/progress")
@@ -63,11 +64,41 @@ def test_get_progress_is_public(client, monkeypatch):
 
 
 def test_get_progress_404(client, monkeypatch):
-    monkeypatch.setattr(api_deps, "get_project_by_id", lambda db, pid: None)
+    monkeypatch.setattr(api_deps, "project_exists", lambda db, pid: False)
     resp = client.get("/api/v1/projects/999/progress")
     assert resp.status_code == 404
 
 
+def test_get_progress_summary_is_public(client, monkeypatch):
+    rows = [
+        {
+            "project_id": 1,
+            "effective_phase": "BAU",
+            "computed_phase": "VORPLANUNG",
+            "computed_confidence": 0.82,
+            "computed_at": None,
+            "is_overridden": True,
+            "lifecycle_status": "AKTIV",
+        },
+        {
+            "project_id": 2,
+            "effective_phase": None,
+            "computed_phase": None,
+            "computed_confidence": None,
+            "computed_at": None,
+            "is_overridden": False,
+            "lifecycle_status": "AKTIV",
+        },
+    ]
+    monkeypatch.setattr(progress_route.progress_crud, "get_progress_summaries", lambda db: rows)
+    resp = client.get("/api/v1/projects/progress-summary")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [r["project_id"] for r in body] == [1, 2]
+    assert body[0]["effective_phase"] == "BAU"
+    assert body[1]["computed_phase"] is None
+
+
 # --- PATCH (gated) -----------------------------------------------------------
 
 
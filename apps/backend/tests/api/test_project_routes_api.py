@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import pytest
 
+from dashboard_backend.dependencies.routes import get_route_service
 from dashboard_backend.schemas.users import UserRole
 from dashboard_backend.services.exceptions import RoutingUpstreamError
+from dashboard_backend.services.route_service import RouteService
+from main import app
 from tests.api.conftest import basic_auth_header
 
 
@@ -132,3 +135,36 @@ def test_calculate_route_returns_502_on_upstream_error(client, create_user, rout
     )
     assert response.status_code == 502
     assert response.json()["detail"] == "upstream boom"
+
+
+def test_repeated_preview_is_served_from_cache(client, create_user, routing_stub):
+    create_user("planner", "secret123", UserRole.editor)
+    headers = basic_auth_header("planner", "secret123")
+
+    first = client.post("/api/v1/routes/calculate", json=CALCULATE_PAYLOAD, headers=headers)
+    second = client.post("/api/v1/routes/calculate", json=CALCULATE_PAYLOAD, headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert routing_stub.calls == 1
+
+
+def test_preview_of_persisted_route_skips_upstream(client, create_user, routing_stub):
+    create_user("planner", "secret123", UserRole.editor)
+    headers = basic_auth_header("planner", "secret123")
+    feature = client.post("/api/v1/routes/calculate", json=CALCULATE_PAYLOAD, headers=headers).json()
+    assert client.post(
+        f"/api/v1/projects/{PROJECT_ID}/routes", json={"feature": feature}, headers=headers
+    ).status_code == 201
+
+    # A fresh service (e.g. another worker) has an empty in-process cache.
+    app.dependency_overrides[get_route_service] = lambda: RouteService(routing_stub, graph_version="test-graph")
+    again = client.post("/api/v1/routes/calculate", json=CALCULATE_PAYLOAD, headers=headers)
+    assert again.json() == feature
+    assert routing_stub.calls == 1
+
+    # A new graph version misses both layers.
+    app.dependency_overrides[get_route_service] = lambda: RouteService(routing_stub, graph_version="test-graph-2")
+    rebuilt = client.post("/api/v1/routes/calculate", json=CALCULATE_PAYLOAD, headers=headers)
+    assert rebuilt.json()["properties"]["graph_version"] == "test-graph-2"
+    assert routing_stub.calls == 2
@@ -50,12 +50,83 @@ def test_list_projects_empty(client, monkeypatch):
     assert resp.json() == []
 
 
+# ---------------------------------------------------------------------------
+# GET /api/v1/projects/summary
+# ---------------------------------------------------------------------------
+
+
+def test_list_project_summaries_omits_geometry(client, monkeypatch):
+    from dashboard_backend.schemas.projects.project_schema import ProjectListItemSchema
+
+    items = [
+        ProjectListItemSchema(id=1, name="Alpha", project_number="1-001"),
+        ProjectListItemSchema(id=2, name="Beta"),
+    ]
+    monkeypatch.setattr(projects_route, "get_project_list_items", lambda db: items)
+
+    resp = client.get("/api/v1/projects/summary")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [p["id"] for p in body] == [1, 2]
+    assert body[0]["project_number"] == "1-001"
+    assert "geojson_representation" not in body[0]
+    assert "etcs" not in body[0]
+
+
+# ---------------------------------------------------------------------------
+# GET /api/v1/projects/geometry
+# ---------------------------------------------------------------------------
+
+
+def test_project_geometry_passes_bbox_and_zoom(client, monkeypatch):
+    captured = {}
+
+    def fake_geometry(db, bbox=None, zoom=None):
+        captured.update(bbox=bbox, zoom=zoom)
+        return {"type": "FeatureCollection", "features": []}
+
+    monkeypatch.setattr(projects_route, "get_project_geometry", fake_geometry)
+
+    resp = client.get("/api/v1/projects/geometry?bbox=6,50,8.5,52&zoom=9")
+    assert resp.status_code == 200
+    assert resp.json() == {"type": "FeatureCollection", "features": []}
+    assert captured == {"bbox": (6.0, 50.0, 8.5, 52.0), "zoom": 9}
+
+
+def test_project_geometry_rejects_malformed_bbox(client):
+    resp = client.get("/api/v1/projects/geometry?bbox=6,50,8")
+    assert resp.status_code == 422
+
+
+def test_project_geometry_metrics_404_without_geometry(client, monkeypatch):
+    monkeypatch.setattr(api_deps, "get_project_by_id", lambda db, pid: _make_project(pid))
+    monkeypatch.setattr(projects_route, "get_project_geometry_metrics", lambda db, pid: None)
+
+    resp = client.get("/api/v1/projects/1/geometry-metrics")
+    assert resp.status_code == 404
+
+
+def test_project_geometry_metrics_success(client, monkeypatch):
+    metrics = {
+        "bbox": {"type": "Polygon", "coordinates": [[[7, 51], [8, 51], [8, 52], [7, 52], [7, 51]]]},
+        "centroid": {"type": "Point", "coordinates": [7.5, 51.5]},
+        "length_km": 131.2,
+    }
+    monkeypatch.setattr(api_deps, "get_project_by_id", lambda db, pid: _make_project(pid))
+    monkeypatch.setattr(projects_route, "get_project_geometry_metrics", lambda db, pid: metrics)
+
+    resp = client.get("/api/v1/projects/1/geometry-metrics")
+    assert resp.status_code == 200
+    assert resp.json()["length_km"] == 131.2
+
+
 # ---------------------------------------------------------------------------
 # GET /api/v1/projects/{project_id}
 # ---------------------------------------------------------------------------
 
 
 def test_get_project_found(client, monkeypatch):
+    monkeypatch.setattr(api_deps, "project_exists", lambda db, pid: True)
     monkeypatch.setattr(api_deps, "get_project_by_id", lambda db, pid: _make_project(pid))
 
     resp = client.get("/api/v1/projects/1")
@@ -64,7 +135,7 @@ def test_get_project_found(client, monkeypatch):
 
 
 def test_get_project_not_found(client, monkeypatch):
-    monkeypatch.setattr(api_deps, "get_project_by_id", lambda db, pid: None)
+    monkeypatch.setattr(api_deps, "project_exists", lambda db, pid: False)
 
     resp = client.get("/api/v1/projects/999")
     assert resp.status_code == 404
@@ -265,6 +336,85 @@ def test_link_finves_requires_editor(client, create_user):
     assert resp.status_code == 403
 
 
+# ---------------------------------------------------------------------------
+# PATCH /api/v1/projects/bulk
+# ---------------------------------------------------------------------------
+
+
+def test_bulk_patch_requires_editor(client, create_user):
+    create_user("viewer", "pass123", UserRole.viewer)
+    resp = client.patch(
+        "/api/v1/projects/bulk",
+        json=[{"id": 1, "changes": {"etcs": True}}],
+        headers=basic_auth_header("viewer", "pass123"),
+    )
+    assert resp.status_code == 403
+
+
+def test_bulk_patch_success_single_transaction(client, create_user, monkeypatch):
+    create_user("editor", "pass123", UserRole.editor)
+    projects = {1: _make_project(1, "Alpha"), 2: _make_project(2, "Beta")}
+    changelogs: list = []
+    batches: list = []
+
+    monkeypatch.setattr(
+        projects_route, "get_projects_by_ids", lambda db, ids: [projects[i] for i in ids if i in projects]
+    )
+    monkeypatch.setattr(
+        projects_route,
+        "create_changelog_for_patch",
+        lambda db, project, data, *a, **kw: changelogs.append((project.id, data)),
+    )
+
+    def fake_bulk(db, updates):
+        batches.append([(p.id, data) for p, data in updates])
+        for p, data in updates:
+            for key, value in data.items():
+                setattr(p, key, value)
+        return [p for p, _ in updates]
+
+    monkeypatch.setattr(projects_route, "bulk_update_projects", fake_bulk)
+
+    resp = client.patch(
+        "/api/v1/projects/bulk",
+        json=[{"id": 1, "changes": {"etcs": True}}, {"id": 2, "changes": {"etcs": True, "name": "Beta 2"}}],
+        headers=basic_auth_header("editor", "pass123"),
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [p["id"] for p in body] == [1, 2]
+    assert all(p["etcs"] for p in body)
+    assert body[1]["name"] == "Beta 2"
+    assert [pid for pid, _ in changelogs] == [1, 2]
+    assert batches == [[(1, {"etcs": True}), (2, {"etcs": True, "name": "Beta 2"})]]
+
+
+def test_bulk_patch_missing_project_is_404(client, create_user, monkeypatch):
+    create_user("editor", "pass123", UserRole.editor)
+    monkeypatch.setattr(projects_route, "get_projects_by_ids", lambda db, ids: [_make_project(1)])
+    monkeypatch.setattr(
+        projects_route, "bulk_update_projects", lambda db, updates: (_ for _ in ()).throw(AssertionError)
+    )
+
+    resp = client.patch(
+        "/api/v1/projects/bulk",
+        json=[{"id": 1, "changes": {"etcs": True}}, {"id": 99, "changes": {"etcs": True}}],
+        headers=basic_auth_header("editor", "pass123"),
+    )
+    assert resp.status_code == 404
+    assert "99" in resp.json()["detail"]
+
+
+def test_bulk_patch_rejects_duplicate_ids(client, create_user):
+    create_user("editor", "pass123", UserRole.editor)
+    resp = client.patch(
+        "/api/v1/projects/bulk",
+        json=[{"id": 1, "changes": {"etcs": True}}, {"id": 1, "changes": {"abs": True}}],
+        headers=basic_auth_header("editor", "pass123"),
+    )
+    assert resp.status_code == 422
+
+
 # ---------------------------------------------------------------------------
 # PATCH /api/v1/projects/{project_id}
 # ---------------------------------------------------------------------------
@@ -0,0 +1,167 @@
+"""Per-entry VIB draft storage: paginated reads, single-entry edits, streaming confirm."""
+from __future__ import annotations
+
+import base64
+
+import pytest
+
+from dashboard_backend.crud import vib as vib_crud
+from dashboard_backend.models.vib import VibDraftEntry, VibEntry
+from dashboard_backend.schemas.users import UserRole
+from dashboard_backend.schemas.vib import VibEntryProposed, VibParseTaskResult
+
+
+def _auth(u: str, p: str) -> dict:
+    return {"Authorization": "Basic " + base64.b64encode(f"{u}:{p}".encode()).decode()}
+
+
+@pytest.fixture()
+def editor(create_user):
+    create_user("editor_vd", "pass", UserRole.editor)
+    return _auth("editor_vd", "pass")
+
+
+@pytest.fixture()
+def draft(db_session):
+    result = VibParseTaskResult(
+        year=2031,
+        drucksache_nr="21/999",
+        entries=[
+            VibEntryProposed(
+                vib_section=f"B.4.1.{i}", vib_name_raw=f"Vorhaben {i}", raw_text=f"Text {i}"
+            )
+            for i in range(7)
+        ],
+    )
+    draft = vib_crud.save_draft_report(db_session, "parse-vd", result, None)
+    db_session.flush()
+    return draft
+
+
+def _entry(client, headers, idx: int) -> dict:
+    resp = client.get(
+        "/api/v1/import/vib/draft/parse-vd/entries", params={"offset": idx, "limit": 1}, headers=headers
+    )
+    return resp.json()["items"][0]["entry"]
+
+
+def test_entries_are_paginated(client, editor, draft):
+    resp = client.get(
+        "/api/v1/import/vib/draft/parse-vd/entries", params={"offset": 2, "limit": 3}, headers=editor
+    )
+    assert resp.status_code == 200
+    page = resp.json()
+    assert page["total"] == 7
+    assert [item["idx"] for item in page["items"]] == [2, 3, 4]
+    assert page["items"][0]["entry"]["vib_section"] == "B.4.1.2"
+
+    full = client.get("/api/v1/import/vib/parse-result/parse-vd", headers=editor).json()
+    assert full["drucksache_nr"] == "21/999"
+    assert [e["vib_name_raw"] for e in full["entries"]] == [f"Vorhaben {i}" for i in range(7)]
+
+
+def test_single_entry_edits_do_not_overwrite_each_other(client, editor, draft, db_session):
+    first = _entry(client, editor, 1)
+    second = _entry(client, editor, 5)
+    # Two editors, each saving only the entry they changed.
+    first["bauaktivitaeten"] = "Editor A"
+    second["bauaktivitaeten"] = "Editor B"
+    for idx, body in ((1, first), (5, second)):
+        resp = client.patch(
+            f"/api/v1/import/vib/draft/parse-vd/entries/{idx}", json=body, headers=editor
+        )
+        assert resp.status_code == 204
+
+    assert _entry(client, editor, 1)["bauaktivitaeten"] == "Editor A"
+    assert _entry(client, editor, 5)["bauaktivitaeten"] == "Editor B"
+
+    resp = client.patch("/api/v1/import/vib/draft/parse-vd/entries/7", json=first, headers=editor)
+    assert resp.status_code == 422
+
+
+def test_summary_counts_entries_without_loading_them(client, editor, draft):
+    entry = _entry(client, editor, 2)
+    entry["project_ids"] = [1]
+    entry["ai_extraction_failed"] = True
+    client.patch("/api/v1/import/vib/draft/parse-vd/entries/2", json=entry, headers=editor)
+    entry = _entry(client, editor, 4)
+    entry["ai_carried_over_from_year"] = 2030
+    client.patch("/api/v1/import/vib/draft/parse-vd/entries/4", json=entry, headers=editor)
+
+    resp = client.get("/api/v1/import/vib/draft/parse-vd", headers=editor)
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "task_id": "parse-vd",
+        "year": 2031,
+        "drucksache_nr": "21/999",
+        "report_date": None,
+        "total": 7,
+        "matched": 1,
+        "ai_failed": 1,
+        "carried_over": 1,
+    }
+
+
+def test_whole_draft_overwrite_is_gone(client, editor, draft):
+    full = client.get("/api/v1/import/vib/parse-result/parse-vd", headers=editor).json()
+    resp = client.patch("/api/v1/import/vib/draft/parse-vd", json=full, headers=editor)
+    assert resp.status_code == 405
+
+
+def test_confirm_streams_entries_from_draft(client, editor, draft, db_session, monkeypatch):
+    monkeypatch.setattr(vib_crud, "DRAFT_CHUNK_SIZE", 3)
+    resp = client.post(
+        "/api/v1/import/vib/confirm",
+        json={"task_id": "parse-vd", "year": 2031, "use_draft": True},
+        headers=editor,
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["entries_created"] == 7
+    names = [e.vib_name_raw for e in db_session.query(VibEntry).order_by(VibEntry.id)]
+    assert names == [f"Vorhaben {i}" for i in range(7)]
+    assert vib_crud.get_draft_by_task_id(db_session, "parse-vd") is None
+    assert db_session.query(VibDraftEntry).count() == 0
+
+
+def test_confirm_requires_explicit_draft_flag(client, editor, draft, db_session):
+    entry = _entry(client, editor, 0)
+    resp = client.post(
+        "/api/v1/import/vib/confirm",
+        json={"task_id": "parse-vd", "year": 2031, "use_draft": True, "entries": [entry]},
+        headers=editor,
+    )
+    assert resp.status_code == 422
+
+    # Without the flag, an empty entry list imports an empty report, not the draft.
+    resp = client.post(
+        "/api/v1/import/vib/confirm",
+        json={"task_id": "parse-vd", "year": 2031, "entries": []},
+        headers=editor,
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["entries_created"] == 0
+
+
+def test_entry_retry_waits_out_a_rate_limit(client, editor, draft, monkeypatch):
+    from dashboard_backend.core.config import settings
+    from dashboard_backend.tasks import vib_ai_extraction
+
+    class _RateLimitError(Exception):
+        status_code = 429
+        response = type("R", (), {"headers": {"retry-after": "0"}})()
+
+    calls: list[str] = []
+
+    def _llm(system_prompt, prompt, **kwargs):
+        calls.append(prompt)
+        if len(calls) == 1:
+            raise _RateLimitError("Error code: 429")
+        return {"bauaktivitaeten": "nach Retry"}
+
+    monkeypatch.setattr(settings, "llm_base_url", "http://llm.invalid")
+    monkeypatch.setattr(vib_ai_extraction, "call_llm_json", _llm)
+
+    resp = client.post("/api/v1/import/vib/extract-ai/parse-vd/entry/2", headers=editor)
+    assert resp.status_code == 200
+    assert resp.json()["bauaktivitaeten"] == "nach Retry"
+    assert len(calls) == 2
@@ -0,0 +1,104 @@
+"""OCR images of a VIB draft: stored by reference, served with ETag / Range."""
+from __future__ import annotations
+
+import base64
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from dashboard_backend.crud import vib as vib_crud
+from dashboard_backend.schemas.users import UserRole
+from dashboard_backend.schemas.vib import VibParseTaskResult
+from dashboard_backend.tasks.vib import _store_ocr_images
+from dashboard_backend.utils import image_store
+
+
+def _auth(u: str, p: str) -> dict:
+    return {"Authorization": "Basic " + base64.b64encode(f"{u}:{p}".encode()).decode()}
+
+
+def _jpeg(size=(900, 600)) -> bytes:
+    out = io.BytesIO()
+    Image.new("RGB", size, (10, 120, 200)).save(out, format="JPEG")
+    return out.getvalue()
+
+
+@pytest.fixture()
+def editor(create_user):
+    create_user("editor_vi", "pass", UserRole.editor)
+    return _auth("editor_vi", "pass")
+
+
+@pytest.fixture()
+def draft(db_session, tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(image_store, "_image_root", lambda: tmp_path.resolve() / "ocr-images")
+    data = _jpeg()
+    refs = _store_ocr_images([
+        {"page_index": 3, "id": "img-1.jpeg",
+         "image_base64": "data:image/jpeg;base64," + base64.b64encode(data).decode()},
+        {"page_index": 1, "id": "img-0.jpeg", "image_base64": base64.b64encode(data).decode()},
+        {"page_index": 2, "id": "img-2.png", "image_base64": "%%% not base64"},
+    ])
+    draft = vib_crud.save_draft_report(
+        db_session, "parse-vi", VibParseTaskResult(year=2031), None, ocr_images=refs
+    )
+    db_session.flush()
+    return draft, data
+
+
+def test_images_are_listed_without_data(client, editor, draft):
+    resp = client.get("/api/v1/import/vib/draft/parse-vi/images", headers=editor)
+    assert resp.status_code == 200
+    images = resp.json()
+    assert [(img["id"], img["page_index"]) for img in images] == [("img-0.jpeg", 1), ("img-1.jpeg", 3)]
+    assert images[0]["media_type"] == "image/jpeg"
+    assert images[0]["has_thumbnail"] is True
+    assert "image_base64" not in images[0]
+
+
+def test_image_is_served_with_etag_and_ranges(client, editor, draft):
+    _, data = draft
+    url = "/api/v1/import/vib/draft/parse-vi/image/img-1.jpeg"
+    resp = client.get(url, headers=editor)
+    assert resp.status_code == 200
+    assert resp.content == data
+    assert resp.headers["content-type"] == "image/jpeg"
+    assert "immutable" in resp.headers["cache-control"]
+    etag = resp.headers["etag"]
+
+    assert client.get(url, headers={**editor, "If-None-Match": etag}).status_code == 304
+
+    partial = client.get(url, headers={**editor, "Range": "bytes=0-9"})
+    assert partial.status_code == 206
+    assert partial.content == data[:10]
+
+
+def test_thumbnail_is_served_separately(client, editor, draft):
+    url = "/api/v1/import/vib/draft/parse-vi/image/img-0.jpeg"
+    full = client.get(url, headers=editor)
+    thumb = client.get(url, params={"thumbnail": "true"}, headers=editor)
+    assert thumb.status_code == 200
+    assert thumb.headers["etag"] != full.headers["etag"]
+    assert len(thumb.content) < len(full.content)
+    with Image.open(io.BytesIO(thumb.content)) as img:
+        assert max(img.size) == image_store.THUMBNAIL_MAX_PX
+
+
+def test_unknown_image_is_404(client, editor, draft):
+    resp = client.get("/api/v1/import/vib/draft/parse-vi/image/img-2.png", headers=editor)
+    assert resp.status_code == 404
+
+
+def test_decompression_bomb_does_not_fail_the_parse(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(image_store, "_image_root", lambda: tmp_path.resolve() / "ocr-images")
+
+    def _bomb(data, media_type=None):
+        raise Image.DecompressionBombError("too many pixels")
+
+    monkeypatch.setattr(image_store, "put_image", _bomb)
+    refs = _store_ocr_images([
+        {"page_index": 0, "id": "img-0.png", "image_base64": base64.b64encode(b"x").decode()},
+    ])
+    assert refs == []
@@ -15,6 +15,11 @@ os.environ.setdefault("CELERY_RESULT_BACKEND", "cache+memory://")
 os.environ.setdefault("LLM_BASE_URL", "")
 os.environ.setdefault("LLM_API_KEY", "")
 os.environ.setdefault("LLM_MODEL", "test-model")
+# OCR tests mock Mistral per test; a persistent cache would leak results between
+# them. test_ocr_cache.py enables it against a tmp directory.
+os.environ.setdefault("OCR_CACHE_ENABLED", "false")
+# Same for LLM responses; test_llm_cache.py enables it against a tmp directory.
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
 # Required Settings field with no default — provide a dummy so the suite is hermetic
 # and does not depend on a developer's local .env (CI has none). setdefault keeps any
 # real value from the environment/.env when present.
@@ -0,0 +1,157 @@
+"""Tests for the persistent OCR page cache used by extract_full_pdf_text."""
+from __future__ import annotations
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dashboard_backend.tasks import ocr_cache
+from dashboard_backend.tasks.vib_ocr import extract_full_pdf_text
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ocr_cache.settings, "ocr_cache_enabled", True)
+    monkeypatch.setattr(ocr_cache.settings, "ocr_cache_ttl_seconds", 3600)
+    monkeypatch.setattr(ocr_cache.settings, "ocr_cache_max_mb", 1024)
+    monkeypatch.setattr(ocr_cache, "_cache_root", lambda: tmp_path / "ocr-cache")
+    monkeypatch.setattr(ocr_cache, "_size_bytes", None)
+
+
+def _mistral_pages() -> list:
+    return [
+        SimpleNamespace(
+            index=0,
+            markdown="B Schienenwege\n[tbl-1.md](tbl-1.md)\n![img-0.jpeg](img-0.jpeg)",
+            header="Seite 1",
+            footer="Drucksache 20/1",
+            tables=[SimpleNamespace(id="tbl-1", content="| A | B |\n|---|---|")],
+            images=[SimpleNamespace(id="img-0.jpeg", image_base64="data:image/jpeg;base64,AAA")],
+        ),
+        SimpleNamespace(index=1, markdown="Fortsetzung", header=None, footer=None),
+    ]
+
+
+def _extract(client, **kwargs):
+    with patch("dashboard_backend.tasks.vib_ocr.Mistral", return_value=client):
+        return extract_full_pdf_text(
+            pdf_bytes=b"%PDF fake",
+            api_key="sk-test",
+            base_url="https://api.mistral.ai",
+            model="mistral-ocr-latest",
+            **kwargs,
+        )
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.ocr.process.return_value = SimpleNamespace(pages=_mistral_pages(), model="mistral-ocr-2512")
+    return client
+
+
+def test_second_parse_skips_ocr_and_rebuilds_identical_output():
+    client = _client()
+    first = _extract(client)
+    second = _extract(client)
+
+    assert client.ocr.process.call_count == 1
+    assert second == first
+    assert second[1:3] == ("mistral-ocr-2512", "done")
+    assert second[3] == [
+        {"page_index": 0, "id": "img-0.jpeg", "image_base64": "data:image/jpeg;base64,AAA"}
+    ]
+
+
+def test_toggling_strip_headers_footers_is_served_from_cache():
+    client = _client()
+    stripped = _extract(client, strip_headers_footers=True)[0]
+    with_headers = _extract(client, strip_headers_footers=False)[0]
+
+    assert client.ocr.process.call_count == 1
+    assert "Seite 1" not in stripped
+    assert with_headers.startswith("Seite 1\n")
+    assert "Drucksache 20/1" in with_headers
+    assert "| A | B |" in with_headers
+
+
+def test_key_includes_page_range_and_model(monkeypatch):
+    monkeypatch.setattr(
+        "dashboard_backend.tasks.vib_ocr.extract_pages_as_pdf", lambda pdf, s, e: b"%PDF sub"
+    )
+    client = _client()
+    _extract(client)
+    _extract(client, start_page=2, end_page=5)
+    _extract(client, start_page=2, end_page=5)
+    assert client.ocr.process.call_count == 2
+
+    assert ocr_cache.load_pages("0" * 64, None, None, "mistral-ocr-latest") is None
+    key_a = ocr_cache.cache_key("a" * 64, 1, 2, "m1")
+    assert key_a != ocr_cache.cache_key("a" * 64, 1, 2, "m2")
+    assert key_a != ocr_cache.cache_key("a" * 64, 1, 3, "m1")
+
+
+def test_fallback_and_failures_are_not_cached():
+    failing = MagicMock()
+    failing.ocr.process.side_effect = RuntimeError("API down")
+    with patch("dashboard_backend.tasks.vib_ocr._ocr_fallback_pymupdf", return_value=[]):
+        assert _extract(failing)[2] == "fallback"
+
+    client = _client()
+    _extract(client)
+    assert client.ocr.process.call_count == 1
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    client = _client()
+    _extract(client)
+    for path in (tmp_path / "ocr-cache").rglob("*.json.gz"):
+        path.write_bytes(b"not gzip")
+    _extract(client)
+    assert client.ocr.process.call_count == 2
+
+
+def test_disabled_cache_always_calls_ocr(monkeypatch):
+    monkeypatch.setattr(ocr_cache.settings, "ocr_cache_enabled", False)
+    client = _client()
+    _extract(client)
+    _extract(client)
+    assert client.ocr.process.call_count == 2
+
+
+def test_digest_from_blob_store_is_not_recomputed(monkeypatch):
+    def _no_hashing(*_args):
+        raise AssertionError("PDF must not be hashed again")
+
+    monkeypatch.setattr("dashboard_backend.tasks.vib_ocr.hashlib", SimpleNamespace(sha256=_no_hashing))
+    client = _client()
+    _extract(client, pdf_sha256="b" * 64)
+
+    assert ocr_cache.load_pages("b" * 64, None, None, "mistral-ocr-latest") is not None
+
+
+def test_expired_entry_is_a_miss():
+    ocr_cache.store_pages("a" * 64, None, None, "m", _mistral_pages(), "m")
+    assert ocr_cache.load_pages("a" * 64, None, None, "m") is not None
+    path = ocr_cache._cache_path(ocr_cache.cache_key("a" * 64, None, None, "m"))
+    old = time.time() - 7200
+    os.utime(path, (old, old))
+    assert ocr_cache.load_pages("a" * 64, None, None, "m") is None
+    assert not path.exists()
+
+
+def test_size_limit_evicts_oldest_entries(monkeypatch):
+    monkeypatch.setattr(ocr_cache.settings, "ocr_cache_max_mb", 1)
+    monkeypatch.setattr(ocr_cache.settings, "ocr_cache_ttl_seconds", 0)
+    blob = os.urandom(300_000).hex()  # ~330 KB gzipped
+    for i in range(4):
+        page = SimpleNamespace(index=0, markdown=blob, header=None, footer=None)
+        ocr_cache.store_pages("a" * 64, i, i, "m", [page], "m")
+        path = ocr_cache._cache_path(ocr_cache.cache_key("a" * 64, i, i, "m"))
+        os.utime(path, (1000 + i, 1000 + i))
+
+    assert ocr_cache._directory_size() <= 1024 * 1024
+    assert ocr_cache.load_pages("a" * 64, 3, 3, "m") is not None
+    assert ocr_cache.load_pages("a" * 64, 0, 0, "m") is None
@@ -77,3 +77,448 @@ class TestMergeAiResult:
         ai = {"teilinbetriebnahmen": "- Keine."}
         result = _merge_ai_result(entry, ai)
         assert result["teilinbetriebnahmen"] is None
+
+
+# ---------------------------------------------------------------------------
+# extract_vib_blocks — concurrency, 429 backoff, checkpoints and resume
+# ---------------------------------------------------------------------------
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from dashboard_backend.models.users import User
+from dashboard_backend.crud.vib import iter_draft_entries, save_draft_report
+from dashboard_backend.models.vib.vib_draft_entry import VibDraftEntry
+from dashboard_backend.models.vib.vib_draft_report import VibDraftReport
+from dashboard_backend.models.vib.vib_entry import VibEntry
+from dashboard_backend.models.vib.vib_pfa_entry import VibPfaEntry
+from dashboard_backend.models.vib.vib_report import VibReport
+from dashboard_backend.schemas.vib import VibEntryProposed, VibParseTaskResult
+from dashboard_backend.tasks import vib_ai_extraction
+
+
+class _RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self):
+        super().__init__("Error code: 429 - rate limit")
+        self.response = type("R", (), {"headers": {"retry-after": "0.05"}})()
+
+
+@pytest.fixture()
+def draft_db(monkeypatch):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    User.metadata.create_all(
+        engine,
+        tables=[
+            User.__table__,
+            VibDraftReport.__table__,
+            VibDraftEntry.__table__,
+            VibReport.__table__,
+            VibEntry.__table__,
+            VibPfaEntry.__table__,
+        ],
+    )
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(vib_ai_extraction, "Session", factory)
+    monkeypatch.setattr(vib_ai_extraction.settings, "llm_base_url", "http://llm.invalid")
+    monkeypatch.setattr(vib_ai_extraction.settings, "llm_max_concurrency", 4)
+    # One request per entry unless a test enables batching.
+    monkeypatch.setattr(vib_ai_extraction.settings, "llm_batch_max_entries", 1)
+    monkeypatch.setattr(vib_ai_extraction.settings, "llm_batch_token_budget", 4000)
+    return factory
+
+
+def _store_draft(factory, n: int, **entry_overrides) -> None:
+    entries = [
+        VibEntryProposed(
+            vib_section=f"B.4.1.{i}",
+            vib_name_raw=f"Vorhaben {i}",
+            category="laufend",
+            raw_text=f"Rohtext {i}" if i else "",
+            **entry_overrides,
+        )
+        for i in range(n)
+    ]
+    _store_entries(factory, entries)
+
+
+def _store_entries(factory, entries: list[VibEntryProposed]) -> None:
+    db = factory()
+    save_draft_report(db, "parse-1", VibParseTaskResult(year=2024, entries=entries), None)
+    db.commit()
+    db.close()
+
+
+def _draft_entries(factory) -> list[dict]:
+    db = factory()
+    try:
+        draft = db.query(VibDraftReport).one()
+        return [e.model_dump(mode="json") for e in iter_draft_entries(db, draft, chunk_size=2)]
+    finally:
+        db.close()
+
+
+def _run(force: bool = False) -> dict:
+    return vib_ai_extraction.extract_vib_blocks.apply(args=["parse-1", {"username": "t"}, force]).get()
+
+
+def test_entries_run_concurrently_and_are_checkpointed(draft_db, monkeypatch):
+    _store_draft(draft_db, 9)
+    in_flight, peak, lock = [0], [0], threading.Lock()
+
+    def _llm(system_prompt, prompt, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        if "Rohtext 3" in prompt:
+            raise RuntimeError("boom")
+        return {"bauaktivitaeten": prompt.split("Projektname: ")[1].split("\n")[0]}
+
+    monkeypatch.setattr(vib_ai_extraction, "call_llm_json", _llm)
+    result = _run()
+
+    assert peak[0] == 4
+    stored = _draft_entries(draft_db)
+    assert stored[0]["ai_extracted"] is False  # no raw_text → never sent
+    assert stored[1]["bauaktivitaeten"] == "Vorhaben 1" and stored[1]["ai_extracted"] is True
+    assert stored[3]["ai_extraction_failed"] is True
+    assert stored[3]["ai_extraction_error"] == "boom"
+    assert [e["bauaktivitaeten"] for e in result["entries"]] == [e["bauaktivitaeten"] for e in stored]
+
+
+def test_rerun_resumes_only_missing_and_failed_entries(draft_db, monkeypatch):
+    _store_draft(draft_db, 5)
+    failing = {"Rohtext 2"}
+    monkeypatch.setattr(
+        vib_ai_extraction,
+        "call_llm_json",
+        lambda s, p, **kw: (_ for _ in ()).throw(RuntimeError("x"))
+        if any(f in p for f in failing)
+        else {"planungsstand": "ok"},
+    )
+    _run()
+
+    sent: list[str] = []
+
+    def _llm(system_prompt, prompt, **kwargs):
+        sent.append(prompt.split("Sektionsnummer: ")[1].split("\n")[0])
+        return {"planungsstand": "ok"}
+
+    monkeypatch.setattr(vib_ai_extraction, "call_llm_json", _llm)
+    _run()
+    assert sent == ["B.4.1.2"]
+    assert all(e["planungsstand"] == "ok" for e in _draft_entries(draft_db)[1:])
+
+    sent.clear()
+    _run(force=True)
+    assert sorted(sent) == ["B.4.1.1", "B.4.1.2", "B.4.1.3", "B.4.1.4"]
+
+
+def test_force_bypasses_the_llm_cache(draft_db, monkeypatch):
+    _store_draft(draft_db, 3)
+    use_cache: list[bool] = []
+
+    def _llm(system_prompt, prompt, **kwargs):
+        use_cache.append(kwargs["use_cache"])
+        return {"planungsstand": "ok"}
+
+    monkeypatch.setattr(vib_ai_extraction, "call_llm_json", _llm)
+    _run()
+    assert use_cache and all(use_cache)
+
+    use_cache.clear()
+    _run(force=True)
+    assert use_cache and not any(use_cache)
+
+
+def test_rate_limit_pauses_and_retries(draft_db, monkeypatch):
+    _store_draft(draft_db, 4)
+    calls = {"n": 0}
+
+    def _llm(system_prompt, prompt, **kwargs):
+        assert kwargs["retry_rate_limits"] is False  # the gate is the only 429 retry layer
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise _RateLimitError()
+        return {"status_bau": True}
+
+    monkeypatch.setattr(vib_ai_extraction, "call_llm_json", _llm)
+    _run()
+    stored = _draft_entries(draft_db)
+    assert all(e["status_bau"] for e in stored[1:])
+    assert not any(e["ai_extraction_failed"] for e in stored)
+    assert calls["n"] == 4  # 3 entries + one retried 429
+
+
+def test_checkpoint_keeps_concurrent_edits_to_other_entries(draft_db, monkeypatch):
+    from dashboard_backend.crud.vib import update_draft_entry
+
+    _store_draft(draft_db, 3)
+    db = draft_db()
+    edited = VibEntryProposed(
+        vib_section="B.4.1.2", vib_name_raw="Vorhaben 2", category="laufend",
+        raw_text="Rohtext 2", bauaktivitaeten="manuell",
+    )
+    assert update_draft_entry(db, "parse-1", 2, edited)
+    assert not update_draft_entry(db, "parse-1", 9, edited)
+    db.commit()
+    db.close()
+    assert _draft_entries(draft_db)[2]["bauaktivitaeten"] == "manuell"
+
+
+def test_checkpoint_merges_into_an_edit_saved_during_the_run(draft_db, monkeypatch):
+    from dashboard_backend.crud.vib import get_draft_entry_for_update, update_draft_entry
+
+    monkeypatch.setattr(vib_ai_extraction.settings, "llm_max_concurrency", 1)
+    _store_draft(draft_db, 3)
+
+    def _llm(system_prompt, prompt, **kwargs):
+        if "Rohtext 2" in prompt:
+            # An editor links a project while the task is already running.
+            db = draft_db()
+            entry = get_draft_entry_for_update(db, "parse-1", 2)
+            update_draft_entry(db, "parse-1", 2, entry.model_copy(update={"project_ids": [7]}))
+            db.commit()
+            db.close()
+        return {"bauaktivitaeten": "KI"}
+
+    monkeypatch.setattr(vib_ai_extraction, "call_llm_json", _llm)
+    _run()
+
+    stored = _draft_entries(draft_db)
+    assert stored[2]["project_ids"] == [7]
+    assert stored[2]["bauaktivitaeten"] == "KI" and stored[2]["ai_extracted"] is True
+
+
+# ---------------------------------------------------------------------------
+# Batching and splitting
+# ---------------------------------------------------------------------------
+
+
+def test_short_entries_are_batched_and_mapped_back_by_section(draft_db, monkeypatch):
+    monkeypatch.setattr(vib_ai_extraction.settings, "llm_batch_max_entries", 8)
+    _store_draft(draft_db, 6)
+    prompts: list[str] = []
+
+    def _llm(system_prompt, prompt, **kwargs):
+        prompts.append(prompt)
+        if "=== ABSCHNITT" in prompt:
+            # B.4.1.4 is missing from the array → extracted on its own.
+            return {
+                "entries": [
+                    {"vib_section": f"B.4.1.{i}", "planungsstand": f"Stand {i}"}
+                    for i in (5, 3, 2, 1)
+                ]
+            }
+        return {"planungsstand": "einzeln"}
+
+    monkeypatch.setattr(vib_ai_extraction, "call_llm_json", _llm)
+    _run()
+
+    assert len(prompts) == 2
+    assert "Die folgenden 5 Abschnitte" in prompts[0]
+    assert "Sektionsnummer: B.4.1.4" in prompts[1]
+    stored = _draft_entries(draft_db)
+    assert [e["planungsstand"] for e in stored[1:]] == [
+        "Stand 1", "Stand 2", "Stand 3", "einzeln", "Stand 5",
+    ]
+    assert not any(e["ai_extraction_failed"] for e in stored)
+
+
+def test_failed_batch_marks_each_entry_failed(draft_db, monkeypatch):
+    monkeypatch.setattr(vib_ai_extraction.settings, "llm_batch_max_entries", 8)
+    _store_draft(draft_db, 4)
+    monkeypatch.setattr(
+        vib_ai_extraction, "call_llm_json", lambda s, p, **kw: (_ for _ in ()).throw(RuntimeError("down"))
+    )
+    _run()
+    stored = _draft_entries(draft_db)
+    assert [e["ai_extraction_failed"] for e in stored] == [False, True, True, True]
+    assert {e["ai_extraction_error"] for e in stored[1:]} == {"down"}
+
+
+def test_plan_jobs_respects_budget_entry_limit_and_unique_sections(monkeypatch):
+    monkeypatch.setattr(vib_ai_extraction.settings, "llm_batch_token_budget", 1000)
+    monkeypatch.setattr(vib_ai_extraction.settings, "llm_batch_max_entries", 3)
+    entries = [
+        {"vib_section": "A", "raw_text": "x" * 900},   # ~300 tokens
+        {"vib_section": "B", "raw_text": "x" * 900},
+        {"vib_section": "C", "raw_text": "x" * 1500},  # ~500 → exceeds budget with A+B
+        {"vib_section": "D", "raw_text": "x" * 6000},  # oversized → alone
+        {"vib_section": None, "raw_text": "x"},        # no section → alone
+        {"vib_section": "C", "raw_text": "x"},         # duplicate section → next batch
+        {"vib_section": "E", "raw_text": "x"},
+        {"vib_section": "F", "raw_text": "x"},
+    ]
+    jobs = vib_ai_extraction._plan_jobs(entries, list(range(len(entries))))
+    assert jobs == [[0, 1], [3], [4], [2], [5, 6, 7]]
+
+
+def test_oversized_entry_is_split_not_truncated(draft_db, monkeypatch):
+    monkeypatch.setattr(vib_ai_extraction.settings, "llm_batch_token_budget", 500)
+    paragraphs = [f"Absatz {i} " + "x" * 600 for i in range(6)]
+    _store_entries(
+        draft_db,
+        [
+            VibEntryProposed(
+                vib_section="B.4.1.1",
+                vib_name_raw="Lang",
+                category="laufend",
+                raw_text="\n\n".join(paragraphs),
+            )
+        ],
+    )
+    prompts: list[str] = []
+
+    def _llm(system_prompt, prompt, **kwargs):
+        prompts.append(prompt)
+        n = len(prompts)
+        return {
+            "bauaktivitaeten": f"Bau {n}",
+            "gesamtkosten_mio_eur": 100 * n if n > 1 else None,
+            "status_bau": n == 2,
+            "pfa_entries": [{"nr_pfa": "1"}, {"nr_pfa": str(n + 1)}],
+        }
+
+    monkeypatch.setattr(vib_ai_extraction, "call_llm_json", _llm)
+    _run()
+
+    assert len(prompts) == 3
+    assert all(f"Teil {i} von 3" in p for i, p in enumerate(prompts, start=1))
+    sent = "".join(prompts)
+    assert all(para in sent for para in paragraphs)
+    entry = _draft_entries(draft_db)[0]
+    assert entry["bauaktivitaeten"] == "Bau 1\nBau 2\nBau 3"
+    assert entry["gesamtkosten_mio_eur"] == 200
+    assert entry["status_bau"] is True
+    assert [p["nr_pfa"] for p in entry["pfa_entries"]] == ["1", "2", "3", "4"]
+
+
+# ---------------------------------------------------------------------------
+# Carry-over of last year's confirmed fields
+# ---------------------------------------------------------------------------
+
+_LONG_TEXT = " ".join(f"Wort{i}" for i in range(300))
+
+
+def _store_previous_report(factory, year: int = 2023) -> None:
+    db = factory()
+    report = VibReport(year=year)
+    report.entries = [
+        VibEntry(
+            vib_section="B.4.1.9",  # renumbered this year → matched by name
+            vib_name_raw="ABS Vorhaben 1",
+            category="laufend",
+            raw_text=_LONG_TEXT,
+            planungsstand="bestätigt 2023",
+            status_bau=True,
+            pfa_entries=[VibPfaEntry(nr_pfa="1.1", oertlichkeit="Nord")],
+        ),
+        VibEntry(
+            vib_section="B.4.1.2",
+            vib_name_raw="Vorhaben 2",
+            category="laufend",
+            raw_text="ganz anderer Text vom Vorjahr",
+            planungsstand="alt",
+        ),
+    ]
+    db.add(report)
+    db.commit()
+    db.close()
+
+
+def test_unchanged_blocks_reuse_previous_year_fields(draft_db, monkeypatch):
+    _store_previous_report(draft_db)
+    entries = [
+        VibEntryProposed(
+            vib_section="B.4.1.1",
+            vib_name_raw="Vorhaben 1",
+            category="laufend",
+            raw_text=_LONG_TEXT.replace("Wort7 ", "wort7  "),  # case/whitespace only
+        ),
+        VibEntryProposed(
+            vib_section="B.4.1.2", vib_name_raw="Vorhaben 2", category="laufend",
+            raw_text="Der Text hat sich 2024 wesentlich geändert.",
+        ),
+    ]
+    _store_entries(draft_db, entries)
+    sent: list[str] = []
+
+    def _llm(system_prompt, prompt, **kwargs):
+        sent.append(prompt.split("Sektionsnummer: ")[1].split("\n")[0])
+        return {"planungsstand": "neu"}
+
+    monkeypatch.setattr(vib_ai_extraction, "call_llm_json", _llm)
+    _run()
+
+    assert sent == ["B.4.1.2"]
+    carried, changed = _draft_entries(draft_db)
+    assert carried["ai_carried_over_from_year"] == 2023
+    assert carried["ai_extracted"] is True
+    assert carried["planungsstand"] == "bestätigt 2023"
+    assert carried["status_bau"] is True
+    assert [p["nr_pfa"] for p in carried["pfa_entries"]] == ["1.1"]
+    assert changed["ai_carried_over_from_year"] is None
+    assert changed["planungsstand"] == "neu"
+
+    # force re-extracts carried entries with the LLM and clears the marker.
+    sent.clear()
+    _run(force=True)
+    assert sorted(sent) == ["B.4.1.1", "B.4.1.2"]
+    assert _draft_entries(draft_db)[0]["ai_carried_over_from_year"] is None
+
+
+def test_text_similarity_is_word_level():
+    from dashboard_backend.tasks.vib_carry_over import text_similarity
+
+    prose = " ".join(["Die Strecke wird zweigleisig ausgebaut"] * 50) + " Kosten 120 Mio"
+    assert text_similarity("Bau  beginnt\n2025", "bau beginnt 2025") == 1.0
+    assert text_similarity(prose, prose.replace("Strecke ", "Strecke neu ", 1)) > 0.99
+    assert text_similarity("a b c d", "w x y z") == 0.0
+    assert text_similarity("", "a") == 0.0
+
+
+def test_text_similarity_requires_identical_facts():
+    from dashboard_backend.tasks.vib_carry_over import text_similarity
+
+    prose = " ".join(["Die Strecke wird zweigleisig ausgebaut"] * 50)
+    assert text_similarity(prose + " Kosten 120 Mio", prose + " Kosten 125 Mio") == 0.0
+    assert text_similarity(prose + " Ende 12.2025", prose + " Ende 12.2026") == 0.0
+    assert text_similarity(prose + " Bau abgeschlossen", prose + " Bau nicht abgeschlossen") == 0.0
+    assert text_similarity(prose + " 2025", prose + " zudem 2025") > 0.99
+
+
+def test_block_with_changed_number_goes_to_the_llm(draft_db, monkeypatch):
+    _store_previous_report(draft_db)
+    _store_entries(draft_db, [
+        VibEntryProposed(
+            vib_section="B.4.1.1",
+            vib_name_raw="Vorhaben 1",
+            category="laufend",
+            raw_text=_LONG_TEXT.replace("Wort42 ", "Wort43 "),  # one number changed
+        ),
+    ])
+    sent: list[str] = []
+
+    def _llm(system_prompt, prompt, **kwargs):
+        sent.append(prompt.split("Sektionsnummer: ")[1].split("\n")[0])
+        return {"planungsstand": "neu"}
+
+    monkeypatch.setattr(vib_ai_extraction, "call_llm_json", _llm)
+    _run()
+
+    assert sent == ["B.4.1.1"]
+    entry = _draft_entries(draft_db)[0]
+    assert entry["ai_carried_over_from_year"] is None
+    assert entry["planungsstand"] == "neu"
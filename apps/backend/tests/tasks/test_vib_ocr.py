@@ -296,3 +296,123 @@ class TestExtractFullPdfText:
 
         assert status == "fallback"
         assert model == "pymupdf"
+
+
+# ---------------------------------------------------------------------------
+# Chunked OCR (_ocr_chunked / extract_full_pdf_text(chunk_pages=...))
+# ---------------------------------------------------------------------------
+
+class TestChunkedOcr:
+    """A fake Mistral that OCRs the real (sub-)PDF it receives, numbering
+    images/tables document-wide like the API does."""
+
+    N_PAGES = 7
+
+    @staticmethod
+    def _pdf(n_pages: int) -> bytes:
+        import fitz
+
+        doc = fitz.open()
+        for i in range(n_pages):
+            doc.new_page().insert_text((72, 72), f"Seite {i + 1}")
+        data = doc.tobytes()
+        doc.close()
+        return data
+
+    class _HttpError(Exception):
+        def __init__(self, status_code: int):
+            super().__init__(f"{status_code} from OCR")
+            self.status_code = status_code
+
+    @classmethod
+    def _fake_ocr(cls, calls: list, fail_first: set | None = None, fail_status: int = 503):
+        import fitz
+
+        def _ocr(pdf_bytes, api_key, base_url, model, timeout_ms=300_000):
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                texts = [page.get_text("text").strip() for page in doc]
+            calls.append(texts[0])
+            if fail_first is not None and texts[0] in fail_first:
+                fail_first.discard(texts[0])
+                raise cls._HttpError(fail_status)
+            pages = []
+            for i, text in enumerate(texts):
+                pages.append(SimpleNamespace(
+                    index=i,
+                    markdown=f"{text}\n[tbl-{i}.md](tbl-{i}.md)\n![img-{i}.jpeg](img-{i}.jpeg)",
+                    header=f"Kopf {text}",
+                    footer=None,
+                    tables=[SimpleNamespace(id=f"tbl-{i}.md", content=f"| {text} |")],
+                    images=[SimpleNamespace(id=f"img-{i}.jpeg", image_base64=f"b64-{text}")],
+                ))
+            return pages, "mistral-ocr-2512"
+
+        return _ocr
+
+    def _extract(self, pdf, chunk_pages, calls, **kwargs):
+        fake = self._fake_ocr(calls, kwargs.pop("fail_first", None), kwargs.pop("fail_status", 503))
+        with patch("dashboard_backend.tasks.vib_ocr._ocr_with_mistral", fake), \
+             patch("dashboard_backend.tasks.vib_ocr.time.sleep"):
+            return extract_full_pdf_text(
+                pdf_bytes=pdf, api_key="sk-test", base_url="https://api.mistral.ai",
+                model="mistral-ocr-latest", chunk_pages=chunk_pages, **kwargs,
+            )
+
+    def test_windows_cover_all_pages(self):
+        from dashboard_backend.tasks.vib_ocr import _page_windows
+
+        assert _page_windows(7, 3) == [(1, 3), (4, 6), (7, 7)]
+        assert _page_windows(6, 3) == [(1, 3), (4, 6)]
+
+    def test_stitched_output_identical_to_single_call(self):
+        pdf = self._pdf(self.N_PAGES)
+        single_calls, chunk_calls = [], []
+        for strip in (True, False):
+            single = self._extract(pdf, 0, single_calls, strip_headers_footers=strip)
+            chunked = self._extract(pdf, 3, chunk_calls, strip_headers_footers=strip)
+            assert chunked == single
+        assert "| Seite 7 |" in single[0]
+        assert [img["id"] for img in single[3]] == [f"img-{i}.jpeg" for i in range(7)]
+        assert sorted(chunk_calls) == sorted(["Seite 1", "Seite 4", "Seite 7"] * 2)
+
+    def test_page_range_and_chunking_combine(self):
+        pdf = self._pdf(self.N_PAGES)
+        single = self._extract(pdf, 0, [], start_page=2, end_page=6)
+        chunked = self._extract(pdf, 2, [], start_page=2, end_page=6)
+        assert chunked == single
+        assert "Seite 1\n" not in chunked[0] and "Seite 6" in chunked[0]
+
+    def test_failed_chunk_is_retried(self):
+        pdf = self._pdf(self.N_PAGES)
+        calls: list = []
+        result = self._extract(pdf, 3, calls, fail_first={"Seite 4"})
+        assert result[2] == "done"
+        assert calls.count("Seite 4") == 2
+
+    def test_exhausted_chunk_falls_back_and_rerun_reuses_finished_windows(self, tmp_path, monkeypatch):
+        from dashboard_backend.tasks import ocr_cache
+
+        monkeypatch.setattr(ocr_cache.settings, "ocr_cache_enabled", True)
+        monkeypatch.setattr(ocr_cache, "_cache_root", lambda: tmp_path / "ocr-cache")
+        pdf = self._pdf(self.N_PAGES)
+
+        calls: list = []
+        failing = self._extract(pdf, 3, calls, chunk_retries=0, fail_first={"Seite 4"})
+        # Only window 4–6 is read with pymupdf; the others keep the OCR result.
+        assert failing[2] == "partial"
+        assert failing[1] == "mistral-ocr-2512"
+        assert "| Seite 1 |" in failing[0] and "| Seite 7 |" in failing[0]
+        assert "Seite 5" in failing[0] and "| Seite 5 |" not in failing[0]
+        assert sorted(calls) == ["Seite 1", "Seite 4", "Seite 7"]
+
+        rerun_calls: list = []
+        rerun = self._extract(pdf, 3, rerun_calls, chunk_retries=0)
+        assert rerun[2] == "done"
+        assert rerun_calls == ["Seite 4"]  # windows 1–3 and 7 came from the cache
+
+    def test_non_transient_error_is_not_retried(self):
+        pdf = self._pdf(self.N_PAGES)
+        calls: list = []
+        result = self._extract(pdf, 3, calls, chunk_retries=2, fail_first={"Seite 4"}, fail_status=401)
+        assert result[2] == "partial"
+        assert calls.count("Seite 4") == 1
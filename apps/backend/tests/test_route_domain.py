@@ -49,3 +49,22 @@ def test_route_in_validates_coordinate_ranges():
                 {"lat": 51.0, "lon": 7.0},
             ]
         )
+
+
+def test_preview_cache_evicts_lru_and_expires(monkeypatch):
+    from dashboard_backend.services import route_service
+
+    now = [0.0]
+    monkeypatch.setattr(route_service.time, "monotonic", lambda: now[0])
+    cache = route_service._PreviewCache(ttl_seconds=60, max_entries=2)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    assert cache.get("a") == {"n": 1}
+    cache.put("c", {"n": 3})
+    assert cache.get("b") is None  # least recently used
+
+    cache.get("a")["n"] = 99  # callers get copies
+    assert cache.get("a") == {"n": 1}
+
+    now[0] = 61.0
+    assert cache.get("a") is None and cache.get("c") is None
@@ -0,0 +1,96 @@
+"""Unit tests for utils/blob_store.py (content-addressed upload store)."""
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import mmap
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import dashboard_backend.utils.blob_store as bs
+
+
+@pytest.fixture(autouse=True)
+def _blob_root(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(bs, "_blob_root", lambda: tmp_path.resolve() / "blobs")
+
+
+def test_put_file_streams_into_digest_path():
+    payload = b"%PDF-1.4 " + b"x" * (bs.CHUNK_SIZE + 17)  # spans several chunks
+    stored = bs.put_file(io.BytesIO(payload))
+
+    assert stored.sha256 == hashlib.sha256(payload).hexdigest()
+    assert stored.size == len(payload)
+    assert stored.duplicate is False
+    path = bs.blob_path(stored.sha256)
+    assert path.parent.name == stored.sha256[:2]
+    assert path.read_bytes() == payload
+    # No temp files left behind.
+    assert [p.name for p in path.parent.parent.iterdir() if p.is_file()] == []
+
+
+def test_identical_reupload_is_detected():
+    first = bs.put_bytes(b"same document")
+    second = bs.put_bytes(b"same document")
+    assert second.sha256 == first.sha256
+    assert second.duplicate is True
+    assert bs.exists(first.sha256)
+
+
+def test_open_blob_yields_read_only_memory_map():
+    stored = bs.put_bytes(b"hello blob")
+    with bs.open_blob(stored.sha256) as data:
+        assert isinstance(data, mmap.mmap)
+        assert data.read() == b"hello blob"
+        assert base64.b64decode(base64.b64encode(data)) == b"hello blob"
+        with pytest.raises(TypeError):
+            data[0] = 0
+
+
+def test_open_blob_empty_and_missing():
+    empty = bs.put_bytes(b"")
+    with bs.open_blob(empty.sha256) as data:
+        assert data == b""
+    with pytest.raises(FileNotFoundError):
+        with bs.open_blob("0" * 64):
+            pass
+
+
+@pytest.mark.parametrize("digest", ["", "../../etc/passwd", "A" * 64, "0" * 63])
+def test_blob_path_rejects_invalid_digests(digest):
+    with pytest.raises(ValueError):
+        bs.blob_path(digest)
+
+
+def test_delete_blob_ignores_missing_and_invalid():
+    stored = bs.put_bytes(b"to delete")
+    bs.delete_blob(stored.sha256)
+    assert not bs.exists(stored.sha256)
+    bs.delete_blob(stored.sha256)
+    bs.delete_blob("not-a-digest")
+
+
+def test_purge_expired_deletes_only_old_blobs():
+    old = bs.put_bytes(b"%PDF old")
+    fresh = bs.put_bytes(b"%PDF fresh")
+    past = time.time() - 48 * 3600
+    os.utime(bs.blob_path(old.sha256), (past, past))
+
+    assert bs.purge_expired(24 * 3600) == 1
+    assert not bs.exists(old.sha256)
+    assert bs.exists(fresh.sha256)
+
+
+def test_duplicate_upload_renews_retention():
+    first = bs.put_bytes(b"%PDF same")
+    past = time.time() - 48 * 3600
+    os.utime(bs.blob_path(first.sha256), (past, past))
+
+    assert bs.put_file(io.BytesIO(b"%PDF same")).duplicate is True
+    assert bs.purge_expired(24 * 3600) == 0
+    assert bs.exists(first.sha256)
+
@@ -0,0 +1,87 @@
+"""Unit tests for crud/data_versions.py (version bumping on writes)."""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from dashboard_backend.crud import data_versions as dv
+from dashboard_backend.models.app_settings import AppSettings
+from dashboard_backend.models.data_version import DataVersion
+from dashboard_backend.models.projects.project_group import ProjectGroup
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    for table in (DataVersion.__table__, ProjectGroup.__table__, AppSettings.__table__):
+        table.create(bind=engine)
+    factory = sessionmaker(bind=engine)
+    dv.register_version_tracking(factory)
+    session = factory()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _group() -> ProjectGroup:
+    return ProjectGroup(name="Gruppe", short_name="G1", color="#000000")
+
+
+def test_unknown_scope_is_version_zero(db):
+    assert dv.get_versions(db, [dv.SCOPE_PROJECTS]) == {dv.SCOPE_PROJECTS: 0}
+
+
+def test_flush_of_tracked_table_bumps_scope(db):
+    db.add(_group())
+    db.commit()
+    assert dv.get_versions(db, [dv.SCOPE_PROJECTS, dv.SCOPE_VIB]) == {dv.SCOPE_PROJECTS: 1, dv.SCOPE_VIB: 0}
+
+    group = db.query(ProjectGroup).one()
+    group.name = "Umbenannt"
+    db.commit()
+    assert dv.get_versions(db, [dv.SCOPE_PROJECTS])[dv.SCOPE_PROJECTS] == 2
+
+
+def test_bulk_delete_bumps_scope(db):
+    db.add(_group())
+    db.commit()
+
+    db.query(ProjectGroup).delete(synchronize_session=False)
+    db.commit()
+    assert dv.get_versions(db, [dv.SCOPE_PROJECTS])[dv.SCOPE_PROJECTS] == 2
+
+
+def test_untracked_table_does_not_bump(db):
+    db.add(AppSettings(id=1, map_group_mode="all"))
+    db.commit()
+    assert dv.get_versions(db, [dv.SCOPE_PROJECTS])[dv.SCOPE_PROJECTS] == 0
+
+
+def test_rollback_discards_bump(db):
+    db.add(_group())
+    db.flush()
+    db.rollback()
+    db.commit()
+    assert dv.get_versions(db, [dv.SCOPE_PROJECTS])[dv.SCOPE_PROJECTS] == 0
+
+
+def test_bump_waits_for_commit(db):
+    db.add(_group())
+    db.flush()
+    assert db.query(DataVersion).count() == 0
+
+    db.commit()
+    assert dv.get_versions(db, [dv.SCOPE_PROJECTS])[dv.SCOPE_PROJECTS] == 1
+
+
+def test_unchanged_assignment_does_not_bump(db):
+    db.add(_group())
+    db.commit()
+
+    group = db.query(ProjectGroup).one()
+    group.name = group.name
+    db.commit()
+    assert dv.get_versions(db, [dv.SCOPE_PROJECTS])[dv.SCOPE_PROJECTS] == 1
@@ -0,0 +1,98 @@
+"""Unit tests for utils/image_store.py (content-addressed OCR images + thumbnails)."""
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import os
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+import dashboard_backend.utils.image_store as store
+
+
+@pytest.fixture(autouse=True)
+def _image_root(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(store, "_image_root", lambda: tmp_path.resolve() / "ocr-images")
+
+
+def _png(size=(1200, 800), mode="RGBA") -> bytes:
+    out = io.BytesIO()
+    Image.new(mode, size, (200, 30, 30, 128) if mode == "RGBA" else (200, 30, 30)).save(out, format="PNG")
+    return out.getvalue()
+
+
+def test_put_image_stores_original_and_thumbnail():
+    data = _png()
+    stored = store.put_image(data)
+
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+    assert stored.size == len(data)
+    assert stored.media_type == "image/png"
+    assert stored.has_thumbnail is True
+    assert store.image_path(stored.sha256).read_bytes() == data
+    with Image.open(store.thumbnail_path(stored.sha256)) as thumb:
+        assert thumb.format == "JPEG"
+        assert max(thumb.size) == store.THUMBNAIL_MAX_PX
+        assert thumb.size == (320, 213)
+
+
+def test_identical_images_are_stored_once():
+    first = store.put_image(_png(mode="RGB"))
+    mtime = store.image_path(first.sha256).stat().st_mtime_ns
+    second = store.put_image(_png(mode="RGB"))
+    assert second == first
+    assert store.image_path(first.sha256).stat().st_mtime_ns == mtime
+    files = [p for p in store.image_path(first.sha256).parent.iterdir()]
+    assert len(files) == 2  # original + thumbnail, no temp files
+
+
+def test_undecodable_image_is_stored_without_thumbnail():
+    stored = store.put_image(b"not an image", "image/webp")
+    assert stored.has_thumbnail is False
+    assert stored.media_type == "image/webp"
+    assert store.exists(stored.sha256)
+    assert not store.thumbnail_path(stored.sha256).exists()
+
+
+def test_decompression_bomb_is_stored_without_thumbnail(monkeypatch):
+    # Pillow raises DecompressionBombError above 2 * MAX_IMAGE_PIXELS.
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 1000)
+    stored = store.put_image(_png(size=(100, 100)))
+    assert stored.has_thumbnail is False
+    assert store.exists(stored.sha256)
+    assert not store.thumbnail_path(stored.sha256).exists()
+
+
+def test_decode_base64_accepts_data_uri():
+    data = _png(size=(4, 4))
+    encoded = base64.b64encode(data).decode()
+    assert store.decode_base64(encoded) == (data, None)
+    assert store.decode_base64(f"data:image/png;base64,{encoded}") == (data, "image/png")
+    with pytest.raises(ValueError):
+        store.decode_base64("data:image/png;base64,@@@")
+
+
+def test_image_path_rejects_bad_digest():
+    with pytest.raises(ValueError):
+        store.image_path("../../etc/passwd")
+
+
+def test_purge_unreferenced_keeps_referenced_and_recent_images():
+    kept = store.put_image(_png(size=(400, 300)))
+    orphan = store.put_image(_png(size=(500, 300)))
+    recent = store.put_image(_png(size=(600, 300)))
+    past = time.time() - 7200
+    for stored in (kept, orphan):
+        for path in (store.image_path(stored.sha256), store.thumbnail_path(stored.sha256)):
+            os.utime(path, (past, past))
+
+    assert store.purge_unreferenced({kept.sha256}, min_age_seconds=3600) == 1
+    assert store.exists(kept.sha256)
+    assert not store.exists(orphan.sha256)
+    assert not store.thumbnail_path(orphan.sha256).exists()
+    assert store.exists(recent.sha256)
+
@@ -0,0 +1,116 @@
+"""Prompt-hash LLM response cache used by call_llm_json."""
+from __future__ import annotations
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dashboard_backend.services import llm, llm_cache
+from dashboard_backend.services.llm import call_llm_json
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(llm_cache.settings, "llm_cache_enabled", True)
+    monkeypatch.setattr(llm_cache.settings, "llm_cache_ttl_seconds", 3600)
+    monkeypatch.setattr(llm_cache.settings, "llm_cache_max_mb", 256)
+    monkeypatch.setattr(llm_cache.settings, "llm_model", "test-model")
+    monkeypatch.setattr(llm_cache, "_cache_root", lambda: tmp_path / "llm-cache")
+    monkeypatch.setattr(llm_cache, "_size_bytes", None)
+    llm_cache.reset_stats()
+    llm.reset_client()
+    yield
+    llm.reset_client()
+
+
+def _client(content: str = '{"planungsstand": "offen"}') -> MagicMock:
+    client = MagicMock()
+    client.chat.completions.create.return_value = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+    return client
+
+
+def test_identical_prompt_is_answered_from_cache():
+    client = _client()
+    with patch("openai.OpenAI", return_value=client):
+        first = call_llm_json("system", "Rohtext")
+        second = call_llm_json("system", "Rohtext")
+
+    assert first == second == {"planungsstand": "offen"}
+    assert client.chat.completions.create.call_count == 1
+    assert llm_cache.stats() == {"hits": 1, "misses": 1, "stores": 1, "evictions": 0}
+
+
+def test_use_cache_false_asks_the_model_and_refreshes_the_entry():
+    client = _client()
+    with patch("openai.OpenAI", return_value=client):
+        call_llm_json("system", "Rohtext")
+        client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"planungsstand": "neu"}'))]
+        )
+        assert call_llm_json("system", "Rohtext", use_cache=False) == {"planungsstand": "neu"}
+        assert call_llm_json("system", "Rohtext") == {"planungsstand": "neu"}
+
+    assert client.chat.completions.create.call_count == 2
+    assert llm_cache.stats()["hits"] == 1
+
+
+def test_key_covers_model_and_both_prompts(monkeypatch):
+    client = _client()
+    with patch("openai.OpenAI", return_value=client):
+        call_llm_json("system", "Rohtext")
+        call_llm_json("system 2", "Rohtext")
+        call_llm_json("system", "Rohtext 2")
+        monkeypatch.setattr(llm_cache.settings, "llm_model", "other-model")
+        call_llm_json("system", "Rohtext")
+    assert client.chat.completions.create.call_count == 4
+    assert llm_cache.stats()["hits"] == 0
+
+
+def test_failed_calls_are_not_cached():
+    client = _client("not json")
+    with patch("openai.OpenAI", return_value=client):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                call_llm_json("system", "Rohtext")
+    assert client.chat.completions.create.call_count == 2
+    assert llm_cache.stats()["stores"] == 0
+
+
+def test_expired_entry_is_a_miss():
+    llm_cache.store("test-model", "s", "p", {"a": 1})
+    assert llm_cache.load("test-model", "s", "p") == {"a": 1}
+    path = llm_cache._cache_path(llm_cache.cache_key("test-model", "s", "p"))
+    old = time.time() - 7200
+    os.utime(path, (old, old))
+    assert llm_cache.load("test-model", "s", "p") is None
+    assert not path.exists()
+
+
+def test_size_limit_evicts_oldest_entries(monkeypatch):
+    monkeypatch.setattr(llm_cache.settings, "llm_cache_max_mb", 1)
+    monkeypatch.setattr(llm_cache.settings, "llm_cache_ttl_seconds", 0)
+    blob = os.urandom(300_000).hex()  # ~330 KB gzipped
+    for i in range(4):
+        llm_cache.store("test-model", "s", f"p{i}", {"blob": blob})
+        path = llm_cache._cache_path(llm_cache.cache_key("test-model", "s", f"p{i}"))
+        os.utime(path, (1000 + i, 1000 + i))
+
+    assert llm_cache.stats()["evictions"] >= 2
+    assert llm_cache._directory_size() <= 1024 * 1024
+    assert llm_cache.load("test-model", "s", "p3") is not None
+    assert llm_cache.load("test-model", "s", "p0") is None
+
+
+def test_disabled_cache_never_reads_or_writes(monkeypatch):
+    monkeypatch.setattr(llm_cache.settings, "llm_cache_enabled", False)
+    client = _client()
+    with patch("openai.OpenAI", return_value=client):
+        call_llm_json("system", "Rohtext")
+        call_llm_json("system", "Rohtext")
+    assert client.chat.completions.create.call_count == 2
+    assert llm_cache.stats() == {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
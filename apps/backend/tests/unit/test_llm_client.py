@@ -0,0 +1,125 @@
+"""Pooled LLM client: reuse, retry policy and call metrics."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import httpx
+import openai
+import pytest
+
+from dashboard_backend.services import llm
+
+
+@pytest.fixture(autouse=True)
+def _fresh_client(monkeypatch):
+    monkeypatch.setattr(llm.settings, "llm_base_url", "http://llm.local/v1")
+    monkeypatch.setattr(llm.settings, "llm_max_retries", 3)
+    monkeypatch.setattr(llm.settings, "llm_retry_backoff_seconds", 1.0)
+    llm.reset_client()
+    llm.reset_metrics()
+    yield
+    llm.reset_client()
+
+
+@pytest.fixture()
+def sleeps(monkeypatch):
+    calls: list[float] = []
+    monkeypatch.setattr(llm.time, "sleep", calls.append)
+    return calls
+
+
+def _ok(content: str = '{"ok": true}', prompt_tokens: int = 120, completion_tokens: int = 30):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens),
+    )
+
+
+def _status_error(status: int, headers: dict | None = None) -> openai.APIStatusError:
+    response = httpx.Response(
+        status, headers=headers or {}, request=httpx.Request("POST", "http://llm.local/v1")
+    )
+    cls = {429: openai.RateLimitError, 400: openai.BadRequestError}.get(
+        status, openai.InternalServerError
+    )
+    return cls(f"Error code: {status}", response=response, body=None)
+
+
+def _run(side_effect, **kwargs):
+    client = MagicMock()
+    client.chat.completions.create.side_effect = side_effect
+    with patch("openai.OpenAI", return_value=client) as factory:
+        return llm.call_llm_json("system", "prompt", **kwargs), client, factory
+
+
+def test_client_is_created_once_and_reused():
+    client = MagicMock()
+    client.chat.completions.create.return_value = _ok()
+    with patch("openai.OpenAI", return_value=client) as factory:
+        for _ in range(5):
+            assert llm.call_llm_json("system", "prompt") == {"ok": True}
+    assert factory.call_count == 1
+    kwargs = factory.call_args.kwargs
+    assert kwargs["max_retries"] == 0
+    assert kwargs["timeout"].connect == llm.settings.llm_connect_timeout_seconds
+    assert kwargs["timeout"].read == llm.settings.llm_read_timeout_seconds
+
+
+def test_client_is_rebuilt_when_settings_change(monkeypatch):
+    client = MagicMock()
+    client.chat.completions.create.return_value = _ok()
+    with patch("openai.OpenAI", return_value=client) as factory:
+        llm.call_llm_json("system", "prompt")
+        monkeypatch.setattr(llm.settings, "llm_base_url", "http://other.local/v1")
+        llm.call_llm_json("system", "prompt")
+    assert factory.call_count == 2
+
+
+def test_rate_limit_and_server_errors_are_retried(sleeps):
+    result, client, _ = _run([_status_error(429), _status_error(503), _ok()])
+    assert result == {"ok": True}
+    assert client.chat.completions.create.call_count == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 2.0
+    assert llm.metrics()["retries"] == 2
+
+
+def test_retry_after_header_is_honoured(sleeps):
+    _run([_status_error(429, {"retry-after": "7"}), _ok()])
+    assert sleeps == [7.0]
+
+
+def test_client_errors_are_not_retried(sleeps):
+    with pytest.raises(openai.BadRequestError):
+        _run([_status_error(400), _ok()])
+    assert sleeps == []
+    assert llm.metrics()["errors"] == 1
+
+
+def test_gives_up_after_max_retries(sleeps):
+    with pytest.raises(openai.RateLimitError):
+        _run([_status_error(429)] * 4)
+    assert len(sleeps) == 3
+
+
+def test_rate_limits_can_be_left_to_the_caller(sleeps):
+    with pytest.raises(openai.RateLimitError):
+        _run([_status_error(429), _ok()], retry_rate_limits=False)
+    assert sleeps == []
+    llm.reset_client()
+    result, _, _ = _run([_status_error(503), _ok()], retry_rate_limits=False)
+    assert result == {"ok": True}
+    assert len(sleeps) == 1
+
+
+def test_metrics_record_latency_and_tokens():
+    client = MagicMock()
+    client.chat.completions.create.side_effect = [_ok(), _ok(prompt_tokens=80, completion_tokens=20)]
+    with patch("openai.OpenAI", return_value=client):
+        llm.call_llm_json("system", "a")
+        llm.call_llm_json("system", "b")
+    m = llm.metrics()
+    assert m["calls"] == 2 and m["errors"] == 0
+    assert m["prompt_tokens"] == 200 and m["completion_tokens"] == 50
+    assert m["latency_seconds_max"] >= 0 and m["latency_seconds_avg"] <= m["latency_seconds_max"]
@@ -0,0 +1,155 @@
+"""Batched parent-geometry rollup (crud/projects/projects.py).
+
+Runs against an in-memory SQLite schema with the PostGIS columns of
+``project`` replaced by TEXT (same approach as test_progress_aggregation).
+``sync_project_geometry`` is stubbed out — it emits PostGIS functions and is
+covered in test_project_geometry.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, Text, create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from dashboard_backend.crud.projects import projects as projects_crud
+from dashboard_backend.models.projects.project import Project
+
+
+def _sqlite_project_table() -> Table:
+    md = MetaData()
+    cols = []
+    for c in Project.__table__.columns:
+        if c.name in ("centroid", "geometry"):
+            cols.append(Column(c.name, Text))
+        else:
+            cols.append(c.copy())
+    return Table("project", md, *cols)
+
+
+@pytest.fixture()
+def db(monkeypatch):
+    monkeypatch.setattr(projects_crud, "sync_project_geometry", lambda project: None)
+    engine = create_engine("sqlite:///:memory:")
+
+    @event.listens_for(engine, "connect")
+    def _register_spatial_stubs(dbapi_conn, _record):
+        for name, nargs in (("GeomFromEWKT", 1), ("ST_AsEWKB", 1), ("AsEWKB", 1)):
+            dbapi_conn.create_function(name, nargs, lambda x: x)
+
+    _sqlite_project_table().create(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _line(x: float) -> str:
+    return json.dumps(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "LineString", "coordinates": [[x, 50.0], [x + 1, 51.0]]},
+                    "properties": {"src": x},
+                }
+            ],
+        }
+    )
+
+
+def _sources(project: Project) -> list:
+    if project.geojson_representation is None:
+        return []
+    return sorted(f["properties"]["src"] for f in json.loads(project.geojson_representation)["features"])
+
+
+def _tree(db):
+    """root ← mid ← (leaf_a, leaf_b); root ← leaf_c"""
+    root = Project(name="root")
+    db.add(root)
+    db.flush()
+    mid = Project(name="mid", superior_project_id=root.id)
+    leaf_c = Project(name="leaf_c", superior_project_id=root.id, geojson_representation=_line(3))
+    db.add_all([mid, leaf_c])
+    db.flush()
+    leaf_a = Project(name="leaf_a", superior_project_id=mid.id, geojson_representation=_line(1))
+    leaf_b = Project(name="leaf_b", superior_project_id=mid.id, geojson_representation=_line(2))
+    db.add_all([leaf_a, leaf_b])
+    db.commit()
+    return root, mid, leaf_a, leaf_b, leaf_c
+
+
+def test_update_rolls_geometry_up_the_whole_chain(db):
+    root, mid, leaf_a, _leaf_b, _leaf_c = _tree(db)
+
+    projects_crud.update_project(db, leaf_a.id, {"geojson_representation": _line(10)}, project=leaf_a)
+
+    db.expire_all()
+    assert _sources(db.get(Project, mid.id)) == [2, 10]
+    assert _sources(db.get(Project, root.id)) == [2, 3, 10]
+
+
+def test_update_commits_once(db):
+    _root, _mid, leaf_a, _leaf_b, _leaf_c = _tree(db)
+    commits = []
+    event.listen(db, "after_commit", lambda session: commits.append(1))
+
+    projects_crud.update_project(db, leaf_a.id, {"geojson_representation": _line(10)}, project=leaf_a)
+
+    assert len(commits) == 1
+
+
+def test_clearing_last_child_geometry_clears_parent(db):
+    root = Project(name="root")
+    db.add(root)
+    db.flush()
+    leaf = Project(name="leaf", superior_project_id=root.id, geojson_representation=_line(1))
+    db.add(leaf)
+    db.commit()
+
+    projects_crud.update_project(db, leaf.id, {"geojson_representation": None}, project=leaf)
+
+    db.expire_all()
+    assert db.get(Project, root.id).geojson_representation is None
+
+
+def test_recompute_all_parents(db):
+    root, mid, *_ = _tree(db)
+
+    count = projects_crud.recompute_all_parent_geojson(db)
+
+    db.expire_all()
+    assert count == 2
+    assert _sources(db.get(Project, mid.id)) == [1, 2]
+    assert _sources(db.get(Project, root.id)) == [1, 2, 3]
+
+
+def test_bulk_update_recomputes_shared_ancestor_once(db, monkeypatch):
+    root, mid, leaf_a, leaf_b, leaf_c = _tree(db)
+    applied: list = []
+    original = projects_crud._apply_child_features
+    monkeypatch.setattr(
+        projects_crud,
+        "_apply_child_features",
+        lambda parent, features: (applied.append(parent.id), original(parent, features)),
+    )
+
+    projects_crud.bulk_update_projects(
+        db,
+        [
+            (leaf_a, {"geojson_representation": _line(10)}),
+            (leaf_b, {"geojson_representation": _line(20)}),
+            (leaf_c, {"name": "renamed"}),
+        ],
+    )
+
+    db.expire_all()
+    assert sorted(applied) == sorted([mid.id, root.id])
+    assert _sources(db.get(Project, root.id)) == [3, 10, 20]
+    assert db.get(Project, leaf_c.id).name == "renamed"
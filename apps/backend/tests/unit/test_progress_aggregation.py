@@ -1,8 +1,9 @@
 """Batched superior aggregation (#89): golden semantics + sublinear queries.
 
-Runs against an in-memory SQLite schema. ``project.centroid`` is a PostGIS
-geometry in production; the table is re-created here with TEXT in its place so
-plain SQLite can host it (the aggregation never touches the column).
+Runs against an in-memory SQLite schema. ``project.centroid`` and
+``project.geometry`` are PostGIS geometries in production; the table is
+re-created here with TEXT in their place so plain SQLite can host it (the
+aggregation never touches these columns).
 """
 
 from __future__ import annotations
@@ -36,12 +37,12 @@ from dashboard_backend.services.progress_derivation import aggregate_tree
 
 
 def _sqlite_project_table() -> Table:
-    """Clone project's table with the Geometry column replaced by TEXT."""
+    """Clone project's table with the Geometry columns replaced by TEXT."""
     md = MetaData()
     cols = []
     for c in Project.__table__.columns:
-        if c.name == "centroid":
-            cols.append(Column("centroid", Text))
+        if c.name in ("centroid", "geometry"):
+            cols.append(Column(c.name, Text))
         else:
             cols.append(c.copy())
     return Table("project", md, *cols)
@@ -210,3 +211,151 @@ def test_aggregation_resyncs_stale_leaves_in_batch(engine, db):
         engine, lambda: progress_crud._build_aggregation_node(db, superior2, date(2026, 7, 1))
     )
     assert q_stale2 == q_stale, f"stale resync grew with leaves: {q_stale} -> {q_stale2}"
+
+
+# --- Summary list + beat resync ---------------------------------------------
+
+
+def test_resync_stale_progress_refreshes_only_stale_projects(db):
+    superior = _make_tree(db, 3)
+    leaves = (
+        db.query(ProjectProgress)
+        .join(Project, Project.id == ProjectProgress.project_id)
+        .filter(Project.superior_project_id == superior.id)
+        .order_by(ProjectProgress.project_id)
+        .all()
+    )
+    stale_at = datetime.utcnow() - timedelta(days=30)
+    leaves[0].computed_at = stale_at
+    db.commit()
+
+    # The superior has no progress row yet, leaves[0] is stale → two refreshed.
+    stats = progress_crud.resync_stale_progress(db, date(2026, 7, 1))
+    assert stats["refreshed"] == 2
+    assert stats["chunks"] == 1
+    db.expire_all()
+    assert leaves[0].computed_at > stale_at
+    assert leaves[0].computed_phase == "VORPLANUNG"
+    assert progress_crud.resync_stale_progress(db, date(2026, 7, 1))["refreshed"] == 0
+
+
+def test_resync_stale_progress_refreshes_ahead_of_the_window(db):
+    """A cache inside ``RESYNC_LEAD`` of expiry is refreshed before any GET
+    would find it stale."""
+    superior = _make_tree(db, 2)
+    progress_crud.resync_stale_progress(db, date(2026, 7, 1))  # superior row
+    almost_stale = (
+        datetime.utcnow()
+        - progress_crud.STALENESS_WINDOW
+        + progress_crud.RESYNC_LEAD / 2
+    )
+    leaf = (
+        db.query(ProjectProgress)
+        .filter(ProjectProgress.project_id != superior.id)
+        .order_by(ProjectProgress.project_id)
+        .first()
+    )
+    leaf.computed_at = almost_stale
+    db.commit()
+
+    assert progress_crud.resync_stale_progress(db, date(2026, 7, 1))["refreshed"] == 1
+
+
+def test_resync_stale_progress_chunks_with_constant_queries(engine, db):
+    _make_tree(db, 2)
+    _make_tree(db, 8)
+    db.query(ProjectProgress).update({ProjectProgress.computed_at: None})
+    db.commit()
+    # 12 stale projects, chunks of 4 → three chunks.
+    stats, queries = _count_queries(
+        engine,
+        lambda: progress_crud.resync_stale_progress(db, date(2026, 7, 1), chunk_size=4),
+    )
+    assert stats["refreshed"] == 12
+    assert stats["chunks"] == 3
+    assert stats["duration_seconds"] >= stats["sync_seconds"]
+
+    db.query(ProjectProgress).update({ProjectProgress.computed_at: None})
+    db.commit()
+    _, queries_big_chunk = _count_queries(
+        engine,
+        lambda: progress_crud.resync_stale_progress(db, date(2026, 7, 1), chunk_size=12),
+    )
+    assert queries_big_chunk < queries
+
+
+def test_failing_resync_chunk_does_not_abort_the_rest(db, monkeypatch):
+    _make_tree(db, 8)
+    db.query(ProjectProgress).update({ProjectProgress.computed_at: None})
+    db.commit()
+    ids = sorted(pid for (pid,) in db.query(Project.id).all())
+
+    real_chunk = progress_crud._resync_chunk
+
+    def _flaky_chunk(session, project_ids, today):
+        if ids[3] in project_ids:
+            raise RuntimeError("boom")
+        return real_chunk(session, project_ids, today)
+
+    monkeypatch.setattr(progress_crud, "_resync_chunk", _flaky_chunk)
+    stats = progress_crud.resync_stale_progress(db, date(2026, 7, 1), chunk_size=3)
+
+    assert stats["chunks"] == 2
+    assert stats["failed_chunks"] == 1
+    assert (stats["refreshed"], stats["failed"]) == (6, 3)
+    fresh = {
+        pid
+        for (pid,) in db.query(ProjectProgress.project_id).filter(ProjectProgress.computed_at.isnot(None))
+    }
+    assert fresh == set(ids[:3] + ids[6:])
+
+
+def test_progress_summaries_read_cache_with_override(db):
+    superior = _make_tree(db, 2)
+    db.query(ProjectProgress).update({ProjectProgress.computed_at: None})
+    db.commit()
+    progress_crud.resync_stale_progress(db, date(2026, 7, 1))
+    leaf = (
+        db.query(ProjectProgress)
+        .join(Project, Project.id == ProjectProgress.project_id)
+        .filter(Project.superior_project_id == superior.id)
+        .order_by(ProjectProgress.project_id)
+        .first()
+    )
+    leaf.manual_phase_override = "IN_BETRIEB"
+    db.commit()
+
+    by_id = {row["project_id"]: row for row in progress_crud.get_progress_summaries(db)}
+    assert set(by_id) == {superior.id, superior.id + 1, superior.id + 2}
+    assert by_id[leaf.project_id]["computed_phase"] == "VORPLANUNG"
+    assert by_id[leaf.project_id]["effective_phase"] == "IN_BETRIEB"
+    assert by_id[leaf.project_id]["is_overridden"] is True
+
+
+def test_progress_summaries_aggregate_superiors_like_the_detail_view(db):
+    superior = _make_tree(db, 2)
+    db.query(ProjectProgress).update({ProjectProgress.computed_at: None})
+    db.commit()
+    progress_crud.resync_stale_progress(db, date(2026, 7, 1))
+
+    by_id = {row["project_id"]: row for row in progress_crud.get_progress_summaries(db)}
+    # Same aggregation as the headline of get_progress_view.
+    root = aggregate_tree(progress_crud._build_aggregation_node(db, superior, date(2026, 7, 1)))
+    assert root.display_phase.value == "BAU"
+    assert by_id[superior.id]["effective_phase"] == "BAU"
+    assert by_id[superior.id]["computed_phase"] == "NICHT_GESTARTET"
+
+
+def test_progress_summaries_survive_a_superior_cycle(db):
+    superior = _make_tree(db, 2)
+    db.query(ProjectProgress).update({ProjectProgress.computed_at: None})
+    db.commit()
+    progress_crud.resync_stale_progress(db, date(2026, 7, 1))
+    leaf_id = superior.id + 1
+    # Corrupt hierarchy: the superior points back at its own leaf.
+    superior.superior_project_id = leaf_id
+    db.commit()
+
+    by_id = {row["project_id"]: row for row in progress_crud.get_progress_summaries(db)}
+    assert set(by_id) == {superior.id, leaf_id, superior.id + 2}
+    assert by_id[superior.id]["effective_phase"] == "BAU"
@@ -331,3 +331,19 @@ def test_aggregate_tree_all_unknown_children_is_unknown():
     )
     assert res.is_known is False
     assert res.span is None
+
+
+def test_aggregate_tree_memo_computes_each_subtree_once(monkeypatch):
+    from dashboard_backend.services import progress_derivation as pd
+
+    leaf = AggregationNode(leaf_phase=MainPhase.BAU, leaf_is_known=True)
+    mid = AggregationNode(leaf_phase=MainPhase.NICHT_GESTARTET, leaf_is_known=False, children=[leaf])
+    top = AggregationNode(leaf_phase=MainPhase.NICHT_GESTARTET, leaf_is_known=False, children=[mid])
+
+    calls: list = []
+    real = pd._aggregate
+    monkeypatch.setattr(pd, "_aggregate", lambda node, memo: calls.append(node) or real(node, memo))
+    memo: dict = {}
+    assert pd.aggregate_tree(mid, memo).display_phase is MainPhase.BAU
+    assert pd.aggregate_tree(top, memo).display_phase is MainPhase.BAU
+    assert len(calls) == 3
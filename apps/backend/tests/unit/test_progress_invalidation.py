@@ -0,0 +1,157 @@
+"""Dependency-tracked progress invalidation on source writes.
+
+Runs against the in-memory SQLite schema of ``test_progress_aggregation``
+(project table cloned with the Geometry columns as TEXT). The Celery enqueue
+is captured by monkeypatching ``recompute_progress_batch.delay``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from dashboard_backend.crud import bauportal as bauportal_crud
+from dashboard_backend.crud.projects import progress_invalidation as invalidation
+from dashboard_backend.models.projects.bauportal_status import BauportalStatus
+from dashboard_backend.models.projects.project import Project
+from dashboard_backend.models.projects.project_progress import ProjectProgress
+from dashboard_backend.models.vib.vib_entry import VibEntry, vib_entry_project
+from dashboard_backend.models.vib.vib_pfa_entry import VibPfaEntry
+from dashboard_backend.models.vib.vib_report import VibReport
+from dashboard_backend.tasks import progress as progress_tasks
+
+# Reuse the SQLite engine fixture (project table clone + spatial stubs).
+from tests.unit.test_progress_aggregation import engine  # noqa: F401
+
+
+@pytest.fixture()
+def db(engine):  # noqa: F811
+    factory = sessionmaker(bind=engine)
+    invalidation.register_progress_invalidation(factory)
+    session = factory()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture()
+def enqueued(monkeypatch):
+    calls: list[list[int]] = []
+    monkeypatch.setattr(
+        progress_tasks.recompute_progress_batch, "delay", lambda ids: calls.append(ids)
+    )
+    return calls
+
+
+def _hierarchy(db) -> tuple[Project, Project, Project]:
+    """root → mid → leaf, each with a fresh progress cache."""
+    root = Project(name="Root")
+    db.add(root)
+    db.flush()
+    mid = Project(name="Mid", superior_project_id=root.id)
+    db.add(mid)
+    db.flush()
+    leaf = Project(name="Leaf", superior_project_id=mid.id)
+    db.add(leaf)
+    db.flush()
+    for p in (root, mid, leaf):
+        db.add(ProjectProgress(project_id=p.id, computed_at=datetime.utcnow()))
+    db.commit()
+    return root, mid, leaf
+
+
+def test_vib_entry_feeds_linked_projects_pfa_subprojects_and_ancestors(db):
+    root, mid, leaf = _hierarchy(db)
+    other = Project(name="Other")
+    db.add(other)
+    db.flush()
+    report = VibReport(year=2024)
+    db.add(report)
+    db.flush()
+    entry = VibEntry(vib_report_id=report.id, vib_name_raw="ABS X")
+    db.add(entry)
+    db.flush()
+    db.execute(vib_entry_project.insert(), [{"vib_entry_id": entry.id, "project_id": other.id}])
+    pfa = VibPfaEntry(vib_entry_id=entry.id, project_id=leaf.id)
+    db.add(pfa)
+    db.commit()
+
+    assert invalidation.projects_fed_by(db, VibEntry, [entry.id]) == {
+        other.id,
+        leaf.id,
+        mid.id,
+        root.id,
+    }
+    # An assigned PFA feeds its subproject and the entry's linked projects.
+    assert invalidation.projects_fed_by(db, VibPfaEntry, [pfa.id]) == {
+        other.id,
+        leaf.id,
+        mid.id,
+        root.id,
+    }
+    assert invalidation.projects_fed_by(db, VibEntry, [None]) == set()
+
+
+def test_invalidate_marks_stale_and_enqueues_one_batch_on_commit(db, enqueued):
+    root, mid, leaf = _hierarchy(db)
+
+    invalidation.invalidate_progress(db, [leaf.id])
+    invalidation.invalidate_progress(db, [mid.id, None])
+    assert enqueued == []  # nothing leaves the transaction before the commit
+    db.commit()
+
+    assert enqueued == [sorted([root.id, mid.id, leaf.id])]
+    assert all(p.computed_at is None for p in db.query(ProjectProgress).all())
+
+    db.commit()  # no pending ids → no second task
+    assert len(enqueued) == 1
+
+
+def test_enqueue_failure_does_not_break_the_commit(db, monkeypatch, caplog):
+    _, _, leaf = _hierarchy(db)
+
+    def _broker_down(ids):
+        raise ConnectionError("broker unreachable")
+
+    monkeypatch.setattr(progress_tasks.recompute_progress_batch, "delay", _broker_down)
+    invalidation.invalidate_progress(db, [leaf.id])
+    db.commit()
+
+    assert "Could not enqueue progress recompute" in caplog.text
+    assert db.get(ProjectProgress, leaf.id).computed_at is None  # left for the resync
+
+
+def test_rollback_drops_pending_invalidation(db, enqueued):
+    _, _, leaf = _hierarchy(db)
+    invalidation.invalidate_progress(db, [leaf.id])
+    db.rollback()
+    db.commit()
+    assert enqueued == []
+
+
+def test_sessions_of_other_factories_do_not_enqueue(engine, enqueued):  # noqa: F811
+    other = sessionmaker(bind=engine)()
+    try:
+        _, _, leaf = _hierarchy(other)
+        invalidation.invalidate_progress(other, [leaf.id])
+        other.commit()
+    finally:
+        other.close()
+    assert enqueued == []
+
+
+def test_bauportal_confirm_all_enqueues_affected_projects_once(db, enqueued):
+    root, mid, leaf = _hierarchy(db)
+    for bauportal_id in (1, 2):
+        db.add(
+            BauportalStatus(
+                bauportal_id=bauportal_id, shorttitle=f"BP {bauportal_id}", project_id=leaf.id
+            )
+        )
+    db.commit()
+
+    assert bauportal_crud.confirm_all(db) == 2
+    assert enqueued == [sorted([root.id, mid.id, leaf.id])]
@@ -0,0 +1,119 @@
+"""Unit tests for crud/projects/geometry.py (bbox filter + zoom simplification)."""
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from dashboard_backend.crud.projects import geometry as geo
+
+
+class _FakeQuery:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def options(self, *args):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _FakeDb:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def query(self, model):
+        return _FakeQuery(self._rows)
+
+
+def _project(pid: int, coords) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=pid,
+        name=f"P{pid}",
+        project_number=f"{pid}-001",
+        geojson_representation=json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {"type": "Feature", "geometry": {"type": "LineString", "coordinates": coords}, "properties": {}}
+                ],
+            }
+        ),
+    )
+
+
+def test_simplify_tolerance_halves_per_zoom_level():
+    assert geo.simplify_tolerance(None) == 0.0
+    assert geo.simplify_tolerance(5) == 2 * geo.simplify_tolerance(6)
+
+
+def test_geometry_merges_all_projects_without_bbox():
+    db = _FakeDb([_project(1, [[7.0, 51.0], [7.5, 51.5]]), _project(2, [[13.0, 52.0], [13.5, 52.5]])])
+    result = geo.get_project_geometry(db)
+    assert result["type"] == "FeatureCollection"
+    assert [f["properties"]["project_id"] for f in result["features"]] == [1, 2]
+    assert result["features"][0]["properties"]["name"] == "P1"
+
+
+def test_geometry_filters_by_bbox():
+    db = _FakeDb([_project(1, [[7.0, 51.0], [7.5, 51.5]]), _project(2, [[13.0, 52.0], [13.5, 52.5]])])
+    result = geo.get_project_geometry(db, bbox=(6.0, 50.0, 8.0, 52.0))
+    assert [f["properties"]["project_id"] for f in result["features"]] == [1]
+
+
+def test_geometry_simplifies_for_low_zoom():
+    # A nearly straight line with a tiny kink collapses to its endpoints at zoom 5.
+    coords = [[7.0, 51.0], [7.25, 51.0001], [7.5, 51.0]]
+    db = _FakeDb([_project(1, coords)])
+    full = geo.get_project_geometry(db)
+    simplified = geo.get_project_geometry(db, zoom=5)
+    assert len(full["features"][0]["geometry"]["coordinates"]) == 3
+    assert len(simplified["features"][0]["geometry"]["coordinates"]) == 2
+
+
+def test_geometry_skips_invalid_geometry():
+    project = _project(1, [[7.0, 51.0], [7.5, 51.5]])
+    project.geojson_representation = json.dumps({"type": "LineString", "coordinates": "garbage"})
+    result = geo.get_project_geometry(_FakeDb([project]))
+    assert result["features"] == []
+
+
+# ---------------------------------------------------------------------------
+# sync_project_geometry — typed geometry column kept in sync on write
+# ---------------------------------------------------------------------------
+
+
+def test_sync_project_geometry_builds_collection():
+    from geoalchemy2.shape import to_shape
+
+    from dashboard_backend.crud.projects.projects import sync_project_geometry
+
+    project = _project(1, [[7.0, 51.0], [7.5, 51.5]])
+    sync_project_geometry(project)
+    geom = to_shape(project.geometry)
+    assert geom.geom_type == "GeometryCollection"
+    assert len(geom.geoms) == 1
+    assert project.centroid is not None  # ST_Centroid expression, evaluated on flush
+
+
+def test_sync_project_geometry_clears_on_empty_geojson():
+    from dashboard_backend.crud.projects.projects import sync_project_geometry
+
+    project = _project(1, [[7.0, 51.0], [7.5, 51.5]])
+    project.geojson_representation = None
+    sync_project_geometry(project)
+    assert project.geometry is None
+    assert project.centroid is None
+
+
+def test_project_queries_do_not_load_the_geometry_column():
+    from sqlalchemy import select
+
+    from dashboard_backend.models.projects.project import Project
+
+    sql = str(select(Project).compile())
+    assert "project.geojson_representation" in sql
+    assert "project.geometry" not in sql
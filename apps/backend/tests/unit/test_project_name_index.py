@@ -0,0 +1,149 @@
+"""ProjectNameIndex: shortlisted matching must equal the pairwise matcher.
+
+The reference implementation below is the pre-index O(rows × projects) loop
+(normalise + SequenceMatcher for every pair). The index only prunes projects
+whose score upper bound is below the threshold, so suggestions must be
+identical on any input.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from difflib import SequenceMatcher
+from types import SimpleNamespace
+
+import pytest
+
+from dashboard_backend.services.project_name_index import (
+    ProjectNameIndex,
+    name_similarity,
+    normalize_name,
+)
+from dashboard_backend.tasks.finve_matching import (
+    suggest_per_erlaeuterung_project,
+    suggest_projects_for_finve,
+    suggest_projects_for_sv_erlaeuterung,
+)
+from dashboard_backend.tasks.vib_matching import (
+    suggest_project_for_bauportal,
+    suggest_projects_for_vib_entry,
+)
+
+_WORDS = [
+    "Hamburg", "Kiel", "Lübeck", "Berlin", "Dresden", "Leipzig", "München",
+    "Nürnberg", "Stuttgart", "Ulm", "Karlsruhe", "Basel", "Knoten", "Ausbau",
+    "Strecke", "Hbf", "Elektrifizierung", "Fulda", "Erfurt", "Hanau", "Würzburg",
+    "Rhein", "Ruhr", "Express", "Güterverkehr", "Korridor", "Mitte", "Süd",
+]
+_PREFIXES = ["", "", "ABS ", "NBS ", "ABS/NBS ", "Neu-"]
+_JOINERS = [" ", "–", "-", " / ", ", "]
+
+
+def _random_name(rng: random.Random) -> str:
+    words = rng.sample(_WORDS, rng.randint(1, 4))
+    name = rng.choice(_PREFIXES) + words[0]
+    for word in words[1:]:
+        name += rng.choice(_JOINERS) + word
+    if rng.random() < 0.2:
+        name += f" VDE {rng.randint(1, 9)}"
+    return name
+
+
+def _reference_score(a_raw: str, b_raw: str) -> float:
+    a = normalize_name(a_raw)
+    b = normalize_name(b_raw)
+    if not a or not b:
+        return 0.0
+    full = SequenceMatcher(None, a, b, autojunk=False).ratio()
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    token = len(tokens_a & tokens_b) / max(len(tokens_a), len(tokens_b))
+    return 0.6 * full + 0.4 * token
+
+
+def _reference_top(name, projects, threshold, limit):
+    scored = [
+        (_reference_score(name, p.name), p.id) for p in projects if p.name
+    ]
+    scored = [(s, pid) for s, pid in scored if s >= threshold]
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [pid for _, pid in scored[:limit]]
+
+
+def _reference_best(name, projects, threshold):
+    best_id, best_score = None, 0.0
+    for p in projects:
+        if not p.name:
+            continue
+        s = _reference_score(name, p.name)
+        if s > best_score:
+            best_score, best_id = s, p.id
+    return best_id if best_score >= threshold else None
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = random.Random(20261018)
+    projects = [
+        SimpleNamespace(id=i, name=_random_name(rng), description=None) for i in range(200)
+    ]
+    projects.append(SimpleNamespace(id=9999, name=None, description=None))
+    queries = [_random_name(rng) for _ in range(80)] + [p.name for p in projects[:20]]
+    return projects, queries
+
+
+def test_scores_match_pairwise_similarity(corpus):
+    projects, queries = corpus
+    index = ProjectNameIndex(projects)
+    for query in queries:
+        expected = [
+            (_reference_score(query, p.name), p.id)
+            for p in projects
+            if p.name and _reference_score(query, p.name) >= 0.3
+        ]
+        assert index.scores(query, 0.3) == expected
+        assert name_similarity(query, projects[0].name) == _reference_score(query, projects[0].name)
+
+
+def test_importer_suggestions_are_unchanged(corpus):
+    projects, queries = corpus
+    index = ProjectNameIndex(projects)
+    for query in queries:
+        assert suggest_projects_for_finve(query, index) == _reference_top(query, projects, 0.45, 3)
+        assert suggest_project_for_bauportal(query, index) == _reference_best(query, projects, 0.50)
+        assert suggest_per_erlaeuterung_project([query], index) == [
+            _reference_best(query, projects, 0.45)
+        ]
+        # Plain lists are still accepted and indexed on the fly.
+        assert suggest_projects_for_finve(query, projects) == suggest_projects_for_finve(query, index)
+    assert suggest_projects_for_sv_erlaeuterung(queries[:10], index) == list(
+        dict.fromkeys(
+            pid
+            for pid in (_reference_best(q, projects, 0.45) for q in queries[:10])
+            if pid is not None
+        )
+    )
+
+
+def test_vib_suggestions_put_vde_matches_first(corpus):
+    projects, _ = corpus
+    index = ProjectNameIndex(
+        projects
+        + [SimpleNamespace(id=5000, name="Knoten Nord", description="Teil von VDE Nr. 8.2")]
+    )
+    result = suggest_projects_for_vib_entry("VDE 8.2 Knoten Nord", index)
+    assert result[0] == 5000
+    assert len(result) <= 3
+    assert suggest_projects_for_vib_entry("", index) == []
+
+
+def test_many_rows_against_many_projects_is_fast():
+    rng = random.Random(7)
+    projects = [SimpleNamespace(id=i, name=_random_name(rng)) for i in range(3000)]
+    queries = [_random_name(rng) for _ in range(300)]
+    started = time.perf_counter()
+    index = ProjectNameIndex(projects)
+    for query in queries:
+        suggest_projects_for_finve(query, index)
+    # Generous bound for slow CI machines; locally this runs well under 1 s.
+    assert time.perf_counter() - started < 5
@@ -0,0 +1,96 @@
+"""In-memory rail graph (CSR, A*, one-to-many, many-to-many, k shortest paths)."""
+from __future__ import annotations
+
+import math
+import random
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from dashboard_backend.crud.data_versions import SCOPE_ROUTING, bump_versions
+from dashboard_backend.models.data_version import DataVersion
+from dashboard_backend.models.railway_infrastructure import RoutingEdge, RoutingNode
+from dashboard_backend.routing.graph import RailGraph, get_rail_graph, reset_rail_graph
+
+# A ─1─ B ─1─ C
+# │           │
+# 3           1      E (isolated)
+# │           │
+# D ────5──── F      plus a parallel A–B section of length 2
+_NODES = [
+    (1, "A", 50.0, 10.0), (2, "B", 50.0, 10.01), (3, "C", 50.0, 10.02),
+    (4, "D", 49.98, 10.0), (5, "F", 49.99, 10.02), (6, "E", 48.0, 9.0),
+]
+_EDGES = [(11, 1, 2, 1.0), (12, 2, 3, 1.0), (13, 1, 4, 3.0), (14, 3, 5, 1.0), (15, 4, 5, 5.0), (16, 2, 1, 2.0)]
+
+
+@pytest.fixture()
+def graph() -> RailGraph:
+    return RailGraph(_NODES, _EDGES)
+
+
+def test_shortest_path_follows_sections(graph):
+    path = graph.shortest_path("D", "C")
+    assert path.op_ids == ["D", "A", "B", "C"]
+    assert path.section_ids == [13, 11, 12]
+    assert path.cost == 5.0
+    assert graph.shortest_path("A", "E") is None
+    assert graph.shortest_path("A", "A").section_ids == []
+    with pytest.raises(ValueError):
+        graph.shortest_path("A", "UNKNOWN")
+
+
+def test_batch_distances(graph):
+    assert graph.distances_from("A", ["C", "F", "E"]) == {"C": 2.0, "F": 3.0}
+    assert graph.distances_from("E") == {"E": 0.0}
+    matrix = graph.distance_matrix(["A", "D"], ["F", "E", "A"])
+    np.testing.assert_array_equal(matrix, [[3.0, np.inf, 0.0], [5.0, np.inf, 3.0]])
+
+
+def test_k_shortest_paths_are_loopless_and_ordered(graph):
+    paths = graph.k_shortest_paths("A", "F", 4)
+    assert [p.section_ids for p in paths] == [[11, 12, 14], [16, 12, 14], [13, 15]]
+    assert [p.cost for p in paths] == [3.0, 4.0, 8.0]
+
+
+def test_astar_matches_dijkstra_on_a_random_grid():
+    rng = random.Random(7)
+    nodes = [(i * 10 + j, f"N{i}{j}", 50 + i * 0.01, 10 + j * 0.01) for i in range(10) for j in range(10)]
+    edges, eid = [], 0
+    for i in range(10):
+        for j in range(10):
+            for di, dj in ((0, 1), (1, 0)):
+                if i + di < 10 and j + dj < 10:
+                    eid += 1
+                    edges.append((eid, i * 10 + j, (i + di) * 10 + j + dj, rng.uniform(1.2, 5.0)))
+    graph = RailGraph(nodes, edges)
+    assert graph._heuristic_scale > 0
+
+    distances = graph.distances_from("N00")
+    for target in ("N99", "N45", "N90"):
+        path = graph.shortest_path("N00", target)
+        assert math.isclose(path.cost, distances[target])
+
+
+def test_graph_is_rebuilt_when_routing_version_changes():
+    engine = create_engine("sqlite://")
+    models = (RoutingNode, RoutingEdge, DataVersion)
+    RoutingNode.metadata.create_all(engine, tables=[m.__table__ for m in models])
+    reset_rail_graph()
+    with Session(engine) as db:
+        db.add_all([RoutingNode(id=i, op_id=o, latitude=la, longitude=lo) for i, o, la, lo in _NODES])
+        db.add_all([RoutingEdge(id=e, source=s, target=t, cost=c) for e, s, t, c in _EDGES[:2]])
+        db.flush()
+
+        first = get_rail_graph(db)
+        assert get_rail_graph(db) is first
+        assert first.shortest_path("A", "F") is None
+
+        db.add(RoutingEdge(id=14, source=3, target=5, cost=1.0))
+        bump_versions(db, [SCOPE_ROUTING])
+        rebuilt = get_rail_graph(db)
+        assert rebuilt is not first
+        assert rebuilt.shortest_path("A", "F").cost == 3.0
+    reset_rail_graph()
@@ -0,0 +1,165 @@
+"""Streaming RINF XML import (iterparse → staging tables → set-based / differential merge)."""
+from __future__ import annotations
+
+import io
+import tracemalloc
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from dashboard_backend.models.railway_infrastructure import (
+    OperationalPoint,
+    SectionOfLine,
+    SOLTrack,
+    SOLTrackParameter,
+)
+from scripts.import_rinf_data.bulk_load import DiffStats
+from scripts.import_rinf_data.import_xml import import_xml_file, import_xml_file_diff
+from scripts.import_rinf_data.rinf_xml_stream import OPRow, ParamRow, SOLRow, TrackRow, iter_rinf_rows
+
+_OP = """
+<OperationalPoint ValidityDateStart="2020-01-01" ValidityDateEnd="{end}">
+  <UniqueOPID Value="{op_id}"/>
+  <OPName Value="{name}"/>
+  <OPType Value="station"/>
+  <OPGeographicLocation Latitude="52.5" Longitude="13,4"/>
+  <OPRailwayLocation NationalIdentNum="6100" Kilometer="12.3"/>
+</OperationalPoint>"""
+
+_SOL = """
+<SectionOfLine ValidityDateStart="2020-01-01" ValidityDateEnd="2030-12-31">
+  <SOLIMCode Value="0080"/>
+  <SOLLineIdentification Value="{line}"/>
+  <SOLOPStart Value="{start}"/>
+  <SOLOPEnd Value="{end}"/>
+  <SOLLength Value="4.2"/>
+  <SOLNature Value="regular"/>
+  <SOLTrack ValidityDateStart="2020-01-01">
+    <SOLTrackIdentification Value="1"/>
+    <SOLTrackDirection Value="N"/>
+    <SOLTrackParameter ID="IPP_MaxSpeed" IsApplicable="Y" Value="160"/>
+    <SOLTrackParameter ID="ILL_Gauging" IsApplicable="N"/>
+  </SOLTrack>
+  <SOLTrack>
+    <SOLTrackIdentification Value="2"/>
+    <SOLTrackDirection Value="O"/>
+  </SOLTrack>
+</SectionOfLine>"""
+
+
+def _xml(ops: list[tuple[str, str, str]], sols: list[tuple[str, str, str]]) -> str:
+    body = "".join(_OP.format(op_id=o, name=n, end=e) for o, n, e in ops)
+    body += "".join(_SOL.format(line=l, start=s, end=e) for l, s, e in sols)
+    return f"<RINFData><OperationalPoints>{body}</OperationalPoints></RINFData>"
+
+
+@pytest.fixture()
+def conn():
+    engine = create_engine("sqlite://")
+    tables = [t.__table__ for t in (OperationalPoint, SectionOfLine, SOLTrack, SOLTrackParameter)]
+    OperationalPoint.metadata.create_all(engine, tables=tables)
+    with engine.begin() as connection:
+        yield connection
+
+
+def test_rows_are_streamed_as_tuples():
+    xml = _xml([("DE000A1", "Alpha", "2030-12-31")], [("6100", "DE000A1", "DE000A1")])
+    rows = list(iter_rinf_rows(io.BytesIO(xml.encode())))
+
+    assert [type(r) for r in rows] == [OPRow, SOLRow, TrackRow, ParamRow, ParamRow, TrackRow]
+    op = rows[0]
+    assert (op.op_id, op.country_code, op.longitude, op.validity_date_end) == (
+        "DE000A1", "DE", 13.4, date(2030, 12, 31)
+    )
+    assert rows[2].sol_seq == rows[1].seq == 1
+    assert rows[4] == ParamRow(seq=2, track_seq=1, parameter_id="ILL_Gauging", is_applicable="N", value=None, optional_value=None)
+    assert rows[5].seq == 2
+
+
+def test_import_merges_staged_rows(tmp_path, conn):
+    path = tmp_path / "rinf_XX.xml"
+    path.write_text(_xml(
+        [("DE000A1", "Alpha alt", "2025-12-31"), ("DE000B2", "Beta", "2030-12-31"), ("DE000A1", "Alpha", "2030-12-31")],
+        [("6100", "DE000A1", "DE000B2"), ("6101", "DE000B2", "DE000A1")],
+    ))
+
+    stats = import_xml_file(conn, str(path), batch_size=2)
+
+    assert (stats.operational_points, stats.sections_of_line, stats.tracks, stats.parameters) == (2, 2, 4, 4)
+    db = Session(bind=conn)
+    assert db.scalar(select(OperationalPoint.name).where(OperationalPoint.op_id == "DE000A1")) == "Alpha"
+    sol = db.scalars(select(SectionOfLine).where(SectionOfLine.sol_line_identification == "6101")).one()
+    assert sol.sol_op_start == "DE000B2"
+    assert [t.sol_track_identification for t in sorted(sol.tracks, key=lambda t: t.id)] == ["1", "2"]
+    assert {p.parameter_id for t in sol.tracks for p in t.parameters} == {"IPP_MaxSpeed", "ILL_Gauging"}
+
+    # Re-import appends sections again but keeps existing operational points.
+    stats = import_xml_file(conn, str(path))
+    assert stats.operational_points == 0 and stats.operational_points_skipped == 2
+    assert db.scalar(select(func.count()).select_from(SectionOfLine)) == 4
+    assert db.scalar(select(func.count()).select_from(SOLTrack)) == 8
+
+    stats = import_xml_file(conn, str(path), clear_tables=True)
+    assert stats.operational_points == 2
+    assert db.scalar(select(func.count()).select_from(SOLTrackParameter)) == 4
+
+
+def test_memory_does_not_grow_with_file_size(tmp_path):
+    def peak(n: int) -> int:
+        path = tmp_path / f"rinf_{n}.xml"
+        path.write_text(_xml([(f"DE{i:06d}", f"OP {i}", "2030-12-31") for i in range(n)], []))
+        tracemalloc.start()
+        for _ in iter_rinf_rows(str(path)):
+            pass
+        _, high = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return high
+
+    small, large = peak(2_000), peak(20_000)
+    assert large < small * 2
+
+
+def test_diff_import_applies_only_the_delta(tmp_path, conn):
+    path = tmp_path / "rinf_DE.xml"
+    ops = [("DE000A1", "Alpha", "2030-12-31"), ("DE000B2", "Beta", "2030-12-31"), ("DE000C3", "Gamma", "2030-12-31")]
+    sols = [("6100", "DE000A1", "DE000B2"), ("6101", "DE000B2", "DE000C3")]
+    path.write_text(_xml(ops, sols))
+
+    first = import_xml_file_diff(conn, str(path), expire_on=date(2026, 10, 18))
+    assert (first.operational_points_inserted, first.sections_of_line_inserted) == (3, 2)
+    assert (first.tracks_inserted, first.parameters_inserted) == (4, 4)
+
+    db = Session(bind=conn)
+    ids_before = dict(db.execute(select(SectionOfLine.sol_line_identification, SectionOfLine.id)).all())
+    op_ids_before = dict(db.execute(select(OperationalPoint.op_id, OperationalPoint.id)).all())
+    track = db.scalars(select(SOLTrack).where(SOLTrack.section_id == ids_before["6100"])).first()
+    db.add(SOLTrackParameter(track_id=track.id, parameter_id="MANUAL", value="x", manual_added=True))
+    db.flush()
+
+    unchanged = import_xml_file_diff(conn, str(path), expire_on=date(2026, 10, 18))
+    assert unchanged == DiffStats()
+
+    # Beta renamed, Gamma and line 6101 gone, max speed changed, one track dropped.
+    changed = _xml([("DE000A1", "Alpha", "2030-12-31"), ("DE000B2", "Beta Hbf", "2030-12-31")], sols[:1])
+    changed = changed.replace('Value="160"', 'Value="200"').replace('<SOLTrackIdentification Value="2"/>', '<SOLTrackIdentification Value="3"/>')
+    path.write_text(changed)
+    delta = import_xml_file_diff(conn, str(path), expire_on=date(2026, 10, 18))
+
+    assert (delta.operational_points_inserted, delta.operational_points_updated, delta.operational_points_expired) == (0, 1, 1)
+    assert (delta.sections_of_line_inserted, delta.sections_of_line_updated, delta.sections_of_line_expired) == (0, 0, 1)
+    assert (delta.tracks_inserted, delta.tracks_deleted) == (1, 1)
+    assert (delta.parameters_updated, delta.parameters_inserted, delta.parameters_deleted) == (1, 0, 0)
+
+    db.expire_all()
+    # Rows keep their ids (project links point at them) and are expired, not deleted.
+    assert dict(db.execute(select(SectionOfLine.sol_line_identification, SectionOfLine.id)).all()) == ids_before
+    assert dict(db.execute(select(OperationalPoint.op_id, OperationalPoint.id)).all()) == op_ids_before
+    gamma = db.scalars(select(OperationalPoint).where(OperationalPoint.op_id == "DE000C3")).one()
+    assert gamma.validity_date_end == date(2026, 10, 18)
+    assert db.scalar(select(SectionOfLine.validity_date_end).where(SectionOfLine.id == ids_before["6101"])) == date(2026, 10, 18)
+    params = dict(db.execute(
+        select(SOLTrackParameter.parameter_id, SOLTrackParameter.value).where(SOLTrackParameter.track_id == track.id)
+    ).all())
+    assert params == {"IPP_MaxSpeed": "200", "ILL_Gauging": None, "MANUAL": "x"}
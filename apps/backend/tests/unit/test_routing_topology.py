@@ -0,0 +1,58 @@
+"""Persisted routing topology (routing_node / routing_edge)."""
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from dashboard_backend.crud.data_versions import SCOPE_ROUTING, get_versions
+from dashboard_backend.models.data_version import DataVersion
+from dashboard_backend.models.railway_infrastructure import (
+    OperationalPoint,
+    RoutingEdge,
+    RoutingNode,
+    SectionOfLine,
+)
+from dashboard_backend.routing.topology import refresh_routing_topology
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine("sqlite://")
+    models = (OperationalPoint, SectionOfLine, RoutingNode, RoutingEdge, DataVersion)
+    OperationalPoint.metadata.create_all(engine, tables=[m.__table__ for m in models])
+    with Session(engine) as session:
+        yield session
+
+
+def _op(id_: int, op_id: str) -> OperationalPoint:
+    return OperationalPoint(id=id_, op_id=op_id, latitude=48.0 + id_, longitude=11.0)
+
+
+def test_refresh_builds_stable_nodes_and_edges(db):
+    db.add_all([_op(10, "DEA"), _op(20, "DEB"), _op(30, "DEC"), _op(40, "DED"), _op(50, "DEUNUSED")])
+    db.add_all([
+        SectionOfLine(id=1, sol_op_start="DEA", sol_op_end="DEB", sol_length=4.2),
+        SectionOfLine(id=2, sol_op_start="DEB", sol_op_end="DEC", sol_length=1.5, validity_date_end=date(2030, 1, 1)),
+        # Expired on the refresh date, and a section without length.
+        SectionOfLine(id=3, sol_op_start="DEC", sol_op_end="DED", sol_length=2.0, validity_date_end=date(2026, 10, 18)),
+        SectionOfLine(id=4, sol_op_start="DEA", sol_op_end="DEC", sol_length=None),
+    ])
+    db.flush()
+
+    assert refresh_routing_topology(db, as_of=date(2026, 10, 18)) == (3, 2)
+
+    nodes = dict(db.execute(select(RoutingNode.op_id, RoutingNode.id)).all())
+    assert nodes == {"DEA": 10, "DEB": 20, "DEC": 30}
+    edges = db.execute(select(RoutingEdge.id, RoutingEdge.source, RoutingEdge.target, RoutingEdge.cost)
+                       .order_by(RoutingEdge.id)).all()
+    assert [tuple(e) for e in edges] == [(1, 10, 20, 4.2), (2, 20, 30, 1.5)]
+    assert get_versions(db, [SCOPE_ROUTING]) == {SCOPE_ROUTING: 1}
+
+    # A second refresh replaces the tables instead of appending.
+    db.get(SectionOfLine, 2).validity_date_end = date(2026, 1, 1)
+    db.flush()
+    assert refresh_routing_topology(db, as_of=date(2026, 10, 18)) == (2, 1)
+    assert get_versions(db, [SCOPE_ROUTING]) == {SCOPE_ROUTING: 2}
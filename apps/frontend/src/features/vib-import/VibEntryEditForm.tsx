@@ -96,9 +96,17 @@ export default function VibEntryEditForm({
                             {entry.vib_section}
                         </Text>
                     )}
-                    {entry.ai_extracted && (
+                    {entry.ai_extracted && !entry.ai_carried_over_from_year && (
                         <ChronicleDataChip>KI</ChronicleDataChip>
                     )}
+                    {entry.ai_carried_over_from_year && (
+                        <Tooltip
+                            label={`Rohtext unverändert — Felder aus dem bestätigten VIB ${entry.ai_carried_over_from_year} übernommen`}
+                            withArrow
+                        >
+                            <ChronicleDataChip>aus {entry.ai_carried_over_from_year}</ChronicleDataChip>
+                        </Tooltip>
+                    )}
                     {entry.ai_extraction_failed && (
                         <Tooltip label={entry.ai_extraction_error ?? "KI-Extraktion fehlgeschlagen"} withArrow>
                             <ChronicleDataChip>KI fehlgeschlagen</ChronicleDataChip>
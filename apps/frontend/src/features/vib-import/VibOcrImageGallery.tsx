@@ -0,0 +1,60 @@
+import { useState } from "react";
+import { Anchor, Collapse, Group, Image, Loader, SimpleGrid, Stack, Text } from "@mantine/core";
+import { API_BASE } from "../../shared/api/client";
+import { useVibDraftImages } from "../../shared/api/queries";
+
+/**
+ * OCR images of a VIB draft. The image list is only fetched once the section
+ * is opened; thumbnails load lazily as they scroll into view and link to the
+ * full image.
+ */
+export default function VibOcrImageGallery({ taskId }: { taskId: string }) {
+    const [open, setOpen] = useState(false);
+    const { data: images, isLoading } = useVibDraftImages(taskId, open);
+    const imageUrl = (id: string) =>
+        `${API_BASE}/api/v1/import/vib/draft/${taskId}/image/${encodeURIComponent(id)}`;
+
+    return (
+        <Stack gap="xs">
+            <Text
+                size="sm"
+                c="blue"
+                style={{ cursor: "pointer", userSelect: "none" }}
+                onClick={() => setOpen((o) => !o)}
+            >
+                {open ? "OCR-Bilder ausblenden ▲" : "OCR-Bilder anzeigen ▼"}
+            </Text>
+            <Collapse in={open}>
+                {isLoading ? (
+                    <Group justify="center">
+                        <Loader size="sm" />
+                    </Group>
+                ) : !images?.length ? (
+                    <Text size="sm" c="dimmed">
+                        Keine Bilder im OCR-Ergebnis.
+                    </Text>
+                ) : (
+                    <SimpleGrid cols={{ base: 2, sm: 4, md: 6 }} spacing="xs">
+                        {images.map((img) => (
+                            <Stack key={img.id} gap={2}>
+                                <Anchor href={imageUrl(img.id)} target="_blank" rel="noreferrer">
+                                    <Image
+                                        src={`${imageUrl(img.id)}?thumbnail=true`}
+                                        loading="lazy"
+                                        alt={img.id}
+                                        radius="sm"
+                                        h={120}
+                                        fit="contain"
+                                    />
+                                </Anchor>
+                                <Text size="xs" c="dimmed">
+                                    Seite {img.page_index + 1}
+                                </Text>
+                            </Stack>
+                        ))}
+                    </SimpleGrid>
+                )}
+            </Collapse>
+        </Stack>
+    );
+}
@@ -17,32 +17,41 @@ import { IconChevronLeft, IconChevronRight } from "@tabler/icons-react";
 import { notifications } from "@mantine/notifications";
 import RequirePermission from "../../components/RequirePermission";
 import {
-    useVibParseResult,
+    useVibDraftSummary,
+    useVibDraftEntries,
     useConfirmVibImport,
     useProjects,
-    useSaveVibDraft,
+    useSaveVibDraftEntry,
     useRetryVibAiForEntry,
     useVibAiAvailable,
     useVibOcrAvailable,
     type VibEntryProposed,
-    type VibConfirmEntryInput,
 } from "../../shared/api/queries";
 import VibEntryEditForm from "./VibEntryEditForm";
+import VibOcrImageGallery from "./VibOcrImageGallery";
+
+// Entries are loaded page by page around the current one, never the whole draft.
+const PAGE_SIZE = 50;
 
 function VibReviewPageContent() {
     const { taskId } = useParams<{ taskId: string }>();
     const navigate = useNavigate();
 
-    const { data: parseResult, isLoading, isError } = useVibParseResult(taskId ?? null);
+    const [currentIndex, setCurrentIndex] = useState(0);
+    const pageOffset = Math.floor(currentIndex / PAGE_SIZE) * PAGE_SIZE;
+    const { data: summary, isLoading, isError } = useVibDraftSummary(taskId ?? null);
+    const { data: page } = useVibDraftEntries(taskId ?? null, pageOffset, PAGE_SIZE);
     const { data: projects } = useProjects();
     const { data: aiAvailable } = useVibAiAvailable();
     const { data: ocrAvailable } = useVibOcrAvailable();
     const confirm = useConfirmVibImport();
-    const saveDraft = useSaveVibDraft();
+    const saveEntry = useSaveVibDraftEntry();
     const retryAi = useRetryVibAiForEntry();
 
-    const [entries, setEntries] = useState<VibEntryProposed[] | null>(null);
-    const [currentIndex, setCurrentIndex] = useState(0);
+    // Local state of the entries touched in this session, by index.
+    const [edits, setEdits] = useState<Record<number, VibEntryProposed>>({});
+    // Indices edited since the last save — only these are written back.
+    const [dirty, setDirty] = useState<Set<number>>(new Set());
     const [retryingIdx, setRetryingIdx] = useState<number | null>(null);
 
     if (isLoading) {
@@ -55,7 +64,7 @@ function VibReviewPageContent() {
         );
     }
 
-    if (isError || !parseResult) {
+    if (isError || !summary) {
         return (
             <Container size="sm" py="xl">
                 <Alert color="red" variant="light" title="Fehler">
@@ -66,9 +75,9 @@ function VibReviewPageContent() {
         );
     }
 
-    const displayEntries: VibEntryProposed[] = entries ?? parseResult.entries;
-    const total = displayEntries.length;
-    const currentEntry = displayEntries[currentIndex];
+    const total = summary.total;
+    const currentEntry: VibEntryProposed | undefined =
+        edits[currentIndex] ?? page?.items.find((item) => item.idx === currentIndex)?.entry;
 
     const projectOptions = (projects ?? []).map((p) => ({
         value: String(p.id),
@@ -76,24 +85,25 @@ function VibReviewPageContent() {
     }));
 
     const updateCurrentEntry = (patch: Partial<VibEntryProposed>) => {
-        setEntries((prev) => {
-            const base = prev ?? parseResult.entries;
-            return base.map((e, i) => (i === currentIndex ? { ...e, ...patch } : e));
-        });
+        if (!currentEntry) return;
+        setEdits((prev) => ({ ...prev, [currentIndex]: { ...currentEntry, ...patch } }));
+        setDirty((prev) => new Set(prev).add(currentIndex));
+    };
+
+    const saveDirtyEntries = async () => {
+        if (!taskId) return;
+        await Promise.all(
+            [...dirty].map((idx) =>
+                saveEntry.mutateAsync({ taskId, entryIdx: idx, entry: edits[idx] }),
+            ),
+        );
+        setDirty(new Set());
     };
 
     const handleSaveDraft = async () => {
-        if (!taskId || !parseResult) return;
+        if (!taskId) return;
         try {
-            await saveDraft.mutateAsync({
-                taskId,
-                data: {
-                    year: parseResult.year,
-                    drucksache_nr: parseResult.drucksache_nr,
-                    report_date: parseResult.report_date,
-                    entries: displayEntries,
-                },
-            });
+            await saveDirtyEntries();
             notifications.show({ color: "green", message: "Entwurf gespeichert." });
         } catch {
             notifications.show({ color: "red", message: "Entwurf konnte nicht gespeichert werden." });
@@ -105,9 +115,13 @@ function VibReviewPageContent() {
         setRetryingIdx(idx);
         try {
             const updated = await retryAi.mutateAsync({ taskId, entryIdx: idx });
-            setEntries((prev) =>
-                (prev ?? parseResult.entries).map((e, i) => (i === idx ? updated : e))
-            );
+            setEdits((prev) => ({ ...prev, [idx]: updated }));
+            // Persisted by the server; drop local edits of this entry.
+            setDirty((prev) => {
+                const next = new Set(prev);
+                next.delete(idx);
+                return next;
+            });
             notifications.show({ color: "green", message: "KI-Extraktion erfolgreich." });
         } catch {
             notifications.show({ color: "red", message: "KI-Extraktion fehlgeschlagen." });
@@ -118,17 +132,18 @@ function VibReviewPageContent() {
 
     const handleConfirm = async () => {
         if (!taskId) return;
+        // The server imports the saved draft entries (use_draft), so pending
+        // edits are saved first.
         const payload = {
             task_id: taskId,
-            year: parseResult.year,
-            drucksache_nr: parseResult.drucksache_nr,
-            report_date: parseResult.report_date,
-            entries: displayEntries.map(
-                // eslint-disable-next-line @typescript-eslint/no-unused-vars
-                ({ suggested_project_ids, ...rest }): VibConfirmEntryInput => rest,
-            ),
+            year: summary.year,
+            drucksache_nr: summary.drucksache_nr,
+            report_date: summary.report_date,
+            use_draft: true,
+            entries: [],
         };
         try {
+            await saveDirtyEntries();
             const res = await confirm.mutateAsync(payload);
             notifications.show({
                 color: "green",
@@ -141,8 +156,10 @@ function VibReviewPageContent() {
         }
     };
 
-    const matchedCount = displayEntries.filter((e) => e.project_ids.length > 0).length;
-    const failedAiCount = displayEntries.filter((e) => e.ai_extraction_failed).length;
+    // Server-side counters of the saved draft (refreshed after every save).
+    const matchedCount = summary.matched;
+    const failedAiCount = summary.ai_failed;
+    const carriedOverCount = summary.carried_over;
 
     return (
         <Container size="lg" py="xl">
@@ -150,12 +167,12 @@ function VibReviewPageContent() {
                 {/* Header */}
                 <Group justify="space-between" align="flex-start">
                     <Stack gap={2}>
-                        <ChronicleHeadline as="h1">VIB-Review — Berichtsjahr {parseResult.year}</ChronicleHeadline>
+                        <ChronicleHeadline as="h1">VIB-Review — Berichtsjahr {summary.year}</ChronicleHeadline>
                         <Text size="sm" c="dimmed">
-                            {parseResult.drucksache_nr
-                                ? `Drucksache ${parseResult.drucksache_nr}`
+                            {summary.drucksache_nr
+                                ? `Drucksache ${summary.drucksache_nr}`
                                 : ""}
-                            {parseResult.report_date ? ` · ${parseResult.report_date}` : ""}
+                            {summary.report_date ? ` · ${summary.report_date}` : ""}
                         </Text>
                     </Stack>
                     <Group gap="sm">
@@ -169,6 +186,13 @@ function VibReviewPageContent() {
                                 </ChronicleDataChip>
                             </Tooltip>
                         )}
+                        {carriedOverCount > 0 && (
+                            <Tooltip label={`${carriedOverCount} Einträge unverändert aus dem Vorjahr übernommen (ohne KI-Aufruf)`} withArrow>
+                                <ChronicleDataChip>
+                                    {carriedOverCount} übernommen
+                                </ChronicleDataChip>
+                            </Tooltip>
+                        )}
                         <Tooltip label={ocrAvailable?.available ? `OCR: ${ocrAvailable.model}` : "Texterkennung: pymupdf"}>
                             <ChronicleDataChip>
                                 {ocrAvailable?.available ? "Mistral OCR" : "pymupdf"}
@@ -177,7 +201,7 @@ function VibReviewPageContent() {
                         <Button
                             variant="light"
                             onClick={handleSaveDraft}
-                            loading={saveDraft.isPending}
+                            loading={saveEntry.isPending}
                         >
                             Entwurf speichern
                         </Button>
@@ -201,7 +225,7 @@ function VibReviewPageContent() {
                     </ActionIcon>
                     <Group gap={4} align="center">
                         <Select
-                            data={displayEntries.map((_, i) => ({ value: String(i + 1), label: String(i + 1) }))}
+                            data={Array.from({ length: total }, (_, i) => ({ value: String(i + 1), label: String(i + 1) }))}
                             value={String(currentIndex + 1)}
                             onChange={(v) => v && setCurrentIndex(Number(v) - 1)}
                             searchable
@@ -219,13 +243,17 @@ function VibReviewPageContent() {
                     >
                         <IconChevronRight size={16} />
                     </ActionIcon>
-                    <Text fw={600} lineClamp={1} style={{ maxWidth: 500 }}>
-                        {currentEntry.vib_name_raw}
-                    </Text>
-                    <ChronicleDataChip>
-                        {currentEntry.category}
-                    </ChronicleDataChip>
-                    {currentEntry.ai_extraction_failed && (
+                    {currentEntry && (
+                        <>
+                            <Text fw={600} lineClamp={1} style={{ maxWidth: 500 }}>
+                                {currentEntry.vib_name_raw}
+                            </Text>
+                            <ChronicleDataChip>
+                                {currentEntry.category}
+                            </ChronicleDataChip>
+                        </>
+                    )}
+                    {currentEntry?.ai_extraction_failed && (
                         <Tooltip label={currentEntry.ai_extraction_error ?? "KI-Extraktion fehlgeschlagen – Wiederholen im Eintrag möglich"} withArrow>
                             <ChronicleDataChip>KI ✗</ChronicleDataChip>
                         </Tooltip>
@@ -233,6 +261,11 @@ function VibReviewPageContent() {
                 </Group>
 
                 {/* Entry form */}
+                {!currentEntry && total > 0 && (
+                    <Group justify="center">
+                        <Loader size="sm" />
+                    </Group>
+                )}
                 {currentEntry && (
                     <VibEntryEditForm
                         entry={currentEntry}
@@ -242,6 +275,8 @@ function VibReviewPageContent() {
                         isRetryingAi={retryingIdx === currentIndex}
                     />
                 )}
+
+                {taskId && <VibOcrImageGallery taskId={taskId} />}
             </Stack>
         </Container>
     );
@@ -1,4 +1,4 @@
-import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
+import { keepPreviousData, useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 
 import { api } from "./client";
 import type { components } from "./types.gen";
@@ -52,6 +52,11 @@ export const queryKeys = {
     vibEntriesConfirmed: ["vib-entries-confirmed"],
     vibAiAvailable: ["vib-ai-available"],
     vibOcrAvailable: ["vib-ocr-available"],
+    vibDraftImages: (taskId: string) => ["vib-draft-images", taskId] as const,
+    vibDraftSummary: (taskId: string) => ["vib-draft-summary", taskId] as const,
+    vibDraftEntries: (taskId: string) => ["vib-draft-entries", taskId] as const,
+    vibDraftEntriesPage: (taskId: string, offset: number, limit: number) =>
+        ["vib-draft-entries", taskId, offset, limit] as const,
     adminUnassignedFinves: ["admin-unassigned-finves"],
     adminUnassignedVibEntries: ["admin-unassigned-vib-entries"],
     bauportalEntries: ["bauportal-entries"],
@@ -1195,26 +1200,77 @@ export function useVibOcrAvailable() {
     });
 }
 
-export function useSaveVibDraft() {
+export type VibDraftImage = components["schemas"]["VibDraftImageSchema"];
+
+export function useVibDraftImages(taskId: string, enabled: boolean) {
+    return useQuery({
+        queryKey: queryKeys.vibDraftImages(taskId),
+        queryFn: () => api<VibDraftImage[]>(`/api/v1/import/vib/draft/${taskId}/images`),
+        enabled,
+        // Images of a draft never change after parsing.
+        staleTime: Infinity,
+    });
+}
+
+export type VibDraftSummary = components["schemas"]["VibDraftSummarySchema"];
+
+export type VibDraftEntryPage = components["schemas"]["VibDraftEntryPage"];
+
+export function useVibDraftSummary(taskId: string | null) {
+    return useQuery({
+        queryKey: queryKeys.vibDraftSummary(taskId ?? ""),
+        enabled: taskId !== null,
+        queryFn: () => api<VibDraftSummary>(`/api/v1/import/vib/draft/${taskId}`),
+        retry: false,
+    });
+}
+
+export function useVibDraftEntries(taskId: string | null, offset: number, limit: number) {
+    return useQuery({
+        queryKey: queryKeys.vibDraftEntriesPage(taskId ?? "", offset, limit),
+        enabled: taskId !== null,
+        queryFn: () =>
+            api<VibDraftEntryPage>(
+                `/api/v1/import/vib/draft/${taskId}/entries?offset=${offset}&limit=${limit}`,
+            ),
+        // Keep showing the previous page while the next one loads.
+        placeholderData: keepPreviousData,
+    });
+}
+
+export function useSaveVibDraftEntry() {
     const queryClient = useQueryClient();
     return useMutation({
-        mutationFn: ({ taskId, data }: { taskId: string; data: VibParseTaskResult }) =>
-            api<void>(`/api/v1/import/vib/draft/${taskId}`, {
+        mutationFn: ({
+            taskId,
+            entryIdx,
+            entry,
+        }: {
+            taskId: string;
+            entryIdx: number;
+            entry: VibEntryProposed;
+        }) =>
+            api<void>(`/api/v1/import/vib/draft/${taskId}/entries/${entryIdx}`, {
                 method: "PATCH",
-                json: data,
+                json: entry,
             }),
-        onSuccess: (_, { taskId, data }) => {
-            queryClient.setQueryData(queryKeys.vibParseResult(taskId), data);
+        onSuccess: (_, { taskId }) => {
+            queryClient.invalidateQueries({ queryKey: queryKeys.vibDraftSummary(taskId) });
+            queryClient.invalidateQueries({ queryKey: queryKeys.vibDraftEntries(taskId) });
         },
     });
 }
 
 export function useRetryVibAiForEntry() {
+    const queryClient = useQueryClient();
     return useMutation({
         mutationFn: ({ taskId, entryIdx }: { taskId: string; entryIdx: number }) =>
             api<VibEntryProposed>(`/api/v1/import/vib/extract-ai/${taskId}/entry/${entryIdx}`, {
                 method: "POST",
             }),
+        onSuccess: (_, { taskId }) => {
+            queryClient.invalidateQueries({ queryKey: queryKeys.vibDraftSummary(taskId) });
+        },
     });
 }
 
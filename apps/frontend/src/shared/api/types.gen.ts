@@ -1204,19 +1204,37 @@ export interface paths {
             path?: never;
             cookie?: never;
         };
-        get?: never;
+        /**
+         * Get Vib Draft Summary
+         * @description Return the draft header and its counters without loading any entry.
+         */
+        get: operations["get_vib_draft_summary_api_v1_import_vib_draft__parse_task_id__get"];
         put?: never;
         post?: never;
         delete?: never;
         options?: never;
         head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/api/v1/import/vib/draft/{parse_task_id}/entries": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
         /**
-         * Save Vib Draft
-         * @description Overwrite the draft's raw_result_json with the current review state.
-         *
-         *     Called by the review UI to persist edits so work survives page reloads.
+         * List Vib Draft Entries
+         * @description Return one page of the draft's entries, ordered by index.
          */
-        patch: operations["save_vib_draft_api_v1_import_vib_draft__parse_task_id__patch"];
+        get: operations["list_vib_draft_entries_api_v1_import_vib_draft__parse_task_id__entries_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
         trace?: never;
     };
     "/api/v1/import/vib/extract-ai/{parse_task_id}/entry/{entry_idx}": {
@@ -4499,6 +4517,11 @@ export interface components {
             drucksache_nr?: string | null;
             /** Report Date */
             report_date?: string | null;
+            /**
+             * Use Draft
+             * @default false
+             */
+            use_draft: boolean;
             /**
              * Entries
              * @default []
@@ -4526,6 +4549,73 @@ export interface components {
             /** Created At */
             created_at: string;
         };
+        /**
+         * VibDraftSummarySchema
+         * @description Header and counters of a draft (GET /draft/{parse_task_id}); the entries
+         *     themselves are read page by page from GET /draft/{parse_task_id}/entries.
+         */
+        VibDraftSummarySchema: {
+            /** Task Id */
+            task_id: string;
+            /** Year */
+            year: number;
+            /** Drucksache Nr */
+            drucksache_nr?: string | null;
+            /** Report Date */
+            report_date?: string | null;
+            /** Total */
+            total: number;
+            /** Matched */
+            matched: number;
+            /** Ai Failed */
+            ai_failed: number;
+            /** Carried Over */
+            carried_over: number;
+        };
+        /**
+         * VibDraftEntryItem
+         * @description One draft entry with its index in the parse result.
+         */
+        VibDraftEntryItem: {
+            /** Idx */
+            idx: number;
+            entry: components["schemas"]["VibEntryProposed"];
+        };
+        /**
+         * VibDraftEntryPage
+         * @description A page of draft entries (GET /draft/{parse_task_id}/entries).
+         */
+        VibDraftEntryPage: {
+            /** Total */
+            total: number;
+            /** Offset */
+            offset: number;
+            /** Limit */
+            limit: number;
+            /**
+             * Items
+             * @default []
+             */
+            items: components["schemas"]["VibDraftEntryItem"][];
+        };
+        /**
+         * VibDraftImageSchema
+         * @description One OCR image of a draft (GET /draft/{task_id}/images); bytes are
+         *     served by GET /draft/{task_id}/image/{id}, ``?thumbnail=true`` for the
+         *     thumbnail.
+         */
+        VibDraftImageSchema: {
+            /** Id */
+            id: string;
+            /** Page Index */
+            page_index: number;
+            /** Media Type */
+            media_type: string;
+            /** Byte Size */
+            byte_size: number;
+            /** Has Thumbnail */
+            has_thumbnail: boolean;
+        };
         /**
          * VibEntryForProjectSchema
          * @description VIB entry as returned in GET /projects/{id}/vib.
@@ -4695,6 +4785,8 @@ export interface components {
             ai_extraction_failed: boolean;
             /** Ai Extraction Error */
             ai_extraction_error?: string | null;
+            /** Ai Carried Over From Year */
+            ai_carried_over_from_year?: number | null;
         };
         /**
          * VibEntrySchema
@@ -7413,7 +7505,7 @@ export interface operations {
             };
         };
     };
-    save_vib_draft_api_v1_import_vib_draft__parse_task_id__patch: {
+    get_vib_draft_summary_api_v1_import_vib_draft__parse_task_id__get: {
         parameters: {
             query?: never;
             header?: never;
@@ -7424,18 +7516,52 @@ export interface operations {
                 session?: string | null;
             };
         };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["VibParseTaskResult"];
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["VibDraftSummarySchema"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    list_vib_draft_entries_api_v1_import_vib_draft__parse_task_id__entries_get: {
+        parameters: {
+            query?: {
+                offset?: number;
+                limit?: number;
+            };
+            header?: never;
+            path: {
+                parse_task_id: string;
+            };
+            cookie?: {
+                session?: string | null;
             };
         };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
-            204: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content?: never;
+                content: {
+                    "application/json": components["schemas"]["VibDraftEntryPage"];
+                };
             };
             /** @description Validation Error */
             422: {
@@ -7535,7 +7661,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": unknown;
+                    "application/json": components["schemas"]["VibDraftImageSchema"][];
                 };
             };
             /** @description Validation Error */